@@ -0,0 +1,426 @@
+"""
+Benchmark: the same workloads against the MySQL, MongoDB and Neo4j APIs.
+
+Run this from the project root against the local Docker stack, for example:
+
+    python -m seed.synthetic --customers 10000 --movies 2000 --rentals 50000 --reset --migrate
+    python -m benchmarks.cross_backend --requests 500 --concurrency 8
+    python -m benchmarks.cross_backend --requests 500 --concurrency 8 --compare benchmarks/results/<earlier>.json
+
+(--seed-data runs the first step as part of the benchmark.)
+
+Every workload sends the same requests to /api/v1/<backend> over HTTP:
+
+- list:             GET /movies?limit=50
+- get_by_id:        GET /movies/<id>
+- create_rental:    POST /rentals with one available copy (needs a JWT; a
+                    throwaway API user is registered for the run)
+- recommendations:  GET /movies/<id>/recommendations?limit=10 (item-item
+                    model on MySQL and MongoDB, graph on Neo4j)
+- customer_history: a customer's rentals
+
+Backends without an equivalent endpoint report the workload as n/a (see
+ENDPOINTS). Request targets (movie, customer and copy ids) are drawn from
+MySQL with --seed, and the migrations copy those ids unchanged, so every
+backend gets the identical sequence. Note that create_rental consumes
+available copies: re-seed before runs that must be strictly comparable.
+
+For each backend and workload it reports throughput and p50/p95/p99
+latency of the successful requests, and writes everything to a JSON file
+(benchmarks/results/ by default). --compare prints the change against an
+earlier result file; with --fail-on-regression the exit status is 1 when a
+p95 got worse by more than --threshold.
+
+Only local API URLs are accepted unless --allow-remote is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import math
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+BACKENDS = ("mysql", "mongodb", "neo4j")
+WORKLOADS = ("list", "get_by_id", "create_rental", "recommendations", "customer_history")
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1", "0.0.0.0"}
+
+# (method, path, body) of one request
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+class Pools:
+    """Ids the requests are built from, sampled once per run."""
+
+    def __init__(self, movie_ids: List[int], customer_ids: List[int], employee_ids: List[int], item_ids: List[int]):
+        self.movie_ids = movie_ids
+        self.customer_ids = customer_ids
+        self.employee_ids = employee_ids
+        self.item_ids = item_ids
+
+
+# Neo4j rentals need a client-chosen id; keep each run's ids apart
+_RUN_BASE = 10**12 + int(time.time()) * 1000
+
+# Request builders per workload and backend: (pools, rng, n) -> Request.
+# None means the backend has no equivalent endpoint.
+ENDPOINTS: Dict[str, Dict[str, Optional[Callable[[Pools, random.Random, int], Request]]]] = {
+    "list": {
+        b: (lambda p, r, n: ("GET", "/movies?limit=50", None)) for b in BACKENDS
+    },
+    "get_by_id": {
+        b: (lambda p, r, n: ("GET", f"/movies/{r.choice(p.movie_ids)}", None)) for b in BACKENDS
+    },
+    "create_rental": {
+        "mysql": lambda p, r, n: ("POST", "/rentals", {
+            "customer_id": r.choice(p.customer_ids),
+            "employee_id": r.choice(p.employee_ids),
+            "inventory_item_ids": [p.item_ids[n]],
+        }),
+        "mongodb": lambda p, r, n: ("POST", "/rentals", {
+            "customer_id": r.choice(p.customer_ids),
+            "employee_id": r.choice(p.employee_ids),
+            "inventory_items": [{"item_id": p.item_ids[n]}],
+        }),
+        # The Neo4j rental resource stores the node only, without relationships
+        "neo4j": lambda p, r, n: ("POST", "/rentals", {"id": _RUN_BASE + n, "status": "OPEN"}),
+    },
+    # Item-item model (MySQL, MongoDB) against the graph traversal (Neo4j)
+    "recommendations": {
+        b: (lambda p, r, n: ("GET", f"/movies/{r.choice(p.movie_ids)}/recommendations?limit=10", None))
+        for b in BACKENDS
+    },
+    "customer_history": {
+        "mysql": lambda p, r, n: ("GET", f"/rentals?customer_id={r.choice(p.customer_ids)}&limit=100", None),
+        "mongodb": None,
+        "neo4j": lambda p, r, n: ("GET", f"/customers/{r.choice(p.customer_ids)}/rental-paths", None),
+    },
+}
+
+
+# ── HTTP ─────────────────────────────────────────────────────────────────────
+class Client:
+    """Keep-alive HTTP client, one connection per thread."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.https = parts.scheme == "https"
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.token: Optional[str] = None
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = self._local.conn = cls(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def request(self, method: str, path: str, body: Optional[Dict[str, Any]] = None) -> Tuple[int, bytes]:
+        headers = {"Accept": "application/json"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        conn = self._connection()
+        try:
+            conn.request(method, self.prefix + path, body=payload, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except (http.client.HTTPException, OSError):
+            # Dropped keep-alive connection: reconnect once
+            conn.close()
+            self._local.conn = None
+            conn = self._connection()
+            conn.request(method, self.prefix + path, body=payload, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+
+    def login(self) -> None:
+        """Register a throwaway API user and keep its access token."""
+        creds = {"username": f"bench-{uuid.uuid4().hex[:12]}", "password": uuid.uuid4().hex}
+        status, body = self.request("POST", "/auth/register", creds)
+        if status != 201:
+            raise RuntimeError(f"register failed ({status}): {body[:200]!r}")
+        status, body = self.request("POST", "/auth/login", creds)
+        if status != 200:
+            raise RuntimeError(f"login failed ({status}): {body[:200]!r}")
+        self.token = json.loads(body)["access_token"]
+
+
+# ── measuring ────────────────────────────────────────────────────────────────
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    # nearest rank
+    if not samples:
+        return None
+    return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+
+def summarize(latencies_ms: List[float], errors: int, seconds: float, error_sample: Optional[str]) -> Dict[str, Any]:
+    ok = sorted(latencies_ms)
+    return {
+        "requests": len(ok) + errors,
+        "errors": errors,
+        "error_sample": error_sample,
+        "seconds": round(seconds, 3),
+        "throughput_rps": round(len(ok) / seconds, 1) if seconds else None,
+        "mean_ms": round(sum(ok) / len(ok), 2) if ok else None,
+        "p50_ms": _round(_percentile(ok, 0.50)),
+        "p95_ms": _round(_percentile(ok, 0.95)),
+        "p99_ms": _round(_percentile(ok, 0.99)),
+        "max_ms": _round(ok[-1] if ok else None),
+    }
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+def run_workload(client: Client, backend: str, requests: List[Request], concurrency: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    error_sample: Optional[str] = None
+    lock = threading.Lock()
+
+    def one(req: Request) -> None:
+        nonlocal errors, error_sample
+        method, path, body = req
+        start = time.perf_counter()
+        try:
+            status, payload = client.request(method, f"/{backend}{path}", body)
+            failure = None if status < 400 else f"{status} {method} {path}: {payload[:200].decode(errors='replace')}"
+        except Exception as e:
+            failure = f"{type(e).__name__} {method} {path}: {e}"
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            if failure is None:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+                error_sample = error_sample or failure
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, requests))
+    return summarize(latencies, errors, time.perf_counter() - start, error_sample)
+
+
+# ── setup ────────────────────────────────────────────────────────────────────
+def sample_pools(rng: random.Random, size: int) -> Tuple[Pools, Dict[str, int]]:
+    """Draw request targets from MySQL; the other backends hold the same ids."""
+    from sqlalchemy import text
+
+    from seed.mysql_seed_helpers import get_session
+
+    session = get_session()
+    try:
+        def ids(sql: str) -> List[int]:
+            return [row[0] for row in session.execute(text(sql))]
+
+        movie_ids = ids("SELECT movie_id FROM movie ORDER BY movie_id")
+        customer_ids = ids("SELECT customer_id FROM customer ORDER BY customer_id")
+        employee_ids = ids("SELECT employee_id FROM employee ORDER BY employee_id")
+        item_ids = ids("SELECT inventory_item_id FROM inventory_item WHERE status = 1 ORDER BY inventory_item_id")
+        dataset = {
+            "customers": len(customer_ids),
+            "movies": len(movie_ids),
+            "inventory_items": int(session.execute(text("SELECT COUNT(*) FROM inventory_item")).scalar()),
+            "rentals": int(session.execute(text("SELECT COUNT(*) FROM rental")).scalar()),
+        }
+    finally:
+        session.close()
+
+    if not movie_ids or not customer_ids or not employee_ids:
+        raise RuntimeError("MySQL has no movies/customers/employees; seed first (python -m seed.synthetic)")
+    if len(item_ids) < size:
+        raise RuntimeError(f"create_rental needs {size} available copies, MySQL has {len(item_ids)}; re-seed")
+
+    def sample(values: List[int], k: int) -> List[int]:
+        return rng.sample(values, min(k, len(values)))
+
+    pools = Pools(
+        movie_ids=sample(movie_ids, 10_000),
+        customer_ids=sample(customer_ids, 10_000),
+        employee_ids=employee_ids,
+        item_ids=sample(item_ids, size),
+    )
+    return pools, dataset
+
+
+def build_requests(workload: str, backend: str, pools: Pools, seed: int, count: int) -> Optional[List[Request]]:
+    builder = ENDPOINTS[workload][backend]
+    if builder is None:
+        return None
+    # Same seed per workload on every backend: identical targets in identical order
+    rng = random.Random(f"{seed}:{workload}")
+    return [builder(pools, rng, n) for n in range(count)]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+# ── reporting ────────────────────────────────────────────────────────────────
+def print_results(results: Dict[str, Dict[str, Optional[Dict[str, Any]]]]) -> None:
+    print(f"\n{'workload':<18}{'backend':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for workload in WORKLOADS:
+        for backend, per_workload in results.items():
+            if workload not in per_workload:
+                continue
+            r = per_workload[workload]
+            if r is None:
+                print(f"{workload:<18}{backend:<10}{'n/a':>10}")
+                continue
+            print(
+                f"{workload:<18}{backend:<10}{_fmt(r['throughput_rps'])}{_fmt(r['p50_ms'])}"
+                f"{_fmt(r['p95_ms'])}{_fmt(r['p99_ms'])}{r['errors']:>8}"
+            )
+    for backend, per_workload in results.items():
+        for workload, r in per_workload.items():
+            if r and r["error_sample"]:
+                print(f"[{backend}/{workload}] first error: {r['error_sample']}")
+
+
+def _fmt(value: Optional[float]) -> str:
+    return f"{value:>10.1f}" if value is not None else f"{'-':>10}"
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """Print p95/throughput changes per backend and workload; returns the regressions."""
+    regressions: List[str] = []
+    print(f"\ncompared with {previous['meta'].get('started_at')} ({previous['meta'].get('git_commit')})")
+    print(f"{'workload':<18}{'backend':<10}{'p95 before':>12}{'p95 now':>10}{'change':>9}{'req/s change':>14}")
+    for backend, per_workload in current["results"].items():
+        for workload, now in per_workload.items():
+            before = previous["results"].get(backend, {}).get(workload)
+            if not now or not before or not now["p95_ms"] or not before["p95_ms"]:
+                continue
+            change = now["p95_ms"] / before["p95_ms"] - 1
+            rps_change = (
+                now["throughput_rps"] / before["throughput_rps"] - 1
+                if now["throughput_rps"] and before["throughput_rps"] else 0.0
+            )
+            flag = "  REGRESSION" if change > threshold else ""
+            print(
+                f"{workload:<18}{backend:<10}{before['p95_ms']:>12.1f}{now['p95_ms']:>10.1f}"
+                f"{change:>+9.0%}{rps_change:>+14.0%}{flag}"
+            )
+            if flag:
+                regressions.append(f"{backend}/{workload}")
+    return regressions
+
+
+# ── main ─────────────────────────────────────────────────────────────────────
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    if args.seed_data:
+        from seed import synthetic
+
+        scale = synthetic.Scale(customers=args.customers, movies=args.movies, rentals=args.rentals, seed=args.seed)
+        synthetic.reset()
+        synthetic.build(scale)
+        synthetic.migrate()
+
+    backends = args.backends.split(",")
+    workloads = args.workloads.split(",")
+    rng = random.Random(args.seed)
+    pools, dataset = sample_pools(rng, args.requests + args.warmup)
+
+    client = Client(args.url, args.timeout)
+    if "create_rental" in workloads:
+        client.login()
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    results: Dict[str, Dict[str, Optional[Dict[str, Any]]]] = {b: {} for b in backends}
+    for workload in workloads:
+        for backend in backends:
+            requests = build_requests(workload, backend, pools, args.seed, args.warmup + args.requests)
+            if requests is None:
+                results[backend][workload] = None
+                continue
+            print(f"[bench] {workload} on {backend} ...")
+            if args.warmup:
+                run_workload(client, backend, requests[: args.warmup], args.concurrency)
+            results[backend][workload] = run_workload(client, backend, requests[args.warmup :], args.concurrency)
+
+    return {
+        "meta": {
+            "started_at": started_at,
+            "git_commit": _git_commit(),
+            "url": args.url,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "dataset": dataset,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:5004/api/v1", help="API base URL")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per workload and backend")
+    parser.add_argument("--warmup", type=int, default=20, help="unmeasured requests sent first")
+    parser.add_argument("--concurrency", type=int, default=4, help="parallel clients")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds per request")
+    parser.add_argument("--seed", type=int, default=42, help="picks the request targets")
+    parser.add_argument("--seed-data", action="store_true", help="reset and seed MySQL, then migrate, before running")
+    parser.add_argument("--customers", type=int, default=1000, help="with --seed-data")
+    parser.add_argument("--movies", type=int, default=500, help="with --seed-data")
+    parser.add_argument("--rentals", type=int, default=5000, help="with --seed-data")
+    parser.add_argument("--out", type=Path, help="result file (default benchmarks/results/cross_backend-<time>.json)")
+    parser.add_argument("--compare", type=Path, help="earlier result file to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p95 increase counted as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--allow-remote", action="store_true", help="accept a non-local --url")
+    args = parser.parse_args()
+
+    for name, allowed in (("backends", BACKENDS), ("workloads", WORKLOADS)):
+        unknown = set(getattr(args, name).split(",")) - set(allowed)
+        if unknown:
+            parser.error(f"unknown {name}: {', '.join(sorted(unknown))}")
+    if urlsplit(args.url).hostname not in LOCAL_HOSTS and not args.allow_remote:
+        parser.error(f"{args.url} is not local; the benchmark is meant for the local containers (--allow-remote)")
+
+    report = run(args)
+    print_results(report["results"])
+
+    out = args.out or RESULTS_DIR / f"cross_backend-{datetime.now():%Y%m%d-%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nresults written to {out}")
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text()), report, args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"p95 regressions: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Micro-benchmark: embedded inventory writes in MongoDB.
+
+Run this from the project root, for example:
+
+    python -m benchmarks.mongo_embedded_writes --items 5000 --ops 200
+
+It compares two ways of changing one element of `locations.inventory`:
+
+- save:       load the Location through MongoEngine, change the element in
+              Python and save() (what the repository used to do).
+- positional: a single update_one / find_one_and_update with $set + array
+              filters, $push or $pull (EmbeddedArray, used by the repository now).
+
+The benchmark works on a scratch collection (`bench_locations` by default)
+that is dropped afterwards, so it never touches the real locations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from mongoengine.context_managers import switch_collection
+
+from src.repositories.mongodb.connection import init_mongo
+from src.repositories.mongodb.embedded_array import EmbeddedArray
+from src.repositories.mongodb.odm_models.location_document import (
+    InventoryItemEmbedded,
+    Location,
+)
+
+STATUSES = ["AVAILABLE", "RENTED", "DAMAGED"]
+LOCATION_ID = 1
+
+
+def _seed(items: int) -> None:
+    Location._get_collection().delete_many({})
+    Location(
+        location_id=LOCATION_ID,
+        address="Benchmark Street 1",
+        city="Copenhagen",
+        inventory=[
+            InventoryItemEmbedded(inventory_item_id=i, movie_id=i % 500 + 1, format_id=1, status="AVAILABLE")
+            for i in range(1, items + 1)
+        ],
+    ).save()
+
+
+# ── legacy: load → modify → save() ───────────────────────────────────────────
+def _save_update(item_id: int) -> None:
+    loc = Location.objects(inventory__inventory_item_id=item_id).first()
+    for item in loc.inventory:
+        if item.inventory_item_id == item_id:
+            item.status = random.choice(STATUSES)
+            break
+    loc.save()
+
+
+def _save_push_pull(item_id: int) -> None:
+    loc = Location.objects(location_id=LOCATION_ID).first()
+    loc.inventory.append(InventoryItemEmbedded(inventory_item_id=item_id, movie_id=1, format_id=1, status="AVAILABLE"))
+    loc.save()
+    loc = Location.objects(inventory__inventory_item_id=item_id).first()
+    loc.inventory = [i for i in loc.inventory if i.inventory_item_id != item_id]
+    loc.save()
+
+
+# ── positional operators ─────────────────────────────────────────────────────
+def _positional_update(inventory: EmbeddedArray, item_id: int) -> None:
+    inventory.set(item_id, {"status": random.choice(STATUSES)})
+
+
+def _positional_push_pull(inventory: EmbeddedArray, item_id: int) -> None:
+    inventory.push(LOCATION_ID, InventoryItemEmbedded(inventory_item_id=item_id, movie_id=1, format_id=1, status="AVAILABLE"))
+    inventory.pull(item_id)
+
+
+def _time(fn: Callable[[int], None], ids: List[int]) -> Dict[str, float]:
+    samples = []
+    for item_id in ids:
+        start = time.perf_counter()
+        fn(item_id)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "ops_per_s": len(samples) / (sum(samples) / 1000),
+    }
+
+
+def run(items: int, ops: int, collection: str) -> None:
+    init_mongo()
+    inventory = EmbeddedArray(Location, "inventory", InventoryItemEmbedded, "inventory_item_id", "location_id")
+    update_ids = [random.randint(1, items) for _ in range(ops)]
+    new_ids = list(range(items + 1, items + ops + 1))
+
+    with switch_collection(Location, collection):
+        try:
+            _seed(items)
+            doc_kb = len(str(Location._get_collection().find_one())) / 1024
+            print(f"Location with {items} inventory items (~{doc_kb:.0f} KB), {ops} ops per case\n")
+
+            cases = [
+                ("update status", "save", lambda i: _save_update(i), update_ids),
+                ("update status", "positional", lambda i: _positional_update(inventory, i), update_ids),
+                ("push + pull", "save", lambda i: _save_push_pull(i), new_ids),
+                ("push + pull", "positional", lambda i: _positional_push_pull(inventory, i), new_ids),
+            ]
+            print(f"{'case':<15}{'strategy':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'ops/s':>10}")
+            for name, strategy, fn, ids in cases:
+                r = _time(fn, ids)
+                print(
+                    f"{name:<15}{strategy:<12}{r['mean_ms']:>10.2f}{r['p50_ms']:>10.2f}"
+                    f"{r['p95_ms']:>10.2f}{r['ops_per_s']:>10.0f}"
+                )
+        finally:
+            Location._get_collection().drop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=5000, help="inventory items in the benchmark location")
+    parser.add_argument("--ops", type=int, default=200, help="operations per case")
+    parser.add_argument("--collection", default="bench_locations", help="scratch collection (dropped afterwards)")
+    args = parser.parse_args()
+    run(args.items, args.ops, args.collection)
+
+
+if __name__ == "__main__":
+    main()
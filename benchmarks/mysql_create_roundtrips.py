@@ -0,0 +1,157 @@
+"""
+Micro-benchmark: read-back after creates in the MySQL repositories.
+
+Run this from the project root, for example:
+
+    python -m benchmarks.mysql_create_roundtrips --ops 200
+
+It compares three ways of creating a row and answering with it:
+
+- read-back: write, then SELECT the row again (what the repositories used
+             to do: get_by_id after the stored procedure, refresh after commit).
+- returning: the procedure returns the created row itself (what the
+             procedure-backed repositories do now). ORM creates still
+             refresh after commit, so for genres this equals read-back.
+- minimal:   create(..., returning=False), i.e. `Prefer: return=minimal`;
+             only the new id is returned.
+
+Besides latency it counts the SQL statements sent per create. Every row the
+benchmark creates (customers with their address, genres) is deleted again
+afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import uuid
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import delete, event
+
+from src.repositories.mysql.base_repository import BaseRepository
+from src.repositories.mysql.customer_repository import CustomerRepository
+from src.repositories.mysql.orm_models.base import engine
+from src.repositories.mysql.orm_models.customer_orm import Customer
+from src.repositories.mysql.orm_models.genre_orm import Genre
+
+_statements = 0
+
+
+def _count_statement(*_args: Any) -> None:
+    global _statements
+    _statements += 1
+
+
+def _customer(tag: str, case: int, n: int) -> Dict[str, Any]:
+    return {
+        "first_name": "Bench",
+        "last_name": f"Mark {n}",
+        "email": f"bench-{tag}-{case}-{n}@example.com",
+        "phone_number": f"+45{int(tag, 16) % 10**5:05d}{case}{n:05d}",
+        "address": "Benchmark Street 1",
+        "city": "Copenhagen",
+        "post_code": "2100",
+    }
+
+
+# ── strategies ───────────────────────────────────────────────────────────────
+def _customer_read_back(repo: CustomerRepository, data: Dict[str, Any]) -> Any:
+    created = repo.create(data, returning=False)
+    return repo.get_by_id(created["id"])
+
+
+def _customer_returning(repo: CustomerRepository, data: Dict[str, Any]) -> Any:
+    return repo.create(data)
+
+
+def _customer_minimal(repo: CustomerRepository, data: Dict[str, Any]) -> Any:
+    return repo.create(data, returning=False)
+
+
+def _genre_read_back(repo: BaseRepository, data: Dict[str, Any]) -> Any:
+    with repo._SessionLocal() as session:
+        obj = Genre(**data)
+        session.add(obj)
+        session.commit()
+        session.refresh(obj)
+        return repo._to_dict(obj)
+
+
+def _genre_returning(repo: BaseRepository, data: Dict[str, Any]) -> Any:
+    return repo.create(data)
+
+
+def _genre_minimal(repo: BaseRepository, data: Dict[str, Any]) -> Any:
+    return repo.create(data, returning=False)
+
+
+def _time(fn: Callable[[Dict[str, Any]], Any], payloads: List[Dict[str, Any]], created: List[Any]) -> Dict[str, float]:
+    global _statements
+    _statements = 0
+    samples = []
+    for data in payloads:
+        start = time.perf_counter()
+        out = fn(data)
+        samples.append((time.perf_counter() - start) * 1000)
+        created.append(out["id"])
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "stmts_per_op": _statements / len(samples),
+    }
+
+
+def run(ops: int) -> None:
+    customers = CustomerRepository()
+    genres = BaseRepository(Genre)
+    tag = uuid.uuid4().hex[:8]
+    created_customers: List[Any] = []
+    created_genres: List[Any] = []
+
+    cases = [
+        ("customer (proc)", "read-back", lambda d: _customer_read_back(customers, d), "customer"),
+        ("customer (proc)", "returning", lambda d: _customer_returning(customers, d), "customer"),
+        ("customer (proc)", "minimal", lambda d: _customer_minimal(customers, d), "customer"),
+        ("genre (ORM)", "read-back", lambda d: _genre_read_back(genres, d), "genre"),
+        ("genre (ORM)", "returning", lambda d: _genre_returning(genres, d), "genre"),
+        ("genre (ORM)", "minimal", lambda d: _genre_minimal(genres, d), "genre"),
+    ]
+
+    event.listen(engine, "before_cursor_execute", _count_statement)
+    try:
+        print(f"{ops} creates per case\n")
+        print(f"{'case':<18}{'strategy':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'stmts/op':>10}")
+        for number, (name, strategy, fn, kind) in enumerate(cases):
+            if kind == "customer":
+                payloads = [_customer(tag, number, n) for n in range(ops)]
+                r = _time(fn, payloads, created_customers)
+            else:
+                payloads = [{"name": f"bench-{tag}-{number}-{n}"} for n in range(ops)]
+                r = _time(fn, payloads, created_genres)
+            print(
+                f"{name:<18}{strategy:<12}{r['mean_ms']:>10.2f}{r['p50_ms']:>10.2f}"
+                f"{r['p95_ms']:>10.2f}{r['stmts_per_op']:>10.1f}"
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count_statement)
+        with engine.begin() as conn:
+            # address rows go with their customer (ON DELETE CASCADE)
+            if created_customers:
+                conn.execute(delete(Customer).where(Customer.customer_id.in_(created_customers)))
+            if created_genres:
+                conn.execute(delete(Genre).where(Genre.genre_id.in_(created_genres)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=200, help="creates per case")
+    args = parser.parse_args()
+    run(args.ops)
+
+
+if __name__ == "__main__":
+    main()
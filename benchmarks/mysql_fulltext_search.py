@@ -0,0 +1,139 @@
+"""
+Micro-benchmark: full-text movie search against LIKE scanning in MySQL.
+
+Run this from the project root, for example:
+
+    python -m benchmarks.mysql_fulltext_search --runs 50
+    python -m benchmarks.mysql_fulltext_search --terms godfather "star wars"
+
+It times the same searches four ways:
+
+- like:     WHERE title LIKE '%term%' OR summary LIKE '%term%'
+            (a full table scan; what filtering GET /movies amounts to).
+- like-title: the LIKE scan on the title only.
+- natural:  MovieRepository.search(mode="natural"), i.e. MATCH(title, summary)
+            AGAINST(... IN NATURAL LANGUAGE MODE), ranked (GET /movies/search).
+- boolean:  the same in boolean mode, every word required (+word).
+
+Without --terms the search words are drawn from the titles in the database
+(--seed makes the draw repeatable). Use a large catalogue to see the gap,
+e.g. after `python -m seed.synthetic --movies 100000`. Besides latency it
+prints the rows matched and the access type from EXPLAIN for each strategy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import text
+
+from src.repositories.mysql.movie_repository import MovieRepository
+from src.repositories.mysql.orm_models.base import engine
+
+LIKE_SQL = (
+    "SELECT movie_id, title FROM movie "
+    "WHERE title LIKE CONCAT('%', :q, '%') OR summary LIKE CONCAT('%', :q, '%') "
+    "ORDER BY movie_id LIMIT :limit"
+)
+LIKE_TITLE_SQL = "SELECT movie_id, title FROM movie WHERE title LIKE CONCAT('%', :q, '%') ORDER BY movie_id LIMIT :limit"
+# Skips words below innodb_ft_min_token_size (3) and most stopwords
+MIN_WORD_LENGTH = 4
+
+
+def sample_terms(count: int, seed: int) -> List[str]:
+    with engine.connect() as conn:
+        titles = [row[0] for row in conn.execute(text("SELECT title FROM movie ORDER BY movie_id LIMIT 5000"))]
+    words = sorted({w.lower() for title in titles for w in re.findall(r"[A-Za-z]+", title) if len(w) >= MIN_WORD_LENGTH})
+    if not words:
+        raise SystemExit("No movies to draw search terms from; seed the database or pass --terms")
+    return random.Random(seed).sample(words, min(count, len(words)))
+
+
+def _like(sql: str) -> Callable[[str, int], int]:
+    def run(term: str, limit: int) -> int:
+        with engine.connect() as conn:
+            return len(conn.execute(text(sql), {"q": term, "limit": limit}).all())
+    return run
+
+
+def _search(repo: MovieRepository, mode: str) -> Callable[[str, int], int]:
+    def run(term: str, limit: int) -> int:
+        if mode == "boolean":
+            term = " ".join(f"+{w}" for w in term.split())
+        items, _ = repo.search(term, mode=mode, limit=limit)
+        return len(items)
+    return run
+
+
+def _explain(strategy: str, term: str) -> str:
+    if strategy == "like":
+        sql, params = LIKE_SQL, {"q": term, "limit": 20}
+    elif strategy == "like-title":
+        sql, params = LIKE_TITLE_SQL, {"q": term, "limit": 20}
+    else:
+        modifier = "IN BOOLEAN MODE" if strategy == "boolean" else "IN NATURAL LANGUAGE MODE"
+        sql = f"SELECT movie_id FROM movie WHERE MATCH(title, summary) AGAINST(:q {modifier}) LIMIT 20"
+        params = {"q": term}
+    with engine.connect() as conn:
+        row = conn.execute(text(f"EXPLAIN {sql}"), params).mappings().first()
+    return f"{row['type']} ({row['key'] or 'no index'})" if row else "?"
+
+
+def _time(fn: Callable[[str, int], int], terms: List[str], runs: int, limit: int) -> Dict[str, float]:
+    samples = []
+    matched = 0
+    for n in range(runs):
+        term = terms[n % len(terms)]
+        start = time.perf_counter()
+        matched += fn(term, limit)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[max(int(len(samples) * 0.95) - 1, 0)],
+        "rows_per_query": matched / len(samples),
+    }
+
+
+def run(runs: int, terms: List[str], limit: int) -> None:
+    repo = MovieRepository()
+    with engine.connect() as conn:
+        movies = conn.execute(text("SELECT COUNT(*) FROM movie")).scalar()
+    strategies: List[tuple[str, Any]] = [
+        ("like", _like(LIKE_SQL)),
+        ("like-title", _like(LIKE_TITLE_SQL)),
+        ("natural", _search(repo, "natural")),
+        ("boolean", _search(repo, "boolean")),
+    ]
+
+    print(f"{movies} movies, {runs} searches per strategy, limit {limit}, terms: {', '.join(terms)}\n")
+    print(f"{'strategy':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'rows/q':>9}  access")
+    for name, fn in strategies:
+        fn(terms[0], limit)  # warm-up (buffer pool, FTS cache)
+        r = _time(fn, terms, runs, limit)
+        print(
+            f"{name:<12}{r['mean_ms']:>10.2f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+            f"{r['rows_per_query']:>9.1f}  {_explain(name, terms[0])}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=50, help="searches per strategy")
+    parser.add_argument("--terms", nargs="+", help="search terms (default: words drawn from the movie titles)")
+    parser.add_argument("--term-count", type=int, default=10, help="how many terms to draw without --terms")
+    parser.add_argument("--limit", type=int, default=20, help="page size")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    terms = args.terms or sample_terms(args.term_count, args.seed)
+    run(args.runs, terms, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -353,4 +353,21 @@ db.createCollection("rentals", {
     }
   }
 });
-// -----------------------------------------------------------------------------
\ No newline at end of file
+// -----------------------------------------------------------------------------
+// counters - integer ID sequences (no MySQL equivalent; replaces AUTO_INCREMENT)
+// _id is "<collection>.<field path>", e.g. "rentals.rentalId" or
+// "locations.inventory.inventoryItemId". seq is the last reserved ID.
+// -----------------------------------------------------------------------------
+db.createCollection("counters", {
+  validator: {
+    $jsonSchema: {
+      bsonType: "object",
+      required: ["_id","seq"],
+      properties: {
+        _id: { bsonType: "string" },
+        seq: { bsonType: ["int","long"] }
+      }
+    }
+  }
+});
+// -----------------------------------------------------------------------------
@@ -16,6 +16,15 @@ db.customers.createIndex(
   }
 );
 
+// embedded IDs; the API's ID allocator finds their max by sorting on them
+db.customers.createIndex(
+  { "address.addressId": 1 }
+);
+
+db.customers.createIndex(
+  { "membershipPlan.membershipPlanId": 1 }
+);
+
 // -----------------------------------------------------------------------------
 // promoCodes
 // -----------------------------------------------------------------------------
@@ -97,6 +106,17 @@ db.movies.createIndex(
   { genres: 1, releaseYear: -1 }
 );
 
+// full-text search (GET /movies/search); at most one text index per collection
+db.movies.createIndex(
+  { title: "text", summary: "text" },
+  { name: "movies_text", weights: { title: 3, summary: 1 } }
+);
+
+// embedded IDs; the API's ID allocator finds their max by sorting on them
+db.movies.createIndex(
+  { "reviews.reviewId": 1 }
+);
+
 // -----------------------------------------------------------------------------
 // locations
 // -----------------------------------------------------------------------------
@@ -113,6 +133,15 @@ db.locations.createIndex(
   { "employees.email": 1 }
 );
 
+// embedded IDs; the API's ID allocator finds their max by sorting on them
+db.locations.createIndex(
+  { "inventory.inventoryItemId": 1 }
+);
+
+db.locations.createIndex(
+  { "employees.employeeId": 1 }
+);
+
 // -----------------------------------------------------------------------------
 // rentals
 // -----------------------------------------------------------------------------
@@ -136,4 +165,9 @@ db.rentals.createIndex(
 db.rentals.createIndex(
   { locationId: 1, status: 1, rentedAtDatetime: -1 }
 );
+
+// embedded IDs; the API's ID allocator finds their max by sorting on them
+db.rentals.createIndex(
+  { "payments.paymentId": 1 }
+);
 // -----------------------------------------------------------------------------
\ No newline at end of file
@@ -54,7 +54,17 @@ BEGIN
 
     COMMIT;
 
-    SELECT v_customer_id AS new_customer_id;
+    -- Return the created row so callers need no read-back
+    SELECT
+        customer_id AS new_customer_id,
+        customer_id,
+        first_name,
+        last_name,
+        email,
+        phone_number,
+        created_at
+    FROM customer
+    WHERE customer_id = v_customer_id;
 END$$
 
 DELIMITER ;
@@ -157,7 +167,20 @@ BEGIN
 
     COMMIT;
 
-    SELECT v_rental_id AS new_rental_id;
+    -- Return the created row so callers need no read-back
+    SELECT
+        rental_id AS new_rental_id,
+        rental_id,
+        rented_at_datetime,
+        returned_at_datetime,
+        due_at_datetime,
+        reserved_at_datetime,
+        status,
+        customer_id,
+        promo_code_id,
+        employee_id
+    FROM rental
+    WHERE rental_id = v_rental_id;
 END$$
 
 DELIMITER ;
@@ -229,7 +252,20 @@ BEGIN
 
     COMMIT;
 
-    SELECT v_rental_id AS new_reservation_id;
+    -- Return the created row so callers need no read-back
+    SELECT
+        rental_id AS new_reservation_id,
+        rental_id,
+        rented_at_datetime,
+        returned_at_datetime,
+        due_at_datetime,
+        reserved_at_datetime,
+        status,
+        customer_id,
+        promo_code_id,
+        employee_id
+    FROM rental
+    WHERE rental_id = v_rental_id;
 END$$
 
 DELIMITER ;
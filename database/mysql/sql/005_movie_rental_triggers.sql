@@ -14,16 +14,19 @@ BEGIN
     DECLARE v_rental_count INT;
     DECLARE v_membership_id INT;
 
-    SET v_rental_count = get_customer_rental_count(NEW.customer_id);
+    -- Bulk loads (seed/synthetic.py) set @bulk_load and assign tiers themselves
+    IF @bulk_load IS NULL THEN
+        SET v_rental_count = get_customer_rental_count(NEW.customer_id);
 
-    IF v_rental_count >= 200 THEN
-        SELECT membership_id INTO v_membership_id FROM membership WHERE membership = 'GOLD';
-    ELSEIF v_rental_count >= 50 THEN
-        SELECT membership_id INTO v_membership_id FROM membership WHERE membership = 'SILVER';
-    END IF;
+        IF v_rental_count >= 200 THEN
+            SELECT membership_id INTO v_membership_id FROM membership WHERE membership = 'GOLD';
+        ELSEIF v_rental_count >= 50 THEN
+            SELECT membership_id INTO v_membership_id FROM membership WHERE membership = 'SILVER';
+        END IF;
 
-    IF v_membership_id IS NOT NULL THEN
-        UPDATE membership_plan SET membership_id = v_membership_id WHERE customer_id = NEW.customer_id;
+        IF v_membership_id IS NOT NULL THEN
+            UPDATE membership_plan SET membership_id = v_membership_id WHERE customer_id = NEW.customer_id;
+        END IF;
     END IF;
 END$$
 
@@ -35,21 +38,24 @@ CREATE TRIGGER trg_rental_insert_audit
 AFTER INSERT ON rental
 FOR EACH ROW
 BEGIN
-    INSERT INTO rental_status_audit (
-        rental_id, action,
-        old_status, new_status,
-        old_rented_at_datetime, new_rented_at_datetime,
-        old_due_at_datetime, new_due_at_datetime,
-        old_returned_at_datetime, new_returned_at_datetime,
-        changed_by
-    ) VALUES (
-        NEW.rental_id, 'INSERT',
-        NULL, NEW.status,
-        NULL, NEW.rented_at_datetime,
-        NULL, NEW.due_at_datetime,
-        NULL, NEW.returned_at_datetime,
-        COALESCE(@app_user, CURRENT_USER())
-    );
+    -- Generated history loaded in bulk (@bulk_load) is not audited row by row
+    IF @bulk_load IS NULL THEN
+        INSERT INTO rental_status_audit (
+            rental_id, action,
+            old_status, new_status,
+            old_rented_at_datetime, new_rented_at_datetime,
+            old_due_at_datetime, new_due_at_datetime,
+            old_returned_at_datetime, new_returned_at_datetime,
+            changed_by
+        ) VALUES (
+            NEW.rental_id, 'INSERT',
+            NULL, NEW.status,
+            NULL, NEW.rented_at_datetime,
+            NULL, NEW.due_at_datetime,
+            NULL, NEW.returned_at_datetime,
+            COALESCE(@app_user, CURRENT_USER())
+        );
+    END IF;
 END$$
 
 DROP TRIGGER IF EXISTS trg_rental_update_audit$$
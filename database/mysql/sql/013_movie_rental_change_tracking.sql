@@ -0,0 +1,274 @@
+USE movie_rental;
+
+-- -----------------------------------------------------
+-- Change tracking for the incremental MySQL -> MongoDB / Neo4j sync
+-- (migrations/incremental_sync.py)
+-- -----------------------------------------------------
+-- Sources read by the sync:
+--   updated_at watermarks  (tables below, maintained by MySQL)
+--   sync_tombstone         (deletes from the tables below)
+-- rental_status_audit / payment_audit (011) only log status, date and
+-- amount changes, so rentals and payments are followed through updated_at
+-- like every other table.
+-- The sync re-reads current rows for every key it sees, so applying the
+-- same change twice is harmless.
+-- -----------------------------------------------------
+
+-- -----------------------------------------------------
+-- updated_at watermarks
+-- -----------------------------------------------------
+ALTER TABLE customer
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_customer_updated_at (updated_at, customer_id);
+ALTER TABLE address
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_address_updated_at (updated_at, address_id);
+ALTER TABLE membership
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_membership_updated_at (updated_at, membership_id);
+ALTER TABLE membership_plan
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_membership_plan_updated_at (updated_at, membership_plan_id);
+ALTER TABLE movie
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_movie_updated_at (updated_at, movie_id);
+ALTER TABLE review
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_review_updated_at (updated_at, review_id);
+ALTER TABLE genre
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_genre_updated_at (updated_at, genre_id);
+ALTER TABLE movie_genre
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_movie_genre_updated_at (updated_at, movie_genre_id);
+ALTER TABLE format
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_format_updated_at (updated_at, format_id);
+ALTER TABLE location
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_location_updated_at (updated_at, location_id);
+ALTER TABLE inventory_item
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_inventory_item_updated_at (updated_at, inventory_item_id);
+ALTER TABLE employee
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_employee_updated_at (updated_at, employee_id);
+ALTER TABLE fee
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_fee_updated_at (updated_at, fee_id);
+ALTER TABLE promo_code
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_promo_code_updated_at (updated_at, promo_code_id);
+ALTER TABLE rental
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_rental_updated_at (updated_at, rental_id);
+ALTER TABLE payment
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_payment_updated_at (updated_at, payment_id);
+-- rental_item / rental_fee are embedded in the MongoDB rental documents
+-- (and drive HAS_ITEM in Neo4j): a change re-syncs the owning rental
+ALTER TABLE rental_item
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_rental_item_updated_at (updated_at, rental_item_id);
+ALTER TABLE rental_fee
+  ADD COLUMN updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  ADD INDEX idx_rental_fee_updated_at (updated_at, rental_fee_id);
+
+-- -----------------------------------------------------
+-- Deleted rows (row_id = primary key, parent_id = owning row for
+-- rows that are embedded in another document in MongoDB)
+-- -----------------------------------------------------
+DROP TABLE IF EXISTS sync_tombstone;
+CREATE TABLE sync_tombstone (
+  tombstone_id BIGINT NOT NULL AUTO_INCREMENT,
+  table_name VARCHAR(64) NOT NULL,
+  row_id INT NOT NULL,
+  parent_id INT NULL,
+  deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (tombstone_id),
+  INDEX idx_sync_tombstone_deleted_at (deleted_at)
+);
+
+-- -----------------------------------------------------
+-- Sync positions, one per (target, source)
+-- -----------------------------------------------------
+DROP TABLE IF EXISTS sync_checkpoint;
+CREATE TABLE sync_checkpoint (
+  target VARCHAR(32) NOT NULL,
+  source VARCHAR(64) NOT NULL,
+  -- "<last id>|<unseen ids below it>" for sync_tombstone, "<updated_at>|<pk>" for watermarks
+  position VARCHAR(8192) NOT NULL,
+  updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (target, source)
+);
+
+-- -----------------------------------------------------
+-- Tombstone triggers
+-- -----------------------------------------------------
+DELIMITER $$
+
+DROP TRIGGER IF EXISTS trg_customer_delete_tombstone$$
+CREATE TRIGGER trg_customer_delete_tombstone
+AFTER DELETE ON customer
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('customer', OLD.customer_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_address_delete_tombstone$$
+CREATE TRIGGER trg_address_delete_tombstone
+AFTER DELETE ON address
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('address', OLD.address_id, OLD.customer_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_membership_delete_tombstone$$
+CREATE TRIGGER trg_membership_delete_tombstone
+AFTER DELETE ON membership
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('membership', OLD.membership_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_membership_plan_delete_tombstone$$
+CREATE TRIGGER trg_membership_plan_delete_tombstone
+AFTER DELETE ON membership_plan
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('membership_plan', OLD.membership_plan_id, OLD.customer_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_movie_delete_tombstone$$
+CREATE TRIGGER trg_movie_delete_tombstone
+AFTER DELETE ON movie
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('movie', OLD.movie_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_review_delete_tombstone$$
+CREATE TRIGGER trg_review_delete_tombstone
+AFTER DELETE ON review
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('review', OLD.review_id, OLD.movie_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_genre_delete_tombstone$$
+CREATE TRIGGER trg_genre_delete_tombstone
+AFTER DELETE ON genre
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('genre', OLD.genre_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_movie_genre_delete_tombstone$$
+CREATE TRIGGER trg_movie_genre_delete_tombstone
+AFTER DELETE ON movie_genre
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('movie_genre', OLD.movie_genre_id, OLD.movie_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_format_delete_tombstone$$
+CREATE TRIGGER trg_format_delete_tombstone
+AFTER DELETE ON format
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('format', OLD.format_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_location_delete_tombstone$$
+CREATE TRIGGER trg_location_delete_tombstone
+AFTER DELETE ON location
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('location', OLD.location_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_inventory_item_delete_tombstone$$
+CREATE TRIGGER trg_inventory_item_delete_tombstone
+AFTER DELETE ON inventory_item
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('inventory_item', OLD.inventory_item_id, OLD.location_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_employee_delete_tombstone$$
+CREATE TRIGGER trg_employee_delete_tombstone
+AFTER DELETE ON employee
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('employee', OLD.employee_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_fee_delete_tombstone$$
+CREATE TRIGGER trg_fee_delete_tombstone
+AFTER DELETE ON fee
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('fee', OLD.fee_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_promo_code_delete_tombstone$$
+CREATE TRIGGER trg_promo_code_delete_tombstone
+AFTER DELETE ON promo_code
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('promo_code', OLD.promo_code_id, NULL);
+END$$
+
+DROP TRIGGER IF EXISTS trg_rental_delete_tombstone$$
+CREATE TRIGGER trg_rental_delete_tombstone
+AFTER DELETE ON rental
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('rental', OLD.rental_id, OLD.customer_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_payment_delete_tombstone$$
+CREATE TRIGGER trg_payment_delete_tombstone
+AFTER DELETE ON payment
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('payment', OLD.payment_id, OLD.rental_id);
+END$$
+
+-- Not fired for rows removed by ON DELETE CASCADE from rental; the rental's
+-- own tombstone covers those
+DROP TRIGGER IF EXISTS trg_rental_item_delete_tombstone$$
+CREATE TRIGGER trg_rental_item_delete_tombstone
+AFTER DELETE ON rental_item
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('rental_item', OLD.rental_item_id, OLD.rental_id);
+END$$
+
+DROP TRIGGER IF EXISTS trg_rental_fee_delete_tombstone$$
+CREATE TRIGGER trg_rental_fee_delete_tombstone
+AFTER DELETE ON rental_fee
+FOR EACH ROW
+BEGIN
+    INSERT INTO sync_tombstone (table_name, row_id, parent_id)
+    VALUES ('rental_fee', OLD.rental_fee_id, OLD.rental_id);
+END$$
+
+DELIMITER ;
@@ -0,0 +1,185 @@
+USE movie_rental;
+
+-- -----------------------------------------------------
+-- Batch checkout: many carts in one call / one transaction
+-- (RentalRepository.create_rentals_batch, POST /mysql/rentals/batch)
+-- -----------------------------------------------------
+-- p_carts is a JSON array of carts:
+--   [{"customer_id": 1, "employee_id": 2, "promo_code_id": null,
+--     "inventory_item_ids": [10, 11]}, ...]
+-- All carts are checked together; if any item is unknown, not available or
+-- in more than one cart, nothing is written. The created rentals are
+-- returned as the result set (one row per cart, in cart order), so callers
+-- need no read-back.
+-- -----------------------------------------------------
+
+DELIMITER $$
+
+DROP PROCEDURE IF EXISTS create_rentals_batch$$
+CREATE PROCEDURE create_rentals_batch (
+    IN p_carts JSON
+)
+BEGIN
+    DECLARE v_now          DATETIME;
+    DECLARE v_due          DATETIME;
+    DECLARE v_cart_count   INT;
+    DECLARE v_item_count   INT;
+    DECLARE v_i            INT DEFAULT 0;
+    DECLARE v_bad_items    TEXT;
+    DECLARE v_message      VARCHAR(128);
+
+    -- Any SQL error (including SIGNAL) will rollback the transaction
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        DROP TEMPORARY TABLE IF EXISTS tmp_batch_cart_item;
+        DROP TEMPORARY TABLE IF EXISTS tmp_batch_cart;
+        RESIGNAL;
+    END;
+
+    DROP TEMPORARY TABLE IF EXISTS tmp_batch_cart_item;
+    DROP TEMPORARY TABLE IF EXISTS tmp_batch_cart;
+
+    CREATE TEMPORARY TABLE tmp_batch_cart (
+        cart_index    INT NOT NULL,
+        customer_id   INT NULL,
+        employee_id   INT NULL,
+        promo_code_id INT NULL,
+        rental_id     INT NULL,
+        PRIMARY KEY (cart_index)
+    );
+
+    CREATE TEMPORARY TABLE tmp_batch_cart_item (
+        cart_index        INT NOT NULL,
+        inventory_item_id INT NOT NULL,
+        INDEX (inventory_item_id),
+        INDEX (cart_index)
+    );
+
+    START TRANSACTION;
+
+    -- 1) Unpack every cart and item with one JSON_TABLE pass each
+    INSERT INTO tmp_batch_cart (cart_index, customer_id, employee_id, promo_code_id)
+    SELECT j.ord - 1, j.customer_id, j.employee_id, j.promo_code_id
+    FROM JSON_TABLE(p_carts, '$[*]' COLUMNS(
+        ord           FOR ORDINALITY,
+        customer_id   INT PATH '$.customer_id',
+        employee_id   INT PATH '$.employee_id',
+        promo_code_id INT PATH '$.promo_code_id'
+    )) j;
+
+    INSERT INTO tmp_batch_cart_item (cart_index, inventory_item_id)
+    SELECT j.ord - 1, j.item_id
+    FROM JSON_TABLE(p_carts, '$[*]' COLUMNS(
+        ord FOR ORDINALITY,
+        NESTED PATH '$.inventory_item_ids[*]' COLUMNS(item_id INT PATH '$')
+    )) j
+    WHERE j.item_id IS NOT NULL;
+
+    SELECT COUNT(*) INTO v_cart_count FROM tmp_batch_cart;
+    SELECT COUNT(*) INTO v_item_count FROM tmp_batch_cart_item;
+
+    IF v_cart_count = 0 THEN
+        SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'No carts given.';
+    END IF;
+
+    -- 2) Set-based availability check across all carts
+    SELECT GROUP_CONCAT(d.inventory_item_id ORDER BY d.inventory_item_id) INTO v_bad_items
+    FROM (
+        SELECT inventory_item_id
+        FROM tmp_batch_cart_item
+        GROUP BY inventory_item_id
+        HAVING COUNT(*) > 1
+    ) d;
+
+    IF v_bad_items IS NOT NULL THEN
+        SET v_message = LEFT(CONCAT('Inventory items in more than one cart: ', v_bad_items), 128);
+        SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = v_message;
+    END IF;
+
+    SELECT GROUP_CONCAT(t.inventory_item_id ORDER BY t.inventory_item_id) INTO v_bad_items
+    FROM tmp_batch_cart_item t
+    LEFT JOIN inventory_item i
+        ON i.inventory_item_id = t.inventory_item_id
+       AND i.status = 1 -- TRUE
+    WHERE i.inventory_item_id IS NULL;
+
+    IF v_bad_items IS NOT NULL THEN
+        SET v_message = LEFT(CONCAT('Inventory items not available for rental: ', v_bad_items), 128);
+        SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = v_message;
+    END IF;
+
+    -- 3) Writes
+    SET v_now = NOW();
+    SET v_due = DATE_ADD(v_now, INTERVAL 7 DAY); -- standard 7 days
+
+    -- Claim the items first; the status = 1 guard catches items taken by a
+    -- concurrent checkout since the check above
+    UPDATE inventory_item i
+    JOIN tmp_batch_cart_item t ON t.inventory_item_id = i.inventory_item_id
+    SET i.status = 0
+    WHERE i.status = 1;
+
+    IF ROW_COUNT() <> v_item_count THEN
+        SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'One or more inventory items are not available for rental.';
+    END IF;
+
+    -- One INSERT per cart: LAST_INSERT_ID() is only reliable per statement,
+    -- and the ids are needed to link the items
+    WHILE v_i < v_cart_count DO
+        INSERT INTO rental (
+            rented_at_datetime,
+            due_at_datetime,
+            status,
+            customer_id,
+            employee_id,
+            promo_code_id
+        )
+        SELECT v_now, v_due, 'OPEN', customer_id, employee_id, promo_code_id
+        FROM tmp_batch_cart
+        WHERE cart_index = v_i;
+
+        UPDATE tmp_batch_cart
+        SET rental_id = LAST_INSERT_ID()
+        WHERE cart_index = v_i;
+
+        SET v_i = v_i + 1;
+    END WHILE;
+
+    INSERT INTO rental_item (rental_id, inventory_item_id)
+    SELECT c.rental_id, t.inventory_item_id
+    FROM tmp_batch_cart_item t
+    JOIN tmp_batch_cart c ON c.cart_index = t.cart_index;
+
+    COMMIT;
+
+    -- 4) Created rows, one per cart
+    SELECT
+        c.cart_index,
+        r.rental_id,
+        r.rented_at_datetime,
+        r.returned_at_datetime,
+        r.due_at_datetime,
+        r.reserved_at_datetime,
+        r.status,
+        r.customer_id,
+        r.promo_code_id,
+        r.employee_id,
+        (
+            SELECT JSON_ARRAYAGG(t.inventory_item_id)
+            FROM tmp_batch_cart_item t
+            WHERE t.cart_index = c.cart_index
+        ) AS inventory_item_ids
+    FROM tmp_batch_cart c
+    JOIN rental r ON r.rental_id = c.rental_id
+    ORDER BY c.cart_index;
+
+    DROP TEMPORARY TABLE IF EXISTS tmp_batch_cart_item;
+    DROP TEMPORARY TABLE IF EXISTS tmp_batch_cart;
+END$$
+
+DELIMITER ;
@@ -16,6 +16,9 @@ CREATE CONSTRAINT fee_id_unique IF NOT EXISTS FOR (f:Fee) REQUIRE f.feeId IS UNI
 CREATE CONSTRAINT promo_code_id_unique IF NOT EXISTS FOR (pc:PromoCode) REQUIRE pc.promoCodeId IS UNIQUE;
 CREATE CONSTRAINT review_id_unique IF NOT EXISTS FOR (rv:Review) REQUIRE rv.reviewId IS UNIQUE;
 
+// Full-text search over movies (GET /api/v1/neo4j/movies/search)
+CREATE FULLTEXT INDEX movie_fulltext IF NOT EXISTS FOR (m:Movie) ON EACH [m.title, m.summary];
+
 CREATE
   (mtype:Membership {membershipId: "", membership: ""})<-[:IS_MEMBERSHIP_TYPE]-
   (mp:MembershipPlan {membershipPlanId: "", monthlyCost: "", startsOn: "", endsOn: ""})-[:HAS_MEMBERSHIP]->
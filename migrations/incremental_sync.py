@@ -0,0 +1,477 @@
+"""
+Incremental MySQL → MongoDB / Neo4j sync (change data capture).
+
+Run this from the project root, for example:
+
+    python -m migrations.incremental_sync                 # follow changes forever
+    python -m migrations.incremental_sync --once          # drain pending changes and exit
+    python -m migrations.incremental_sync --targets mongodb --from-now
+
+Instead of dropping and reloading everything like the full migrations, it
+tails MySQL change feeds and applies only the touched rows:
+
+- updated_at watermarks on every synced table (013)
+- sync_tombstone, filled by the delete triggers in 013
+
+Rental items, rental fees and payments are embedded in the MongoDB rental
+documents (and rental items are the Neo4j HAS_ITEM edges), so a change to
+one of them re-syncs the owning rental.
+
+A change only says *which* row changed. The sync re-reads the current state
+of the owning document / node from MySQL (building it exactly like the full
+migrations do) and upserts or deletes it, so applying a change twice is
+harmless. Changes are applied in batches; the position of every
+(target, source) pair is checkpointed in `sync_checkpoint`, so a restarted
+sync resumes where it stopped. Without a checkpoint a source is read from
+the beginning (full catch-up) unless --from-now is given.
+
+Rows are only picked up once they are SYNC_SAFETY_LAG_SECONDS old, which
+gives transactions that were still open when a newer row became visible
+time to commit before the position moves past them. The tombstone feed
+also remembers the ids it skipped over (a transaction that took an id and
+had not committed yet, or rolled back) and looks for them again on every
+pass while they are within SYNC_GAP_WINDOW ids of the position. With the
+default poll interval the MongoDB and Neo4j views stay a few seconds behind
+MySQL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from pymongo import DeleteMany, ReplaceOne
+from sqlalchemy import bindparam, text
+
+from src.repositories.mysql.orm_models.base import SessionLocal
+
+SYNC_INTERVAL = float(os.getenv("SYNC_INTERVAL_SECONDS", "1"))
+SYNC_LAG = int(os.getenv("SYNC_SAFETY_LAG_SECONDS", "2"))
+SYNC_BATCH = int(os.getenv("SYNC_BATCH_SIZE", "500"))
+# Skipped ids of an append-only feed are re-read until the position is this far past them
+SYNC_GAP_WINDOW = int(os.getenv("SYNC_GAP_WINDOW", "1000"))
+
+
+class Change(NamedTuple):
+    kind: str                 # MySQL table of the changed row
+    id: Optional[int]         # its primary key
+    parent_id: Optional[int]  # owning row (e.g. address → customer) when tracked
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Change sources
+# ─────────────────────────────────────────────────────────────────────────────
+
+class AuditSource:
+    """Tail an append-only table by its auto-increment id (tombstones).
+
+    Auto-increment ids are handed out when a row is inserted but become
+    visible in commit order, so a reader can see id 12 before id 11 has
+    committed. The position is "<last id>|<ids below it not seen yet>": the
+    missing ids are looked up again on every pass until they show up or the
+    position is more than `gap_window` ids past them (rolled-back inserts
+    leave gaps that never fill).
+    """
+
+    MAX_GAPS = 500  # keeps the checkpoint within sync_checkpoint.position
+
+    def __init__(self, name: str, table: str, seq: str, ts: str, kind: str, key: str, parent: str = "NULL",
+                 gap_window: int = SYNC_GAP_WINDOW):
+        self.name = name
+        self.table = table
+        self.seq = seq
+        self.kind = kind
+        self.gap_window = gap_window
+        columns = f"SELECT {seq} AS seq, {kind} AS kind, {key} AS id, {parent} AS parent_id FROM {table} "
+        self.sql = text(
+            columns + f"WHERE {seq} > :after AND {ts} <= NOW() - INTERVAL :lag SECOND "
+            f"ORDER BY {seq} LIMIT :limit"
+        )
+        self.gaps_sql = text(columns + f"WHERE {seq} IN :gaps ORDER BY {seq}").bindparams(
+            bindparam("gaps", expanding=True)
+        )
+
+    def head(self, session) -> str:
+        return str(session.execute(text(f"SELECT COALESCE(MAX({self.seq}), 0) FROM {self.table}")).scalar())
+
+    def read(self, session, position: Optional[str], limit: int, lag: int) -> Tuple[List[Change], Optional[str]]:
+        last_raw, _, gaps_raw = (position or "0").partition("|")
+        last = int(last_raw)
+        gaps = {int(g) for g in gaps_raw.split(",") if g}
+
+        late = session.execute(self.gaps_sql, {"gaps": sorted(gaps)}).fetchall() if gaps else []
+        rows = session.execute(self.sql, {"after": last, "lag": lag, "limit": limit}).fetchall()
+        if not rows and not late:
+            return [], position
+
+        gaps -= {r.seq for r in late}
+        seen = last
+        for r in rows:
+            gaps.update(range(max(seen + 1, r.seq - self.gap_window), r.seq))
+            seen = r.seq
+        gaps = sorted(g for g in gaps if g > seen - self.gap_window)[-self.MAX_GAPS:]
+        new_position = str(seen) + ("|" + ",".join(map(str, gaps)) if gaps else "")
+        return [Change(r.kind, r.id, r.parent_id) for r in [*late, *rows]], new_position
+
+
+class WatermarkSource:
+    """Follow a table through its `updated_at` column, keyset-ordered by (updated_at, pk)."""
+
+    START = "1970-01-01 00:00:01|0"
+
+    def __init__(self, table: str, pk: str, parent: Optional[str] = None):
+        self.name = f"{table}.updated_at"
+        self.table = table
+        self.sql = text(
+            f"SELECT {pk} AS id, {parent or 'NULL'} AS parent_id, updated_at "
+            f"FROM {table} "
+            f"WHERE updated_at >= :ts AND (updated_at > :ts OR {pk} > :id) "
+            f"AND updated_at <= NOW() - INTERVAL :lag SECOND "
+            f"ORDER BY updated_at, {pk} LIMIT :limit"
+        )
+
+    def head(self, session) -> str:
+        return f"{session.execute(text('SELECT NOW()')).scalar():%Y-%m-%d %H:%M:%S}|0"
+
+    def read(self, session, position: Optional[str], limit: int, lag: int) -> Tuple[List[Change], Optional[str]]:
+        ts, _, last_id = (position or self.START).partition("|")
+        params = {"ts": datetime.fromisoformat(ts), "id": int(last_id), "lag": lag, "limit": limit}
+        rows = session.execute(self.sql, params).fetchall()
+        if not rows:
+            return [], position
+        last = rows[-1]
+        return [Change(self.table, r.id, r.parent_id) for r in rows], f"{last.updated_at:%Y-%m-%d %H:%M:%S}|{last.id}"
+
+
+SOURCES = [
+    AuditSource("sync_tombstone", "sync_tombstone", "tombstone_id", "deleted_at", "table_name", "row_id", "parent_id"),
+    WatermarkSource("customer", "customer_id"),
+    WatermarkSource("address", "address_id", "customer_id"),
+    WatermarkSource("membership", "membership_id"),
+    WatermarkSource("membership_plan", "membership_plan_id", "customer_id"),
+    WatermarkSource("movie", "movie_id"),
+    WatermarkSource("review", "review_id", "movie_id"),
+    WatermarkSource("genre", "genre_id"),
+    WatermarkSource("movie_genre", "movie_genre_id", "movie_id"),
+    WatermarkSource("format", "format_id"),
+    WatermarkSource("location", "location_id"),
+    WatermarkSource("inventory_item", "inventory_item_id", "location_id"),
+    WatermarkSource("employee", "employee_id"),
+    WatermarkSource("fee", "fee_id"),
+    WatermarkSource("promo_code", "promo_code_id"),
+    WatermarkSource("rental", "rental_id"),
+    WatermarkSource("payment", "payment_id", "rental_id"),
+    WatermarkSource("rental_item", "rental_item_id", "rental_id"),
+    WatermarkSource("rental_fee", "rental_fee_id", "rental_id"),
+]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Checkpoints
+# ─────────────────────────────────────────────────────────────────────────────
+
+def load_checkpoint(session, target: str, source: str) -> Optional[str]:
+    return session.execute(
+        text("SELECT position FROM sync_checkpoint WHERE target = :t AND source = :s"),
+        {"t": target, "s": source},
+    ).scalar()
+
+
+def save_checkpoint(session, target: str, source: str, position: str) -> None:
+    session.execute(
+        text(
+            "INSERT INTO sync_checkpoint (target, source, position) VALUES (:t, :s, :p) "
+            "ON DUPLICATE KEY UPDATE position = VALUES(position)"
+        ),
+        {"t": target, "s": source, "p": position},
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Targets
+# ─────────────────────────────────────────────────────────────────────────────
+
+class MongoTarget:
+    """Rebuild the touched MongoDB documents with the full migration's builders."""
+
+    name = "mongodb"
+
+    # changed table -> (collection, use the row's own id or its parent id)
+    ROUTES = {
+        "customer": ("customers", "id"),
+        "address": ("customers", "parent"),
+        "membership_plan": ("customers", "parent"),
+        "movie": ("movies", "id"),
+        "review": ("movies", "parent"),
+        "movie_genre": ("movies", "parent"),
+        "location": ("locations", "id"),
+        "inventory_item": ("locations", "parent"),
+        "rental": ("rentals", "id"),
+        "payment": ("rentals", "parent"),
+        "rental_item": ("rentals", "parent"),
+        "rental_fee": ("rentals", "parent"),
+        "genre": ("genres", "id"),
+        "format": ("formats", "id"),
+        "fee": ("feeTypes", "id"),
+        "promo_code": ("promoCodes", "id"),
+        "membership": ("membershipTypes", "id"),
+    }
+
+    def __init__(self):
+        from migrations import migrate_sql_to_mongo as m
+        from src.repositories.mongodb.odm_models.rental_document import Rental as MongoRental
+
+        m.init_mongo()
+
+        def lookup(build: Callable[[Any], Any]) -> Callable[[Any, List[Any]], List[Any]]:
+            return lambda session, rows: [build(r) for r in rows]
+
+        # collection -> (document class, id attribute, SQL model, SQL pk column, builder)
+        self.collections = {
+            # A customer without an address is skipped (and reported) instead of failing the batch
+            "customers": (
+                m.MongoCustomer, "customer_id", m.SqlCustomer, m.SqlCustomer.customer_id,
+                lambda session, rows: m.build_customer_docs(session, rows, strict=False),
+            ),
+            "movies": (m.MongoMovie, "movie_id", m.SqlMovie, m.SqlMovie.movie_id, m.build_movie_docs),
+            "locations": (m.MongoLocation, "location_id", m.SqlLocation, m.SqlLocation.location_id, m.build_location_docs),
+            "rentals": (MongoRental, "rental_id", m.SqlRental, m.SqlRental.rental_id, m.build_rental_docs),
+            "genres": (m.MongoGenre, "genre_id", m.SqlGenre, m.SqlGenre.genre_id, lookup(m.genre_doc)),
+            "formats": (m.MongoFormat, "format_id", m.SqlFormat, m.SqlFormat.format_id, lookup(m.format_doc)),
+            "feeTypes": (m.MongoFeeType, "fee_id", m.SqlFee, m.SqlFee.fee_id, lookup(m.fee_type_doc)),
+            "promoCodes": (m.MongoPromoCode, "promo_code_id", m.SqlPromoCode, m.SqlPromoCode.promo_code_id, lookup(m.promo_code_doc)),
+            "membershipTypes": (m.MongoMembershipType, "membership_id", m.SqlMembership, m.SqlMembership.membership_id, lookup(m.membership_type_doc)),
+        }
+
+    def apply(self, session, changes: List[Change]) -> int:
+        targets: Dict[str, Set[int]] = defaultdict(set)
+        all_locations = False
+        for c in changes:
+            if c.kind == "employee":
+                # every location embeds the full employee list
+                all_locations = True
+                continue
+            route = self.ROUTES.get(c.kind)
+            if route is None:
+                continue
+            collection, which = route
+            key = c.id if which == "id" else c.parent_id
+            if key is not None:
+                targets[collection].add(key)
+
+        # genre names are denormalized into movies
+        if targets.get("genres"):
+            rows = session.execute(
+                text("SELECT DISTINCT movie_id FROM movie_genre WHERE genre_id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"ids": sorted(targets["genres"])},
+            )
+            targets["movies"].update(r.movie_id for r in rows)
+        # membership names are denormalized into customers' plans
+        if targets.get("membershipTypes"):
+            rows = session.execute(
+                text("SELECT DISTINCT customer_id FROM membership_plan WHERE membership_id IN :ids").bindparams(
+                    bindparam("ids", expanding=True)
+                ),
+                {"ids": sorted(targets["membershipTypes"])},
+            )
+            targets["customers"].update(r.customer_id for r in rows)
+        if all_locations:
+            targets["locations"].update(r[0] for r in session.execute(text("SELECT location_id FROM location")))
+
+        touched = 0
+        for collection, ids in targets.items():
+            touched += self._rebuild(session, collection, sorted(ids))
+        return touched
+
+    def _rebuild(self, session, collection: str, ids: List[int]) -> int:
+        document_cls, id_attr, sql_model, pk, build = self.collections[collection]
+        id_field = document_cls._fields[id_attr].db_field
+        touched = 0
+        for start in range(0, len(ids), SYNC_BATCH):
+            chunk = ids[start:start + SYNC_BATCH]
+            rows = session.query(sql_model).filter(pk.in_(chunk)).all()
+            docs = build(session, rows)
+            found = {getattr(r, pk.key) for r in rows}
+            skipped = found - {getattr(d, id_attr) for d in docs}
+            if skipped:
+                # Left as they are in MongoDB; a later change to them syncs them again
+                print(f"[{self.name}] {collection}: skipped rows that cannot be built: {sorted(skipped)}")
+            ops: List[Any] = []
+            for doc in docs:
+                doc.validate()
+                son = doc.to_mongo()
+                ops.append(ReplaceOne({id_field: son[id_field]}, son, upsert=True))
+            missing = set(chunk) - found
+            if missing:
+                ops.append(DeleteMany({id_field: {"$in": sorted(missing)}}))
+            if ops:
+                document_cls._get_collection().bulk_write(ops, ordered=False)
+            touched += len(chunk)
+        session.expunge_all()
+        return touched
+
+
+class Neo4jTarget:
+    """Re-upsert the touched nodes and re-wire the edges they own with UNWIND statements."""
+
+    name = "neo4j"
+
+    # changed table -> (NodeSpec entity, use the row's own id or its parent id)
+    ROUTES = {
+        "customer": ("customers", "id"),
+        "address": ("addresses", "id"),
+        "membership": ("memberships", "id"),
+        "membership_plan": ("membership plans", "id"),
+        "movie": ("movies", "id"),
+        "movie_genre": ("movies", "parent"),
+        "genre": ("genres", "id"),
+        "format": ("formats", "id"),
+        "location": ("locations", "id"),
+        "inventory_item": ("inventory items", "id"),
+        "employee": ("employees", "id"),
+        "fee": ("fees", "id"),
+        "promo_code": ("promo codes", "id"),
+        "rental": ("rentals", "id"),
+        "rental_item": ("rentals", "parent"),  # HAS_ITEM edges are owned by the rental
+        "payment": ("payments", "id"),
+    }
+
+    def __init__(self):
+        from migrations import migrate_sql_to_neo4j as n
+
+        self.n = n
+        self.nodes = {spec.entity: spec for spec in n.NODES}
+        # Join-table edges belong to the entity whose id the join rows are fetched by
+        join_owner = {n.fetch_all_rental_items: "rentals", n.fetch_all_movie_genres: "movies"}
+        self.owned: Dict[str, List[Any]] = defaultdict(list)
+        for rel in n.RELATIONSHIPS:
+            owner = join_owner.get(rel.fetch) or next(
+                (spec.entity for spec in n.NODES if spec.fetch is rel.fetch), None
+            )
+            if owner:
+                self.owned[owner].append(rel)
+
+    def apply(self, session, changes: List[Change]) -> int:
+        targets: Dict[str, Set[int]] = defaultdict(set)
+        for c in changes:
+            route = self.ROUTES.get(c.kind)
+            if route is None:
+                continue
+            entity, which = route
+            key = c.id if which == "id" else c.parent_id
+            if key is not None:
+                targets[entity].add(key)
+
+        touched = 0
+        for entity, ids in targets.items():
+            for batch in self.n.chunked(sorted(ids), SYNC_BATCH):
+                touched += self._sync_entity(entity, batch)
+        return touched
+
+    def _sync_entity(self, entity: str, ids: List[int]) -> int:
+        n = self.n
+        spec = self.nodes[entity]
+        label = spec.model.__label__
+        rows = spec.fetch(ids)
+        n.upsert_nodes(spec, rows, SYNC_BATCH)
+
+        missing = sorted(set(ids) - {r[spec.id_field] for r in rows})
+        if missing:
+            n.run_batch(f"UNWIND $rows AS id MATCH (n:{label} {{{spec.key}: id}}) DETACH DELETE n RETURN count(*)", missing)
+
+        present = sorted({r[spec.id_field] for r in rows})
+        if present:
+            for rel in self.owned.get(entity, []):
+                # Drop this entity's current edges of the type, then wire them from MySQL
+                if rel.start_field == spec.id_field:
+                    match = f"(:{rel.start.__label__} {{{rel.start_key}: id}})-[r:{rel.rel_type}]->(:{rel.end.__label__})"
+                else:
+                    match = f"(:{rel.start.__label__})-[r:{rel.rel_type}]->(:{rel.end.__label__} {{{rel.end_key}: id}})"
+                n.run_batch(f"UNWIND $rows AS id MATCH {match} DELETE r RETURN count(*)", present)
+                n.merge_relationships(rel, rel.fetch(present), SYNC_BATCH)
+        return len(ids)
+
+
+TARGETS: Dict[str, Callable[[], Any]] = {
+    "mongodb": MongoTarget,
+    "neo4j": Neo4jTarget,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Engine
+# ─────────────────────────────────────────────────────────────────────────────
+
+def sync_source(target, source, batch_size: int = SYNC_BATCH, lag: int = SYNC_LAG) -> int:
+    """Apply one batch from `source` to `target` and checkpoint it. Returns changes applied."""
+    with SessionLocal() as session:
+        position = load_checkpoint(session, target.name, source.name)
+        changes, new_position = source.read(session, position, batch_size, lag)
+        if not changes:
+            return 0
+        start = time.perf_counter()
+        touched = target.apply(session, changes)
+        save_checkpoint(session, target.name, source.name, new_position)
+        session.commit()
+    print(
+        f"[{target.name}] {source.name}: {len(changes)} changes → {touched} rebuilt "
+        f"in {time.perf_counter() - start:.2f}s (position {new_position})"
+    )
+    return len(changes)
+
+
+def start_from_now(targets: Iterable[Any], sources: Iterable[Any]) -> None:
+    """Give sources without a checkpoint the current head as their starting position."""
+    with SessionLocal() as session:
+        for target in targets:
+            for source in sources:
+                if load_checkpoint(session, target.name, source.name) is None:
+                    save_checkpoint(session, target.name, source.name, source.head(session))
+        session.commit()
+
+
+def run(target_names: List[str], once: bool = False, interval: float = SYNC_INTERVAL,
+        batch_size: int = SYNC_BATCH, lag: int = SYNC_LAG, from_now: bool = False) -> None:
+    targets = [TARGETS[name]() for name in target_names]
+    if from_now:
+        start_from_now(targets, SOURCES)
+
+    while True:
+        # Drain every feed before sleeping; each call applies at most one batch
+        applied = 0
+        for target in targets:
+            for source in SOURCES:
+                try:
+                    applied += sync_source(target, source, batch_size, lag)
+                except Exception as e:
+                    # Position is not advanced; the batch is retried on the next poll
+                    print(f"[{target.name}] {source.name}: sync failed: {e}")
+        if applied:
+            continue
+        if once:
+            return
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally sync MySQL changes to MongoDB and Neo4j.")
+    parser.add_argument("--targets", default="mongodb,neo4j", help="comma-separated: mongodb, neo4j")
+    parser.add_argument("--once", action="store_true", help="apply pending changes and exit")
+    parser.add_argument("--interval", type=float, default=SYNC_INTERVAL, help="seconds between polls when idle")
+    parser.add_argument("--batch-size", type=int, default=SYNC_BATCH, help="changes per batch")
+    parser.add_argument("--lag", type=int, default=SYNC_LAG, help="only read rows at least this many seconds old")
+    parser.add_argument("--from-now", action="store_true", help="skip history for sources without a checkpoint")
+    args = parser.parse_args()
+
+    names = [t.strip() for t in args.targets.split(",") if t.strip()]
+    unknown = [t for t in names if t not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    run(names, once=args.once, interval=args.interval, batch_size=args.batch_size,
+        lag=args.lag, from_now=args.from_now)
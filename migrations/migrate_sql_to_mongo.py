@@ -1,21 +1,38 @@
+"""
+MySQL → MongoDB migration.
+
+Run this from the project root, for example:
+
+    python -m migrations.migrate_sql_to_mongo [--batch-size 1000] [--workers 4]
+
+Every collection is rebuilt from scratch. Parent rows are read in keyset
+chunks of `--batch-size`; their child rows (addresses, genres, reviews,
+inventory, rental items, payments, fees) are fetched with one set-based
+query per chunk and grouped in memory, and the documents are written with
+`insert_many(ordered=False)`. The collections do not depend on each other,
+so they are migrated concurrently in a thread pool, each with its own MySQL
+session. Throughput is reported per collection.
+"""
+
+import argparse
+import os
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.exc import OperationalError
 
 # MySQL ORM imports
 from src.repositories.mysql.orm_models.base import SessionLocal
 from src.repositories.mysql.orm_models.customer_orm import Customer as SqlCustomer
 from src.repositories.mysql.orm_models.movie_orm import Movie as SqlMovie
-from src.repositories.mysql.orm_models.review_orm import Review as SqlReview
 from src.repositories.mysql.orm_models.genre_orm import Genre as SqlGenre
 from src.repositories.mysql.orm_models.format_orm import Format as SqlFormat
 from src.repositories.mysql.orm_models.location_orm import Location as SqlLocation
-from src.repositories.mysql.orm_models.inventory_item_orm import (
-    InventoryItem as SqlInventoryItem,
-)
 from src.repositories.mysql.orm_models.employee_orm import Employee as SqlEmployee
 from src.repositories.mysql.orm_models.fee_orm import Fee as SqlFee
 from src.repositories.mysql.orm_models.membership_orm import (
@@ -25,7 +42,6 @@ from src.repositories.mysql.orm_models.promo_code_orm import (
     PromoCode as SqlPromoCode,
 )
 from src.repositories.mysql.orm_models.rental_orm import Rental as SqlRental
-from src.repositories.mysql.orm_models.payment_orm import Payment as SqlPayment
 
 # Mongo connection + ODM imports
 from src.repositories.mongodb.connection import init_mongo
@@ -85,32 +101,144 @@ def get_mysql_session_with_retry(retries: int = 10, delay_seconds: int = 3):
     raise RuntimeError(f"Could not connect to MySQL after {retries} attempts") from last_error
 
 
-def migrate_customers(session):
-    """Migrate customers with their primary address and current membership plan."""
-    MongoCustomer.drop_collection()
 
-    customers = session.query(SqlCustomer).all()
-    print(f"[customers] Found {len(customers)} in MySQL")
-
-    for c in customers:
-        # address: pick first address row for this customer
-        addr_row = session.execute(
-            text(
-                """
-                SELECT address_id, address, city, post_code
-                FROM address
-                WHERE customer_id = :cid
-                ORDER BY address_id
-                LIMIT 1
-                """
-            ),
-            {"cid": c.customer_id},
-        ).fetchone()
-
-        if not addr_row:
+
+BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "1000"))
+WORKERS = int(os.getenv("MIGRATION_WORKERS", "4"))
+
+
+class MigrationStats(NamedTuple):
+    collection: str
+    documents: int
+    seconds: float
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+class BatchWriter:
+    """Buffer ODM documents and write them with insert_many(ordered=False)."""
+
+    def __init__(self, document_cls, batch_size: int):
+        self.collection = document_cls._get_collection()
+        self.batch_size = batch_size
+        self.buffer: List[Any] = []
+        self.written = 0
+
+    def add(self, doc) -> None:
+        doc.validate()
+        self.buffer.append(doc.to_mongo())
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.collection.insert_many(self.buffer, ordered=False)
+            self.written += len(self.buffer)
+            self.buffer = []
+
+
+def _iter_chunks(session, model, pk, batch_size: int) -> Iterator[List[Any]]:
+    """Yield ORM rows in primary-key order, `batch_size` at a time (keyset paging)."""
+    last = None
+    while True:
+        q = session.query(model)
+        if last is not None:
+            q = q.filter(pk > last)
+        rows = q.order_by(pk).limit(batch_size).all()
+        if not rows:
+            return
+        yield rows
+        last = getattr(rows[-1], pk.key)
+        # Chunks are independent; keep the identity map from growing.
+        session.expunge_all()
+
+
+def _group_by(session, sql: str, key: str, ids: List[int]) -> Dict[int, List[Any]]:
+    """Run a child-row query for the parent `ids` (bound as :ids) and group rows by `key`."""
+    grouped: Dict[int, List[Any]] = defaultdict(list)
+    stmt = text(sql).bindparams(bindparam("ids", expanding=True))
+    for row in session.execute(stmt, {"ids": ids}):
+        grouped[getattr(row, key)].append(row)
+    return grouped
+
+
+def _dec(value):
+    """Decimal for Decimal128 fields (None stays None)."""
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def _migrate_lookup(session, document_cls, sql_model, build: Callable[[Any], Any], batch_size: int) -> int:
+    document_cls.drop_collection()
+    writer = BatchWriter(document_cls, batch_size)
+    for r in session.query(sql_model).all():
+        writer.add(build(r))
+    writer.flush()
+    return writer.written
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Collections
+# ─────────────────────────────────────────────────────────────────────────────
+
+def build_customer_docs(session, rows: List[Any], strict: bool = True) -> List[Any]:
+    """Customer documents for `rows` (customer ORM rows), with address and membership plan.
+
+    A customer without an address raises, unless `strict` is False: then it
+    is left out of the result.
+    """
+    docs: List[Any] = []
+    ids = [row.customer_id for row in rows]
+
+    # address: first address row per customer
+    addresses = _group_by(
+        session,
+        """
+        SELECT customer_id, address_id, address, city, post_code
+        FROM address
+        WHERE customer_id IN :ids
+        ORDER BY customer_id, address_id
+        """,
+        "customer_id", ids,
+    )
+
+    # membership plan + membership type
+    plans = _group_by(
+        session,
+        """
+        SELECT
+            mp.customer_id,
+            mp.membership_plan_id,
+            mp.monthly_cost,
+            mp.starts_on,
+            mp.ends_on,
+            mp.membership_id,
+            m.membership AS membership_type
+        FROM membership_plan AS mp
+        JOIN membership AS m
+          ON mp.membership_id = m.membership_id
+        WHERE mp.customer_id IN :ids
+        ORDER BY mp.customer_id, mp.membership_plan_id
+        """,
+        "customer_id", ids,
+    )
+
+    for c in rows:
+        addr_rows = addresses.get(c.customer_id)
+        if not addr_rows:
+            if not strict:
+                continue
             raise RuntimeError(
                 f"No address found for customer_id={c.customer_id}"
             )
+        addr_row = addr_rows[0]
 
         address_embedded = MongoAddress(
             address_id=addr_row.address_id,
@@ -119,28 +247,8 @@ def migrate_customers(session):
             post_code=addr_row.post_code,
         )
 
-        # membership plan + membership type
-        mp_row = session.execute(
-            text(
-                """
-                SELECT
-                    mp.membership_plan_id,
-                    mp.monthly_cost,
-                    mp.starts_on,
-                    mp.ends_on,
-                    mp.membership_id,
-                    m.membership AS membership_type
-                FROM membership_plan AS mp
-                JOIN membership AS m
-                  ON mp.membership_id = m.membership_id
-                WHERE mp.customer_id = :cid
-                LIMIT 1
-                """
-            ),
-            {"cid": c.customer_id},
-        ).fetchone()
-
-        if not mp_row:
+        mp_rows = plans.get(c.customer_id)
+        if not mp_rows:
             membership_plan_embedded = MongoMembershipPlan(
                 membership_plan_id=c.customer_id,  # fallback ID
                 membership_type="BRONZE",
@@ -150,6 +258,7 @@ def migrate_customers(session):
                 membership_id=3,  # Assuming 3=BRONZE
             )
         else:
+            mp_row = mp_rows[0]
             membership_plan_embedded = MongoMembershipPlan(
                 membership_plan_id=mp_row.membership_plan_id,
                 membership_type=mp_row.membership_type,
@@ -159,7 +268,7 @@ def migrate_customers(session):
                 membership_id=mp_row.membership_id,
             )
 
-        doc = MongoCustomer(
+        docs.append(MongoCustomer(
             customer_id=c.customer_id,
             first_name=c.first_name,
             last_name=c.last_name,
@@ -168,119 +277,123 @@ def migrate_customers(session):
             created_at=c.created_at or datetime.utcnow(),
             address=address_embedded,
             membership_plan=membership_plan_embedded,
-        )
+        ))
+
+    return docs
+
+
+def migrate_customers(session, batch_size: int = BATCH_SIZE) -> int:
+    """Migrate customers with their primary address and current membership plan."""
+    MongoCustomer.drop_collection()
+    writer = BatchWriter(MongoCustomer, batch_size)
+
+    for chunk in _iter_chunks(session, SqlCustomer, SqlCustomer.customer_id, batch_size):
+        for doc in build_customer_docs(session, chunk):
+            writer.add(doc)
+
+    writer.flush()
+    return writer.written
+
+
+def membership_type_doc(r):
+    return MongoMembershipType(membership_id=r.membership_id, type=r.membership)
+
 
-        doc.save()
+def format_doc(r):
+    return MongoFormat(format_id=r.format_id, type=r.format)
 
-    print("[customers] Migration completed.")
 
+def genre_doc(r):
+    return MongoGenre(genre_id=r.genre_id, name=r.name)
 
-def migrate_membership_types(session):
+
+def fee_type_doc(r):
+    return MongoFeeType(
+        fee_id=r.fee_id,
+        fee_type=r.fee_type,
+        default_amount_dkk=_dec(r.amount_dkk),  # Decimal for Decimal128Field
+    )
+
+
+def promo_code_doc(r):
+    return MongoPromoCode(
+        promo_code_id=r.promo_code_id,
+        code=r.code,
+        description=r.description,
+        percent_off=_dec(r.percent_off),
+        amount_off_dkk=_dec(r.amount_off_dkk),
+        starts_at=r.starts_at,
+        ends_at=r.ends_at,
+    )
+
+
+def migrate_membership_types(session, batch_size: int = BATCH_SIZE) -> int:
     """Migrate membership types (lookup)."""
-    MongoMembershipType.drop_collection()
-    rows = session.query(SqlMembership).all()
-    print(f"[membershipTypes] Found {len(rows)} in MySQL")
-    for r in rows:
-        MongoMembershipType(membership_id=r.membership_id, type=r.membership).save()
-    print("[membershipTypes] Migration completed.")
+    return _migrate_lookup(session, MongoMembershipType, SqlMembership, membership_type_doc, batch_size)
 
 
-def migrate_formats(session):
+def migrate_formats(session, batch_size: int = BATCH_SIZE) -> int:
     """Migrate formats (lookup)."""
-    MongoFormat.drop_collection()
-    rows = session.query(SqlFormat).all()
-    print(f"[formats] Found {len(rows)} in MySQL")
-    for r in rows:
-        MongoFormat(format_id=r.format_id, type=r.format).save()
-    print("[formats] Migration completed.")
+    return _migrate_lookup(session, MongoFormat, SqlFormat, format_doc, batch_size)
 
 
-def migrate_genres(session):
+def migrate_genres(session, batch_size: int = BATCH_SIZE) -> int:
     """Migrate genres (lookup)."""
-    MongoGenre.drop_collection()
-    rows = session.query(SqlGenre).all()
-    print(f"[genres] Found {len(rows)} in MySQL")
-    for r in rows:
-        MongoGenre(genre_id=r.genre_id, name=r.name).save()
-    print("[genres] Migration completed.")
+    return _migrate_lookup(session, MongoGenre, SqlGenre, genre_doc, batch_size)
 
 
-def migrate_fee_types(session):
+def migrate_fee_types(session, batch_size: int = BATCH_SIZE) -> int:
     """Migrate fee types (lookup)."""
-    MongoFeeType.drop_collection()
-    rows = session.query(SqlFee).all()
-    print(f"[feeTypes] Found {len(rows)} in MySQL")
-    for r in rows:
-        # ensure Decimal type for Decimal128Field
-        amt = r.amount_dkk if isinstance(r.amount_dkk, Decimal) else Decimal(str(r.amount_dkk))
-        MongoFeeType(
-            fee_id=r.fee_id,
-            fee_type=r.fee_type,
-            default_amount_dkk=amt,
-        ).save()
-    print("[feeTypes] Migration completed.")
+    return _migrate_lookup(session, MongoFeeType, SqlFee, fee_type_doc, batch_size)
 
 
-def migrate_promo_codes(session):
+def migrate_promo_codes(session, batch_size: int = BATCH_SIZE) -> int:
     """Migrate promo codes (lookup)."""
-    MongoPromoCode.drop_collection()
-    rows = session.query(SqlPromoCode).all()
-    print(f"[promoCodes] Found {len(rows)} in MySQL")
-    for r in rows:
-        percent = None if r.percent_off is None else (r.percent_off if isinstance(r.percent_off, Decimal) else Decimal(str(r.percent_off)))
-        amount = None if r.amount_off_dkk is None else (r.amount_off_dkk if isinstance(r.amount_off_dkk, Decimal) else Decimal(str(r.amount_off_dkk)))
-        MongoPromoCode(
-            promo_code_id=r.promo_code_id,
-            code=r.code,
-            description=r.description,
-            percent_off=percent,
-            amount_off_dkk=amount,
-            starts_at=r.starts_at,
-            ends_at=r.ends_at,
-        ).save()
-    print("[promoCodes] Migration completed.")
-
-
-def migrate_movies(session):
-    """Migrate movies with denormalized genres and embedded reviews."""
-    MongoMovie.drop_collection()
-    movies = session.query(SqlMovie).all()
-    print(f"[movies] Found {len(movies)} in MySQL")
-
-    for m in movies:
-        # genres via movie_genre join
-        genre_rows = session.execute(
-            text(
-                """
-                SELECT g.name
-                FROM movie_genre mg
-                JOIN genre g ON g.genre_id = mg.genre_id
-                WHERE mg.movie_id = :mid
-                ORDER BY g.name
-                """
-            ),
-            {"mid": m.movie_id},
-        ).fetchall()
-        genres = [gr.name for gr in genre_rows]
-
-        # embedded reviews
-        reviews = (
-            session.query(SqlReview)
-            .filter(SqlReview.movie_id == m.movie_id)
-            .all()
-        )
-        review_embeds = []
-        for rv in reviews:
-            review_embeds.append(
-                MongoReviewEmbedded(
-                    review_id=rv.review_id,
-                    movie_id=rv.movie_id,
-                    rating=int(rv.rating) if rv.rating is not None else 0,
-                    body=rv.body,
-                    created_at=rv.created_at or datetime.utcnow(),
-                    customer_id=None,  # not present in SQL schema
-                )
+    return _migrate_lookup(session, MongoPromoCode, SqlPromoCode, promo_code_doc, batch_size)
+
+
+def build_movie_docs(session, rows: List[Any]) -> List[Any]:
+    """Movie documents for `rows` (movie ORM rows), with genres and reviews."""
+    docs: List[Any] = []
+    ids = [row.movie_id for row in rows]
+
+    # genres via movie_genre join
+    genres = _group_by(
+        session,
+        """
+        SELECT mg.movie_id, g.name
+        FROM movie_genre mg
+        JOIN genre g ON g.genre_id = mg.genre_id
+        WHERE mg.movie_id IN :ids
+        ORDER BY mg.movie_id, g.name
+        """,
+        "movie_id", ids,
+    )
+
+    # embedded reviews
+    reviews = _group_by(
+        session,
+        """
+        SELECT review_id, movie_id, rating, body, created_at
+        FROM review
+        WHERE movie_id IN :ids
+        ORDER BY movie_id, review_id
+        """,
+        "movie_id", ids,
+    )
+
+    for m in rows:
+        review_embeds = [
+            MongoReviewEmbedded(
+                review_id=rv.review_id,
+                movie_id=rv.movie_id,
+                rating=int(rv.rating) if rv.rating is not None else 0,
+                body=rv.body,
+                created_at=rv.created_at or datetime.utcnow(),
+                customer_id=None,  # not present in SQL schema
             )
+            for rv in reviews.get(m.movie_id, [])
+        ]
 
         # Convert average rating (Decimal) to int within 1..10 if present
         avg_rating = None
@@ -290,18 +403,31 @@ def migrate_movies(session):
             except Exception:
                 avg_rating = None
 
-        MongoMovie(
+        docs.append(MongoMovie(
             movie_id=m.movie_id,
             title=m.title,
             release_year=m.release_year,
             runtime_min=m.runtime_min,
             rating=avg_rating,
             summary=m.summary,
-            genres=genres,
+            genres=[gr.name for gr in genres.get(m.movie_id, [])],
             reviews=review_embeds,
-        ).save()
+        ))
 
-    print("[movies] Migration completed.")
+    return docs
+
+
+def migrate_movies(session, batch_size: int = BATCH_SIZE) -> int:
+    """Migrate movies with denormalized genres and embedded reviews."""
+    MongoMovie.drop_collection()
+    writer = BatchWriter(MongoMovie, batch_size)
+
+    for chunk in _iter_chunks(session, SqlMovie, SqlMovie.movie_id, batch_size):
+        for doc in build_movie_docs(session, chunk):
+            writer.add(doc)
+
+    writer.flush()
+    return writer.written
 
 
 def _status_code_to_string(code: int) -> str:
@@ -315,13 +441,10 @@ def _status_code_to_string(code: int) -> str:
     return mapping.get(int(code) if code is not None else 0, "UNKNOWN")
 
 
-def migrate_locations(session):
-    """Migrate locations with embedded employees and inventory items."""
-    MongoLocation.drop_collection()
-
+def _employee_embeds(session) -> List[Any]:
     # employees are not linked to locations in SQL; embed all employees in each location
     employees = session.query(SqlEmployee).all()
-    employee_embeds = [
+    return [
         MongoEmployeeEmbedded(
             employee_id=e.employee_id,
             first_name=e.first_name,
@@ -333,16 +456,27 @@ def migrate_locations(session):
         for e in employees
     ]
 
-    locations = session.query(SqlLocation).all()
-    print(f"[locations] Found {len(locations)} in MySQL")
 
-    for loc in locations:
-        # inventory for this location
-        inventory_rows = (
-            session.query(SqlInventoryItem)
-            .filter(SqlInventoryItem.location_id == loc.location_id)
-            .all()
-        )
+def build_location_docs(session, rows: List[Any], employee_embeds: Optional[List[Any]] = None) -> List[Any]:
+    """Location documents for `rows` (location ORM rows), with employees and inventory."""
+    if employee_embeds is None:
+        employee_embeds = _employee_embeds(session)
+    docs: List[Any] = []
+    ids = [row.location_id for row in rows]
+
+    # inventory for the locations in this chunk
+    inventory = _group_by(
+        session,
+        """
+        SELECT inventory_item_id, location_id, movie_id, format_id, status
+        FROM inventory_item
+        WHERE location_id IN :ids
+        ORDER BY location_id, inventory_item_id
+        """,
+        "location_id", ids,
+    )
+
+    for loc in rows:
         inv_embeds = [
             MongoInventoryEmbedded(
                 inventory_item_id=ii.inventory_item_id,
@@ -350,25 +484,38 @@ def migrate_locations(session):
                 format_id=ii.format_id,
                 status=_status_code_to_string(ii.status),
             )
-            for ii in inventory_rows
+            for ii in inventory.get(loc.location_id, [])
         ]
 
-        MongoLocation(
+        docs.append(MongoLocation(
             location_id=loc.location_id,
             address=loc.address,
             city=loc.city,
             employees=employee_embeds,
             inventory=inv_embeds,
-        ).save()
+        ))
 
-    print("[locations] Migration completed.")
+    return docs
 
 
-def migrate_rentals(session):
-    """Migrate rentals with embedded items, payments, fees, and promo snapshot."""
-    MongoRental = None  # lazy import to avoid circular if any
+def migrate_locations(session, batch_size: int = BATCH_SIZE) -> int:
+    """Migrate locations with embedded employees and inventory items."""
+    MongoLocation.drop_collection()
+    writer = BatchWriter(MongoLocation, batch_size)
+    employee_embeds = _employee_embeds(session)
+
+    for chunk in _iter_chunks(session, SqlLocation, SqlLocation.location_id, batch_size):
+        for doc in build_location_docs(session, chunk, employee_embeds):
+            writer.add(doc)
+
+    writer.flush()
+    return writer.written
+
+
+def build_rental_docs(session, rows: List[Any], promos: Optional[Dict[int, Any]] = None) -> List[Any]:
+    """Rental documents for `rows` (rental ORM rows), with items, payments, fees and promo."""
     from src.repositories.mongodb.odm_models.rental_document import (
-        Rental as _MongoRental,
+        Rental as MongoRental,
         RentalItemEmbedded as _MongoRentalItem,
         PaymentEmbedded as _MongoPayment,
         RentalFeeEmbedded as _MongoRentalFee,
@@ -376,43 +523,58 @@ def migrate_rentals(session):
         PromoSnapshotEmbedded as _MongoPromoSnapshot,
     )
 
-    MongoRental = _MongoRental
+    if promos is None:
+        promo_ids = {r.promo_code_id for r in rows if r.promo_code_id is not None}
+        promos = {
+            p.promo_code_id: p
+            for p in session.query(SqlPromoCode).filter(SqlPromoCode.promo_code_id.in_(promo_ids)).all()
+        } if promo_ids else {}
+    docs: List[Any] = []
+    ids = [row.rental_id for row in rows]
+
+    # items: join rental_item -> inventory_item for details
+    items = _group_by(
+        session,
+        """
+        SELECT ri.rental_id, ri.rental_item_id, ri.inventory_item_id,
+               ii.movie_id, ii.format_id, ii.location_id
+        FROM rental_item ri
+        JOIN inventory_item ii ON ii.inventory_item_id = ri.inventory_item_id
+        WHERE ri.rental_id IN :ids
+        ORDER BY ri.rental_id, ri.rental_item_id
+        """,
+        "rental_id", ids,
+    )
 
-    MongoRental.drop_collection()
+    payments = _group_by(
+        session,
+        """
+        SELECT payment_id, rental_id, amount_dkk, created_at
+        FROM payment
+        WHERE rental_id IN :ids
+        ORDER BY rental_id, payment_id
+        """,
+        "rental_id", ids,
+    )
 
-    rentals = session.query(SqlRental).all()
-    print(f"[rentals] Found {len(rentals)} in MySQL")
+    # fees with snapshot
+    fees = _group_by(
+        session,
+        """
+        SELECT rf.rental_id, rf.rental_fee_id, rf.fee_id, f.fee_type, f.amount_dkk
+        FROM rental_fee rf
+        JOIN fee f ON f.fee_id = rf.fee_id
+        WHERE rf.rental_id IN :ids
+        ORDER BY rf.rental_id, rf.rental_fee_id
+        """,
+        "rental_id", ids,
+    )
 
-    for r in rentals:
+    for r in rows:
+        item_rows = items.get(r.rental_id, [])
         # derive location_id from first rental_item -> inventory_item
-        loc_row = session.execute(
-            text(
-                """
-                SELECT ii.location_id
-                FROM rental_item ri
-                JOIN inventory_item ii ON ii.inventory_item_id = ri.inventory_item_id
-                WHERE ri.rental_id = :rid
-                ORDER BY ri.rental_item_id
-                LIMIT 1
-                """
-            ),
-            {"rid": r.rental_id},
-        ).fetchone()
-        location_id = loc_row.location_id if loc_row else None
-
-        # items: join rental_item -> inventory_item for details
-        item_rows = session.execute(
-            text(
-                """
-                SELECT ri.rental_item_id, ri.inventory_item_id, ii.movie_id, ii.format_id
-                FROM rental_item ri
-                JOIN inventory_item ii ON ii.inventory_item_id = ri.inventory_item_id
-                WHERE ri.rental_id = :rid
-                ORDER BY ri.rental_item_id
-                """
-            ),
-            {"rid": r.rental_id},
-        ).fetchall()
+        location_id = item_rows[0].location_id if item_rows else None
+
         item_embeds = [
             _MongoRentalItem(
                 rental_item_id=it.rental_item_id,
@@ -423,39 +585,20 @@ def migrate_rentals(session):
             for it in item_rows
         ]
 
-        # payments
-        payments = (
-            session.query(SqlPayment)
-            .filter(SqlPayment.rental_id == r.rental_id)
-            .all()
-        )
         pay_embeds = [
             _MongoPayment(
                 payment_id=p.payment_id,
-                amount_dkk=p.amount_dkk if isinstance(p.amount_dkk, Decimal) else Decimal(str(p.amount_dkk)),
+                amount_dkk=_dec(p.amount_dkk),
                 created_at=p.created_at or datetime.utcnow(),
             )
-            for p in payments
+            for p in payments.get(r.rental_id, [])
         ]
 
-        # fees with snapshot
-        fee_rows = session.execute(
-            text(
-                """
-                SELECT rf.rental_fee_id, rf.fee_id, f.fee_type, f.amount_dkk
-                FROM rental_fee rf
-                JOIN fee f ON f.fee_id = rf.fee_id
-                WHERE rf.rental_id = :rid
-                ORDER BY rf.rental_fee_id
-                """
-            ),
-            {"rid": r.rental_id},
-        ).fetchall()
         fee_embeds = []
-        for fr in fee_rows:
+        for fr in fees.get(r.rental_id, []):
             snapshot = _MongoFeeSnapshot(
                 fee_type=fr.fee_type,
-                default_amount_dkk=fr.amount_dkk if isinstance(fr.amount_dkk, Decimal) else Decimal(str(fr.amount_dkk)),
+                default_amount_dkk=_dec(fr.amount_dkk),
             )
             fee_embeds.append(
                 _MongoRentalFee(
@@ -468,19 +611,18 @@ def migrate_rentals(session):
 
         # promo snapshot (optional)
         promo_embed = None
-        if r.promo_code_id is not None:
-            promo = session.get(SqlPromoCode, r.promo_code_id)
-            if promo:
-                promo_embed = _MongoPromoSnapshot(
-                    promo_code_id=promo.promo_code_id,
-                    code=promo.code,
-                    percent_off=None if promo.percent_off is None else (promo.percent_off if isinstance(promo.percent_off, Decimal) else Decimal(str(promo.percent_off))),
-                    amount_off_dkk=None if promo.amount_off_dkk is None else (promo.amount_off_dkk if isinstance(promo.amount_off_dkk, Decimal) else Decimal(str(promo.amount_off_dkk))),
-                    starts_at=promo.starts_at,
-                    ends_at=promo.ends_at,
-                )
+        promo = promos.get(r.promo_code_id) if r.promo_code_id is not None else None
+        if promo:
+            promo_embed = _MongoPromoSnapshot(
+                promo_code_id=promo.promo_code_id,
+                code=promo.code,
+                percent_off=_dec(promo.percent_off),
+                amount_off_dkk=_dec(promo.amount_off_dkk),
+                starts_at=promo.starts_at,
+                ends_at=promo.ends_at,
+            )
 
-        MongoRental(
+        docs.append(MongoRental(
             rental_id=r.rental_id,
             customer_id=r.customer_id,
             location_id=location_id,
@@ -494,37 +636,102 @@ def migrate_rentals(session):
             payments=pay_embeds,
             fees=fee_embeds,
             promo=promo_embed,
-        ).save()
+        ))
 
-    print("[rentals] Migration completed.")
+    return docs
 
 
-def migrate_all():
-    """Run all migrations in a dependency-safe order."""
-    # 1) Init Mongo connection
-    init_mongo()
+def migrate_rentals(session, batch_size: int = BATCH_SIZE) -> int:
+    """Migrate rentals with embedded items, payments, fees, and promo snapshot."""
+    from src.repositories.mongodb.odm_models.rental_document import Rental as MongoRental  # lazy import to avoid circular if any
 
-    # 2) MySQL session with retry
-    session = get_mysql_session_with_retry()
+    MongoRental.drop_collection()
+    writer = BatchWriter(MongoRental, batch_size)
+
+    # promo codes are a small lookup; load them once instead of per rental
+    promos = {p.promo_code_id: p for p in session.query(SqlPromoCode).all()}
+
+    for chunk in _iter_chunks(session, SqlRental, SqlRental.rental_id, batch_size):
+        for doc in build_rental_docs(session, chunk, promos):
+            writer.add(doc)
+
+    writer.flush()
+    return writer.written
+
+
+# Collection name -> migration function. Each collection is built only from
+# MySQL, so they can run in any order or concurrently.
+MIGRATIONS: Dict[str, Callable[..., int]] = {
+    "membershipTypes": migrate_membership_types,
+    "formats": migrate_formats,
+    "genres": migrate_genres,
+    "feeTypes": migrate_fee_types,
+    "promoCodes": migrate_promo_codes,
+    "movies": migrate_movies,
+    "locations": migrate_locations,
+    "customers": migrate_customers,
+    "rentals": migrate_rentals,
+}
 
+
+def _run_one(name: str, migrate: Callable[..., int], batch_size: int) -> MigrationStats:
+    # SQLAlchemy sessions are not thread-safe: one per collection
+    session = get_mysql_session_with_retry()
     try:
-        # lookups first
-        migrate_membership_types(session)
-        migrate_formats(session)
-        migrate_genres(session)
-        migrate_fee_types(session)
-        migrate_promo_codes(session)
-
-        # main entities
-        migrate_movies(session)
-        migrate_locations(session)
-        migrate_customers(session)
-        migrate_rentals(session)
+        start = time.perf_counter()
+        count = migrate(session, batch_size=batch_size)
+        stats = MigrationStats(name, count, time.perf_counter() - start)
     finally:
         session.close()
+    print(
+        f"[{name}] Migrated {stats.documents} documents in {stats.seconds:.2f}s "
+        f"({stats.docs_per_second:.0f} docs/s)"
+    )
+    return stats
+
+
+def migrate_all(batch_size: int = BATCH_SIZE, workers: int = WORKERS) -> List[MigrationStats]:
+    """Run all collection migrations concurrently and report throughput per collection."""
+    # 1) Init Mongo connection (MongoClient is thread-safe and shared by the workers)
+    init_mongo()
+
+    # 2) Fail fast if MySQL is unreachable before starting the workers
+    get_mysql_session_with_retry().close()
+
+    start = time.perf_counter()
+    results: List[MigrationStats] = []
+    errors: List[str] = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(_run_one, name, migrate, batch_size): name
+            for name, migrate in MIGRATIONS.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"[{name}] Migration failed: {e}")
+                errors.append(name)
+    elapsed = time.perf_counter() - start
+
+    total = sum(r.documents for r in results)
+    print(f"\n{'collection':<18}{'documents':>12}{'seconds':>10}{'docs/s':>12}")
+    for r in sorted(results, key=lambda r: r.collection):
+        print(f"{r.collection:<18}{r.documents:>12}{r.seconds:>10.2f}{r.docs_per_second:>12.0f}")
+    print(f"{'total':<18}{total:>12}{elapsed:>10.2f}{(total / elapsed if elapsed else 0):>12.0f}")
+
+    if errors:
+        raise RuntimeError(f"Migration failed for: {', '.join(sorted(errors))}")
+    return results
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate MySQL data to MongoDB.")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows per chunk / documents per insert_many")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="collections migrated concurrently")
+    args = parser.parse_args()
+
     print("Starting full migration from MySQL to MongoDB...")
-    migrate_all()
+    migrate_all(batch_size=args.batch_size, workers=args.workers)
     print("Migration finished.")
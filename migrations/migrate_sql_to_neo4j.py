@@ -5,11 +5,15 @@ What it does:
 - Reads entities from MySQL via SQLAlchemy ORM models
 - Upserts corresponding Neo4j nodes and creates edges for relationships
 - Is idempotent (safe to re-run); updates existing nodes if values changed
-- Uses simple batching for large datasets
+- Sends each batch as one parameterized `UNWIND $rows AS row MERGE ...`
+  statement in an explicit transaction (one round trip per batch)
+- Writes all nodes before any relationships, so every edge can be matched
+  in a single pass
+- Prints a timing report per entity
 
 Entities migrated:
-- Reference/lookup: Genres, Formats, Locations
-- Core domain: Customers, Addresses, Membership Plans, Memberships
+- Reference/lookup: Genres, Formats, Locations, Memberships
+- Core domain: Customers, Addresses, Membership Plans
 - Movies & inventory: Movies, Inventory Items
 - Staff & operations: Employees, Rentals, Rental-Item edges (HAS_ITEM)
 - Finance: Fees, Promo Codes, Payments (and links to Rentals/Customers)
@@ -21,13 +25,16 @@ Neo4j connection is configured via `src.repositories.neo4j.connection` using env
 
 Run inside the API container:
 	python -m migrations.migrate_sql_to_neo4j
+
+Batch size: CUSTOMER_MIGRATE_BATCH (default 500 rows per statement).
 """
 
 from __future__ import annotations
 
 import os
 import sys
-from typing import Iterable, List, Dict
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Type
 
 # Ensure we can import project modules when run as a module or script
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -40,7 +47,8 @@ os.environ.setdefault("NEO4J_USER", "neo4j")
 os.environ.setdefault("NEO4J_PASSWORD", "letmein123")
 
 # Configure Neo4j neomodel via project connection module (reads env above)
-from src.repositories.neo4j.connection import config as _neo_config  # noqa: F401  # side-effect import
+from src.repositories.neo4j.connection import config as _neo_config, install_labels  # noqa: F401  # side-effect import
+from neomodel import StructuredNode, db
 from src.repositories.neo4j.ogm_models.customer_ogm import Customer as CustomerNode
 from src.repositories.neo4j.ogm_models.address_ogm import Address as AddressNode
 from src.repositories.neo4j.ogm_models.membership_plan_ogm import MembershipPlan as MembershipPlanNode
@@ -72,7 +80,7 @@ from src.repositories.mysql.orm_models.payment_orm import Payment as PaymentORM
 from src.repositories.mysql.orm_models.fee_orm import Fee as FeeORM
 from src.repositories.mysql.orm_models.promo_code_orm import PromoCode as PromoCodeORM
 from src.repositories.mysql.orm_models.base import SessionLocal
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 
 def chunked(iterable: Iterable[Dict], size: int) -> Iterable[List[Dict]]:
@@ -87,10 +95,27 @@ def chunked(iterable: Iterable[Dict], size: int) -> Iterable[List[Dict]]:
 		yield batch
 
 
-def fetch_all_customers() -> List[Dict]:
+# ─────────────────────────── MySQL readers ──────────────────────────────────
+# Every reader returns all rows, or only the rows owned by `ids` (used by the
+# incremental sync): the primary key for entities, the parent id for joins.
+
+def _only(query, column, ids: Optional[Iterable[int]]):
+	"""Restrict an ORM query to rows whose `column` is in `ids` (no filter when None)."""
+	return query if ids is None else query.filter(column.in_(list(ids)))
+
+
+def _where_in(sql: str, column: str, ids: Optional[Iterable[int]]):
+	"""(statement, params) for a raw query with a `{where}` placeholder."""
+	if ids is None:
+		return text(sql.format(where="")), {}
+	stmt = text(sql.format(where=f"WHERE {column} IN :ids")).bindparams(bindparam("ids", expanding=True))
+	return stmt, {"ids": list(ids)}
+
+
+def fetch_all_customers(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	"""Fetch all customers from MySQL as dictionaries using the ORM model."""
 	with SessionLocal() as session:
-		rows = session.query(CustomerORM).all()
+		rows = _only(session.query(CustomerORM), CustomerORM.customer_id, ids).all()
 		def to_dict(row: CustomerORM) -> Dict:
 			return {
 				"customer_id": row.customer_id,
@@ -104,50 +129,9 @@ def fetch_all_customers() -> List[Dict]:
 		return [to_dict(r) for r in rows]
 
 
-def upsert_customer(batch: List[Dict]) -> int:
-	"""Upsert a batch of customers into Neo4j. Returns count upserted."""
-	count = 0
-	for c in batch:
-		# Idempotent get-or-create by unique customerId
-		node = CustomerNode.nodes.get_or_none(customerId=c["customer_id"])  # type: ignore[attr-defined]
-		if node is None:
-			node = CustomerNode(
-				customerId=c["customer_id"],
-				firstName=c["first_name"],
-				lastName=c["last_name"],
-				email=c["email"],
-				phoneNumber=c["phone_number"],
-				createdAt=c["created_at"],
-			)
-		else:
-			# Update properties in case of changes
-			node.firstName = c["first_name"]
-			node.lastName = c["last_name"]
-			node.email = c["email"]
-			node.phoneNumber = c["phone_number"]
-			node.createdAt = c["created_at"]
-
-		node.save()
-		count += 1
-	return count
-
-
-def migrate_customers(batch_size: int = 500) -> None:
-	customers = fetch_all_customers()
-	total = len(customers)
-	print(f"Found {total} customers in MySQL.")
-	migrated = 0
-	for batch in chunked(customers, batch_size):
-		migrated += upsert_customer(batch)
-		print(f"Migrated {migrated}/{total} customers…")
-	print(f"Done. Migrated {migrated} customers to Neo4j.")
-
-
-# ─────────────────────────── Additional entities & relationships ────────────
-
-def fetch_all_addresses() -> List[Dict]:
+def fetch_all_addresses(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(AddressORM).all()
+		rows = _only(session.query(AddressORM), AddressORM.address_id, ids).all()
 		return [{
 			"address_id": r.address_id,
 			"address": r.address,
@@ -157,47 +141,9 @@ def fetch_all_addresses() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_addresses(batch: List[Dict]) -> int:
-	count = 0
-	for a in batch:
-		node = AddressNode.nodes.get_or_none(addressId=a["address_id"])  # type: ignore
-		if node is None:
-			node = AddressNode(
-				addressId=a["address_id"],
-				address=a["address"],
-				city=a["city"],
-				postCode=a["post_code"],
-			)
-		else:
-			node.address = a["address"]
-			node.city = a["city"]
-			node.postCode = a["post_code"]
-		node.save()
-		# connect to customer
-		cust = CustomerNode.nodes.get_or_none(customerId=a["customer_id"])  # type: ignore
-		try:
-			if cust:
-				cust.addresses.connect(node)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		count += 1
-	return count
-
-
-def migrate_addresses(batch_size: int = 500) -> None:
-	items = fetch_all_addresses()
-	total = len(items)
-	print(f"Found {total} addresses in MySQL.")
-	migrated = 0
-	for batch in chunked(items, batch_size):
-		migrated += upsert_addresses(batch)
-		print(f"Migrated {migrated}/{total} addresses…")
-	print(f"Done. Migrated {migrated} addresses to Neo4j.")
-
-
-def fetch_all_membership_plans() -> List[Dict]:
+def fetch_all_membership_plans(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(MembershipPlanORM).all()
+		rows = _only(session.query(MembershipPlanORM), MembershipPlanORM.membership_plan_id, ids).all()
 		return [{
 			"membership_plan_id": r.membership_plan_id,
 			"monthly_cost": float(r.monthly_cost) if r.monthly_cost is not None else None,
@@ -208,148 +154,27 @@ def fetch_all_membership_plans() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_membership_plans(batch: List[Dict]) -> int:
-	count = 0
-	for m in batch:
-		node = MembershipPlanNode.nodes.get_or_none(membershipPlanId=m["membership_plan_id"])  # type: ignore
-		if node is None:
-			node = MembershipPlanNode(
-				membershipPlanId=m["membership_plan_id"],
-				monthlyCost=m["monthly_cost"],
-				startsOn=m["starts_on"],
-				endsOn=m["ends_on"],
-			)
-		else:
-			node.monthlyCost = m["monthly_cost"]
-			node.startsOn = m["starts_on"]
-			node.endsOn = m["ends_on"]
-		node.save()
-		# connect to membership and customer
-		try:
-			mem = MembershipNode.nodes.get_or_none(membershipId=m["membership_id"])  # type: ignore
-			if mem:
-				node.membership.connect(mem)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		try:
-			cust = CustomerNode.nodes.get_or_none(customerId=m["customer_id"])  # type: ignore
-			if cust:
-				node.customer.connect(cust)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		count += 1
-	return count
-
-
-def migrate_membership_plans(batch_size: int = 500) -> None:
-	items = fetch_all_membership_plans()
-	total = len(items)
-	print(f"Found {total} membership plans in MySQL.")
-	migrated = 0
-	for batch in chunked(items, batch_size):
-		migrated += upsert_membership_plans(batch)
-		print(f"Migrated {migrated}/{total} membership plans…")
-	print(f"Done. Migrated {migrated} membership plans to Neo4j.")
-
-
-def fetch_all_memberships() -> List[Dict]:
+def fetch_all_memberships(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(MembershipORM).all()
-		return [{
-			"membership_id": r.membership_id,
-			"customer_id": r.customer_id,
-			"membership_plan_id": r.membership_plan_id,
-			"start_date": r.start_date,
-			"end_date": r.end_date,
-			"status": r.status,
-		} for r in rows]
+		rows = _only(session.query(MembershipORM), MembershipORM.membership_id, ids).all()
+		return [{"membership_id": r.membership_id, "membership": r.membership} for r in rows]
 
 
-def upsert_memberships(batch: List[Dict]) -> int:
-	count = 0
-	for m in batch:
-		node = MembershipNode.nodes.get_or_none(membershipId=m["membership_id"])  # type: ignore
-		if node is None:
-			node = MembershipNode(
-				membershipId=m["membership_id"],
-				startDate=m["start_date"],
-				endDate=m["end_date"],
-				status=m["status"],
-			)
-		else:
-			node.startDate = m["start_date"]
-			node.endDate = m["end_date"]
-			node.status = m["status"]
-		node.save()
-		# Link to Customer and MembershipPlan if present
-		cust = CustomerNode.nodes.get_or_none(customerId=m["customer_id"])  # type: ignore
-		plan = MembershipPlanNode.nodes.get_or_none(membershipPlanId=m["membership_plan_id"])  # type: ignore
-		if cust:
-			# assuming relationship defined on Membership to Customer -> use generic pattern via neomodel Relationship? If not, connect via customer.rentals etc.
-			try:
-				cust.memberships.connect(node)  # type: ignore[attr-defined]
-			except Exception:
-				pass
-		if plan:
-			try:
-				node.plan.connect(plan)  # type: ignore[attr-defined]
-			except Exception:
-				pass
-		count += 1
-	return count
-
-
-def migrate_memberships(batch_size: int = 500) -> None:
-	items = fetch_all_memberships()
-	total = len(items)
-	print(f"Found {total} memberships in MySQL.")
-	migrated = 0
-	for batch in chunked(items, batch_size):
-		migrated += upsert_memberships(batch)
-		print(f"Migrated {migrated}/{total} memberships…")
-	print(f"Done. Migrated {migrated} memberships to Neo4j.")
-
-
-# Movies, genres, formats, inventory items
-def fetch_all_genres() -> List[Dict]:
+def fetch_all_genres(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(GenreORM).all()
+		rows = _only(session.query(GenreORM), GenreORM.genre_id, ids).all()
 		return [{"genre_id": r.genre_id, "name": r.name} for r in rows]
 
 
-def upsert_genres(batch: List[Dict]) -> int:
-	count = 0
-	for g in batch:
-		node = GenreNode.nodes.get_or_none(genreId=g["genre_id"])  # type: ignore
-		if node is None:
-			node = GenreNode(genreId=g["genre_id"], name=g["name"])
-		else:
-			node.name = g["name"]
-		node.save(); count += 1
-	return count
-
-
-def fetch_all_formats() -> List[Dict]:
+def fetch_all_formats(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(FormatORM).all()
+		rows = _only(session.query(FormatORM), FormatORM.format_id, ids).all()
 	return [{"format_id": r.format_id, "format": r.format} for r in rows]
 
 
-def upsert_formats(batch: List[Dict]) -> int:
-	count = 0
-	for f in batch:
-		node = FormatNode.nodes.get_or_none(formatId=f["format_id"])  # type: ignore
-		if node is None:
-			node = FormatNode(formatId=f["format_id"], format=f["format"])  # type: ignore
-		else:
-			node.format = f["format"]
-		node.save(); count += 1
-	return count
-
-
-def fetch_all_movies() -> List[Dict]:
+def fetch_all_movies(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(MovieORM).all()
+		rows = _only(session.query(MovieORM), MovieORM.movie_id, ids).all()
 		return [{
 			"movie_id": r.movie_id,
 			"title": r.title,
@@ -360,33 +185,9 @@ def fetch_all_movies() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_movies(batch: List[Dict]) -> int:
-	count = 0
-	for m in batch:
-		node = MovieNode.nodes.get_or_none(movieId=m["movie_id"])  # type: ignore
-		if node is None:
-			node = MovieNode(
-				movieId=m["movie_id"],
-				title=m["title"],
-				releaseYear=m["release_year"],
-				runtimeMin=m["runtime_min"],
-				rating=m["rating"],
-				summary=m["summary"],
-			)  # type: ignore
-		else:
-			node.title = m["title"]
-			node.releaseYear = m["release_year"]
-			node.runtimeMin = m["runtime_min"]
-			node.rating = m["rating"]
-			node.summary = m["summary"]
-		node.save()
-		count += 1
-	return count
-
-
-def fetch_all_locations() -> List[Dict]:
+def fetch_all_locations(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(LocationORM).all()
+		rows = _only(session.query(LocationORM), LocationORM.location_id, ids).all()
 		return [{
 			"location_id": r.location_id,
 			"address": r.address,
@@ -394,22 +195,9 @@ def fetch_all_locations() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_locations(batch: List[Dict]) -> int:
-	count = 0
-	for l in batch:
-		node = LocationNode.nodes.get_or_none(locationId=l["location_id"])  # type: ignore
-		if node is None:
-			node = LocationNode(locationId=l["location_id"], address=l["address"], city=l["city"])  # type: ignore
-		else:
-			node.address = l["address"]
-			node.city = l["city"]
-		node.save(); count += 1
-	return count
-
-
-def fetch_all_inventory_items() -> List[Dict]:
+def fetch_all_inventory_items(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(InventoryItemORM).all()
+		rows = _only(session.query(InventoryItemORM), InventoryItemORM.inventory_item_id, ids).all()
 		return [{
 			"inventory_item_id": r.inventory_item_id,
 			"movie_id": r.movie_id,
@@ -419,41 +207,9 @@ def fetch_all_inventory_items() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_inventory_items(batch: List[Dict]) -> int:
-	count = 0
-	for ii in batch:
-		node = InventoryItemNode.nodes.get_or_none(inventoryItemId=ii["inventory_item_id"])  # type: ignore
-		if node is None:
-			node = InventoryItemNode(inventoryItemId=ii["inventory_item_id"], status=bool(ii["status"]))  # type: ignore
-		else:
-			node.status = bool(ii["status"])  # type: ignore
-		node.save()
-		# link to movie & location
-		mv = MovieNode.nodes.get_or_none(movieId=ii["movie_id"])  # type: ignore
-		loc = LocationNode.nodes.get_or_none(locationId=ii["location_id"])  # type: ignore
-		fmt = FormatNode.nodes.get_or_none(formatId=ii["format_id"])  # type: ignore
-		try:
-			if mv:
-				node.movie.connect(mv)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		try:
-			if loc:
-				node.location.connect(loc)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		try:
-			if fmt:
-				node.format.connect(fmt)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		count += 1
-	return count
-
-
-def fetch_all_employees() -> List[Dict]:
+def fetch_all_employees(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(EmployeeORM).all()
+		rows = _only(session.query(EmployeeORM), EmployeeORM.employee_id, ids).all()
 		return [{
 			"employee_id": r.employee_id,
 			"first_name": r.first_name,
@@ -464,32 +220,9 @@ def fetch_all_employees() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_employees(batch: List[Dict]) -> int:
-	count = 0
-	for e in batch:
-		node = EmployeeNode.nodes.get_or_none(employeeId=e["employee_id"])  # type: ignore
-		if node is None:
-			node = EmployeeNode(
-				employeeId=e["employee_id"],
-				firstName=e["first_name"],
-				lastName=e["last_name"],
-				phoneNumber=e["phone_number"],
-				email=e["email"],
-				isActive=bool(e["is_active"]),
-			)  # type: ignore
-		else:
-			node.firstName = e["first_name"]
-			node.lastName = e["last_name"]
-			node.phoneNumber = e["phone_number"]
-			node.email = e["email"]
-			node.isActive = bool(e["is_active"])  # type: ignore
-		node.save(); count += 1
-	return count
-
-
-def fetch_all_rentals() -> List[Dict]:
+def fetch_all_rentals(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(RentalORM).all()
+		rows = _only(session.query(RentalORM), RentalORM.rental_id, ids).all()
 		return [{
 			"rental_id": r.rental_id,
 			"customer_id": r.customer_id,
@@ -503,106 +236,30 @@ def fetch_all_rentals() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_rentals(batch: List[Dict]) -> int:
-	count = 0
-	for r in batch:
-		node = RentalNode.nodes.get_or_none(rentalId=r["rental_id"])  # type: ignore
-		if node is None:
-			node = RentalNode(
-				rentalId=r["rental_id"],
-				rentedAtDatetime=r["rented_at_datetime"],
-				returnedAtDatetime=r["returned_at_datetime"],
-				dueAtDatetime=r["due_at_datetime"],
-				reservedAtDatetime=r["reserved_at_datetime"],
-				status=r["status"],
-			)  # type: ignore
-		else:
-			node.rentedAtDatetime = r["rented_at_datetime"]
-			node.returnedAtDatetime = r["returned_at_datetime"]
-			node.dueAtDatetime = r["due_at_datetime"]
-			node.reservedAtDatetime = r["reserved_at_datetime"]
-			node.status = r["status"]
-		node.save()
-		cust = CustomerNode.nodes.get_or_none(customerId=r["customer_id"])  # type: ignore
-		promo = None
-		emp = None
-		if r.get("promo_code_id") is not None:
-			promo = PromoCodeNode.nodes.get_or_none(promoCodeId=r["promo_code_id"])  # type: ignore
-		if r.get("employee_id") is not None:
-			emp = EmployeeNode.nodes.get_or_none(employeeId=r["employee_id"])  # type: ignore
-		try:
-			if cust:
-				cust.rentals.connect(node)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		try:
-			if promo:
-				node.promo.connect(promo)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		try:
-			if emp:
-				node.employee.connect(emp)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		count += 1
-	return count
-
-
-def fetch_all_rental_items() -> List[Dict]:
+def fetch_all_rental_items(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	"""Fetch rental_item join rows: rental_id, inventory_item_id."""
 	with SessionLocal() as session:
 		# Use raw SQL as ORM class is not defined
-		rows = session.execute(
-			text("SELECT rental_id, inventory_item_id FROM rental_item ORDER BY rental_id, inventory_item_id")
-		).fetchall()
+		rows = session.execute(*_where_in(
+			"SELECT rental_id, inventory_item_id FROM rental_item {where} ORDER BY rental_id, inventory_item_id",
+			"rental_id", ids,
+		)).fetchall()
 		return [{"rental_id": r[0], "inventory_item_id": r[1]} for r in rows]
 
 
-def fetch_all_movie_genres() -> List[Dict]:
-    """Fetch movie_genre join rows: movie_id, genre_id."""
-    with SessionLocal() as session:
-        rows = session.execute(
-            text("SELECT movie_id, genre_id FROM movie_genre ORDER BY movie_id, genre_id")
-        ).fetchall()
-        return [{"movie_id": r[0], "genre_id": r[1]} for r in rows]
-
-
-def wire_movie_genres(batch: List[Dict]) -> int:
-    """Create (:Movie)-[:OF_GENRE]->(:Genre) edges from join rows."""
-    count = 0
-    for mg in batch:
-        mv = MovieNode.nodes.get_or_none(movieId=mg["movie_id"])  # type: ignore
-        gn = GenreNode.nodes.get_or_none(genreId=mg["genre_id"])  # type: ignore
-        if not mv or not gn:
-            continue
-        try:
-            mv.genres.connect(gn)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        count += 1
-    return count
-
-
-def wire_rental_items(batch: List[Dict]) -> int:
-	"""Create (:Rental)-[:HAS_ITEM]->(:InventoryItem) edges from join rows."""
-	count = 0
-	for ri in batch:
-		rent = RentalNode.nodes.get_or_none(rentalId=ri["rental_id"])  # type: ignore
-		item = InventoryItemNode.nodes.get_or_none(inventoryItemId=ri["inventory_item_id"])  # type: ignore
-		if not rent or not item:
-			continue
-		try:
-			rent.items.connect(item)  # type: ignore[attr-defined]
-		except Exception:
-			pass
-		count += 1
-	return count
-
-
-def fetch_all_fees() -> List[Dict]:
+def fetch_all_movie_genres(ids: Optional[Iterable[int]] = None) -> List[Dict]:
+	"""Fetch movie_genre join rows: movie_id, genre_id."""
 	with SessionLocal() as session:
-		rows = session.query(FeeORM).all()
+		rows = session.execute(*_where_in(
+			"SELECT movie_id, genre_id FROM movie_genre {where} ORDER BY movie_id, genre_id",
+			"movie_id", ids,
+		)).fetchall()
+		return [{"movie_id": r[0], "genre_id": r[1]} for r in rows]
+
+
+def fetch_all_fees(ids: Optional[Iterable[int]] = None) -> List[Dict]:
+	with SessionLocal() as session:
+		rows = _only(session.query(FeeORM), FeeORM.fee_id, ids).all()
 		return [{
 			"fee_id": r.fee_id,
 			"fee_type": r.fee_type,
@@ -610,22 +267,9 @@ def fetch_all_fees() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_fees(batch: List[Dict]) -> int:
-	count = 0
-	for f in batch:
-		node = FeeNode.nodes.get_or_none(feeId=f["fee_id"])  # type: ignore
-		if node is None:
-			node = FeeNode(feeId=f["fee_id"], feeType=f["fee_type"], amountDkk=f["amount_dkk"])  # type: ignore
-		else:
-			node.feeType = f["fee_type"]
-			node.amountDkk = f["amount_dkk"]
-		node.save(); count += 1
-	return count
-
-
-def fetch_all_promo_codes() -> List[Dict]:
+def fetch_all_promo_codes(ids: Optional[Iterable[int]] = None) -> List[Dict]:
 	with SessionLocal() as session:
-		rows = session.query(PromoCodeORM).all()
+		rows = _only(session.query(PromoCodeORM), PromoCodeORM.promo_code_id, ids).all()
 		return [{
 			"promo_code_id": r.promo_code_id,
 			"code": r.code,
@@ -637,70 +281,216 @@ def fetch_all_promo_codes() -> List[Dict]:
 		} for r in rows]
 
 
-def upsert_promo_codes(batch: List[Dict]) -> int:
-	count = 0
-	for p in batch:
-		node = PromoCodeNode.nodes.get_or_none(promoCodeId=p["promo_code_id"])  # type: ignore
-		if node is None:
-			node = PromoCodeNode(
-				promoCodeId=p["promo_code_id"],
-				code=p["code"],
-				description=p["description"],
-				percentOff=p["percent_off"],
-				amountOffDkk=p["amount_off_dkk"],
-				startsAt=p["starts_at"],
-				endsAt=p["ends_at"],
-			)  # type: ignore
-		else:
-			node.code = p["code"]
-			node.description = p["description"]
-			node.percentOff = p["percent_off"]
-			node.amountOffDkk = p["amount_off_dkk"]
-			node.startsAt = p["starts_at"]
-			node.endsAt = p["ends_at"]
-		node.save(); count += 1
-	return count
-
-
-def fetch_all_payments() -> List[Dict]:
+def fetch_all_payments(ids: Optional[Iterable[int]] = None) -> List[Dict]:
+	"""Payments with the paying customer taken from their rental."""
 	with SessionLocal() as session:
-		rows = session.query(PaymentORM).all()
+		query = (
+			session.query(PaymentORM, RentalORM.customer_id)
+			.join(RentalORM, RentalORM.rental_id == PaymentORM.rental_id)
+		)
+		rows = _only(query, PaymentORM.payment_id, ids).all()
 		return [{
-			"payment_id": r.payment_id,
-			"rental_id": r.rental_id,
-			"amount_dkk": float(r.amount_dkk) if r.amount_dkk is not None else None,
-			"created_at": r.created_at,
-		} for r in rows]
-
-
-def upsert_payments(batch: List[Dict]) -> int:
-	count = 0
-	for p in batch:
-		node = PaymentNode.nodes.get_or_none(paymentId=p["payment_id"])  # type: ignore
-		if node is None:
-			node = PaymentNode(paymentId=p["payment_id"], amountDkk=p["amount_dkk"], createdAt=p["created_at"])  # type: ignore
-		else:
-			node.amountDkk = p["amount_dkk"]
-			node.createdAt = p["created_at"]
-		node.save()
-		rent = RentalNode.nodes.get_or_none(rentalId=p["rental_id"])  # type: ignore
-		if rent:
-			try:
-				node.rental.connect(rent)  # type: ignore[attr-defined]
-			except Exception:
-				pass
-			# derive customer from rental relationship if available
-			try:
-				cust = CustomerNode.nodes.get_or_none(customerId=rent.customer.single().customerId)  # type: ignore[attr-defined]
-			except Exception:
-				cust = None
-			if cust:
-				try:
-					cust.payments.connect(node)  # type: ignore[attr-defined]
-				except Exception:
-					pass
-		count += 1
-	return count
+			"payment_id": p.payment_id,
+			"rental_id": p.rental_id,
+			"customer_id": customer_id,
+			"amount_dkk": float(p.amount_dkk) if p.amount_dkk is not None else None,
+			"created_at": p.created_at,
+		} for p, customer_id in rows]
+
+
+# ─────────────────────────── Bulk Cypher writers ────────────────────────────
+
+class NodeSpec(NamedTuple):
+	"""MySQL rows → nodes of `model`, merged on `key` (row field `id_field`)."""
+	entity: str
+	model: Type[StructuredNode]
+	key: str
+	id_field: str
+	fetch: Callable[[], List[Dict]]
+	props: Callable[[Dict], Dict[str, Any]]
+
+
+class RelSpec(NamedTuple):
+	"""MySQL rows → (start)-[rel_type]->(end) edges between existing nodes."""
+	entity: str
+	fetch: Callable[[], List[Dict]]
+	start: Type[StructuredNode]
+	start_key: str
+	start_field: str
+	rel_type: str
+	end: Type[StructuredNode]
+	end_key: str
+	end_field: str
+
+
+class EntityTiming(NamedTuple):
+	entity: str
+	rows: int
+	written: int
+	batches: int
+	seconds: float
+
+
+def deflate_props(model: Type[StructuredNode], props: Dict[str, Any]) -> Dict[str, Any]:
+	"""Convert values the way neomodel's save() would (e.g. datetimes to epoch floats)."""
+	defined = model.defined_properties(rels=False, aliases=False)
+	out: Dict[str, Any] = {}
+	for name, value in props.items():
+		prop = defined[name]
+		if value is None and prop.has_default:
+			value = prop.default_value()
+		out[name] = prop.deflate(value) if value is not None else None
+	return out
+
+
+def run_batch(cypher: str, rows: List[Dict]) -> int:
+	"""Run one UNWIND statement for `rows` in its own transaction; returns rows written."""
+	with db.transaction:
+		results, _ = db.cypher_query(cypher, {"rows": rows})
+	return results[0][0] if results else 0
+
+
+def upsert_nodes(spec: NodeSpec, rows: List[Dict], batch_size: int) -> EntityTiming:
+	label = spec.model.__label__
+	cypher = (
+		f"UNWIND $rows AS row "
+		f"MERGE (n:{label} {{{spec.key}: row.id}}) "
+		f"SET n += row.props "
+		f"RETURN count(n)"
+	)
+	start = time.perf_counter()
+	written = batches = 0
+	for batch in chunked(rows, batch_size):
+		params = [{"id": r[spec.id_field], "props": deflate_props(spec.model, spec.props(r))} for r in batch]
+		written += run_batch(cypher, params)
+		batches += 1
+	return EntityTiming(spec.entity, len(rows), written, batches, time.perf_counter() - start)
+
+
+def merge_relationships(spec: RelSpec, rows: List[Dict], batch_size: int) -> EntityTiming:
+	cypher = (
+		f"UNWIND $rows AS row "
+		f"MATCH (a:{spec.start.__label__} {{{spec.start_key}: row.start}}) "
+		f"MATCH (b:{spec.end.__label__} {{{spec.end_key}: row.end}}) "
+		f"MERGE (a)-[:{spec.rel_type}]->(b) "
+		f"RETURN count(*)"
+	)
+	pairs = [
+		{"start": r[spec.start_field], "end": r[spec.end_field]}
+		for r in rows
+		if r.get(spec.start_field) is not None and r.get(spec.end_field) is not None
+	]
+	start = time.perf_counter()
+	written = batches = 0
+	for batch in chunked(pairs, batch_size):
+		written += run_batch(cypher, batch)
+		batches += 1
+	return EntityTiming(spec.entity, len(pairs), written, batches, time.perf_counter() - start)
+
+
+# ─────────────────────────── Entities & relationships ───────────────────────
+
+NODES: List[NodeSpec] = [
+	NodeSpec("genres", GenreNode, "genreId", "genre_id", fetch_all_genres,
+		lambda g: {"name": g["name"]}),
+	NodeSpec("formats", FormatNode, "formatId", "format_id", fetch_all_formats,
+		lambda f: {"format": f["format"]}),
+	NodeSpec("memberships", MembershipNode, "membershipId", "membership_id", fetch_all_memberships,
+		lambda m: {"membership": m["membership"]}),
+	NodeSpec("locations", LocationNode, "locationId", "location_id", fetch_all_locations,
+		lambda l: {"address": l["address"], "city": l["city"]}),
+	NodeSpec("movies", MovieNode, "movieId", "movie_id", fetch_all_movies,
+		lambda m: {
+			"title": m["title"],
+			"releaseYear": m["release_year"],
+			"runtimeMin": m["runtime_min"],
+			"rating": m["rating"],
+			"summary": m["summary"],
+		}),
+	NodeSpec("customers", CustomerNode, "customerId", "customer_id", fetch_all_customers,
+		lambda c: {
+			"firstName": c["first_name"],
+			"lastName": c["last_name"],
+			"email": c["email"],
+			"phoneNumber": c["phone_number"],
+			"createdAt": c["created_at"],
+		}),
+	NodeSpec("addresses", AddressNode, "addressId", "address_id", fetch_all_addresses,
+		lambda a: {"address": a["address"], "city": a["city"], "postCode": a["post_code"]}),
+	NodeSpec("membership plans", MembershipPlanNode, "membershipPlanId", "membership_plan_id", fetch_all_membership_plans,
+		lambda m: {"monthlyCost": m["monthly_cost"], "startsOn": m["starts_on"], "endsOn": m["ends_on"]}),
+	NodeSpec("inventory items", InventoryItemNode, "inventoryItemId", "inventory_item_id", fetch_all_inventory_items,
+		lambda ii: {"status": bool(ii["status"])}),
+	NodeSpec("employees", EmployeeNode, "employeeId", "employee_id", fetch_all_employees,
+		lambda e: {
+			"firstName": e["first_name"],
+			"lastName": e["last_name"],
+			"phoneNumber": e["phone_number"],
+			"email": e["email"],
+			"isActive": bool(e["is_active"]),
+		}),
+	NodeSpec("fees", FeeNode, "feeId", "fee_id", fetch_all_fees,
+		lambda f: {"feeType": f["fee_type"], "amountDkk": f["amount_dkk"]}),
+	NodeSpec("promo codes", PromoCodeNode, "promoCodeId", "promo_code_id", fetch_all_promo_codes,
+		lambda p: {
+			"code": p["code"],
+			"description": p["description"],
+			"percentOff": p["percent_off"],
+			"amountOffDkk": p["amount_off_dkk"],
+			"startsAt": p["starts_at"],
+			"endsAt": p["ends_at"],
+		}),
+	NodeSpec("rentals", RentalNode, "rentalId", "rental_id", fetch_all_rentals,
+		lambda r: {
+			"rentedAtDatetime": r["rented_at_datetime"],
+			"returnedAtDatetime": r["returned_at_datetime"],
+			"dueAtDatetime": r["due_at_datetime"],
+			"reservedAtDatetime": r["reserved_at_datetime"],
+			"status": r["status"],
+		}),
+	NodeSpec("payments", PaymentNode, "paymentId", "payment_id", fetch_all_payments,
+		lambda p: {"amountDkk": p["amount_dkk"], "createdAt": p["created_at"]}),
+]
+
+# Directions follow the OGM relationship definitions.
+RELATIONSHIPS: List[RelSpec] = [
+	RelSpec("customer -HAS_ADDRESS-> address", fetch_all_addresses,
+		CustomerNode, "customerId", "customer_id", "HAS_ADDRESS", AddressNode, "addressId", "address_id"),
+	RelSpec("plan -IS_MEMBERSHIP_TYPE-> membership", fetch_all_membership_plans,
+		MembershipPlanNode, "membershipPlanId", "membership_plan_id", "IS_MEMBERSHIP_TYPE", MembershipNode, "membershipId", "membership_id"),
+	RelSpec("plan -HAS_MEMBERSHIP-> customer", fetch_all_membership_plans,
+		MembershipPlanNode, "membershipPlanId", "membership_plan_id", "HAS_MEMBERSHIP", CustomerNode, "customerId", "customer_id"),
+	RelSpec("movie -OF_GENRE-> genre", fetch_all_movie_genres,
+		MovieNode, "movieId", "movie_id", "OF_GENRE", GenreNode, "genreId", "genre_id"),
+	RelSpec("item -IS_COPY_OF-> movie", fetch_all_inventory_items,
+		InventoryItemNode, "inventoryItemId", "inventory_item_id", "IS_COPY_OF", MovieNode, "movieId", "movie_id"),
+	RelSpec("item -LOCATED_AT-> location", fetch_all_inventory_items,
+		InventoryItemNode, "inventoryItemId", "inventory_item_id", "LOCATED_AT", LocationNode, "locationId", "location_id"),
+	RelSpec("item -HAS_FORMAT-> format", fetch_all_inventory_items,
+		InventoryItemNode, "inventoryItemId", "inventory_item_id", "HAS_FORMAT", FormatNode, "formatId", "format_id"),
+	RelSpec("customer -RENTED-> rental", fetch_all_rentals,
+		CustomerNode, "customerId", "customer_id", "RENTED", RentalNode, "rentalId", "rental_id"),
+	RelSpec("rental -USED_PROMO-> promo", fetch_all_rentals,
+		RentalNode, "rentalId", "rental_id", "USED_PROMO", PromoCodeNode, "promoCodeId", "promo_code_id"),
+	RelSpec("rental -PROCESSED_BY-> employee", fetch_all_rentals,
+		RentalNode, "rentalId", "rental_id", "PROCESSED_BY", EmployeeNode, "employeeId", "employee_id"),
+	RelSpec("rental -HAS_ITEM-> item", fetch_all_rental_items,
+		RentalNode, "rentalId", "rental_id", "HAS_ITEM", InventoryItemNode, "inventoryItemId", "inventory_item_id"),
+	RelSpec("payment -FOR_RENTAL-> rental", fetch_all_payments,
+		PaymentNode, "paymentId", "payment_id", "FOR_RENTAL", RentalNode, "rentalId", "rental_id"),
+	RelSpec("customer -MADE_PAYMENT-> payment", fetch_all_payments,
+		CustomerNode, "customerId", "customer_id", "MADE_PAYMENT", PaymentNode, "paymentId", "payment_id"),
+]
+
+
+def print_report(timings: List[EntityTiming]) -> None:
+	print(f"\n{'entity':<40}{'rows':>10}{'written':>10}{'batches':>9}{'seconds':>10}{'rows/s':>10}")
+	for t in timings:
+		rate = t.rows / t.seconds if t.seconds else 0.0
+		print(f"{t.entity:<40}{t.rows:>10}{t.written:>10}{t.batches:>9}{t.seconds:>10.2f}{rate:>10.0f}")
+	total = sum(t.seconds for t in timings)
+	print(f"{'total':<40}{sum(t.rows for t in timings):>10}{sum(t.written for t in timings):>10}"
+		f"{sum(t.batches for t in timings):>9}{total:>10.2f}")
 
 
 def main() -> None:
@@ -709,92 +499,33 @@ def main() -> None:
 		batch_size = int(os.getenv("CUSTOMER_MIGRATE_BATCH", "500"))
 	except ValueError:
 		batch_size = 500
-	# Order: reference types first
-	migrate_addresses(batch_size=batch_size)
-	migrate_membership_plans(batch_size=batch_size)
-	# Migrate genres and formats
-	items = fetch_all_genres(); migrated = 0; total = len(items); print(f"Found {total} genres in MySQL.")
-	for b in chunked(items, batch_size): migrated += upsert_genres(b); print(f"Migrated {migrated}/{total} genres…")
-	print(f"Done. Migrated {migrated} genres to Neo4j.")
-
-	items = fetch_all_formats(); migrated = 0; total = len(items); print(f"Found {total} formats in MySQL.")
-	for b in chunked(items, batch_size): migrated += upsert_formats(b); print(f"Migrated {migrated}/{total} formats…")
-	print(f"Done. Migrated {migrated} formats to Neo4j.")
-
-	migrate_movies_items = fetch_all_movies(); migrated = 0; total = len(migrate_movies_items); print(f"Found {total} movies in MySQL.")
-	for b in chunked(migrate_movies_items, batch_size): migrated += upsert_movies(b); print(f"Migrated {migrated}/{total} movies…")
-	print(f"Done. Migrated {migrated} movies to Neo4j.")
-
-	migrate_locations_items = fetch_all_locations(); migrated = 0; total = len(migrate_locations_items); print(f"Found {total} locations in MySQL.")
-	for b in chunked(migrate_locations_items, batch_size): migrated += upsert_locations(b); print(f"Migrated {migrated}/{total} locations…")
-	print(f"Done. Migrated {migrated} locations to Neo4j.")
-
-	# Core entity: customers
-	migrate_customers(batch_size=batch_size)
-
-	inv_items = fetch_all_inventory_items(); migrated = 0; total = len(inv_items); print(f"Found {total} inventory items in MySQL.")
-	for b in chunked(inv_items, batch_size): migrated += upsert_inventory_items(b); print(f"Migrated {migrated}/{total} inventory items…")
-	print(f"Done. Migrated {migrated} inventory items to Neo4j.")
 
-	emps = fetch_all_employees(); migrated = 0; total = len(emps); print(f"Found {total} employees in MySQL.")
-	for b in chunked(emps, batch_size): migrated += upsert_employees(b); print(f"Migrated {migrated}/{total} employees…")
-	print(f"Done. Migrated {migrated} employees to Neo4j.")
+	# Several specs read the same table; fetch each one once.
+	cache: Dict[Callable[[], List[Dict]], List[Dict]] = {}
+	def rows_for(fetch: Callable[[], List[Dict]]) -> List[Dict]:
+		if fetch not in cache:
+			cache[fetch] = fetch()
+		return cache[fetch]
 
-	# Rentals and Payments after references exist
-	rents = fetch_all_rentals(); migrated = 0; total = len(rents); print(f"Found {total} rentals in MySQL.")
-	for b in chunked(rents, batch_size): migrated += upsert_rentals(b); print(f"Migrated {migrated}/{total} rentals…")
-	print(f"Done. Migrated {migrated} rentals to Neo4j.")
+	# Unique constraints back the MERGE lookups below
+	install_labels()
 
-	# Wire rental items (join table) into graph edges
-	ri_rows = fetch_all_rental_items(); wired = 0; total = len(ri_rows); print(f"Found {total} rental_item rows in MySQL.")
-	for b in chunked(ri_rows, batch_size): wired += wire_rental_items(b); print(f"Wired {wired}/{total} rental_item edges…")
-	print(f"Done. Wired {wired} rental_item edges to Neo4j.")
+	timings: List[EntityTiming] = []
+	# Nodes first, so every relationship below can match both ends in one pass
+	for spec in NODES:
+		rows = rows_for(spec.fetch)
+		print(f"Found {len(rows)} {spec.entity} in MySQL.")
+		t = upsert_nodes(spec, rows, batch_size)
+		print(f"Done. Upserted {t.written} {spec.entity} in {t.batches} batches ({t.seconds:.2f}s).")
+		timings.append(t)
 
-	# Wire movie_genre edges
-	mgs = fetch_all_movie_genres(); wired = 0; total = len(mgs); print(f"Found {total} movie_genre rows in MySQL.")
-	for b in chunked(mgs, batch_size): wired += wire_movie_genres(b); print(f"Wired {wired}/{total} movie_genre edges…")
-	print(f"Done. Wired {wired} movie_genre edges to Neo4j.")
+	for spec in RELATIONSHIPS:
+		t = merge_relationships(spec, rows_for(spec.fetch), batch_size)
+		print(f"Done. Wired {t.written}/{t.rows} {spec.entity} edges in {t.batches} batches ({t.seconds:.2f}s).")
+		timings.append(t)
 
-	fees = fetch_all_fees(); migrated = 0; total = len(fees); print(f"Found {total} fees in MySQL.")
-	for b in chunked(fees, batch_size): migrated += upsert_fees(b); print(f"Migrated {migrated}/{total} fees…")
-	print(f"Done. Migrated {migrated} fees to Neo4j.")
-
-	promos = fetch_all_promo_codes(); migrated = 0; total = len(promos); print(f"Found {total} promo codes in MySQL.")
-	for b in chunked(promos, batch_size): migrated += upsert_promo_codes(b); print(f"Migrated {migrated}/{total} promo codes…")
-	print(f"Done. Migrated {migrated} promo codes to Neo4j.")
-
-	pays = fetch_all_payments(); migrated = 0; total = len(pays); print(f"Found {total} payments in MySQL.")
-	for b in chunked(pays, batch_size): migrated += upsert_payments(b); print(f"Migrated {migrated}/{total} payments…")
-	print(f"Done. Migrated {migrated} payments to Neo4j.")
-
-	# ─────────────────────────── Backfill relationships ───────────────────────────
-	print("Starting relationship backfill pass…")
-	# Re-run upserts that include relationship connects now that all nodes exist
-	addr = fetch_all_addresses(); wired = 0; total = len(addr); print(f"Backfill: {total} addresses → customers")
-	for b in chunked(addr, batch_size): wired += upsert_addresses(b); print(f"Backfilled {wired}/{total} address links…")
-
-	plans = fetch_all_membership_plans(); wired = 0; total = len(plans); print(f"Backfill: {total} membership plans → membership/customer")
-	for b in chunked(plans, batch_size): wired += upsert_membership_plans(b); print(f"Backfilled {wired}/{total} membership plan links…")
-
-	items = fetch_all_inventory_items(); wired = 0; total = len(items); print(f"Backfill: {total} inventory items → movie/location/format")
-	for b in chunked(items, batch_size): wired += upsert_inventory_items(b); print(f"Backfilled {wired}/{total} inventory item links…")
-
-	# Backfill: movie_genre edges
-	mgs = fetch_all_movie_genres(); wired = 0; total = len(mgs); print(f"Backfill: {total} movie_genre edges (OF_GENRE)")
-	for b in chunked(mgs, batch_size): wired += wire_movie_genres(b); print(f"Backfilled {wired}/{total} movie_genre edges…")
-
-	rents = fetch_all_rentals(); wired = 0; total = len(rents); print(f"Backfill: {total} rentals → customer/promo/employee")
-	for b in chunked(rents, batch_size): wired += upsert_rentals(b); print(f"Backfilled {wired}/{total} rental links…")
-
-	ri_rows = fetch_all_rental_items(); wired = 0; total = len(ri_rows); print(f"Backfill: {total} rental_item edges (HAS_ITEM)")
-	for b in chunked(ri_rows, batch_size): wired += wire_rental_items(b); print(f"Backfilled {wired}/{total} rental_item edges…")
-
-	pays = fetch_all_payments(); wired = 0; total = len(pays); print(f"Backfill: {total} payments → rental/customer")
-	for b in chunked(pays, batch_size): wired += upsert_payments(b); print(f"Backfilled {wired}/{total} payment links…")
-
-	print("Relationship backfill complete.")
+	print_report(timings)
 
 
 if __name__ == "__main__":
 	main()
-
@@ -0,0 +1,193 @@
+"""
+Precomputed co-rental similarity for the Neo4j recommendations endpoint.
+
+Run this from the project root, for example:
+
+    python -m migrations.neo4j_co_rentals --full     # (re)build every edge
+    python -m migrations.neo4j_co_rentals            # follow new rentals forever
+    python -m migrations.neo4j_co_rentals --once     # process pending rentals and exit
+
+GET /api/v1/neo4j/movies/<id>/recommendations (live mode) walks
+Customer→Rental→InventoryItem→Movie twice per request. This job materializes
+the result of that walk as one edge per pair of movies rented by the same
+customers:
+
+    (:Movie)-[:CO_RENTED {weight, sharedGenres, score}]->(:Movie)
+
+- weight:       distinct customers who rented both movies
+- sharedGenres: genres the two movies have in common (cached genre overlap)
+- score:        sharedGenres * 2 + weight, the live endpoint's ranking
+
+Edges are undirected in meaning and stored once, from the lower to the
+higher movieId; the precomputed endpoint mode reads them with an undirected
+pattern.
+
+Incremental refresh: a new rental only changes the pairs that involve the
+movies it contains, so the job recomputes exactly those movies' edges from
+the graph (which makes processing a rental twice harmless). New rentals are
+found through the rentalId unique index, starting a little below the last
+one processed so rentals synced out of order are not missed, and are marked
+with coRentedAt once counted. Genre changes are only picked up by --full.
+The position is kept on a (:CoRentalState) node.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from src.repositories.neo4j.driver import read_query, write_query
+
+CO_RENTAL_INTERVAL = float(os.getenv("CO_RENTAL_INTERVAL_SECONDS", "5"))
+CO_RENTAL_BATCH = int(os.getenv("CO_RENTAL_BATCH_SIZE", "500"))
+# Rentals this far below the last processed id are looked at again (unmarked ones only)
+CO_RENTAL_LOOKBACK = int(os.getenv("CO_RENTAL_LOOKBACK", "10000"))
+# Pairs rented by fewer customers than this get no edge
+CO_RENTAL_MIN_WEIGHT = int(os.getenv("CO_RENTAL_MIN_WEIGHT", "1"))
+STATE_NAME = "co_rented"
+
+STATE_QUERY = "MATCH (s:CoRentalState {name: $name}) RETURN s.lastRentalId, s.updatedAt"
+SAVE_STATE = (
+    "MERGE (s:CoRentalState {name: $name}) "
+    "SET s.lastRentalId = $last, s.updatedAt = datetime() "
+    "RETURN count(s)"
+)
+PENDING_RENTALS = (
+    "MATCH (r:Rental) WHERE r.rentalId > $floor AND r.coRentedAt IS NULL "
+    "WITH r ORDER BY r.rentalId LIMIT $limit "
+    "OPTIONAL MATCH (r)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(m:Movie) "
+    "RETURN r.rentalId, collect(DISTINCT m.movieId)"
+)
+MARK_RENTALS = (
+    "UNWIND $ids AS id MATCH (r:Rental {rentalId: id}) "
+    "SET r.coRentedAt = datetime() RETURN count(r)"
+)
+DROP_EDGES = (
+    "UNWIND $ids AS id MATCH (:Movie {movieId: id})-[e:CO_RENTED]-(:Movie) "
+    "DELETE e RETURN count(e)"
+)
+DROP_ALL_EDGES = "MATCH ()-[e:CO_RENTED]->() WITH e LIMIT $limit DELETE e RETURN count(e)"
+# One movie's co-rented neighbours, scored like the live endpoint.
+# With $higherOnly (full build) each pair is computed once, from its lower end.
+BUILD_EDGES = (
+    "UNWIND $ids AS id "
+    "MATCH (m:Movie {movieId: id})<-[:IS_COPY_OF]-(:InventoryItem)<-[:HAS_ITEM]-(:Rental)<-[:RENTED]-(c:Customer) "
+    "WITH m, collect(DISTINCT c) AS customers "
+    "UNWIND customers AS c "
+    "MATCH (c)-[:RENTED]->(:Rental)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(o:Movie) "
+    "WHERE o.movieId <> m.movieId AND (NOT $higherOnly OR o.movieId > m.movieId) "
+    "WITH m, o, count(DISTINCT c) AS weight "
+    "WHERE weight >= $minWeight "
+    "OPTIONAL MATCH (m)-[:OF_GENRE]->(g:Genre)<-[:OF_GENRE]-(o) "
+    "WITH m, o, weight, count(DISTINCT g) AS shared "
+    "WITH CASE WHEN m.movieId < o.movieId THEN m ELSE o END AS a, "
+    "     CASE WHEN m.movieId < o.movieId THEN o ELSE m END AS b, weight, shared "
+    "MERGE (a)-[e:CO_RENTED]->(b) "
+    "SET e.weight = weight, e.sharedGenres = shared, e.score = shared * 2 + weight, e.updatedAt = datetime() "
+    "RETURN count(e)"
+)
+
+
+def _write(cypher: str, params: Dict[str, Any]) -> int:
+    # Managed write transaction: retried on transient errors (every statement here is idempotent)
+    results, _ = write_query(cypher, params)
+    return results[0][0] if results else 0
+
+
+def load_state() -> Optional[int]:
+    results, _ = read_query(STATE_QUERY, {"name": STATE_NAME})
+    return results[0][0] if results else None
+
+
+def rebuild_movies(movie_ids: List[int], min_weight: int = CO_RENTAL_MIN_WEIGHT) -> int:
+    """Recompute every CO_RENTED edge of these movies; returns edges written."""
+    if not movie_ids:
+        return 0
+    _write(DROP_EDGES, {"ids": movie_ids})
+    return _write(BUILD_EDGES, {"ids": movie_ids, "higherOnly": False, "minWeight": min_weight})
+
+
+def full_build(batch_size: int = CO_RENTAL_BATCH, min_weight: int = CO_RENTAL_MIN_WEIGHT) -> None:
+    start = time.perf_counter()
+    # Position first: rentals that arrive during the build are processed afterwards
+    results, _ = read_query("MATCH (r:Rental) RETURN max(r.rentalId)")
+    last = results[0][0] if results and results[0][0] is not None else 0
+
+    dropped = 0
+    while True:
+        n = _write(DROP_ALL_EDGES, {"limit": 10_000})
+        dropped += n
+        if n == 0:
+            break
+
+    results, _ = read_query("MATCH (m:Movie) RETURN m.movieId ORDER BY m.movieId")
+    movie_ids = [row[0] for row in results]
+    written = 0
+    for i in range(0, len(movie_ids), batch_size):
+        written += _write(
+            BUILD_EDGES,
+            {"ids": movie_ids[i:i + batch_size], "higherOnly": True, "minWeight": min_weight},
+        )
+    _write(SAVE_STATE, {"name": STATE_NAME, "last": last})
+    print(
+        f"[co-rentals] full build: {len(movie_ids)} movies, {dropped} old edges dropped, "
+        f"{written} edges written in {time.perf_counter() - start:.2f}s (last rental {last})"
+    )
+
+
+def process_pending(batch_size: int = CO_RENTAL_BATCH, lookback: int = CO_RENTAL_LOOKBACK,
+                    min_weight: int = CO_RENTAL_MIN_WEIGHT) -> int:
+    """Count one batch of new rentals into the edges; returns rentals processed."""
+    last = load_state()
+    if last is None:
+        full_build(batch_size, min_weight)
+        return 0
+    results, _ = read_query(PENDING_RENTALS, {"floor": last - lookback, "limit": batch_size})
+    if not results:
+        return 0
+    start = time.perf_counter()
+    rental_ids = [row[0] for row in results]
+    movie_ids = sorted({mid for _, mids in results for mid in mids if mid is not None})
+    written = rebuild_movies(movie_ids, min_weight)
+    _write(MARK_RENTALS, {"ids": rental_ids})
+    _write(SAVE_STATE, {"name": STATE_NAME, "last": max(last, max(rental_ids))})
+    print(
+        f"[co-rentals] {len(rental_ids)} rentals → {len(movie_ids)} movies, {written} edges "
+        f"in {time.perf_counter() - start:.2f}s (last rental {max(last, max(rental_ids))})"
+    )
+    return len(rental_ids)
+
+
+def run(once: bool = False, interval: float = CO_RENTAL_INTERVAL, batch_size: int = CO_RENTAL_BATCH,
+        lookback: int = CO_RENTAL_LOOKBACK, min_weight: int = CO_RENTAL_MIN_WEIGHT) -> None:
+    while True:
+        try:
+            processed = process_pending(batch_size, lookback, min_weight)
+        except Exception as e:
+            # Rentals are only marked after their movies were rebuilt; retried on the next poll
+            print(f"[co-rentals] refresh failed: {e}")
+            processed = 0
+        if processed:
+            continue
+        if once:
+            return
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain precomputed CO_RENTED edges in Neo4j.")
+    parser.add_argument("--full", action="store_true", help="drop and rebuild every edge, then exit")
+    parser.add_argument("--once", action="store_true", help="process pending rentals and exit")
+    parser.add_argument("--interval", type=float, default=CO_RENTAL_INTERVAL, help="seconds between polls when idle")
+    parser.add_argument("--batch-size", type=int, default=CO_RENTAL_BATCH, help="rentals (or movies for --full) per batch")
+    parser.add_argument("--lookback", type=int, default=CO_RENTAL_LOOKBACK, help="rental ids re-checked below the last one")
+    parser.add_argument("--min-weight", type=int, default=CO_RENTAL_MIN_WEIGHT, help="minimum shared customers for an edge")
+    args = parser.parse_args()
+
+    if args.full:
+        full_build(args.batch_size, args.min_weight)
+    else:
+        run(once=args.once, interval=args.interval, batch_size=args.batch_size,
+            lookback=args.lookback, min_weight=args.min_weight)
@@ -504,15 +504,14 @@ def seed_rentals_and_reservations(
     def random_employee_id() -> int:
         return random.choice(employees).employee_id
 
+    # Shuffle once and pop, so an item is never handed out twice
+    items = [it.inventory_item_id for it in items]
+    random.shuffle(items)
+
     def take_item_ids(k: int = 1) -> list[int]:
-        nonlocal items
         if len(items) < k:
             return []
-        chosen = random.sample(items, k)
-        # remove chosen from the pool so we don't reuse them
-        remaining = [it for it in items if it not in chosen]
-        items = remaining
-        return [c.inventory_item_id for c in chosen]
+        return [items.pop() for _ in range(k)]
 
     created_rentals = 0
     for _ in range(num_rentals):
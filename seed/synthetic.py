@@ -0,0 +1,560 @@
+"""
+Synthetic MySQL dataset for benchmarks and load tests.
+
+Run this from the project root, for example:
+
+    python -m seed.synthetic --customers 10000 --movies 2000 --rentals 50000 --seed 42 --migrate
+    python -m seed.synthetic --customers 1000000 --movies 100000 --rentals 10000000 --reset
+
+Unlike mysql_seed.py, which loads the small hand-written CSV files, this
+generates any number of customers (with address and membership plan),
+movies (with genres), inventory copies and rentals (with rental items).
+The same --seed and counts always produce the same rows, so runs are
+comparable.
+
+- Popularity is skewed: movies are rented following a Zipf distribution
+  (--skew, 0 = uniform) and popular movies get more copies; customers'
+  activity is skewed the same way (--customer-skew). Which ids are popular
+  is a seeded permutation, not the id order.
+- Every table draws from its own random stream, so changing one count does
+  not reshuffle the other tables.
+- Ids are assigned here, starting after the current maximum of each table,
+  so rows reference each other without reading anything back.
+- Rows are streamed: only per-movie copy counts, per-customer rental counts
+  and the copies held by active rentals are kept in memory.
+- --method load-data writes each batch to a temporary file and sends it
+  with LOAD DATA LOCAL INFILE (needs local_infile=ON on the server, set in
+  compose/docker-compose.dev.yml); --method insert sends multi-row INSERTs.
+  The default, auto, uses LOAD DATA when the server allows it.
+- The load runs with unique and foreign key checks off and @bulk_load set,
+  which makes the rental triggers skip their per-row work (see
+  005_movie_rental_triggers.sql). Membership tiers are computed while
+  generating instead.
+- Most rentals are RETURNED; the newest 2% (Scale.open_share) are OPEN, or
+  LATE once past due, and hold their copies (inventory status 0).
+
+--reset empties the domain tables first. --migrate copies the result to
+MongoDB and Neo4j with the migration scripts, so all three backends hold
+the same data.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import tempfile
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+from src.repositories.mysql.orm_models.base import get_engine
+from src.repositories.mysql.pool import CONNECT_TIMEOUT
+
+from .mysql_seed import seed_static_lookups
+
+BATCH_SIZE = 50_000
+
+FIRST_NAMES = [
+    "Anna", "Bo", "Carla", "Dennis", "Emma", "Frederik", "Gitte", "Henrik", "Ida", "Jonas",
+    "Karen", "Lars", "Maja", "Niels", "Olivia", "Peter", "Rasmus", "Sofie", "Thomas", "Ulla",
+]
+LAST_NAMES = [
+    "Andersen", "Berg", "Christensen", "Dahl", "Eriksen", "Frandsen", "Hansen", "Jensen",
+    "Larsen", "Madsen", "Nielsen", "Olsen", "Pedersen", "Rasmussen", "Sørensen", "Thomsen",
+]
+CITIES = [("Copenhagen", "2100"), ("Aarhus", "8000"), ("Odense", "5000"), ("Aalborg", "9000"), ("Esbjerg", "6700")]
+GENRES = [
+    "Action", "Comedy", "Drama", "Horror", "Sci-Fi", "Animation", "Family",
+    "Thriller", "Romance", "Documentary", "Crime", "Fantasy",
+]
+TITLE_WORDS = [
+    "Night", "Shadow", "River", "Last", "Silent", "Iron", "Golden", "Lost", "City", "Dream",
+    "Storm", "Winter", "Secret", "Wild", "Broken", "Star", "Blue", "Empire", "Echo", "Summer",
+]
+# Same thresholds as trg_check_membership_upgrade (rented items per customer)
+MEMBERSHIP_TIERS = [(200, "GOLD", 199.00), (50, "SILVER", 129.00), (0, "BRONZE", 79.00)]
+
+# Truncated by --reset, children first
+DOMAIN_TABLES = [
+    "rental_fee", "payment", "rental_item", "rental", "review", "inventory_item",
+    "movie_genre", "movie", "membership_plan", "address", "customer", "employee", "location",
+]
+
+HISTORY_DAYS = 730
+
+
+@dataclass(frozen=True)
+class Scale:
+    customers: int = 1000
+    movies: int = 500
+    rentals: int = 5000
+    locations: int = 5
+    employees: int = 20
+    copies_per_movie: int = 3
+    max_copies_per_movie: int = 30
+    max_items_per_rental: int = 3
+    skew: float = 1.0
+    customer_skew: float = 0.6
+    open_share: float = 0.02
+    seed: int = 42
+
+
+def _rng(scale: Scale, table: str) -> random.Random:
+    return random.Random(f"{scale.seed}:{table}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Skew
+# ─────────────────────────────────────────────────────────────────────────────
+
+class Zipf:
+    """Ranks in [0, n) with P(rank) roughly proportional to (rank + 1) ** -s.
+
+    Inverts the CDF of the continuous power law, so each draw is O(1) and
+    needs no table of weights.
+    """
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self.n, self.s, self._random = n, s, rng.random
+        self._log_span = math.log(n + 1)
+        if s != 1:
+            self._span = (n + 1) ** (1 - s) - 1
+
+    def __call__(self) -> int:
+        u = self._random()
+        if self.s == 1:
+            x = math.exp(u * self._log_span)
+        else:
+            x = (1 + u * self._span) ** (1 / (1 - self.s))
+        return min(int(x) - 1, self.n - 1)
+
+    def share(self, rank: int) -> float:
+        """Expected fraction of draws that return `rank`."""
+        if self.s == 1:
+            return math.log((rank + 2) / (rank + 1)) / self._log_span
+        return ((rank + 2) ** (1 - self.s) - (rank + 1) ** (1 - self.s)) / self._span
+
+
+class Permutation:
+    """A seeded bijection on [0, n): i -> (i * stride + offset) mod n."""
+
+    def __init__(self, n: int, rng: random.Random):
+        self.n = max(n, 1)
+        stride = rng.randrange(self.n // 3 + 1, self.n + 1)
+        while math.gcd(stride, self.n) != 1:
+            stride += 1
+        self.stride, self.offset = stride, rng.randrange(self.n)
+
+    def __call__(self, i: int) -> int:
+        return (i * self.stride + self.offset) % self.n
+
+
+class Layout:
+    """Id ranges of the generated rows and how popularity maps onto them."""
+
+    def __init__(self, scale: Scale, first: Dict[str, int]):
+        self.scale = scale
+        self.first = first
+        rng = _rng(scale, "popularity")
+        self.movie_rank = Zipf(scale.movies, scale.skew, rng)
+        self.movie_at = Permutation(scale.movies, rng)
+        self.customer_rank = Zipf(scale.customers, scale.customer_skew, rng)
+        self.customer_at = Permutation(scale.customers, rng)
+
+        # Copies follow the expected demand, between 1 and max_copies_per_movie
+        self.copies = array("I", bytes(4 * scale.movies))
+        for rank in range(scale.movies):
+            want = round(scale.copies_per_movie * scale.movies * self.movie_rank.share(rank))
+            self.copies[self.movie_at(rank)] = max(1, min(scale.max_copies_per_movie, want))
+        self.copy_offset = array("Q", bytes(8 * (scale.movies + 1)))
+        for m in range(scale.movies):
+            self.copy_offset[m + 1] = self.copy_offset[m] + self.copies[m]
+
+    def movie_index(self) -> int:
+        return self.movie_at(self.movie_rank())
+
+    def customer_index(self) -> int:
+        return self.customer_at(self.customer_rank())
+
+    def item_id(self, movie_index: int, copy: int) -> int:
+        return self.first["inventory_item"] + self.copy_offset[movie_index] + copy
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Row generators: (table, row) pairs, rows in the column order of COLUMNS
+# ─────────────────────────────────────────────────────────────────────────────
+
+COLUMNS = {
+    "location": ("location_id", "address", "city"),
+    "employee": ("employee_id", "first_name", "last_name", "email", "phone_number", "is_active"),
+    "customer": ("customer_id", "first_name", "last_name", "email", "phone_number", "created_at"),
+    "address": ("address", "city", "post_code", "customer_id"),
+    "membership_plan": ("monthly_cost", "starts_on", "ends_on", "membership_id", "customer_id"),
+    "movie": ("movie_id", "title", "release_year", "runtime_min", "rating", "summary"),
+    "movie_genre": ("movie_id", "genre_id"),
+    "inventory_item": ("inventory_item_id", "movie_id", "location_id", "format_id", "status"),
+    "rental": (
+        "rental_id", "rented_at_datetime", "due_at_datetime", "returned_at_datetime",
+        "status", "customer_id", "employee_id",
+    ),
+    "rental_item": ("rental_id", "inventory_item_id"),
+}
+
+Row = Tuple[Any, ...]
+
+
+def staff_rows(layout: Layout) -> Iterator[Tuple[str, Row]]:
+    scale, first = layout.scale, layout.first
+    rng = _rng(scale, "staff")
+    for n in range(scale.locations):
+        yield "location", (first["location"] + n, f"Hovedgade {n + 1}", rng.choice(CITIES)[0])
+    for n in range(scale.employees):
+        employee_id = first["employee"] + n
+        yield "employee", (
+            employee_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+            f"employee.{employee_id}@synthetic.example", f"+45{employee_id:08d}", 1,
+        )
+
+
+def movie_rows(layout: Layout, genres: Dict[int, str]) -> Iterator[Tuple[str, Row]]:
+    scale, first = layout.scale, layout.first
+    rng = _rng(scale, "movie")
+    genre_ids = sorted(genres)
+    for m in range(scale.movies):
+        movie_id = first["movie"] + m
+        words = rng.sample(TITLE_WORDS, rng.randint(1, 3))
+        movie_genres = rng.sample(genre_ids, rng.randint(1, min(3, len(genre_ids))))
+        yield "movie", (
+            movie_id,
+            f"{' '.join(words)} {movie_id}",
+            rng.randint(1960, 2025),
+            rng.randint(75, 180),
+            round(rng.uniform(3.0, 9.5), 1),
+            f"A {genres[movie_genres[0]].lower()} story about {' and '.join(w.lower() for w in words)}.",
+        )
+        for genre_id in movie_genres:
+            yield "movie_genre", (movie_id, genre_id)
+
+
+def rental_rows(layout: Layout, today: date, held: Set[int], rented_items: array) -> Iterator[Tuple[str, Row]]:
+    """Rentals in date order with their rental items.
+
+    Fills `held` with the copies of OPEN/LATE rentals and `rented_items`
+    with the number of items rented per customer index.
+    """
+    scale, first = layout.scale, layout.first
+    rng = _rng(scale, "rental")
+    randrange, randint = rng.randrange, rng.randint
+    midnight = datetime.combine(today, datetime.min.time())
+    start = midnight - timedelta(days=HISTORY_DAYS)
+    span = HISTORY_DAYS * 86400
+    due_in, one_day = timedelta(days=7), timedelta(days=1)
+    active_from = scale.rentals - int(scale.rentals * scale.open_share)
+
+    def pick() -> int:
+        m = layout.movie_index()
+        return layout.item_id(m, randrange(layout.copies[m]))
+
+    for n in range(scale.rentals):
+        rental_id = first["rental"] + n
+        rented_at = start + timedelta(seconds=span * n // scale.rentals)
+        k = randint(1, scale.max_items_per_rental)
+        items: List[int] = []
+        if n >= active_from:
+            # An active rental holds its copies: pick copies nobody else holds
+            for _ in range(k * 4):
+                item_id = pick()
+                if item_id not in held and item_id not in items:
+                    items.append(item_id)
+                    if len(items) == k:
+                        break
+        is_active = len(items) == k
+        if is_active:
+            held.update(items)
+        else:
+            items = list(dict.fromkeys(pick() for _ in range(k)))
+
+        c = layout.customer_index()
+        rented_items[c] += len(items)
+        due_at = rented_at + due_in
+        if is_active:
+            status, returned_at = ("LATE" if due_at < midnight else "OPEN"), None
+        else:
+            status, returned_at = "RETURNED", rented_at + one_day * randint(1, 9)
+        yield "rental", (
+            rental_id, rented_at, due_at, returned_at, status,
+            first["customer"] + c, first["employee"] + randrange(scale.employees),
+        )
+        for item_id in items:
+            yield "rental_item", (rental_id, item_id)
+
+
+def inventory_rows(layout: Layout, format_ids: Sequence[int], held: Set[int]) -> Iterator[Tuple[str, Row]]:
+    scale, first = layout.scale, layout.first
+    rng = _rng(scale, "inventory_item")
+    for m in range(scale.movies):
+        movie_id = first["movie"] + m
+        for copy in range(layout.copies[m]):
+            item_id = layout.item_id(m, copy)
+            yield "inventory_item", (
+                item_id,
+                movie_id,
+                first["location"] + rng.randrange(scale.locations),
+                rng.choice(format_ids),
+                0 if item_id in held else 1,
+            )
+
+
+def customer_rows(
+    layout: Layout, today: date, rented_items: array, memberships: Dict[str, int]
+) -> Iterator[Tuple[str, Row]]:
+    scale, first = layout.scale, layout.first
+    rng = _rng(scale, "customer")
+    # Customers joined before the rental history starts
+    joined_from = datetime(2018, 1, 1)
+    joined_span = max(1, int((datetime.combine(today, datetime.min.time()) - timedelta(days=HISTORY_DAYS) - joined_from).total_seconds()))
+    plan_ends = today + timedelta(days=365)
+    for c in range(scale.customers):
+        customer_id = first["customer"] + c
+        fname, lname = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        city, post_code = rng.choice(CITIES)
+        yield "customer", (
+            customer_id, fname, lname,
+            # the id keeps the UNIQUE email/phone columns unique
+            f"{fname.lower()}.{customer_id}@synthetic.example",
+            f"+45{customer_id:09d}",
+            joined_from + timedelta(seconds=rng.randrange(joined_span)),
+        )
+        yield "address", (f"{rng.choice(TITLE_WORDS)}vej {rng.randint(1, 200)}", city, post_code, customer_id)
+        tier, cost = next((tier, cost) for threshold, tier, cost in MEMBERSHIP_TIERS if rented_items[c] >= threshold)
+        yield "membership_plan", (cost, today, plan_ends, memberships[tier], customer_id)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Loading
+# ─────────────────────────────────────────────────────────────────────────────
+
+class InsertSink:
+    """Buffers rows of one table and writes them as multi-row INSERTs."""
+
+    def __init__(self, conn, table: str, batch_size: int):
+        self.conn, self.batch_size = conn, batch_size
+        columns = COLUMNS[table]
+        # pymysql sends executemany of an INSERT ... VALUES as multi-row statements
+        self.sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        self.rows: List[Row] = []
+        self.written = 0
+
+    def add(self, row: Row) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        with self.conn.cursor() as cursor:
+            cursor.executemany(self.sql, self.rows)
+        self.conn.commit()
+        self.written += len(self.rows)
+        self.rows = []
+
+
+def _tsv(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+    return str(value)
+
+
+class LoadDataSink:
+    """Spools rows of one table to a file and sends it with LOAD DATA LOCAL INFILE."""
+
+    def __init__(self, conn, table: str, batch_size: int):
+        self.conn, self.batch_size = conn, batch_size
+        self.sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(COLUMNS[table])})"
+        )
+        self.file: Optional[Any] = None
+        self.pending = 0
+        self.written = 0
+
+    def add(self, row: Row) -> None:
+        if self.file is None:
+            self.file = tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="\n", suffix=".tsv", delete=False)
+        self.file.write("\t".join(map(_tsv, row)) + "\n")
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.file is None:
+            return
+        self.file.close()
+        try:
+            with self.conn.cursor() as cursor:
+                cursor.execute(self.sql, (self.file.name,))
+            self.conn.commit()
+        finally:
+            os.unlink(self.file.name)
+            self.file = None
+        self.written += self.pending
+        self.pending = 0
+
+
+def _connect():
+    """A DBAPI connection to the API's database that may send local files."""
+    engine = create_engine(
+        get_engine().url,
+        poolclass=NullPool,
+        connect_args={"local_infile": True, "connect_timeout": CONNECT_TIMEOUT},
+    )
+    return engine.raw_connection()
+
+
+def _rows(conn, sql: str, params: Optional[Sequence[Any]] = None) -> List[Tuple[Any, ...]]:
+    with conn.cursor() as cursor:
+        cursor.execute(sql, params)
+        return list(cursor.fetchall())
+
+
+def _resolve_method(conn, method: str) -> str:
+    if method != "auto":
+        return method
+    rows = _rows(conn, "SHOW GLOBAL VARIABLES LIKE 'local_infile'")
+    if rows and str(rows[0][1]).upper() in ("ON", "1"):
+        return "load-data"
+    print("[synthetic] local_infile is OFF on the server; using multi-row INSERTs")
+    return "insert"
+
+
+def reset() -> None:
+    conn = _connect()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+            for table in DOMAIN_TABLES:
+                cursor.execute(f"TRUNCATE TABLE {table}")
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _load(label: str, rows: Iterator[Tuple[str, Row]], sinks: Dict[str, Any]) -> None:
+    start = time.perf_counter()
+    before = {table: sink.written for table, sink in sinks.items()}
+    for table, row in rows:
+        sinks[table].add(row)
+    for sink in sinks.values():
+        sink.flush()
+    seconds = time.perf_counter() - start
+    counts = {table: sink.written - before[table] for table, sink in sinks.items() if sink.written != before[table]}
+    total = sum(counts.values())
+    detail = ", ".join(f"{table} {n}" for table, n in counts.items())
+    print(f"[synthetic] {label:<10}{total:>12} rows {seconds:>8.1f}s {total / seconds if seconds else 0:>10.0f} rows/s  ({detail})")
+
+
+def build(scale: Scale, batch_size: int = BATCH_SIZE, method: str = "auto") -> Dict[str, int]:
+    """Generate and load the dataset described by `scale`; returns rows written per table."""
+    seed_static_lookups()
+    conn = _connect()
+    try:
+        _rows(conn, "INSERT IGNORE INTO genre (name) VALUES " + ", ".join(["(%s)"] * len(GENRES)), GENRES)
+        conn.commit()
+        genres = dict(_rows(conn, "SELECT genre_id, name FROM genre"))
+        format_ids = [row[0] for row in _rows(conn, "SELECT format_id FROM format ORDER BY format_id")]
+        memberships = {name: membership_id for membership_id, name in _rows(conn, "SELECT membership_id, membership FROM membership")}
+        first = {
+            table: int(_rows(conn, f"SELECT COALESCE(MAX({pk}), 0) + 1 FROM {table}")[0][0])
+            for table, pk in (
+                ("location", "location_id"),
+                ("employee", "employee_id"),
+                ("customer", "customer_id"),
+                ("movie", "movie_id"),
+                ("inventory_item", "inventory_item_id"),
+                ("rental", "rental_id"),
+            )
+        }
+        layout = Layout(scale, first)
+
+        sink_cls = LoadDataSink if _resolve_method(conn, method) == "load-data" else InsertSink
+        sinks = {table: sink_cls(conn, table, batch_size) for table in COLUMNS}
+        # The generated rows are consistent by construction
+        _rows(conn, "SET unique_checks = 0, foreign_key_checks = 0, @bulk_load = 1")
+
+        today = date.today()
+        held: Set[int] = set()
+        rented_items = array("I", bytes(4 * scale.customers))
+        _load("staff", staff_rows(layout), sinks)
+        _load("movies", movie_rows(layout, genres), sinks)
+        # Rentals before inventory and customers: they decide which copies
+        # are out and each customer's membership tier
+        _load("rentals", rental_rows(layout, today, held, rented_items), sinks)
+        _load("inventory", inventory_rows(layout, format_ids, held), sinks)
+        _load("customers", customer_rows(layout, today, rented_items, memberships), sinks)
+
+        _rows(conn, "SET unique_checks = 1, foreign_key_checks = 1, @bulk_load = NULL")
+        return {table: sink.written for table, sink in sinks.items()}
+    finally:
+        conn.close()
+
+
+def migrate() -> None:
+    """Copy the MySQL data to MongoDB and Neo4j."""
+    from migrations import migrate_sql_to_mongo, migrate_sql_to_neo4j
+
+    migrate_sql_to_mongo.migrate_all()
+    migrate_sql_to_neo4j.main()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--customers", type=int, default=Scale.customers)
+    parser.add_argument("--movies", type=int, default=Scale.movies)
+    parser.add_argument("--rentals", type=int, default=Scale.rentals)
+    parser.add_argument("--locations", type=int, default=Scale.locations)
+    parser.add_argument("--employees", type=int, default=Scale.employees)
+    parser.add_argument("--copies-per-movie", type=int, default=Scale.copies_per_movie, help="average copies per movie")
+    parser.add_argument("--skew", type=float, default=Scale.skew, help="Zipf exponent of movie popularity (0 = uniform)")
+    parser.add_argument("--customer-skew", type=float, default=Scale.customer_skew, help="Zipf exponent of customer activity")
+    parser.add_argument("--seed", type=int, default=Scale.seed, help="same seed and counts, same rows")
+    parser.add_argument("--method", choices=("auto", "load-data", "insert"), default="auto")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="rows per INSERT / LOAD DATA batch")
+    parser.add_argument("--reset", action="store_true", help="empty the domain tables first")
+    parser.add_argument("--migrate", action="store_true", help="copy the data to MongoDB and Neo4j afterwards")
+    args = parser.parse_args()
+
+    scale = Scale(
+        customers=args.customers,
+        movies=args.movies,
+        rentals=args.rentals,
+        locations=args.locations,
+        employees=args.employees,
+        copies_per_movie=args.copies_per_movie,
+        skew=args.skew,
+        customer_skew=args.customer_skew,
+        seed=args.seed,
+    )
+    start = time.perf_counter()
+    if args.reset:
+        reset()
+    written = build(scale, args.batch_size, args.method)
+    total = sum(written.values())
+    seconds = time.perf_counter() - start
+    print(f"[synthetic] {total} rows in {seconds:.1f}s ({total / seconds if seconds else 0:.0f} rows/s)")
+    if args.migrate:
+        migrate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import functools
+
+from flask import jsonify
+from flask_jwt_extended import get_jwt, jwt_required
+
+
+def roles_required(*roles):
+    """jwt_required() that also requires the token's role claim to be one of `roles`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        @jwt_required()
+        def wrapper(*args, **kwargs):
+            if get_jwt().get('role') not in roles:
+                return jsonify({'error': f"requires role: {', '.join(roles)}"}), 403
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
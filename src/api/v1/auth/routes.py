@@ -12,10 +12,15 @@ from src.repositories.mysql.orm_models.api_user_orm import ApiUserRole
 from passlib.context import CryptContext
 from sqlalchemy import select
 from src.repositories.mysql.orm_models.api_user_orm import ApiUser
-from src.repositories.mysql.orm_models.base import SessionLocal
+from src.repositories.mysql.orm_models.base import SessionLocal, readiness
 from src.security.passwords import verify_password
+from ..metrics import instrument_blueprint
+from ..readiness import require_ready
 
 bp = Blueprint('auth_routes', __name__)
+# Users live in MySQL
+instrument_blueprint(bp, "mysql")
+require_ready(bp, readiness)
 
 # simple in-memory blocklist
 _TOKEN_BLOCKLIST = set()
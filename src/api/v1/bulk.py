@@ -0,0 +1,44 @@
+# src/api/v1/bulk.py
+"""
+Request/response helpers for the /<resource>/bulk routes.
+
+Bodies are a JSON array, or an object wrapping it ({"items": [...]} for
+POST/PATCH, {"ids": [...]} for DELETE). The response lists one result per
+item in submission order and is 200 when every item succeeded, otherwise
+207 Multi-Status:
+
+    {"succeeded": 2, "failed": 1,
+     "results": [{"index": 0, "id": 7, "status": "updated"},
+                 {"index": 1, "id": 8, "status": "updated"},
+                 {"index": 2, "id": 99, "status": "not_found"}]}
+"""
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List
+
+from flask import jsonify, request
+
+MAX_BULK_ITEMS = int(os.getenv("MAX_BULK_ITEMS", "10000"))
+SUCCESS_STATUSES = {"created", "updated", "deleted"}
+
+
+def bulk_payload(key: str) -> List[Any]:
+    """Items of the request body; raises ValueError for a malformed or oversized body."""
+    body = request.get_json(silent=True)
+    if isinstance(body, dict):
+        body = body.get(key)
+    if not isinstance(body, list):
+        raise ValueError(f"Body must be a JSON array or an object with an '{key}' array")
+    if not body:
+        raise ValueError("No items given")
+    if len(body) > MAX_BULK_ITEMS:
+        raise ValueError(f"At most {MAX_BULK_ITEMS} items per request")
+    return body
+
+
+def bulk_response(results: List[Dict[str, Any]]):
+    succeeded = sum(1 for r in results if r["status"] in SUCCESS_STATUSES)
+    failed = len(results) - succeeded
+    body = {"succeeded": succeeded, "failed": failed, "results": results}
+    return jsonify(body), (207 if failed else 200)
@@ -0,0 +1,65 @@
+# src/api/v1/http_cache.py
+"""
+Conditional GET helpers shared by the CRUD blueprints.
+
+Every GET response carries an ETag and a Cache-Control header. Clients that
+send the ETag back in If-None-Match get an empty 304 when nothing changed:
+
+- collections with a version stamp (see BaseRepository.get_version) are
+  answered before the query runs; the ETag hashes the stamp together with
+  the query string, since filters and paging change the payload. The stamp
+  is read on every list request, so full responses and revalidations use
+  the same ETag.
+- everything else is hashed after serialization, which still saves the
+  transfer of an unchanged payload. Repositories behind the repository
+  cache always take this path, so the ETag matches the body served.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Any, Optional
+
+from flask import Response, jsonify, request
+
+DEFAULT_CACHE_CONTROL = os.getenv("API_CACHE_CONTROL", "no-cache")
+# Lookup tables (genres, formats, ...) may be reused for a while without revalidating
+LOOKUP_CACHE_CONTROL = os.getenv("API_LOOKUP_CACHE_CONTROL", "public, max-age=60")
+
+
+def collection_etag(resource_name: str, version: Any) -> str:
+    args = "&".join(f"{k}={v}" for k, v in sorted(request.args.items(multi=True)))
+    raw = f"{resource_name}|{version}|{args}|{request.accept_mimetypes}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def is_fresh(etag: Optional[str]) -> bool:
+    return etag is not None and request.if_none_match.contains(etag)
+
+
+def not_modified(etag: str, cache_control: Optional[str] = None) -> Response:
+    resp = Response(status=304)
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = cache_control or DEFAULT_CACHE_CONTROL
+    resp.vary.add("Accept")
+    return resp
+
+
+def conditional(resp: Response, etag: Optional[str] = None, cache_control: Optional[str] = None) -> Response:
+    """Add ETag (given or a hash of the body) and Cache-Control, then honour If-None-Match."""
+    resp.headers["Cache-Control"] = cache_control or DEFAULT_CACHE_CONTROL
+    resp.vary.add("Accept")
+    if resp.is_streamed:
+        # Streamed bodies can only be tagged with a precomputed ETag
+        if etag:
+            resp.set_etag(etag)
+        return resp
+    if etag:
+        resp.set_etag(etag)
+    else:
+        resp.add_etag()
+    return resp.make_conditional(request)
+
+
+def conditional_json(payload: Any, etag: Optional[str] = None, cache_control: Optional[str] = None) -> Response:
+    return conditional(jsonify(payload), etag, cache_control)
@@ -0,0 +1,136 @@
+# src/api/v1/metrics.py
+"""
+Request timing for the backend blueprints and the Prometheus /metrics route.
+
+instrument_blueprint() adds before/after request hooks to a blueprint (its
+nested blueprints included) that time every request and count the
+database calls made while handling it; the query-level hooks live in
+src/repositories/instrumentation.py.
+"""
+from __future__ import annotations
+
+import time
+from typing import Iterable, List
+
+from flask import Blueprint, Response, g, request
+
+from src.repositories import instrumentation
+from src.repositories.cache import cache_stats
+from src.repositories.readiness import READY, readiness_status
+
+bp = Blueprint("metrics", __name__)
+
+
+@bp.get("/metrics")
+def metrics():
+    return Response(instrumentation.render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def instrument_blueprint(blueprint: Blueprint, backend: str) -> None:
+    @blueprint.before_request
+    def _start_timer():
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        g._request_metrics = (instrumentation.begin_request(backend, route), time.perf_counter())
+
+    @blueprint.after_request
+    def _stop_timer(response):
+        _finish(response.status_code)
+        return response
+
+    @blueprint.teardown_request
+    def _unhandled(exc):
+        # after_request does not run when the view raised
+        _finish(500)
+
+
+def _finish(status: int) -> None:
+    started = g.pop("_request_metrics", None)
+    if started is not None:
+        token, start = started
+        instrumentation.end_request(token, request.method, status, time.perf_counter() - start)
+
+
+# ── gauges read at scrape time ───────────────────────────────────
+def _readiness_lines() -> Iterable[str]:
+    return instrumentation.gauge_lines(
+        "backend_ready",
+        "1 when the backend's readiness probe succeeded.",
+        (({"backend": name}, 1 if s["state"] == READY else 0) for name, s in readiness_status().items()),
+    )
+
+
+def _pool_lines() -> Iterable[str]:
+    from src.repositories.mysql.orm_models.base import get_engine
+    from src.repositories.mysql.pool import pool_stats
+
+    stats = pool_stats(get_engine())
+    lines: List[str] = []
+    for key, help_ in (
+        ("in_use", "Connections checked out of the MySQL pool."),
+        ("idle", "Idle connections in the MySQL pool."),
+        ("overflow", "Connections open beyond the MySQL pool size."),
+        ("size", "Configured MySQL pool size."),
+        ("max_overflow", "Configured MySQL pool overflow."),
+    ):
+        lines += instrumentation.gauge_lines(f"mysql_pool_{key}", help_, [({}, stats.get(key))])
+    for key in ("checkouts", "connects", "overflow_connects", "timeouts", "invalidations", "pre_ping_failures"):
+        lines += [
+            f"# HELP mysql_pool_{key}_total MySQL pool {key.replace('_', ' ')}.",
+            f"# TYPE mysql_pool_{key}_total counter",
+            f"mysql_pool_{key}_total {stats[key]}",
+        ]
+    return lines
+
+
+def _neo4j_pool_lines() -> Iterable[str]:
+    from src.repositories.neo4j.driver import pool_stats
+
+    stats = pool_stats()
+    lines: List[str] = []
+    for key, help_ in (
+        ("open", "Connections open in the Neo4j pool."),
+        ("in_use", "Connections of the Neo4j pool in use."),
+        ("in_flight", "Neo4j managed transactions running."),
+        ("max_size", "Configured Neo4j pool size."),
+    ):
+        lines += instrumentation.gauge_lines(f"neo4j_pool_{key}", help_, [({}, stats.get(key))])
+    lines += [
+        "# HELP neo4j_transactions_total Neo4j managed transactions by access mode.",
+        "# TYPE neo4j_transactions_total counter",
+    ]
+    lines += [f'neo4j_transactions_total{{access="{a}"}} {n}' for a, n in sorted(stats["transactions"].items())]
+    for key in ("retries", "failures", "acquisition_timeouts"):
+        lines += [
+            f"# HELP neo4j_transaction_{key}_total Neo4j managed transaction {key.replace('_', ' ')}.",
+            f"# TYPE neo4j_transaction_{key}_total counter",
+            f"neo4j_transaction_{key}_total {stats[key]}",
+        ]
+    return lines
+
+
+def _neo4j_query_lines() -> Iterable[str]:
+    from src.repositories.neo4j import queries
+
+    lines: List[str] = []
+    for metric in (queries.query_duration, queries.query_errors, queries.query_profiled, queries.query_db_hits):
+        lines += metric.render()
+    return lines
+
+
+def _cache_lines() -> Iterable[str]:
+    stats = cache_stats()
+    lines: List[str] = []
+    for key in ("hits", "misses", "invalidations"):
+        lines += [
+            f"# HELP repository_cache_{key}_total Repository cache {key} per namespace.",
+            f"# TYPE repository_cache_{key}_total counter",
+        ]
+        lines += [f'repository_cache_{key}_total{{namespace="{ns}"}} {s[key]}' for ns, s in sorted(stats.items())]
+    return lines
+
+
+instrumentation.add_collector(_readiness_lines)
+instrumentation.add_collector(_pool_lines)
+instrumentation.add_collector(_neo4j_pool_lines)
+instrumentation.add_collector(_neo4j_query_lines)
+instrumentation.add_collector(_cache_lines)
@@ -1,13 +1,33 @@
 # src/api/v1/mongodb/crud_blueprint.py
+from typing import Optional
+
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
+from ..bulk import bulk_payload, bulk_response
+from ..http_cache import conditional, conditional_json
+
+# Upper bound for ?limit= so a single page can never unwind a whole collection
+MAX_PAGE_SIZE = 1000
+# Query-string keys that are not field filters
+RESERVED_LIST_ARGS = {"limit", "after"}
+
 
-def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") -> Blueprint:
+def make_crud_blueprint(
+    resource_name: str, repo, id_converter: str = "int", cache_control: Optional[str] = None
+) -> Blueprint:
     """CRUD blueprint for MongoDB resources.
 
     repo must implement: get_all(), get_by_id(id), create(data), update(id, data), delete(id)
     Optionally, repo can implement: get_details(id) for /<resource>/<id>/details
+    Optionally, repo can implement get_all(filters) and get_page(limit, after, filters)
+    (see EmbeddedListing) to enable filtering and keyset pagination on the list route:
+      - limit / after: page on the id; the next cursor is returned in X-Next-After.
+      - <field>=value and <field>__{ne,gt,gte,lt,lte,in}=value: server-side filters.
+    Optionally, repo can implement bulk_create/bulk_update/bulk_delete (see
+    MongoBaseRepository) for POST, PATCH and DELETE /<resource>/bulk.
+    GET responses carry a content-hash ETag (If-None-Match → 304) and
+    `cache_control` (default API_CACHE_CONTROL, "no-cache").
     """
 
     bp = Blueprint(f"mongodb_{resource_name}", __name__)
@@ -16,8 +36,27 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
     @bp.get(f"/{resource_name}")
     def list_resources():
         try:
-            items = repo.get_all()
-            return jsonify(items), 200
+            if not hasattr(repo, "get_page"):
+                return conditional_json(repo.get_all(), cache_control=cache_control)
+
+            after = request.args.get("after", type=int)
+            limit = request.args.get("limit", type=int)
+            if "limit" in request.args and (limit is None or limit < 1):
+                return jsonify({"error": "limit must be a positive integer"}), 400
+            if "after" in request.args and after is None:
+                return jsonify({"error": "after must be a valid id"}), 400
+            filters = {k: v for k, v in request.args.items() if k not in RESERVED_LIST_ARGS} or None
+
+            if limit is not None or after is not None:
+                items, next_after = repo.get_page(min(limit or MAX_PAGE_SIZE, MAX_PAGE_SIZE), after, filters)
+                resp = jsonify(items)
+                if next_after is not None:
+                    resp.headers["X-Next-After"] = str(next_after)
+                return conditional(resp, cache_control=cache_control)
+
+            return conditional_json(repo.get_all(filters=filters), cache_control=cache_control)
+        except ValueError as ve:
+            return jsonify({"error": str(ve)}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
         
@@ -31,7 +70,7 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
                 ), 400
 
             items = repo.get_all_details()
-            return jsonify(items), 200
+            return conditional_json(items, cache_control=cache_control)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -42,7 +81,7 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
             item = repo.get_by_id(item_id)
             if not item:
                 return jsonify({"error": "Not found"}), 404
-            return jsonify(item), 200
+            return conditional_json(item, cache_control=cache_control)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
         
@@ -59,7 +98,7 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
             if not item:
                 return jsonify({"error": "Not found"}), 404
 
-            return jsonify(item), 200
+            return conditional_json(item, cache_control=cache_control)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -103,4 +142,39 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    if hasattr(repo, "bulk_create"):
+
+        # POST /<resource>/bulk
+        @bp.post(f"/{resource_name}/bulk")
+        @jwt_required()
+        def bulk_create_resources():
+            try:
+                return bulk_response(repo.bulk_create(bulk_payload("items")))
+            except ValueError as ve:
+                return jsonify({"error": str(ve)}), 400
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+
+        # PATCH /<resource>/bulk
+        @bp.patch(f"/{resource_name}/bulk")
+        @jwt_required()
+        def bulk_update_resources():
+            try:
+                return bulk_response(repo.bulk_update(bulk_payload("items")))
+            except ValueError as ve:
+                return jsonify({"error": str(ve)}), 400
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+
+        # DELETE /<resource>/bulk
+        @bp.delete(f"/{resource_name}/bulk")
+        @jwt_required()
+        def bulk_delete_resources():
+            try:
+                return bulk_response(repo.bulk_delete(bulk_payload("ids")))
+            except ValueError as ve:
+                return jsonify({"error": str(ve)}), 400
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+
     return bp
\ No newline at end of file
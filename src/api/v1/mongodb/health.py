@@ -1,7 +1,21 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint
+
+from src.repositories.cache import cache_stats
+from src.repositories.mongodb.connection import readiness
+from src.repositories.mongodb.genre_similarity import movie_genres
+from src.repositories.mongodb.recommendations import movie_recommender
+
+from ..metrics import instrument_blueprint
+from ..readiness import health_response
 
 bp = Blueprint("mongodb_health", __name__)
+instrument_blueprint(bp, "mongodb")
 
 @bp.get("/health")
 def health():
-    return jsonify({"backend": "mongodb", "status": "ok"})
+    return health_response(
+        readiness,
+        cache=cache_stats("mongodb."),
+        genre_index=movie_genres.stats(),
+        recommendations=movie_recommender.stats(),
+    )
@@ -2,6 +2,10 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 
 from .crud_blueprint import make_crud_blueprint  # the Mongo-specific one
+from ..http_cache import LOOKUP_CACHE_CONTROL
+from ..metrics import instrument_blueprint
+from ..readiness import require_ready
+from ..search import search_args, search_response, similar_args
 
 from src.repositories.mongodb.customer_repository import CustomerRepositoryMongo
 from src.repositories.mongodb.movie_repository import MovieRepositoryMongo
@@ -18,9 +22,12 @@ from src.repositories.mongodb.inventory_item_repository import InventoryItemRepo
 from src.repositories.mongodb.payment_repository import PaymentRepositoryMongo
 from src.repositories.mongodb.review_repository import ReviewRepositoryMongo
 from src.repositories.mongodb.membership_plan_repository import MembershipPlanRepositoryMongo
+from src.repositories.mongodb.connection import readiness
 
 # Blueprint for MongoDB routes
 bp = Blueprint("mongodb_routes", __name__)
+instrument_blueprint(bp, "mongodb")
+require_ready(bp, readiness)
 
 # Initialize repositories
 customer_repo = CustomerRepositoryMongo()
@@ -39,6 +46,48 @@ payment_repo = PaymentRepositoryMongo()
 review_repo = ReviewRepositoryMongo()
 membership_plan_repo = MembershipPlanRepositoryMongo()
 
+# ---------------------------------------------------------
+# Movie search (movies_text index)
+# ---------------------------------------------------------
+@bp.get("/movies/search")
+def search_movies():
+    try:
+        q, mode, limit, offset = search_args()
+        items, next_offset = movie_repo.search(q, mode=mode, limit=limit, offset=offset)
+        return search_response(items, next_offset)
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Movies sharing the most genres, from an in-memory bitset index (see genre_index.py)
+@bp.get("/movies/<int:id>/similar")
+def movie_similar(id: int):
+    try:
+        limit, mode = similar_args()
+        return jsonify(movie_repo.similar(id, limit=limit, mode=mode))
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Item-item recommendations served from memory (see item_similarity.py); compare
+# with GET /api/v1/neo4j/movies/<id>/recommendations
+@bp.get("/movies/<int:id>/recommendations")
+def movie_recommendations(id: int):
+    try:
+        limit = request.args.get("limit", default=25, type=int)
+        if limit is None or limit < 1:
+            raise ValueError("limit must be a positive integer")
+        metric = request.args.get("metric", default="cosine")
+        resp = jsonify(movie_repo.recommendations(id, limit=limit, metric=metric))
+        resp.headers["X-Recommendation-Mode"] = "item-item"
+        return resp
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # ---------------------------------------------------------
 # Custom Rental Routes (Transactional)
 # ---------------------------------------------------------
@@ -171,11 +220,11 @@ bp.register_blueprint(make_crud_blueprint("customers", customer_repo, id_convert
 bp.register_blueprint(make_crud_blueprint("movies", movie_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("locations", location_repo, id_converter="int"))
 # bp.register_blueprint(make_crud_blueprint("rentals", rental_repo, id_converter="int")) # Replaced by custom blueprint
-bp.register_blueprint(make_crud_blueprint("genres", genre_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("formats", format_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("promo_codes", promo_code_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("memberships", membership_type_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("fees", fee_type_repo, id_converter="int"))
+bp.register_blueprint(make_crud_blueprint("genres", genre_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("formats", format_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("promo_codes", promo_code_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("memberships", membership_type_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("fees", fee_type_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
 bp.register_blueprint(make_crud_blueprint("employees", employee_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("addresses", address_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("inventory_items", inventory_item_repo, id_converter="int"))
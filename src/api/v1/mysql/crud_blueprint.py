@@ -1,22 +1,119 @@
-from flask import Blueprint, jsonify, request
+from typing import Optional
+
+from flask import Blueprint, Response, json, jsonify, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
+from ..bulk import bulk_payload, bulk_response
+from ..http_cache import collection_etag, conditional, conditional_json, is_fresh, not_modified
+
+# Upper bound for ?limit= so a single page can never pull a whole table
+MAX_PAGE_SIZE = 1000
+NDJSON_MIMETYPE = "application/x-ndjson"
+# Query-string keys that are not column filters
+RESERVED_LIST_ARGS = {"limit", "after", "format", "order_by", "fields"}
+
+
+def _csv_arg(name: str):
+    raw = request.args.get(name)
+    if not raw:
+        return None
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+
+def _list_spec() -> dict:
+    """Collect filters, order_by and fields from the query string."""
+    filters = {k: v for k, v in request.args.items() if k not in RESERVED_LIST_ARGS}
+    return {
+        "filters": filters or None,
+        "order_by": _csv_arg("order_by"),
+        "fields": _csv_arg("fields"),
+    }
 
-def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") -> Blueprint:
+
+def _wants_ndjson() -> bool:
+    if request.args.get("format") == "ndjson":
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def make_crud_blueprint(
+    resource_name: str, repo, id_converter: str = "int", cache_control: Optional[str] = None
+) -> Blueprint:
     """Create a CRUD blueprint for a resource using a repository.
 
     repo must implement: get_all(), get_by_id(id), create(data), update(id, data), delete(id)
+    Optionally, repo can implement get_page(limit, after) and iter_all(after) (see
+    BaseRepository) to enable keyset pagination and NDJSON streaming on the list route.
     resource_name: e.g., "genres" -> routes like /genres, /genres/<id>
     id_converter: Flask converter type, default "int".
+    cache_control: Cache-Control for GET responses (default API_CACHE_CONTROL, "no-cache").
+
+    List query parameters:
+      - limit / after: keyset pagination on the primary key. The cursor for the
+        next page is returned in the X-Next-After header (absent on the last page).
+      - format=ndjson (or Accept: application/x-ndjson): stream one JSON object
+        per line instead of building a single array.
+      - <column>=value and <column>__{ne,gt,gte,lt,lte,in}=value: server-side filters.
+      - order_by=col,-col: sort order ("-" for descending).
+      - fields=col,col: only SELECT these columns (the id is always included).
+
+    If the repo implements bulk_create/bulk_update/bulk_delete (see BaseRepository),
+    POST, PATCH and DELETE /<resource>/bulk write many rows per request with
+    per-item results (see api/v1/bulk.py).
+
+    GET responses carry an ETag and honour If-None-Match with a 304. If the repo
+    implements get_version() (see BaseRepository), list ETags are built from
+    the version stamp on every request, so the ETag of a full response is the
+    one a later revalidation is checked against, and a revalidation of an
+    unchanged collection is answered without running the list query.
     """
 
     bp = Blueprint(f"mysql_{resource_name}", __name__)
+    cursor_type = int if id_converter == "int" else str
 
     @bp.get(f"/{resource_name}")
     def list_resources():
         try:
-            items = repo.get_all()
-            return jsonify(items), 200
+            after = request.args.get("after", type=cursor_type)
+            limit = request.args.get("limit", type=int)
+            if "limit" in request.args and (limit is None or limit < 1):
+                return jsonify({"error": "limit must be a positive integer"}), 400
+            if "after" in request.args and after is None:
+                return jsonify({"error": "after must be a valid id"}), 400
+            spec = _list_spec()
+
+            version = repo.get_version() if hasattr(repo, "get_version") else None
+            etag = collection_etag(resource_name, version) if version is not None else None
+            if is_fresh(etag):
+                return not_modified(etag, cache_control)
+
+            if _wants_ndjson() and hasattr(repo, "iter_all"):
+                rows = repo.iter_all(after=after, **spec)
+                # Pull the first row eagerly so bad filters surface as a 400
+                # instead of an error in the middle of a streamed 200.
+                first = next(rows, None)
+
+                def generate():
+                    if first is None:
+                        return
+                    yield json.dumps(first) + "\n"
+                    for item in rows:
+                        yield json.dumps(item) + "\n"
+
+                resp = Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+                return conditional(resp, etag, cache_control)
+
+            if (limit is not None or after is not None) and hasattr(repo, "get_page"):
+                items, next_after = repo.get_page(min(limit or MAX_PAGE_SIZE, MAX_PAGE_SIZE), after, **spec)
+                resp = jsonify(items)
+                if next_after is not None:
+                    resp.headers["X-Next-After"] = str(next_after)
+                return conditional(resp, etag, cache_control)
+
+            items = repo.get_all(**spec) if any(spec.values()) else repo.get_all()
+            return conditional_json(items, etag, cache_control)
+        except ValueError as ve:
+            return jsonify({"error": str(ve)}), 400
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -26,7 +123,7 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
             item = repo.get_by_id(item_id)
             if not item:
                 return jsonify({"error": "Not found"}), 404
-            return jsonify(item), 200
+            return conditional_json(item, cache_control=cache_control)
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
@@ -35,6 +132,11 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
     def create_resource():
         try:
             data = request.get_json() or {}
+            # "Prefer: return=minimal" (RFC 7240) answers with just the id, skipping the read-back
+            minimal = "return=minimal" in request.headers.get("Prefer", "")
+            if minimal:
+                created = repo.create(data, returning=False)
+                return jsonify(created), 201, {"Preference-Applied": "return=minimal"}
             created = repo.create(data)
             return jsonify(created), 201
         except ValueError as ve:
@@ -67,4 +169,36 @@ def make_crud_blueprint(resource_name: str, repo, id_converter: str = "int") ->
         except Exception as e:
             return jsonify({"error": str(e)}), 500
 
+    if hasattr(repo, "bulk_create"):
+
+        @bp.post(f"/{resource_name}/bulk")
+        @jwt_required()
+        def bulk_create_resources():
+            try:
+                return bulk_response(repo.bulk_create(bulk_payload("items")))
+            except ValueError as ve:
+                return jsonify({"error": str(ve)}), 400
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+
+        @bp.patch(f"/{resource_name}/bulk")
+        @jwt_required()
+        def bulk_update_resources():
+            try:
+                return bulk_response(repo.bulk_update(bulk_payload("items")))
+            except ValueError as ve:
+                return jsonify({"error": str(ve)}), 400
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+
+        @bp.delete(f"/{resource_name}/bulk")
+        @jwt_required()
+        def bulk_delete_resources():
+            try:
+                return bulk_response(repo.bulk_delete(bulk_payload("ids")))
+            except ValueError as ve:
+                return jsonify({"error": str(ve)}), 400
+            except Exception as e:
+                return jsonify({"error": str(e)}), 500
+
     return bp
@@ -1,7 +1,25 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint
+
+from src.repositories.cache import cache_stats
+from src.repositories.mysql.genre_similarity import movie_genres
+from src.repositories.mysql.movie_titles import movie_titles
+from src.repositories.mysql.orm_models.base import get_engine, readiness
+from src.repositories.mysql.pool import pool_stats
+from src.repositories.mysql.recommendations import movie_recommender
+
+from ..metrics import instrument_blueprint
+from ..readiness import health_response
 
 bp = Blueprint("mysql_health", __name__)
+instrument_blueprint(bp, "mysql")
 
 @bp.get("/health")
 def health():
-    return jsonify({"backend": "mysql", "status": "ok"})
+    return health_response(
+        readiness,
+        cache=cache_stats("mysql."),
+        pool=pool_stats(get_engine()),
+        autocomplete=movie_titles.stats(),
+        genre_index=movie_genres.stats(),
+        recommendations=movie_recommender.stats(),
+    )
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify, request
+from flask_jwt_extended import jwt_required
 
 from src.repositories.mysql.customer_repository import CustomerRepository
 from src.repositories.mysql.genre_repository import GenreRepository
@@ -17,11 +18,19 @@ from src.repositories.mysql.payment_repository import PaymentRepository
 from src.repositories.mysql.review_repository import ReviewRepository
 from src.repositories.mysql.rental_status_audit_repository import RentalStatusAuditRepository
 from src.repositories.mysql.payment_audit_repository import PaymentAuditRepository
+from src.repositories.mysql.orm_models.base import readiness
 
 from .crud_blueprint import make_crud_blueprint
+from ..bulk import bulk_payload
+from ..http_cache import LOOKUP_CACHE_CONTROL
+from ..metrics import instrument_blueprint
+from ..readiness import require_ready
+from ..search import autocomplete_args, search_args, search_response, similar_args
 
 # Blueprint for MySQL routes
 bp = Blueprint("mysql_routes", __name__)
+instrument_blueprint(bp, "mysql")
+require_ready(bp, readiness)
 
 # Initialize repositories
 repo = CustomerRepository()
@@ -47,13 +56,66 @@ customers_bp = make_crud_blueprint("customers", repo, id_converter="int")
 bp.register_blueprint(customers_bp)
 
 # Register generic CRUD routes for genres (example of BaseRepository usage)
-genres_bp = make_crud_blueprint("genres", genre_repo, id_converter="int")
+genres_bp = make_crud_blueprint(
+    "genres", genre_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL
+)
 bp.register_blueprint(genres_bp)
 
 # Register generic CRUD routes for movies
 movies_bp = make_crud_blueprint("movies", movie_repo, id_converter="int")
 bp.register_blueprint(movies_bp)
 
+# Full-text search over title and summary (FULLTEXT indexes, see 012_movie_rental_full_text_search.sql)
+@bp.get("/movies/search")
+def search_movies():
+    try:
+        q, mode, limit, offset = search_args()
+        items, next_offset = movie_repo.search(q, mode=mode, limit=limit, offset=offset)
+        return search_response(items, next_offset)
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Movies sharing the most genres, from an in-memory bitset index (see genre_index.py)
+@bp.get("/movies/<int:id>/similar")
+def movie_similar(id: int):
+    try:
+        limit, mode = similar_args()
+        return jsonify(movie_repo.similar(id, limit=limit, mode=mode))
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Item-item recommendations served from memory (see item_similarity.py); compare
+# with GET /api/v1/neo4j/movies/<id>/recommendations
+@bp.get("/movies/<int:id>/recommendations")
+def movie_recommendations(id: int):
+    try:
+        limit = request.args.get("limit", default=25, type=int)
+        if limit is None or limit < 1:
+            raise ValueError("limit must be a positive integer")
+        metric = request.args.get("metric", default="cosine")
+        resp = jsonify(movie_repo.recommendations(id, limit=limit, metric=metric))
+        resp.headers["X-Recommendation-Mode"] = "item-item"
+        return resp
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# Typeahead on title words, served from an in-memory index (see movie_titles.py)
+@bp.get("/movies/autocomplete")
+def autocomplete_movies():
+    try:
+        q, limit, sort = autocomplete_args()
+        return jsonify(movie_repo.autocomplete(q, limit=limit, sort=sort))
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # Register generic CRUD routes for employees
 employees_bp = make_crud_blueprint("employees", employee_repo, id_converter="int")
 bp.register_blueprint(employees_bp)
@@ -63,11 +125,15 @@ addresses_bp = make_crud_blueprint("addresses", address_repo, id_converter="int"
 bp.register_blueprint(addresses_bp)
 
 # Register generic CRUD routes for fees
-fees_bp = make_crud_blueprint("fees", fee_repo, id_converter="int")
+fees_bp = make_crud_blueprint(
+    "fees", fee_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL
+)
 bp.register_blueprint(fees_bp)
 
 # Register generic CRUD routes for formats
-formats_bp = make_crud_blueprint("formats", format_repo, id_converter="int")
+formats_bp = make_crud_blueprint(
+    "formats", format_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL
+)
 bp.register_blueprint(formats_bp)
 
 # Register generic CRUD routes for locations
@@ -79,7 +145,9 @@ inventory_items_bp = make_crud_blueprint("inventory_items", inventory_item_repo,
 bp.register_blueprint(inventory_items_bp)
 
 # Register generic CRUD routes for memberships
-memberships_bp = make_crud_blueprint("memberships", membership_repo, id_converter="int")
+memberships_bp = make_crud_blueprint(
+    "memberships", membership_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL
+)
 bp.register_blueprint(memberships_bp)
 
 # Register generic CRUD routes for membership_plans
@@ -87,7 +155,9 @@ membership_plans_bp = make_crud_blueprint("membership_plans", membership_plan_re
 bp.register_blueprint(membership_plans_bp)
 
 # Register generic CRUD routes for promo_codes
-promo_codes_bp = make_crud_blueprint("promo_codes", promo_code_repo, id_converter="int")
+promo_codes_bp = make_crud_blueprint(
+    "promo_codes", promo_code_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL
+)
 bp.register_blueprint(promo_codes_bp)
 
 # Register generic CRUD routes for rentals
@@ -107,6 +177,19 @@ def create_rental_reservation():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# Batch checkout: many carts, one stored procedure call, all-or-nothing
+@bp.post("/rentals/batch")
+@jwt_required()
+def create_rentals_batch():
+    try:
+        carts = bulk_payload("carts")
+        rentals = rental_repo.create_rentals_batch(carts)
+        return jsonify(rentals), 201
+    except ValueError as ve:
+        return jsonify({"error": str(ve)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # Register generic CRUD routes for payments
 payments_bp = make_crud_blueprint("payments", payment_repo, id_converter="int")
 bp.register_blueprint(payments_bp)
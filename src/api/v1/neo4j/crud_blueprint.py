@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Optional
 
 from flask import Blueprint, jsonify, request
 
+from ..bulk import bulk_payload, bulk_response
+from ..http_cache import conditional_json
+
 
 def create_crud_blueprint(resource_name: str, repo_factory: Callable[[], Any]) -> Blueprint:
 	"""
@@ -29,7 +32,7 @@ def create_crud_blueprint(resource_name: str, repo_factory: Callable[[], Any]) -
 	def list_items():
 		repo = repo_factory()
 		items = repo.get_all()
-		return jsonify(items)
+		return conditional_json(items)
 
 	@bp.get(f"/{resource_name}/<int:item_id>")
 	def get_item(item_id: int):
@@ -37,7 +40,7 @@ def create_crud_blueprint(resource_name: str, repo_factory: Callable[[], Any]) -
 		item = repo.get_by_id(item_id)
 		if not item:
 			return jsonify({"error": "not found"}), 404
-		return jsonify(item)
+		return conditional_json(item)
 
 	@bp.post(f"/{resource_name}")
 	def create_item():
@@ -66,11 +69,17 @@ def create_crud_blueprint(resource_name: str, repo_factory: Callable[[], Any]) -
 	return bp
 
 
-def make_crud_blueprint(resource_name: str, repo: Any, id_converter: str = "int") -> Blueprint:
+def make_crud_blueprint(
+	resource_name: str, repo: Any, id_converter: str = "int", cache_control: Optional[str] = None
+) -> Blueprint:
 	"""
 	Alternate factory matching existing usage: takes a repo instance and id converter.
 
 	id_converter: "int" or "string" (for routes param type)
+	cache_control: Cache-Control for GET responses (default API_CACHE_CONTROL); GETs
+	  also carry a content-hash ETag and answer If-None-Match with 304
+	Repos with bulk_create/bulk_update/bulk_delete (see Neo4jBaseRepository) also get
+	POST, PATCH and DELETE /<resource>/bulk.
 	"""
 	bp = Blueprint(f"neo4j_{resource_name}", __name__)
 
@@ -85,14 +94,14 @@ def make_crud_blueprint(resource_name: str, repo: Any, id_converter: str = "int"
 	@bp.get(f"/{resource_name}")
 	def list_items():
 		items = repo.get_all()
-		return jsonify(items)
+		return conditional_json(items, cache_control=cache_control)
 
 	@bp.get(f"/{resource_name}/{param}")
 	def get_item(item_id):
 		item = repo.get_by_id(parse(item_id))
 		if not item:
 			return jsonify({"error": "not found"}), 404
-		return jsonify(item)
+		return conditional_json(item, cache_control=cache_control)
 
 	@bp.post(f"/{resource_name}")
 	def create_item():
@@ -121,5 +130,28 @@ def make_crud_blueprint(resource_name: str, repo: Any, id_converter: str = "int"
 			return jsonify({"error": "not found"}), 404
 		return jsonify({"deleted": True})
 
+	if hasattr(repo, "bulk_create"):
+
+		@bp.post(f"/{resource_name}/bulk")
+		def bulk_create_items():
+			try:
+				return bulk_response(repo.bulk_create(bulk_payload("items")))
+			except ValueError as ve:
+				return jsonify({"error": str(ve)}), 400
+
+		@bp.patch(f"/{resource_name}/bulk")
+		def bulk_update_items():
+			try:
+				return bulk_response(repo.bulk_update(bulk_payload("items")))
+			except ValueError as ve:
+				return jsonify({"error": str(ve)}), 400
+
+		@bp.delete(f"/{resource_name}/bulk")
+		def bulk_delete_items():
+			try:
+				return bulk_response(repo.bulk_delete(bulk_payload("ids")))
+			except ValueError as ve:
+				return jsonify({"error": str(ve)}), 400
+
 	return bp
 
@@ -1,6 +1,13 @@
+import os
+
 from flask import Blueprint, jsonify, request
 
 from .crud_blueprint import make_crud_blueprint
+from ..auth.roles import roles_required
+from ..http_cache import LOOKUP_CACHE_CONTROL
+from ..metrics import instrument_blueprint
+from ..readiness import require_ready
+from ..search import search_args, search_response, similar_args
 
 from src.repositories.neo4j.customer_repository import CustomerRepository
 from src.repositories.neo4j.address_repository import AddressRepository
@@ -16,9 +23,16 @@ from src.repositories.neo4j.fee_repository import FeeRepository
 from src.repositories.neo4j.promo_code_repository import PromoCodeRepository
 from src.repositories.neo4j.membership_repository import MembershipRepository
 from src.repositories.neo4j.membership_plan_repository import MembershipPlanRepository
+from src.repositories.cache import cache_stats
+from src.repositories.neo4j.connection import readiness
+from src.repositories.neo4j import queries
+from src.repositories.neo4j.driver import pool_stats
+from src.repositories.neo4j.genre_similarity import movie_genres
 
 # Parent blueprint for Neo4j routes
 bp = Blueprint("neo4j", __name__)
+instrument_blueprint(bp, "neo4j")
+require_ready(bp, readiness, exempt=("neo4j_health",))
 
 # Initialize repositories
 customer_repo = CustomerRepository()
@@ -41,27 +55,40 @@ bp.register_blueprint(make_crud_blueprint("customers", customer_repo, id_convert
 bp.register_blueprint(make_crud_blueprint("addresses", address_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("locations", location_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("employees", employee_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("genres", genre_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("formats", format_repo, id_converter="int"))
+bp.register_blueprint(make_crud_blueprint("genres", genre_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("formats", format_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
 bp.register_blueprint(make_crud_blueprint("movies", movie_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("inventory_items", inventory_item_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("rentals", rental_repo, id_converter="int"))
 bp.register_blueprint(make_crud_blueprint("payments", payment_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("fees", fee_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("promo_codes", promo_code_repo, id_converter="int"))
-bp.register_blueprint(make_crud_blueprint("memberships", membership_repo, id_converter="int"))
+bp.register_blueprint(make_crud_blueprint("fees", fee_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("promo_codes", promo_code_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
+bp.register_blueprint(make_crud_blueprint("memberships", membership_repo, id_converter="int", cache_control=LOOKUP_CACHE_CONTROL))
 bp.register_blueprint(make_crud_blueprint("membership_plans", membership_plan_repo, id_converter="int"))
 
 # Health endpoint for Neo4j
 @bp.get("/health")
 def neo4j_health():
-	"""Basic health check for Neo4j connectivity via neomodel."""
+	"""Basic health check for Neo4j connectivity through the managed driver."""
+	if not readiness.ready:
+		return jsonify({
+			"status": readiness.state,
+			"readiness": readiness.status(),
+			"cache": cache_stats("neo4j."),
+			"pool": pool_stats(),
+		}), 503
 	try:
 		# lightweight query: count any node label likely to exist (Movie preferred)
-		from neomodel import db
-		result, _ = db.cypher_query("MATCH (n) RETURN count(n) AS cnt LIMIT 1")
+		result, _ = queries.run("node_count_sample")
 		count = int(result[0][0]) if len(result) else 0
-		return jsonify({"status": "ok", "nodeCountSample": count}), 200
+		return jsonify({
+			"status": "ok",
+			"nodeCountSample": count,
+			"readiness": readiness.status(),
+			"cache": cache_stats("neo4j."),
+			"pool": pool_stats(),
+			"genre_index": movie_genres.stats(),
+		}), 200
 	except Exception as e:
 		return jsonify({"status": "error", "message": str(e)}), 500
 
@@ -71,44 +98,41 @@ def neo4j_health():
 @bp.get("/movies/by-rating")
 def neo4j_movies_by_rating():
 	try:
-		from neomodel import db
 		min_rating_param = request.args.get("minRating", default="8")
 		try:
 			min_rating = float(min_rating_param)
 		except ValueError:
 			return jsonify({"status": "error", "message": "minRating must be a number"}), 400
 
-		# Support both numeric and string-stored ratings by attempting toFloat
-		cypher = (
-			"MATCH (m:Movie) "
-			"WHERE (m.rating IS NOT NULL AND (m.rating >= $min OR toFloat(m.rating) >= $min)) "
-			"RETURN m { .movieId, .title, .rating, .releaseYear, .runtimeMin, .summary } AS movie "
-			"ORDER BY coalesce(toFloat(m.rating), -1) DESC"
-		)
-		results, _ = db.cypher_query(cypher, {"min": min_rating})
+		# Range seek on the Movie.rating index (queries.py)
+		results, _ = queries.run("movies_by_rating", {"min": min_rating})
 
 		movies = [row[0] for row in results]
 		return jsonify(movies), 200
 	except Exception as e:
 		return jsonify({"status": "error", "message": str(e)}), 500
 
+# Neo4j: Full-text movie search (movie_fulltext index)
+@bp.get("/movies/search")
+def neo4j_movies_search():
+	try:
+		q, mode, limit, offset = search_args()
+		items, next_offset = movie_repo.search(q, mode=mode, limit=limit, offset=offset)
+		return search_response(items, next_offset)
+	except ValueError as ve:
+		return jsonify({"status": "error", "message": str(ve)}), 400
+	except Exception as e:
+		return jsonify({"status": "error", "message": str(e)}), 500
+
 # Neo4j: Customer rental paths 
 @bp.get("/customers/<int:id>/rental-paths")
 def neo4j_customer_rental_paths(id: int):
 	try:
-		from neomodel import db
-		cypher = (
-			"MATCH (c:Customer {customerId: $cid})-[:RENTED]->(r:Rental)"
-			" OPTIONAL MATCH (r)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(m:Movie)"
-			" WITH r, m"
-			" RETURN r.rentalId AS rentalId,"
-			"        collect(distinct m { .movieId, .title, .rating, .releaseYear, .runtimeMin }) AS movies"
-		)
-		results, _ = db.cypher_query(cypher, {"cid": id})
+		results, _ = queries.run("customer_rental_paths", {"cid": id})
 		rentals = [{"rental_id": rentalId, "movies": movies} for rentalId, movies in results]
 		if not rentals:
 			# Check if customer exists to return 404 vs empty traversal
-			check, _ = db.cypher_query("MATCH (c:Customer {customerId: $cid}) RETURN c LIMIT 1", {"cid": id})
+			check, _ = queries.run("customer_exists", {"cid": id})
 			if not check:
 				return jsonify({"message": "Customer not found"}), 404
 		return jsonify({"customer_id": id, "rentals": rentals}), 200
@@ -121,63 +145,53 @@ def neo4j_movies_similar_by_genre(id: int):
 	"""Return movies that share genres with the given movie, ranked by genre overlap.
 
 	Showcase: Graph pattern matching and relationship traversal for similarity.
+	The OF_GENRE relationships are read once into an in-memory bitset index
+	(see genre_index.py), so a request no longer re-matches every movie of the
+	shared genres. mode=jaccard ranks by overlap relative to both genre sets;
+	ties go to the higher rated movie.
 	"""
 	try:
-		from neomodel import db
-		cypher = (
-			"MATCH (m:Movie {movieId: $mid})-[:OF_GENRE]->(g:Genre) "
-			"MATCH (other:Movie)-[:OF_GENRE]->(g) "
-			"WHERE other.movieId <> m.movieId "
-			"WITH other, count(DISTINCT g) AS sharedGenres "
-			"ORDER BY sharedGenres DESC, other.title ASC "
-			"RETURN other { .movieId, .title, .rating, .releaseYear, .runtimeMin } AS movie, sharedGenres "
-			"LIMIT 25"
-		)
-		results, _ = db.cypher_query(cypher, {"mid": id})
-		payload = [
-			{"movie": row[0], "shared_genres": int(row[1])}
-			for row in results
-		]
-		return jsonify(payload), 200
+		limit, mode = similar_args()
+		return jsonify(movie_repo.similar(id, limit=limit, mode=mode)), 200
+	except ValueError as ve:
+		return jsonify({"status": "error", "message": str(ve)}), 400
 	except Exception as e:
 		return jsonify({"status": "error", "message": str(e)}), 500
 
 # Neo4j: Movie recommendations via co-rentals and genre affinity
+RECOMMENDATION_MODES = ("live", "precomputed")
+DEFAULT_RECOMMENDATION_MODE = os.getenv("NEO4J_RECOMMENDATIONS_MODE", "precomputed")
+# Upper bound for ?limit=; larger values are capped
+MAX_RECOMMENDATIONS = 100
+
 @bp.get("/movies/<int:id>/recommendations")
 def neo4j_movie_recommendations(id: int):
 	"""Recommend movies based on customers who rented the target movie and their other rentals, weighted by genre overlap.
 
 	Showcase: Multi-hop traversal combining customer→rental→movie paths and genre-based scoring.
+	mode=live runs the traversal; mode=precomputed (default) reads the CO_RENTED
+	edges and falls back to live until they have been built.
 	"""
 	try:
-		from neomodel import db
 		# Parameters: control weights and limits via query args
 		limit_param = request.args.get("limit", default="25")
 		try:
 			limit = int(limit_param)
 		except ValueError:
-			limit = 25
-
-		cypher = (
-			# Gather target movie genres once
-			"MATCH (target:Movie {movieId: $mid})-[:OF_GENRE]->(tg:Genre) "
-			"WITH target, collect(DISTINCT tg) AS targetGenres "
-			# Customers who rented the target movie
-			"MATCH (c:Customer)-[:RENTED]->(:Rental)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(target) "
-			# Other movies those customers rented
-			"MATCH (c)-[:RENTED]->(:Rental)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(m:Movie) "
-			"WHERE m.movieId <> target.movieId "
-			# Genre overlap count between m and target
-			"OPTIONAL MATCH (m)-[:OF_GENRE]->(g:Genre) "
-			"WITH m, targetGenres, collect(DISTINCT g) AS mGenres, count(DISTINCT c) AS customerSupport "
-			"WITH m, customerSupport, size([x IN mGenres WHERE x IN targetGenres]) AS sharedGenreCount "
-			# Score: combine genre overlap and number of distinct customers supporting
-			"WITH m, (sharedGenreCount * 2) + customerSupport AS score, sharedGenreCount AS genres, customerSupport AS support "
-			"ORDER BY score DESC, m.title ASC "
-			"RETURN m { .movieId, .title, .rating, .releaseYear, .runtimeMin } AS movie, score, genres, support "
-			"LIMIT $limit"
-		)
-		results, _ = db.cypher_query(cypher, {"mid": id, "limit": limit})
+			return jsonify({"status": "error", "message": "limit must be a positive integer"}), 400
+		if limit < 1:
+			return jsonify({"status": "error", "message": "limit must be a positive integer"}), 400
+		limit = min(limit, MAX_RECOMMENDATIONS)
+		mode = request.args.get("mode", default=DEFAULT_RECOMMENDATION_MODE)
+		if mode not in RECOMMENDATION_MODES:
+			return jsonify({"status": "error", "message": f"mode must be one of: {', '.join(RECOMMENDATION_MODES)}"}), 400
+
+		if mode == "precomputed" and "mode" not in request.args:
+			built, _ = queries.run("co_rentals_built")
+			if not built:
+				mode = "live"
+
+		results, _ = queries.run(f"recommendations_{mode}", {"mid": id, "limit": limit})
 		payload = [
 			{
 				"movie": row[0],
@@ -187,7 +201,34 @@ def neo4j_movie_recommendations(id: int):
 			}
 			for row in results
 		]
-		return jsonify(payload), 200
+		resp = jsonify(payload)
+		resp.headers["X-Recommendation-Mode"] = mode
+		return resp, 200
 	except Exception as e:
 		return jsonify({"status": "error", "message": str(e)}), 500
 
+# Neo4j: Named query registry (admin)
+@bp.get("/admin/queries")
+@roles_required("ADMIN")
+def neo4j_admin_queries():
+	"""Stats of the named Cypher queries: latency, sampled db hits and scans found in their plans."""
+	return jsonify({"profile_every": queries.PROFILE_EVERY, "queries": queries.stats()}), 200
+
+@bp.post("/admin/queries/<name>/profile")
+@roles_required("ADMIN")
+def neo4j_admin_profile_query(name: str):
+	"""PROFILE a named query and return its plan with rows and db hits per operator.
+
+	The body's "params" override the query's sample parameters. Registered
+	queries are reads and run in a read transaction.
+	"""
+	try:
+		data = request.get_json(silent=True) or {}
+		params = data.get("params") or {}
+		if not isinstance(params, dict):
+			return jsonify({"status": "error", "message": "params must be an object"}), 400
+		return jsonify(queries.profile(name, params)), 200
+	except LookupError as le:
+		return jsonify({"status": "error", "message": str(le)}), 404
+	except Exception as e:
+		return jsonify({"status": "error", "message": str(e)}), 500
@@ -0,0 +1,49 @@
+# src/api/v1/readiness.py
+"""
+Readiness gating for the backend blueprints.
+
+While a backend's probe reports it unavailable (see
+src/repositories/readiness.py), its routes answer 503 straight away with a
+Retry-After header instead of waiting for a connection timeout. Requests
+made before the first probe finished ("starting") are let through.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable
+
+from flask import Blueprint, jsonify, request
+
+from src.repositories.readiness import UNAVAILABLE, Readiness
+
+
+def unavailable(readiness: Readiness):
+    status = readiness.status()
+    resp = jsonify({"error": f"{readiness.name} is unavailable", "readiness": status})
+    resp.status_code = 503
+    resp.headers["Retry-After"] = str(max(1, math.ceil(status.get("retry_in_s") or 1)))
+    return resp
+
+
+def require_ready(bp: Blueprint, readiness: Readiness, exempt: Iterable[str] = ()) -> None:
+    """Answer 503 for bp's routes (nested blueprints included) while the backend is unavailable."""
+    exempt = set(exempt)
+
+    @bp.before_request
+    def _require_ready():
+        if readiness.state != UNAVAILABLE:
+            return None
+        if (request.endpoint or "").rsplit(".", 1)[-1] in exempt:
+            return None
+        return unavailable(readiness)
+
+
+def health_response(readiness: Readiness, **extra: Any):
+    """Backend health: 200 once ready, 503 while starting or unavailable."""
+    body = {
+        "backend": readiness.name,
+        "status": "ok" if readiness.ready else readiness.state,
+        "readiness": readiness.status(),
+        **extra,
+    }
+    return jsonify(body), (200 if readiness.ready else 503)
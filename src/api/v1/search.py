@@ -0,0 +1,80 @@
+# src/api/v1/search.py
+"""
+Query-string parsing and response shape shared by the movie search routes.
+
+    GET /movies/search?q=godfather&mode=natural&limit=20&offset=0
+    GET /movies/autocomplete?q=godf&limit=10&sort=rating
+    GET /movies/<id>/similar?mode=shared&limit=25
+
+Search results are ordered by relevance, so they are paged with limit/offset
+rather than a keyset cursor; the offset of the next page is returned in the
+X-Next-Offset header (absent on the last page). Autocomplete returns a single
+short list, as do the genre-similarity lookups.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask import jsonify, request
+
+SEARCH_MODES = ("natural", "boolean")
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_LENGTH = 200
+DEFAULT_AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 50
+MAX_PREFIX_LENGTH = 100
+SIMILAR_MODES = ("shared", "jaccard")
+DEFAULT_SIMILAR_LIMIT = 25
+MAX_SIMILAR_LIMIT = 50
+
+
+def search_args() -> Tuple[str, str, int, int]:
+    """(q, mode, limit, offset) of the request; raises ValueError for invalid values."""
+    q = (request.args.get("q") or "").strip()
+    if not q:
+        raise ValueError("q is required")
+    if len(q) > MAX_QUERY_LENGTH:
+        raise ValueError(f"q must be at most {MAX_QUERY_LENGTH} characters")
+    mode = request.args.get("mode", default="natural")
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(SEARCH_MODES)}")
+    limit = request.args.get("limit", default=DEFAULT_SEARCH_LIMIT, type=int)
+    if limit is None or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    offset = request.args.get("offset", default=0, type=int)
+    if offset is None or offset < 0:
+        raise ValueError("offset must be a non-negative integer")
+    return q, mode, min(limit, MAX_SEARCH_LIMIT), offset
+
+
+def autocomplete_args() -> Tuple[str, int, str]:
+    """(q, limit, sort) of the request; raises ValueError for invalid values."""
+    q = (request.args.get("q") or "").strip()
+    if not q:
+        raise ValueError("q is required")
+    if len(q) > MAX_PREFIX_LENGTH:
+        raise ValueError(f"q must be at most {MAX_PREFIX_LENGTH} characters")
+    limit = request.args.get("limit", default=DEFAULT_AUTOCOMPLETE_LIMIT, type=int)
+    if limit is None or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    sort = request.args.get("sort", default="rating")
+    return q, min(limit, MAX_AUTOCOMPLETE_LIMIT), sort
+
+
+def similar_args() -> Tuple[int, str]:
+    """(limit, mode) of the request; raises ValueError for invalid values."""
+    limit = request.args.get("limit", default=DEFAULT_SIMILAR_LIMIT, type=int)
+    if limit is None or limit < 1:
+        raise ValueError("limit must be a positive integer")
+    mode = request.args.get("mode", default="shared")
+    if mode not in SIMILAR_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(SIMILAR_MODES)}")
+    return min(limit, MAX_SIMILAR_LIMIT), mode
+
+
+def search_response(items: List[Dict[str, Any]], next_offset: Optional[int]):
+    resp = jsonify(items)
+    if next_offset is not None:
+        resp.headers["X-Next-Offset"] = str(next_offset)
+    return resp
@@ -2,19 +2,27 @@ import os
 from flask import Flask, jsonify, send_from_directory
 from flask_jwt_extended import JWTManager
 from flask_swagger_ui import get_swaggerui_blueprint
+from src.repositories import instrumentation
 from src.repositories.mongodb.connection import init_mongo
+from src.repositories.readiness import readiness_status, start_all as start_readiness_probes
 from .api.v1.mysql.health import bp as mysql_health_bp
 from .api.v1.mysql.routes import bp as mysql_routes_bp
 from .api.v1.mongodb.routes import bp as mongodb_routes_bp
 from .api.v1.mongodb.health import bp as mongodb_health_bp
 from .api.v1.auth.routes import bp as auth_bp, init_jwt_callbacks
 from .api.v1.neo4j.routes import bp as neo4j_routes_bp
+from .api.v1.metrics import bp as metrics_bp
 
 def create_app():
     app = Flask(__name__)
 
-    # Initialize MongoDB connection
+    # Query timing hooks; must precede init_mongo() so the MongoClient gets the listener
+    instrumentation.install()
+
+    # Register the MongoDB connection (connects on first use) and probe all
+    # backends in the background, so startup never waits for a database
     init_mongo()
+    start_readiness_probes()
 
     # JWT configuration
     app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY', 'dev-secret-change-me')
@@ -34,9 +42,12 @@ def create_app():
     
     app.register_blueprint(neo4j_routes_bp, url_prefix="/api/v1/neo4j")
 
+    # Prometheus scrape endpoint
+    app.register_blueprint(metrics_bp)
+
     @app.get("/api/v1/health")
     def health():
-        return jsonify({"status": "ok"})
+        return jsonify({"status": "ok", "backends": readiness_status()})
 
     # Swagger/OpenAPI docs
     SWAGGER_URL = "/api/v1/docs"
@@ -0,0 +1,72 @@
+# src/repositories/bulk.py
+from __future__ import annotations
+
+import inspect
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", "500"))
+
+T = TypeVar("T")
+
+# One result per submitted item, in submission order:
+#   {"index": 3, "id": 17, "status": "created" | "updated" | "deleted" | "not_found" | "error",
+#    "error": "..."}   (error only when status == "error")
+BulkResult = Dict[str, Any]
+
+
+def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    size = max(1, size)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def ok(index: int, id_: Any, status: str) -> BulkResult:
+    return {"index": index, "id": id_, "status": status}
+
+
+def failed(index: int, id_: Any, error: Any) -> BulkResult:
+    return {"index": index, "id": id_, "status": "error", "error": str(error)}
+
+
+def is_overridden(repo: Any, base: type, name: str) -> bool:
+    """True if `repo` replaces base.<name> (cache wrappers are looked through).
+
+    A repository whose override only adds a side effect around the base
+    write (and so needs no per-item fallback) lists the method name in
+    `bulk_hook_overrides`.
+    """
+    if name in getattr(type(repo), "bulk_hook_overrides", ()):
+        return False
+    return inspect.unwrap(getattr(type(repo), name)) is not getattr(base, name)
+
+
+def each(
+    items: Sequence[Any],
+    apply: Callable[[Any], Any],
+    status: str,
+    id_of: Callable[[Any, Any], Any],
+) -> List[BulkResult]:
+    """Per-item fallback for repositories whose single-item write has custom logic
+    (stored procedures, embedded documents): one call, and one transaction, per item."""
+    results: List[BulkResult] = []
+    for index, item in enumerate(items):
+        try:
+            out = apply(item)
+        except Exception as e:
+            results.append(failed(index, id_of(item, None), e))
+            continue
+        if out is None or out is False:
+            results.append(ok(index, id_of(item, None), "not_found"))
+        else:
+            results.append(ok(index, id_of(item, out), status))
+    return results
+
+
+def id_field_of(item: Any, *names: str) -> Optional[Any]:
+    if not isinstance(item, dict):
+        return item
+    for name in names:
+        if item.get(name) is not None:
+            return item[name]
+    return None
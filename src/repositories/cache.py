@@ -0,0 +1,255 @@
+# src/repositories/cache.py
+from __future__ import annotations
+
+import copy
+import functools
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_TTL = float(os.getenv("REPOSITORY_CACHE_TTL_SECONDS", "60"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("REPOSITORY_CACHE_MAX_ENTRIES", "256"))
+
+_MISS = object()
+
+
+# ── backends ─────────────────────────────────────────────────────
+class InProcessCache:
+    """
+    Per-process LRU cache with per-entry expiry.
+
+    Each namespace (one per repository) is its own OrderedDict bounded to
+    `max_entries`; reads move an entry to the end, writes evict from the
+    front. Values are deep-copied on the way out so callers can mutate the
+    dicts they get back without corrupting the cache. invalidate() bumps the
+    namespace's generation, and set() drops a value read under an older one.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, namespace: str) -> int:
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def get(self, namespace: str, key: str, generation: Optional[int] = None) -> Any:
+        with self._lock:
+            entries = self._data.get(namespace)
+            if not entries or key not in entries:
+                return _MISS
+            expires_at, value = entries[key]
+            if expires_at <= time.monotonic():
+                del entries[key]
+                return _MISS
+            entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: float, max_entries: int, generation: Optional[int] = None
+    ) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(namespace, 0):
+                return
+            entries = self._data.setdefault(namespace, OrderedDict())
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, namespace: str) -> None:
+        with self._lock:
+            self._data.pop(namespace, None)
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def size(self, namespace: str) -> Optional[int]:
+        with self._lock:
+            return len(self._data.get(namespace, ()))
+
+
+class RedisCache:
+    """
+    Cache shared by all workers/instances, backed by Redis.
+
+    Invalidation bumps a per-namespace version number that is part of every
+    key, so clearing a namespace is a single INCR; stale keys simply expire
+    through their TTL. A value read before an invalidation is written under
+    the old version, where nothing looks it up. Size bounds are left to Redis (`maxmemory` with an
+    LRU eviction policy) rather than `max_entries`.
+    """
+
+    def __init__(self, url: str, prefix: str = "repocache:"):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "REPOSITORY_CACHE_BACKEND=redis requires the 'redis' package (pip install redis)"
+            )
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def generation(self, namespace: str) -> int:
+        return int(self._redis.get(f"{self._prefix}{namespace}:version") or 0)
+
+    def _key(self, namespace: str, key: str, generation: Optional[int]) -> str:
+        if generation is None:
+            generation = self.generation(namespace)
+        return f"{self._prefix}{namespace}:{generation}:{key}"
+
+    def get(self, namespace: str, key: str, generation: Optional[int] = None) -> Any:
+        raw = self._redis.get(self._key(namespace, key, generation))
+        return _MISS if raw is None else pickle.loads(raw)
+
+    def set(
+        self, namespace: str, key: str, value: Any, ttl: float, max_entries: int, generation: Optional[int] = None
+    ) -> None:
+        self._redis.set(self._key(namespace, key, generation), pickle.dumps(value), px=max(1, int(ttl * 1000)))
+
+    def invalidate(self, namespace: str) -> None:
+        self._redis.incr(f"{self._prefix}{namespace}:version")
+
+    def size(self, namespace: str) -> Optional[int]:
+        return None
+
+
+_backend: Any = None
+_backend_lock = threading.Lock()
+
+
+def get_cache() -> Any:
+    """Process-wide backend chosen by REPOSITORY_CACHE_BACKEND (memory | redis | off)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                kind = os.getenv("REPOSITORY_CACHE_BACKEND", "memory").lower()
+                if kind == "redis":
+                    _backend = RedisCache(os.getenv("REPOSITORY_CACHE_URL", "redis://localhost:6379/0"))
+                elif kind == "off":
+                    _backend = False
+                else:
+                    _backend = InProcessCache()
+    return _backend
+
+
+def set_cache(backend: Any) -> None:
+    """Replace the process-wide backend (None re-reads the environment, False disables caching)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+# ── counters ─────────────────────────────────────────────────────
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _count(namespace: str, counter: str) -> None:
+    with _stats_lock:
+        stats = _stats.setdefault(namespace, {"hits": 0, "misses": 0, "invalidations": 0})
+        stats[counter] += 1
+
+
+def cache_stats(prefix: str = "") -> Dict[str, Dict[str, Any]]:
+    """Hit/miss/invalidation counters of this process per namespace, e.g. {"mysql.genres": {...}}."""
+    backend = get_cache()
+    with _stats_lock:
+        snapshot = {ns: dict(s) for ns, s in _stats.items() if ns.startswith(prefix)}
+    for ns, stats in snapshot.items():
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 3) if lookups else None
+        stats["entries"] = backend.size(ns) if backend else None
+    return snapshot
+
+
+# ── repository mixin ─────────────────────────────────────────────
+def _cached_read(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        backend = get_cache()
+        if not backend:
+            return fn(self, *args, **kwargs)
+        namespace = self.cache_namespace
+        key = json.dumps([name, args, kwargs], sort_keys=True, default=str)
+        # Taken before the read: if a write invalidates the namespace while fn
+        # runs, the value it returns may predate the write and is not stored
+        generation = backend.generation(namespace)
+        value = backend.get(namespace, key, generation)
+        if value is not _MISS:
+            _count(namespace, "hits")
+            return value
+        _count(namespace, "misses")
+        value = fn(self, *args, **kwargs)
+        backend.set(namespace, key, value, self.cache_ttl, self.cache_max_entries, generation)
+        return value
+
+    wrapper.__cache_wrapped__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _invalidating(fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            # Also on errors: the write may have reached the database before failing
+            self.cache_invalidate()
+
+    wrapper.__cache_wrapped__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+class CachedRepositoryMixin:
+    """
+    Read-through caching for rarely changing lookup repositories.
+
+    List it before the repository base class:
+
+        class GenreRepository(CachedRepositoryMixin, BaseRepository[Genre]):
+            cache_namespace = "mysql.genres"
+            cache_ttl = 300
+
+    Every method in `cached_methods` that the class has is wrapped so its
+    result is cached per call arguments; every method in
+    `invalidating_methods` drops the whole namespace after it runs. Writes
+    that bypass the repository (other services, the sync job, SQL run by
+    hand, database triggers) are only picked up after `cache_ttl` seconds,
+    and with the in-process backend an invalidation only reaches the
+    current worker, so tables that triggers write to should not be cached.
+    """
+
+    cache_namespace: str = ""
+    cache_ttl: float = DEFAULT_TTL
+    cache_max_entries: int = DEFAULT_MAX_ENTRIES
+    cached_methods: Tuple[str, ...] = ("get_all", "get_page", "get_by_id")
+    invalidating_methods: Tuple[str, ...] = (
+        "create", "update", "delete", "bulk_create", "bulk_update", "bulk_delete",
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not cls.cache_namespace:
+            cls.cache_namespace = f"{cls.__module__}.{cls.__qualname__}"
+        for name in cls.cached_methods + cls.invalidating_methods:
+            fn = getattr(cls, name, None)
+            if fn is None or getattr(fn, "__cache_wrapped__", False):
+                continue
+            setattr(cls, name, _cached_read(name, fn) if name in cls.cached_methods else _invalidating(fn))
+
+    def get_version(self) -> None:
+        # The body may come from the cache while a version stamp would come from
+        # the database, so the ETag is the hash of the body actually served
+        return None
+
+    def cache_invalidate(self) -> None:
+        backend = get_cache()
+        if backend:
+            backend.invalidate(self.cache_namespace)
+            _count(self.cache_namespace, "invalidations")
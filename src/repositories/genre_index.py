@@ -0,0 +1,182 @@
+# src/repositories/genre_index.py
+"""
+In-memory genre-similarity index ("movies sharing the most genres with X").
+
+Genres are a small fixed set, so each movie's genres are one int bitset and
+the overlap of two movies is popcount(a & b); Jaccard similarity is
+popcount(a & b) / popcount(a | b). Movies with the same genres share a
+bitset, so the catalog collapses to a few hundred distinct bitsets: a lookup
+scores those (not every movie), then walks their movie lists, which are
+pre-sorted by rating, best score first. Movies with the same genres get
+the same ranking, so rankings are memoized per bitset until the next
+reload: after warm-up a lookup is a dict hit.
+
+Order: score (shared genres, or Jaccard then shared genres), then rating
+(highest first, unrated last), then title.
+
+Not tied to a backend: GenreSimilarity wraps a loader that returns the
+catalog (see mysql/, mongodb/ and neo4j/genre_similarity.py) and reloads it
+every GENRE_INDEX_REFRESH_SECONDS in the background.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+REFRESH_SECONDS = float(os.getenv("GENRE_INDEX_REFRESH_SECONDS", "60"))
+PRELOAD = os.getenv("GENRE_INDEX_PRELOAD", "true").lower() == "true"
+MODES = ("shared", "jaccard")
+MAX_K = 50
+MAX_MEMOIZED = 16384
+
+# (movie id, genre keys, movie payload with "title" and "rating")
+CatalogEntry = Tuple[Any, Iterable[Hashable], Dict[str, Any]]
+
+
+class GenreIndex:
+    """Genre bitsets of a catalog, grouped by distinct bitset."""
+
+    def __init__(self, entries: Iterable[CatalogEntry], max_k: int = MAX_K):
+        self.max_k = max_k
+        self._movies: Dict[Any, Dict[str, Any]] = {}
+        self._bits: Dict[Any, int] = {}
+        genre_bits: Dict[Hashable, int] = {}
+        for id_, genres, movie in entries:
+            mask = 0
+            for genre in genres:
+                if genre is not None:
+                    mask |= 1 << genre_bits.setdefault(genre, len(genre_bits))
+            self._movies[id_] = movie
+            self._bits[id_] = mask
+        self.genres = len(genre_bits)
+
+        # one list per distinct bitset, in tiebreak order; rank[id] orders across lists
+        order = sorted(self._movies, key=lambda i: _tiebreak(self._movies[i], i))
+        self._rank = {id_: pos for pos, id_ in enumerate(order)}
+        groups: Dict[int, List[Any]] = {}
+        for id_ in order:
+            if self._bits[id_]:
+                groups.setdefault(self._bits[id_], []).append(id_)
+        self._masks = list(groups)
+        self._groups = [groups[mask] for mask in self._masks]
+        self._popcounts = [mask.bit_count() for mask in self._masks]
+        self._top: Dict[Tuple[Any, str], List[Tuple[Any, int, float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._movies)
+
+    @property
+    def distinct_bitsets(self) -> int:
+        return len(self._masks)
+
+    def top(self, id_: Any, k: int = 25, mode: str = "shared") -> List[Dict[str, Any]]:
+        """Up to k movies sharing genres with `id_`: {"movie", "shared_genres", "jaccard"}."""
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of: {', '.join(MODES)}")
+        target = self._bits.get(id_, 0)
+        if not target:
+            return []
+        ranked = self._top.get((target, mode))
+        if ranked is None:
+            ranked = self._rank_similar(target, mode)
+            if len(self._top) >= MAX_MEMOIZED:
+                self._top.clear()
+            self._top[(target, mode)] = ranked
+        # the ranking of a bitset includes its own movies, this one among them
+        similar = (entry for entry in ranked if entry[0] != id_)
+        return [
+            {"movie": dict(self._movies[other]), "shared_genres": shared, "jaccard": jaccard}
+            for other, shared, jaccard in itertools.islice(similar, min(k, self.max_k))
+        ]
+
+    def _rank_similar(self, target: int, mode: str) -> List[Tuple[Any, int, float]]:
+        """The max_k + 1 movies most similar to a bitset (one more, for the movie asking)."""
+        size = target.bit_count()
+        # score every distinct bitset: popcount of the AND (and of the OR for Jaccard)
+        levels: Dict[Tuple[float, int], List[int]] = {}
+        for g, mask in enumerate(self._masks):
+            shared = (target & mask).bit_count()
+            if shared:
+                jaccard = shared / (size + self._popcounts[g] - shared)
+                key = (jaccard, shared) if mode == "jaccard" else (shared, 0)
+                levels.setdefault(key, []).append(g)
+
+        ranked: List[Tuple[Any, int, float]] = []
+        rank = self._rank.__getitem__
+        for key in sorted(levels, reverse=True):
+            groups = [self._groups[g] for g in levels[key]]
+            movies = groups[0] if len(groups) == 1 else heapq.merge(*groups, key=rank)
+            for other in movies:
+                mask = self._bits[other]
+                shared = (target & mask).bit_count()
+                ranked.append((other, shared, round(shared / (target | mask).bit_count(), 4)))
+                if len(ranked) > self.max_k:
+                    return ranked
+        return ranked
+
+
+def _tiebreak(movie: Dict[str, Any], id_: Any) -> Tuple[Any, ...]:
+    try:
+        rating = float(movie.get("rating"))
+    except (TypeError, ValueError):  # unrated (Neo4j may also hold it as a string)
+        rating = None
+    return (rating is None, -(rating or 0.0), movie.get("title") or "", id_)
+
+
+class GenreSimilarity:
+    """A backend's GenreIndex, loaded once the backend is ready and reloaded in the background."""
+
+    def __init__(self, name: str, loader: Callable[[], Iterable[CatalogEntry]]):
+        self.name = name
+        self.loader = loader
+        self._index: Optional[GenreIndex] = None
+        self._built_at = 0.0
+        self._build_seconds: Optional[float] = None
+        self._load_lock = threading.Lock()
+        self._reloading = threading.Event()
+
+    def top(self, movie_id: Any, k: int = 25, mode: str = "shared") -> List[Dict[str, Any]]:
+        if self._index is None:
+            with self._load_lock:
+                if self._index is None:
+                    self._load()
+        elif time.monotonic() - self._built_at >= REFRESH_SECONDS and not self._reloading.is_set():
+            self._reloading.set()
+            threading.Thread(target=self._reload, name=f"{self.name}-genre-index", daemon=True).start()
+        return self._index.top(movie_id, k, mode)
+
+    def load(self) -> None:
+        with self._load_lock:
+            self._load()
+
+    def _load(self) -> None:
+        started = time.perf_counter()
+        self._index = GenreIndex(self.loader())
+        self._built_at = time.monotonic()
+        self._build_seconds = time.perf_counter() - started
+
+    def _reload(self) -> None:
+        try:
+            self.load()
+        except Exception as e:
+            # keep serving the current index; retry after another interval
+            self._built_at = time.monotonic()
+            print(f"[{self.name}] Genre index reload failed: {e}")
+        finally:
+            self._reloading.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        if self._index is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "movies": len(self._index),
+            "genres": self._index.genres,
+            "distinct_bitsets": self._index.distinct_bitsets,
+            "build_seconds": round(self._build_seconds or 0.0, 3),
+            "age_seconds": round(time.monotonic() - self._built_at, 1),
+        }
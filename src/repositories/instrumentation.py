@@ -0,0 +1,347 @@
+# src/repositories/instrumentation.py
+"""
+Query instrumentation for the three backends, exported in Prometheus format.
+
+install() hooks every database call the repositories make:
+
+- MySQL:   SQLAlchemy before/after_cursor_execute on all engines
+- MongoDB: a pymongo CommandListener (registered before the client exists)
+- Neo4j:   timing around neomodel's db.cypher_query and the driver
+           layer's read_query/write_query (neo4j/driver.py)
+
+Each query is counted in a latency histogram per backend and operation.
+While a request is being handled (see src/api/v1/metrics.py) queries are
+also counted per request, so routes with N+1 patterns show up in
+db_queries_per_request. Queries slower than SLOW_QUERY_MS are logged
+with their statement normalized (literals and IN lists collapsed).
+
+Metrics live in process memory: with several gunicorn workers every worker
+exports its own numbers, which Prometheus scrapes per instance.
+"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+# Requests issuing more queries than this are logged as possible N+1 patterns
+QUERY_COUNT_WARN = int(os.getenv("QUERY_COUNT_WARN", "25"))
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 1000)
+
+log = logging.getLogger("movie_rental.queries")
+
+Labels = Tuple[str, ...]
+
+
+# ── metric types ─────────────────────────────────────────────────
+class Counter:
+    def __init__(self, name: str, help_: str, labelnames: Sequence[str]):
+        self.name, self.help, self.labelnames = name, help_, tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_labels(self.labelnames, labels)} {_num(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_: str, labelnames: Sequence[str], buckets: Sequence[float]):
+        self.name, self.help, self.labelnames = name, help_, tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> (per-bucket counts, sum, count)
+        self._values: Dict[Labels, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[0][i] += 1
+                    break
+            entry[1] += value
+            entry[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, n in zip(self.buckets, counts):
+                    cumulative += n
+                    lines.append(
+                        f"{self.name}_bucket{_labels(self.labelnames + ('le',), labels + (_num(bound),))} {cumulative}"
+                    )
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames + ('le',), labels + ('+Inf',))} {count}")
+                lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_num(total)}")
+                lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values)) + "}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() and abs(value) < 1e15 else repr(value)
+
+
+# ── registry ─────────────────────────────────────────────────────
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "API request latency.", ("backend", "method", "route", "status"), LATENCY_BUCKETS
+)
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "Database call latency.", ("backend", "operation"), LATENCY_BUCKETS
+)
+db_queries_per_request = Histogram(
+    "db_queries_per_request", "Database calls made while handling one request.", ("backend", "route"), COUNT_BUCKETS
+)
+db_query_errors = Counter("db_query_errors_total", "Database calls that raised.", ("backend", "operation"))
+db_slow_queries = Counter(
+    "db_slow_queries_total", f"Database calls slower than SLOW_QUERY_MS ({SLOW_QUERY_MS:g} ms).", ("backend",)
+)
+
+_METRICS: List[Any] = [http_request_duration, db_query_duration, db_queries_per_request, db_query_errors, db_slow_queries]
+# Callables returning extra exposition lines (gauges read at scrape time)
+_collectors: List[Callable[[], Iterable[str]]] = []
+
+
+def add_collector(collect: Callable[[], Iterable[str]]) -> None:
+    _collectors.append(collect)
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    for collect in _collectors:
+        try:
+            lines.extend(collect())
+        except Exception as e:  # a broken collector must not take /metrics down
+            lines.append(f"# collector {getattr(collect, '__name__', collect)} failed: {e}")
+    return "\n".join(lines) + "\n"
+
+
+def gauge_lines(name: str, help_: str, samples: Iterable[Tuple[Dict[str, str], Optional[float]]]) -> List[str]:
+    lines = [f"# HELP {name} {help_}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        if value is not None:
+            lines.append(f"{name}{_labels(tuple(labels), tuple(labels.values()))} {_num(value)}")
+    return lines
+
+
+# ── per-request query accounting ─────────────────────────────────
+class RequestStats:
+    __slots__ = ("backend", "route", "queries", "query_seconds")
+
+    def __init__(self, backend: str, route: str):
+        self.backend = backend
+        self.route = route
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+_current: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("request_stats", default=None)
+
+
+def begin_request(backend: str, route: str) -> contextvars.Token:
+    return _current.set(RequestStats(backend, route))
+
+
+def end_request(token: contextvars.Token, method: str, status: int, seconds: float) -> None:
+    stats = _current.get()
+    _current.reset(token)
+    if stats is None:
+        return
+    http_request_duration.observe(seconds, stats.backend, method, stats.route, str(status))
+    db_queries_per_request.observe(stats.queries, stats.backend, stats.route)
+    if stats.queries > QUERY_COUNT_WARN:
+        log.warning(
+            "%s %s issued %d %s queries (%.1f ms in the database)",
+            method, stats.route, stats.queries, stats.backend, stats.query_seconds * 1000,
+        )
+
+
+def record_query(backend: str, operation: str, seconds: float, statement: Any, failed: bool = False) -> None:
+    db_query_duration.observe(seconds, backend, operation)
+    if failed:
+        db_query_errors.inc(backend, operation)
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += seconds
+    if seconds * 1000 >= SLOW_QUERY_MS:
+        db_slow_queries.inc(backend)
+        log.warning(
+            "slow %s query (%.1f ms)%s: %s",
+            backend, seconds * 1000, f" in {stats.route}" if stats else "", normalize(backend, statement),
+        )
+
+
+def record_cypher(query: str, seconds: float, failed: bool = False) -> None:
+    """record_query() for a Cypher statement run outside neomodel (see neo4j/driver.py)."""
+    record_query("neo4j", _cypher_operation(query), seconds, query, failed)
+
+
+# ── statement normalization ──────────────────────────────────────
+_STRING = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"%\((\w+?)(?:_\d+)?\)s|%s|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(backend: str, statement: Any) -> str:
+    """Statement with literals and parameters replaced by ?, so equal queries group together."""
+    if backend == "mongodb" and isinstance(statement, dict):
+        return _normalize_mongo(statement)
+    text = _SPACES.sub(" ", str(statement)).strip()
+    text = _STRING.sub("?", text)
+    text = _PARAM.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    return text[:1000]
+
+
+def _normalize_mongo(command: Dict[str, Any]) -> str:
+    def shape(value: Any, depth: int = 0) -> Any:
+        if depth > 4:
+            return "..."
+        if isinstance(value, dict):
+            return {k: shape(v, depth + 1) for k, v in value.items()}
+        if isinstance(value, list):
+            return [shape(value[0], depth + 1), "..."] if value else []
+        return "?"
+
+    name = next(iter(command), "?")
+    parts = [f"{name} {command.get(name)}"]
+    for key in ("filter", "query", "pipeline", "updates", "deletes", "sort", "projection"):
+        if key in command:
+            parts.append(f"{key}={shape(command[key])}")
+    return " ".join(parts)[:1000]
+
+
+def _sql_operation(statement: str) -> str:
+    words = statement.lstrip(" (\n\t").split(None, 1)
+    return words[0].upper() if words else "?"
+
+
+def _cypher_operation(query: str) -> str:
+    for clause in ("MERGE", "CREATE", "DELETE", "SET", "REMOVE", "CALL", "MATCH", "RETURN"):
+        if re.search(rf"\b{clause}\b", query, re.IGNORECASE):
+            return clause
+    return "?"
+
+
+# ── hooks ────────────────────────────────────────────────────────
+_installed = False
+_install_lock = threading.Lock()
+
+
+def install() -> None:
+    """Attach the listeners to all three backends (idempotent). Call before init_mongo()."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        _install_sqlalchemy()
+        _install_pymongo()
+        _install_neomodel()
+        _installed = True
+
+
+def _install_sqlalchemy() -> None:
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info["query_start"].pop()
+        record_query("mysql", _sql_operation(statement), time.perf_counter() - start, statement)
+
+    def error(context):
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            statement = context.statement or ""
+            record_query("mysql", _sql_operation(statement), time.perf_counter() - starts.pop(), statement, failed=True)
+
+    event.listen(Engine, "before_cursor_execute", before)
+    event.listen(Engine, "after_cursor_execute", after)
+    event.listen(Engine, "handle_error", error)
+
+
+def _install_pymongo() -> None:
+    from pymongo import monitoring
+
+    class QueryListener(monitoring.CommandListener):
+        # Listener callbacks run in the thread that issued the command, so the
+        # request context var is visible here.
+        def __init__(self):
+            self._commands: Dict[Tuple[Any, int], Dict[str, Any]] = {}
+            self._lock = threading.Lock()
+
+        def started(self, event):
+            if event.command_name in ("hello", "isMaster", "ismaster", "ping", "saslStart", "saslContinue"):
+                return
+            with self._lock:
+                self._commands[(event.connection_id, event.request_id)] = event.command
+
+        def _finish(self, event, failed: bool):
+            with self._lock:
+                command = self._commands.pop((event.connection_id, event.request_id), None)
+            if command is not None:
+                record_query("mongodb", event.command_name, event.duration_micros / 1e6, command, failed)
+
+        def succeeded(self, event):
+            self._finish(event, False)
+
+        def failed(self, event):
+            self._finish(event, True)
+
+    monitoring.register(QueryListener())
+
+
+def _install_neomodel() -> None:
+    from neomodel import db
+
+    run = db.cypher_query
+
+    @functools.wraps(run)
+    def timed_cypher_query(query, params=None, *args, **kwargs):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = run(query, params, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            record_cypher(query, time.perf_counter() - start, failed)
+
+    db.cypher_query = timed_cypher_query
@@ -0,0 +1,412 @@
+# src/repositories/item_similarity.py
+"""
+In-process item-item recommendations ("customers who rented this also rented").
+
+Rentals are a sparse, binary customer × movie matrix X. Column products give
+the co-rental counts C = Xᵀ·X, from which two similarities are scored:
+
+    cosine(i, j)  = C[i, j] / sqrt(n[i] * n[j])
+    jaccard(i, j) = C[i, j] / (n[i] + n[j] - C[i, j])
+
+where n[i] is the number of distinct customers who rented movie i. C itself
+is never materialized: it is computed one block of movies at a time and only
+the top TOP_K neighbours of each movie are kept, as dense (movies × TOP_K)
+arrays. Lookups are a binary search plus a slice.
+
+Incremental refresh: new rentals only change the rows of the movies they
+contain and of the movies co-rented with those (their counts, or a
+neighbour's n[i], change), so only those rows are recomputed. When that is
+most of the catalog a full build is done instead.
+
+Models are saved as .npy files in a versioned directory and opened with
+mmap, so every worker shares one copy through the page cache and a
+restarted worker serves immediately from the last saved model. The
+directory's CURRENT file names the live version; one worker at a time
+refreshes it (flock), the others pick up the new version on their next
+check.
+
+Not tied to a backend: a source callable supplies (customer, movie) pairs of
+the rentals after a watermark (see mysql/recommendations.py and
+mongodb/recommendations.py). numpy and scipy (requirements.txt) are
+imported on first use.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; refreshes are then not coordinated across processes
+    fcntl = None
+
+RECOMMENDER_DIR = os.getenv("RECOMMENDER_DIR", os.path.join("var", "recommender"))
+TOP_K = int(os.getenv("RECOMMENDER_TOP_K", "50"))
+# Movies per block when computing co-rental counts (bounds peak memory)
+BLOCK_SIZE = int(os.getenv("RECOMMENDER_BLOCK_SIZE", "2048"))
+REFRESH_SECONDS = float(os.getenv("RECOMMENDER_REFRESH_SECONDS", "300"))
+FULL_REBUILD_SECONDS = float(os.getenv("RECOMMENDER_FULL_REBUILD_SECONDS", "86400"))
+PRELOAD = os.getenv("RECOMMENDER_PRELOAD", "true").lower() == "true"
+# Incremental refreshes touching more than this share of the movies do a full build
+FULL_FRACTION = 0.5
+METRICS = ("cosine", "jaccard")
+KEEP_VERSIONS = 2
+
+# (after watermark) -> (new watermark, customer ids, movie ids), one entry per rented copy
+PairSource = Callable[[int], Tuple[int, Sequence[int], Sequence[int]]]
+
+
+def _modules():
+    try:
+        import numpy
+        from scipy import sparse
+    except ImportError:
+        raise RuntimeError(
+            "Item-item recommendations require the 'numpy' and 'scipy' packages (pip install numpy scipy)"
+        ) from None
+    return numpy, sparse
+
+
+def _matrix(customers, movies):
+    """Binary customer × movie CSC matrix, with the sorted customer and movie ids of its axes."""
+    np, sparse = _modules()
+    customers = np.asarray(customers, dtype=np.int64)
+    movies = np.asarray(movies, dtype=np.int64)
+    customer_ids, rows = np.unique(customers, return_inverse=True)
+    movie_ids, cols = np.unique(movies, return_inverse=True)
+    x = sparse.csc_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(customer_ids), len(movie_ids)),
+    )
+    x.sum_duplicates()
+    x.data[:] = 1  # renting a movie twice still counts once
+    return x, customer_ids, movie_ids
+
+
+def _neighbours(x, counts, movie_ids, rows, top_k: int, block_size: int = BLOCK_SIZE):
+    """Top-k neighbour ids and scores per metric for the movies at column indexes `rows`."""
+    np, _ = _modules()
+    counts = counts.astype(np.float64)
+    xt = x.T.tocsr()
+    out = {
+        metric: (np.full((len(rows), top_k), -1, dtype=np.int64), np.zeros((len(rows), top_k), dtype=np.float32))
+        for metric in METRICS
+    }
+    for start in range(0, len(rows), block_size):
+        block = rows[start:start + block_size]
+        co = (xt[block] @ x).tocsr()  # co-rental counts, len(block) × movies
+        r = np.repeat(np.arange(len(block)), np.diff(co.indptr))
+        cols, c = co.indices, co.data.astype(np.float64)
+        keep = cols != block[r]  # a movie is not its own neighbour
+        r, cols, c = r[keep], cols[keep], c[keep]
+        ni, nj = counts[block][r], counts[cols]
+        scores = {"cosine": c / np.sqrt(ni * nj), "jaccard": c / (ni + nj - c)}
+        for metric, score in scores.items():
+            # per row: best score first, then most co-rentals, then lowest movie id
+            order = np.lexsort((movie_ids[cols], -c, -score, r))
+            rs = r[order]
+            rank = np.arange(len(rs)) - np.searchsorted(rs, rs)
+            top = rank < top_k
+            ids, vals = out[metric]
+            ids[start + rs[top], rank[top]] = movie_ids[cols[order][top]]
+            vals[start + rs[top], rank[top]] = score[order][top]
+    return out
+
+
+class ItemSimilarity:
+    """Top-k item-item neighbours of every rented movie, by cosine and Jaccard similarity."""
+
+    def __init__(self, movie_ids, counts, neighbours: Dict[str, Any], scores: Dict[str, Any],
+                 customers, movies, watermark: int, meta: Optional[Dict[str, Any]] = None):
+        self.movie_ids = movie_ids
+        self.counts = counts
+        self.neighbours = neighbours
+        self.scores = scores
+        # deduplicated (customer, movie) pairs, kept for incremental refreshes
+        self.customers = customers
+        self.movies = movies
+        self.watermark = watermark
+        self.meta = meta or {}
+
+    @property
+    def top_k(self) -> int:
+        return self.neighbours[METRICS[0]].shape[1]
+
+    def __len__(self) -> int:
+        return len(self.movie_ids)
+
+    # ── building ─────────────────────────────────────────────────
+    @classmethod
+    def build(cls, customers, movies, watermark: int, top_k: int = TOP_K) -> "ItemSimilarity":
+        np, _ = _modules()
+        started = time.perf_counter()
+        x, customer_ids, movie_ids = _matrix(customers, movies)
+        counts = np.diff(x.indptr).astype(np.int32)
+        out = _neighbours(x, counts, movie_ids, np.arange(len(movie_ids)), top_k)
+        return cls._from(x, customer_ids, movie_ids, counts, out, watermark, {
+            "kind": "full",
+            "full_built_at": time.time(),
+            "build_seconds": round(time.perf_counter() - started, 3),
+            "recomputed": len(movie_ids),
+        })
+
+    def update(self, customers, movies, watermark: int) -> "ItemSimilarity":
+        """A new model with the rentals after self.watermark added; self is left as is."""
+        np, _ = _modules()
+        started = time.perf_counter()
+        movies = np.asarray(movies, dtype=np.int64)
+        x, customer_ids, movie_ids = _matrix(
+            np.concatenate([self.customers, np.asarray(customers, dtype=np.int64)]),
+            np.concatenate([self.movies, movies]),
+        )
+        touched = np.searchsorted(movie_ids, np.unique(movies))
+        affected = np.union1d(touched, (x.T.tocsr()[touched] @ x).indices) if len(touched) else touched
+        if len(affected) > FULL_FRACTION * len(movie_ids):
+            return self._full(x, customer_ids, movie_ids, watermark)
+        counts = np.diff(x.indptr).astype(np.int32)
+        # pairs only ever grow, so every old movie is still there: copy its rows across
+        old_rows = np.searchsorted(movie_ids, self.movie_ids)
+        out = {}
+        for metric in METRICS:
+            ids = np.full((len(movie_ids), self.top_k), -1, dtype=np.int64)
+            vals = np.zeros((len(movie_ids), self.top_k), dtype=np.float32)
+            ids[old_rows] = self.neighbours[metric]
+            vals[old_rows] = self.scores[metric]
+            out[metric] = (ids, vals)
+        fresh = _neighbours(x, counts, movie_ids, affected, self.top_k)
+        for metric in METRICS:
+            out[metric][0][affected], out[metric][1][affected] = fresh[metric]
+        return self._from(x, customer_ids, movie_ids, counts, out, watermark, {
+            "kind": "incremental",
+            "full_built_at": self.meta.get("full_built_at"),
+            "build_seconds": round(time.perf_counter() - started, 3),
+            "recomputed": len(affected),
+        })
+
+    def _full(self, x, customer_ids, movie_ids, watermark: int) -> "ItemSimilarity":
+        coo = x.tocoo()
+        return ItemSimilarity.build(customer_ids[coo.row], movie_ids[coo.col], watermark, self.top_k)
+
+    @classmethod
+    def _from(cls, x, customer_ids, movie_ids, counts, out, watermark: int, meta: Dict[str, Any]) -> "ItemSimilarity":
+        coo = x.tocoo()
+        meta["built_at"] = time.time()
+        return cls(
+            movie_ids, counts,
+            {metric: ids for metric, (ids, _) in out.items()},
+            {metric: vals for metric, (_, vals) in out.items()},
+            customer_ids[coo.row], movie_ids[coo.col], watermark, meta,
+        )
+
+    # ── lookups ──────────────────────────────────────────────────
+    def top(self, movie_id: int, k: int = 10, metric: str = "cosine") -> List[Dict[str, Any]]:
+        """Up to k most similar movies: {"movie_id", "score", "co_rentals"}, best first."""
+        np, _ = _modules()
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of: {', '.join(METRICS)}")
+        pos = int(np.searchsorted(self.movie_ids, movie_id))
+        if pos >= len(self.movie_ids) or self.movie_ids[pos] != movie_id:
+            return []
+        ids = self.neighbours[metric][pos, :k]
+        scores = self.scores[metric][pos, :k]
+        n = int((ids >= 0).sum())  # rows are padded with -1 at the end
+        ids, scores = ids[:n], scores[:n].astype(np.float64)
+        # co-rental counts are not stored; they follow from the score and both counts
+        ni = float(self.counts[pos])
+        nj = self.counts[np.searchsorted(self.movie_ids, ids)].astype(np.float64)
+        if metric == "cosine":
+            co = scores * np.sqrt(ni * nj)
+        else:
+            co = scores * (ni + nj) / (1 + scores)
+        return [
+            {"movie_id": int(i), "score": round(float(s), 6), "co_rentals": int(round(float(c)))}
+            for i, s, c in zip(ids, scores, co)
+        ]
+
+    # ── persistence ──────────────────────────────────────────────
+    def _arrays(self) -> Dict[str, Any]:
+        arrays = {"movie_ids": self.movie_ids, "counts": self.counts,
+                  "customers": self.customers, "movies": self.movies}
+        for metric in METRICS:
+            arrays[f"{metric}_ids"] = self.neighbours[metric]
+            arrays[f"{metric}_scores"] = self.scores[metric]
+        return arrays
+
+    def save(self, path: str) -> None:
+        np, _ = _modules()
+        os.makedirs(path, exist_ok=True)
+        for name, array in self._arrays().items():
+            np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(array))
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({**self.meta, "watermark": int(self.watermark)}, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "ItemSimilarity":
+        np, _ = _modules()
+        mode = "r" if mmap else None
+        arrays = {
+            name[:-4]: np.load(os.path.join(path, name), mmap_mode=mode)
+            for name in os.listdir(path) if name.endswith(".npy")
+        }
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        return cls(
+            arrays["movie_ids"], arrays["counts"],
+            {metric: arrays[f"{metric}_ids"] for metric in METRICS},
+            {metric: arrays[f"{metric}_scores"] for metric in METRICS},
+            arrays["customers"], arrays["movies"], meta["watermark"], meta,
+        )
+
+
+class ItemRecommender:
+    """
+    One backend's model: loaded from disk (or built) once the backend is
+    ready, refreshed every REFRESH_SECONDS and rebuilt in full every
+    FULL_REBUILD_SECONDS, in a background thread started by a lookup.
+    """
+
+    def __init__(self, name: str, source: PairSource, directory: str = RECOMMENDER_DIR):
+        self.name = name
+        self.source = source
+        self.directory = os.path.join(directory, name)
+        self._model: Optional[ItemSimilarity] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+        self._load_lock = threading.Lock()
+        self._refreshing = threading.Event()
+
+    # ── lookups ──────────────────────────────────────────────────
+    def top(self, movie_id: int, k: int = 10, metric: str = "cosine") -> List[Dict[str, Any]]:
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of: {', '.join(METRICS)}")
+        if self._model is None:
+            self.load()
+        else:
+            self._refresh_if_due()
+        return self._model.top(movie_id, k, metric)
+
+    # ── loading and refreshing ───────────────────────────────────
+    def load(self) -> None:
+        """Open the saved model, building (and saving) one first if there is none."""
+        with self._load_lock:
+            if self._model is not None:
+                return
+            if self._current() is None:
+                # the first worker builds; the others wait for it and open its model
+                with self._locked(blocking=True):
+                    if self._current() is None:
+                        self._publish(self._build(full=True))
+            self._open(self._current())
+
+    def refresh(self, full: bool = False) -> bool:
+        """Add the rentals since the saved model's watermark and publish the result.
+
+        Returns False when another process is already refreshing; that one
+        publishes instead.
+        """
+        with self._locked(blocking=False) as acquired:
+            if not acquired:
+                return False
+            self._publish(self._build(full))
+            return True
+
+    def _build(self, full: bool) -> ItemSimilarity:
+        version = self._current()
+        if version is not None and not full:
+            current = ItemSimilarity.load(self._path(version))
+            watermark, customers, movies = self.source(current.watermark)
+            model = current.update(customers, movies, watermark)
+        else:
+            watermark, customers, movies = self.source(0)
+            model = ItemSimilarity.build(customers, movies, watermark)
+        print(
+            f"[{self.name}] Recommendations {model.meta['kind']} build: {len(model)} movies, "
+            f"{model.meta['recomputed']} recomputed in {model.meta['build_seconds']:.2f}s "
+            f"(last rental {model.watermark})"
+        )
+        return model
+
+    @contextlib.contextmanager
+    def _locked(self, blocking: bool):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, ".lock"), "w") as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except BlockingIOError:
+                    yield False
+                    return
+            yield True
+
+    def _refresh_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < REFRESH_SECONDS or self._refreshing.is_set():
+            return
+        self._checked_at = now
+        version = self._current()
+        if version != self._version:
+            # another worker published a newer model
+            self._open(version)
+        elif time.time() - self._model.meta.get("built_at", 0) >= REFRESH_SECONDS:
+            self._refreshing.set()
+            threading.Thread(target=self._refresh, name=f"{self.name}-recommendations", daemon=True).start()
+
+    def _refresh(self) -> None:
+        try:
+            full_age = time.time() - (self._model.meta.get("full_built_at") or 0)
+            if self.refresh(full=full_age >= FULL_REBUILD_SECONDS):
+                self._open(self._current())
+        except Exception as e:
+            # keep serving the current model; retried after another interval
+            print(f"[{self.name}] Recommendation refresh failed: {e}")
+        finally:
+            self._refreshing.clear()
+
+    # ── versions on disk ─────────────────────────────────────────
+    def _path(self, version: str) -> str:
+        return os.path.join(self.directory, version)
+
+    def _current(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.directory, "CURRENT")) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def _open(self, version: str) -> None:
+        self._model = ItemSimilarity.load(self._path(version))
+        self._version = version
+
+    def _publish(self, model: ItemSimilarity) -> None:
+        version = f"{int(time.time() * 1000)}-{model.watermark}"
+        model.save(self._path(version))
+        tmp = os.path.join(self.directory, "CURRENT.tmp")
+        with open(tmp, "w") as f:
+            f.write(version)
+        os.replace(tmp, os.path.join(self.directory, "CURRENT"))
+        # workers still mapping an older version keep their open files until they switch
+        versions = sorted(
+            (d for d in os.listdir(self.directory) if os.path.isdir(self._path(d))),
+            key=lambda d: int(d.split("-")[0]),
+        )
+        for old in versions[:-KEEP_VERSIONS]:
+            shutil.rmtree(self._path(old), ignore_errors=True)
+
+    def stats(self) -> Dict[str, Any]:
+        if self._model is None:
+            return {"loaded": False}
+        meta = self._model.meta
+        return {
+            "loaded": True,
+            "version": self._version,
+            "movies": len(self._model),
+            "last_rental_id": int(self._model.watermark),
+            "kind": meta.get("kind"),
+            "build_seconds": meta.get("build_seconds"),
+            "age_seconds": round(time.time() - meta.get("built_at", 0), 1),
+        }
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 from src.repositories.mongodb.odm_models.customer_document import Customer, Address
+from src.repositories.mongodb.counters import next_sequence_id
 
 class AddressRepositoryMongo:
     def get_all(self) -> List[Dict[str, Any]]:
@@ -32,12 +33,7 @@ class AddressRepositoryMongo:
             raise ValueError(f"Customer {customer_id} not found")
 
         # Generate new ID
-        max_id = 0
-        all_custs = Customer.objects()
-        for c in all_custs:
-            if c.address and c.address.address_id > max_id:
-                max_id = c.address.address_id
-        new_id = max_id + 1
+        new_id = next_sequence_id(Customer._get_collection_name(), "address.addressId")
 
         new_address = Address(
             address_id=new_id,
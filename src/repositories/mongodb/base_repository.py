@@ -1,11 +1,18 @@
 # src/repositories/mongodb/base_repository.py
 from __future__ import annotations
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar
 
-from mongoengine import Document
+from mongoengine import Document, ValidationError
+from mongoengine.errors import FieldDoesNotExist
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from .. import bulk
+from .counters import next_sequence_id, retry_on_duplicate
 
 DocT = TypeVar("DocT", bound=Document)
+T = TypeVar("T")
 
 
 class MongoBaseRepository(Generic[DocT]):
@@ -33,24 +40,38 @@ class MongoBaseRepository(Generic[DocT]):
     def _get_next_id(self) -> int:
         """
         Helper to simulate auto-increment IDs.
-        Finds the max existing ID and adds 1.
+        Allocates the next ID from the atomic `counters` collection.
         """
-        last = self.model.objects.order_by(f"-{self.id_field}").first()
-        if last:
-            return getattr(last, self.id_field) + 1
-        return 1
+        db_field = self.model._fields[self.id_field].db_field
+        return next_sequence_id(self.model._get_collection_name(), db_field)
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         # If ID is missing and looks like we need an int ID, generate it
         if self.id_field not in data:
-             # Check if the model's id field is an IntField
-             # (This is a bit hacky, assuming we want auto-increment for all)
-             data[self.id_field] = self._get_next_id()
+            # Check if the model's id field is an IntField
+            # (This is a bit hacky, assuming we want auto-increment for all)
+            return self._create_with_next_id(data, self._save_new)
+        return self._save_new(data)
 
+    def _save_new(self, data: Dict[str, Any]) -> Dict[str, Any]:
         doc = self.model(**data)
         doc.save()
         return self._to_dict(doc)
 
+    def _create_with_next_id(self, data: Dict[str, Any], create: Callable[[Dict[str, Any]], T]) -> T:
+        """
+        Run create(data) with a newly allocated id. If the id is taken (the
+        counter fell behind the collection), the sequence is re-synced and
+        create runs once more with a fresh id; each attempt gets its own copy
+        of data.
+        """
+        db_field = self.model._fields[self.id_field].db_field
+        return retry_on_duplicate(
+            self.model._get_collection_name(),
+            db_field,
+            lambda: create({**data, self.id_field: self._get_next_id()}),
+        )
+
     def update(self, id_: Any, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         doc = self.model.objects(**{self.id_field: id_}).first()
         if not doc:
@@ -68,6 +89,132 @@ class MongoBaseRepository(Generic[DocT]):
         deleted_count = self.model.objects(**{self.id_field: id_}).delete()
         return deleted_count > 0
 
+    # ── bulk writes ──────────────────────────────────────────────
+    # One result per item (see repositories/bulk.py). Each chunk is a single
+    # unordered insert_many / bulk_write command: a failing item does not stop
+    # the others, and server-side errors are mapped back to their items.
+    # Repositories that override create/update/delete get one call per item.
+    def bulk_create(self, items: List[Dict[str, Any]], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        if bulk.is_overridden(self, MongoBaseRepository, "create"):
+            return bulk.each(items, self.create, "created", lambda item, out: (out or {}).get(self.id_field))
+
+        results: List[Any] = [None] * len(items)
+        prepared: List[Tuple[int, Any, Dict[str, Any]]] = []
+        for index, data in enumerate(items):
+            given_id = bulk.id_field_of(data, self.id_field)
+            try:
+                if not isinstance(data, dict):
+                    raise ValueError("Each item must be a JSON object")
+                data = dict(data)
+                if given_id is None:
+                    data[self.id_field] = self._get_next_id()
+                doc = self.model(**data)
+                doc.validate()
+            except (ValidationError, FieldDoesNotExist, ValueError, TypeError) as e:
+                results[index] = bulk.failed(index, given_id, e)
+                continue
+            prepared.append((index, getattr(doc, self.id_field), doc.to_mongo().to_dict()))
+
+        coll = self.model._get_collection()
+        for part in bulk.chunks(prepared, chunk_size):
+            errors = self._bulk_errors(lambda: coll.insert_many([son for _, _, son in part], ordered=False))
+            for pos, (index, id_, _) in enumerate(part):
+                results[index] = bulk.failed(index, id_, errors[pos]) if pos in errors else bulk.ok(index, id_, "created")
+        return results
+
+    def bulk_update(self, items: List[Dict[str, Any]], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """Partial updates; every item carries its id as "id" or under the id field."""
+        if bulk.is_overridden(self, MongoBaseRepository, "update"):
+            return bulk.each(
+                items,
+                lambda data: self.update(
+                    bulk.id_field_of(data, "id", self.id_field),
+                    {k: v for k, v in data.items() if k not in ("id", self.id_field)},
+                ),
+                "updated",
+                lambda item, out: bulk.id_field_of(item, "id", self.id_field),
+            )
+
+        results: List[Any] = [None] * len(items)
+        prepared: List[Tuple[int, Any, Dict[str, Any]]] = []
+        for index, data in enumerate(items):
+            id_ = bulk.id_field_of(data, "id", self.id_field)
+            try:
+                if not isinstance(data, dict):
+                    raise ValueError("Each item must be a JSON object")
+                if id_ is None:
+                    raise ValueError("id is required")
+                changes = self._set_fields({k: v for k, v in data.items() if k not in ("id", self.id_field)})
+            except ValueError as e:
+                results[index] = bulk.failed(index, id_, e)
+                continue
+            prepared.append((index, id_, changes))
+
+        coll = self.model._get_collection()
+        id_db = self.model._fields[self.id_field].db_field
+        for part in bulk.chunks(prepared, chunk_size):
+            existing = self._existing_ids([id_ for _, id_, _ in part])
+            found = [(index, id_, changes) for index, id_, changes in part if id_ in existing]
+            ops = [UpdateOne({id_db: id_}, {"$set": changes}) for _, id_, changes in found]
+            errors = self._bulk_errors(lambda: coll.bulk_write(ops, ordered=False)) if ops else {}
+            for pos, (index, id_, _) in enumerate(found):
+                results[index] = bulk.failed(index, id_, errors[pos]) if pos in errors else bulk.ok(index, id_, "updated")
+            for index, id_, _ in part:
+                if id_ not in existing:
+                    results[index] = bulk.ok(index, id_, "not_found")
+        return results
+
+    def bulk_delete(self, ids: List[Any], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        if bulk.is_overridden(self, MongoBaseRepository, "delete"):
+            return bulk.each(ids, self.delete, "deleted", lambda item, out: item)
+
+        coll = self.model._get_collection()
+        id_db = self.model._fields[self.id_field].db_field
+        results: List[Dict[str, Any]] = []
+        for start, part in enumerate(bulk.chunks(list(ids), chunk_size)):
+            existing = self._existing_ids(list(part))
+            if existing:
+                coll.delete_many({id_db: {"$in": list(existing)}})
+            offset = start * max(1, chunk_size)
+            results.extend(
+                bulk.ok(offset + pos, id_, "deleted" if id_ in existing else "not_found")
+                for pos, id_ in enumerate(part)
+            )
+        return results
+
+    def _set_fields(self, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate and convert `changes` (Python field names) to a $set document."""
+        if not changes:
+            raise ValueError("No fields to update")
+        update: Dict[str, Any] = {}
+        for name, value in changes.items():
+            field = self.model._fields.get(name)
+            if field is None:
+                raise ValueError(f"Unknown field: {name}")
+            if value is not None:
+                value = field.to_python(value)
+                try:
+                    field.validate(value)
+                except ValidationError as e:
+                    raise ValueError(f"{name}: {e}")
+                value = field.to_mongo(value)
+            update[field.db_field] = value
+        return update
+
+    def _existing_ids(self, ids: List[Any]) -> set:
+        id_db = self.model._fields[self.id_field].db_field
+        cursor = self.model._get_collection().find({id_db: {"$in": ids}}, {id_db: 1, "_id": 0})
+        return {doc[id_db] for doc in cursor}
+
+    @staticmethod
+    def _bulk_errors(run) -> Dict[int, str]:
+        """Run a bulk command; returns {position in the command: error message}."""
+        try:
+            run()
+        except BulkWriteError as e:
+            return {err["index"]: err.get("errmsg", "write error") for err in e.details.get("writeErrors", [])}
+        return {}
+
     # ── utilities ────────────────────────────────────────────────
     def _to_dict(self, doc: Any) -> Dict[str, Any]:
         if doc is None:
@@ -0,0 +1,146 @@
+# src/repositories/mongodb/counters.py
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from mongoengine.connection import get_db
+from mongoengine.errors import NotUniqueError
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+COUNTERS_COLLECTION = "counters"
+DEFAULT_BLOCK_SIZE = int(os.getenv("MONGO_ID_BLOCK_SIZE", "20"))
+
+T = TypeVar("T")
+
+
+class SequenceAllocator:
+    """
+    Integer ID allocation backed by a `counters` collection.
+
+    Each sequence is one document `{_id: "<collection>.<field path>", seq: <last id>}`.
+    IDs are reserved in blocks with a single `find_one_and_update($inc)` and
+    handed out from a per-process cache, so most creates never touch the
+    counters collection and concurrent writers can never receive the same ID.
+    IDs left in a block when the process exits are simply skipped.
+
+    The first allocation of a sequence in a process raises the counter to the
+    current max ID in the data (`$max`, atomic and idempotent), which keeps the
+    counter valid after a migration reloads a collection. A counter that falls
+    behind later (documents inserted with explicit IDs, a reload while the
+    process runs) shows up as a duplicate key: retry_on_duplicate() re-syncs
+    the sequence and retries once.
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.block_size = max(1, block_size)
+        self._blocks: Dict[str, Tuple[int, int]] = {}  # name -> (next id, last reserved id)
+        self._synced: set[str] = set()
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def next_id(self, collection: str, field: str) -> int:
+        """Return the next ID for `field` in `collection`.
+
+        `field` is the stored (db_field) name; a dotted path such as
+        "inventory.inventoryItemId" addresses IDs inside an embedded array.
+        """
+        name = f"{collection}.{field}"
+        with self._lock_for(name):
+            next_id, last = self._blocks.get(name, (1, 0))
+            if next_id > last:
+                next_id, last = self._reserve_block(name, collection, field)
+            self._blocks[name] = (next_id + 1, last)
+            return next_id
+
+    def reset(self) -> None:
+        """Forget cached blocks (e.g. after a collection has been reloaded)."""
+        self._blocks.clear()
+        self._synced.clear()
+
+    def resync(self, collection: str, field: str) -> None:
+        """Drop the cached block of one sequence and raise its counter to the data's max ID."""
+        name = f"{collection}.{field}"
+        with self._lock_for(name):
+            self._blocks.pop(name, None)
+            self._synced.discard(name)
+
+    def retry_on_duplicate(self, collection: str, field: str, insert: Callable[[], T]) -> T:
+        """Run `insert`, which takes its ID from this sequence; if that ID is
+        already taken, re-sync the sequence and run it once more."""
+        try:
+            return insert()
+        except (DuplicateKeyError, NotUniqueError) as e:
+            if not _is_duplicate_of(e, field):
+                raise
+        self.resync(collection, field)
+        return insert()
+
+    # ── internals ────────────────────────────────────────────────
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def _reserve_block(self, name: str, collection: str, field: str) -> Tuple[int, int]:
+        counters = get_db()[COUNTERS_COLLECTION]
+        if name not in self._synced:
+            current_max = _max_existing_id(collection, field)
+            counters.update_one({"_id": name}, {"$max": {"seq": current_max}}, upsert=True)
+            self._synced.add(name)
+
+        doc = counters.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"seq": self.block_size}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        last = int(doc["seq"])
+        return last - self.block_size + 1, last
+
+
+def _max_existing_id(collection: str, field: str) -> int:
+    """Highest ID currently stored for a (possibly embedded) field.
+
+    A descending sort on an array path orders documents by their largest
+    element, so the first document holds the max; with an index on the
+    field (see REQUIRED_INDEXES in connection.py) this reads one index entry.
+    """
+    doc = get_db()[collection].find_one(
+        {field: {"$type": "number"}}, {field: 1, "_id": 0}, sort=[(field, -1)]
+    )
+    return int(max(_numbers(doc, field.split(".")), default=0)) if doc else 0
+
+
+def _numbers(value: Any, path: List[str]) -> Iterator[Any]:
+    """Numeric values at `path` in a document, descending into embedded arrays."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _numbers(item, path)
+    elif not path:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield value
+    elif isinstance(value, dict):
+        yield from _numbers(value.get(path[0]), path[1:])
+
+
+def _is_duplicate_of(error: Exception, field: str) -> bool:
+    # mongoengine's NotUniqueError wraps the driver's DuplicateKeyError
+    cause: Optional[BaseException] = error if isinstance(error, DuplicateKeyError) else error.__context__
+    details = getattr(cause, "details", None) or {}
+    if "keyPattern" in details:
+        return field in details["keyPattern"]
+    return field in str(error)
+
+
+# Process-wide allocator shared by all Mongo repositories
+sequences = SequenceAllocator()
+
+
+def next_sequence_id(collection: str, field: str) -> int:
+    return sequences.next_id(collection, field)
+
+
+def retry_on_duplicate(collection: str, field: str, insert: Callable[[], T]) -> T:
+    return sequences.retry_on_duplicate(collection, field, insert)
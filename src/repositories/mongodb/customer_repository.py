@@ -11,9 +11,9 @@ class CustomerRepositoryMongo(MongoBaseRepository[Customer]):
         super().__init__(Customer, id_field="customer_id")
 
     def create(self, data: dict) -> dict:
-        # 1. Generate ID
+        # 1. Generate ID (the address and plan ids below are derived from it)
         if "customer_id" not in data:
-            data["customer_id"] = self._get_next_id()
+            return self._create_with_next_id(data, self.create)
 
         # 2. Handle Address (flat input -> embedded)
         if "address" in data and isinstance(data["address"], str):
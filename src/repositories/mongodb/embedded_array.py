@@ -0,0 +1,96 @@
+# src/repositories/mongodb/embedded_array.py
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple, Type
+
+from mongoengine import Document, EmbeddedDocument, ValidationError
+from pymongo import ReturnDocument
+
+
+class EmbeddedArray:
+    """
+    Atomic single-element writes to an embedded array.
+
+    Every write is one `update_one`/`find_one_and_update` on the parent
+    document using `$push`, `$set` with an array filter, or `$pull`, so only
+    the touched element travels over the wire and concurrent writers to other
+    elements of the same array can never overwrite each other (the previous
+    load → modify → `save()` round trip rewrote the whole array).
+    """
+
+    def __init__(
+        self,
+        model: Type[Document],
+        array: str,
+        element: Type[EmbeddedDocument],
+        element_id: str,
+        parent_id: str,
+    ):
+        self.model = model
+        self.array = array
+        self.element = element
+        self.element_id = element._fields[element_id].db_field
+        self.parent_field = model._fields[parent_id]
+        self.parent_id = self.parent_field.db_field
+
+    def push(self, parent_id: Any, element: EmbeddedDocument) -> Optional[Any]:
+        """Append `element` to the parent's array.
+
+        Returns the parent id as stored (e.g. "3" → 3), or None if no such parent exists.
+        """
+        try:
+            element.validate()
+        except ValidationError as e:
+            raise ValueError(str(e))
+        try:
+            parent_id = self.parent_field.to_mongo(self.parent_field.to_python(parent_id))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {self.parent_id}: {parent_id}")
+        res = self.model._get_collection().update_one(
+            {self.parent_id: parent_id},
+            {"$push": {self.array: element.to_mongo()}},
+        )
+        return parent_id if res.matched_count else None
+
+    def set(self, id_: Any, changes: Dict[str, Any]) -> Optional[Tuple[EmbeddedDocument, Any]]:
+        """Set fields on one element; returns (updated element, parent id) or None.
+
+        `changes` uses the element's Python field names; values are validated
+        and converted the same way the ODM would on save().
+        """
+        update: Dict[str, Any] = {}
+        for name, value in changes.items():
+            field = self.element._fields[name]
+            if value is not None:
+                value = field.to_python(value)
+                try:
+                    field.validate(value)
+                except ValidationError as e:
+                    raise ValueError(f"{name}: {e}")
+                value = field.to_mongo(value)
+            update[f"{self.array}.$[el].{field.db_field}"] = value
+
+        coll = self.model._get_collection()
+        query = {f"{self.array}.{self.element_id}": id_}
+        projection = {"_id": 0, self.parent_id: 1, self.array: {"$elemMatch": {self.element_id: id_}}}
+        if update:
+            doc = coll.find_one_and_update(
+                query,
+                {"$set": update},
+                projection=projection,
+                array_filters=[{f"el.{self.element_id}": id_}],
+                return_document=ReturnDocument.AFTER,
+            )
+        else:
+            doc = coll.find_one(query, projection)
+        if not doc or not doc.get(self.array):
+            return None
+        return self.element._from_son(doc[self.array][0]), doc.get(self.parent_id)
+
+    def pull(self, id_: Any) -> bool:
+        """Remove one element; False if no parent contains it."""
+        res = self.model._get_collection().update_one(
+            {f"{self.array}.{self.element_id}": id_},
+            {"$pull": {self.array: {self.element_id: id_}}},
+        )
+        return res.modified_count > 0
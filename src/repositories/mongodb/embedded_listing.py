@@ -0,0 +1,134 @@
+# src/repositories/mongodb/embedded_listing.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from bson.decimal128 import Decimal128
+from mongoengine import Document
+
+
+class EmbeddedField(NamedTuple):
+    """An output field of a flattened listing.
+
+    path: stored field path after `$unwind` (e.g. "payments.paymentId" for an
+          element field, "rentalId" for a parent field)
+    cast: converts query-string filter values to the stored type
+    """
+
+    path: str
+    cast: Callable[[str], Any]
+
+
+def parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+_OPS = {"eq": "$eq", "ne": "$ne", "gt": "$gt", "gte": "$gte", "lt": "$lt", "lte": "$lte", "in": "$in"}
+
+
+class EmbeddedListing:
+    """
+    Server-side listing of an embedded array as flat rows.
+
+    Runs a `$match` → `$unwind` → `$match` → `$sort` → `$project` pipeline
+    directly on the collection and returns plain dicts, so parent documents
+    are never hydrated through MongoEngine. Filters use the same suffix
+    syntax as the MySQL API (`field`, `field__gte`, `field__in`, ...).
+
+    The pre-unwind `$match` uses `$elemMatch` on the array, which lets
+    MongoDB use multikey indexes such as `{"inventory.movieId": 1,
+    "inventory.status": 1}` before any documents are unwound.
+    """
+
+    def __init__(self, model: Type[Document], array: str, id_name: str, fields: Dict[str, EmbeddedField]):
+        self.model = model
+        self.array = array
+        self.id_name = id_name
+        self.fields = fields
+
+    def list(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        after: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        pipeline = self._pipeline(filters, after)
+        if limit is not None:
+            pipeline.insert(-1, {"$limit": limit})
+        cursor = self.model._get_collection().aggregate(pipeline, allowDiskUse=True)
+        return [self._clean(row) for row in cursor]
+
+    def page(
+        self,
+        limit: int,
+        after: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Keyset page on the embedded ID; returns (items, next cursor or None)."""
+        items = self.list(filters, limit=limit + 1, after=after)
+        if len(items) > limit:
+            items = items[:limit]
+            return items, items[-1][self.id_name]
+        return items, None
+
+    # ── internals ────────────────────────────────────────────────
+    def _pipeline(self, filters: Optional[Dict[str, Any]], after: Optional[int]) -> List[Dict[str, Any]]:
+        conditions = self._conditions(filters or {})
+        if after is not None:
+            conditions.append((self.fields[self.id_name].path, {"$gt": after}))
+
+        prefix = f"{self.array}."
+        pre: Dict[str, Any] = {}
+        elem: Dict[str, Any] = {}
+        post: Dict[str, Any] = {}
+        for path, cond in conditions:
+            post.setdefault(path, {}).update(cond)
+            if path.startswith(prefix):
+                elem.setdefault(path[len(prefix):], {}).update(cond)
+            else:
+                pre.setdefault(path, {}).update(cond)
+        if elem:
+            pre[self.array] = {"$elemMatch": elem}
+
+        pipeline: List[Dict[str, Any]] = []
+        if pre:
+            pipeline.append({"$match": pre})
+        pipeline.append({"$unwind": f"${self.array}"})
+        if post:
+            pipeline.append({"$match": post})
+        pipeline.append({"$sort": {self.fields[self.id_name].path: 1}})
+        pipeline.append({"$project": {"_id": 0, **{name: f"${f.path}" for name, f in self.fields.items()}}})
+        return pipeline
+
+    def _conditions(self, filters: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        conditions = []
+        for key, raw in filters.items():
+            name, _, op = key.partition("__")
+            field = self.fields.get(name)
+            if field is None:
+                raise ValueError(f"Unknown field: {name}")
+            if (op or "eq") not in _OPS:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            try:
+                if op == "in":
+                    values = raw if isinstance(raw, (list, tuple)) else str(raw).split(",")
+                    value: Any = [field.cast(v) if isinstance(v, str) else v for v in values]
+                else:
+                    value = field.cast(raw) if isinstance(raw, str) else raw
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid value for {name}: {raw}")
+            conditions.append((field.path, {_OPS[op or "eq"]: value}))
+        return conditions
+
+    def _clean(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Match the ODM to_dict() output: every key present, ISO dates, float decimals."""
+        out: Dict[str, Any] = {}
+        for name in self.fields:
+            value = row.get(name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Decimal128):
+                value = float(value.to_decimal())
+            out[name] = value
+        return out
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 from src.repositories.mongodb.odm_models.location_document import Location, EmployeeEmbedded
+from src.repositories.mongodb.counters import next_sequence_id
 
 class EmployeeRepositoryMongo:
     def get_all(self) -> List[Dict[str, Any]]:
@@ -31,14 +32,8 @@ class EmployeeRepositoryMongo:
         if not loc:
             raise ValueError("No location found to add employee to.")
 
-        # Generate ID: max + 1
-        max_id = 0
-        all_locs = Location.objects()
-        for l in all_locs:
-            for e in l.employees:
-                if e.employee_id > max_id:
-                    max_id = e.employee_id
-        new_id = max_id + 1
+        # Generate ID from the counters collection
+        new_id = next_sequence_id(Location._get_collection_name(), "employees.employeeId")
 
         new_emp = EmployeeEmbedded(
             employee_id=new_id,
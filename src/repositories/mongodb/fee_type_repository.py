@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import MongoBaseRepository
 from .odm_models.fee_type_document import FeeTypeDocument
 
 
-class FeeTypeRepositoryMongo(MongoBaseRepository[FeeTypeDocument]):
+class FeeTypeRepositoryMongo(CachedRepositoryMixin, MongoBaseRepository[FeeTypeDocument]):
+    cache_namespace = "mongodb.fee_types"
+    cache_ttl = 300
+
     def __init__(self) -> None:
         super().__init__(FeeTypeDocument, id_field="fee_id")
@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import MongoBaseRepository
 from .odm_models.format_document import FormatDocument
 
 
-class FormatRepositoryMongo(MongoBaseRepository[FormatDocument]):
+class FormatRepositoryMongo(CachedRepositoryMixin, MongoBaseRepository[FormatDocument]):
+    cache_namespace = "mongodb.formats"
+    cache_ttl = 300
+
     def __init__(self) -> None:
         super().__init__(FormatDocument, id_field="format_id")
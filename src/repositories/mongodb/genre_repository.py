@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import MongoBaseRepository
 from .odm_models.genre_document import GenreDocument
 
 
-class GenreRepositoryMongo(MongoBaseRepository[GenreDocument]):
+class GenreRepositoryMongo(CachedRepositoryMixin, MongoBaseRepository[GenreDocument]):
+    cache_namespace = "mongodb.genres"
+    cache_ttl = 300
+
     def __init__(self) -> None:
         super().__init__(GenreDocument, id_field="genre_id")
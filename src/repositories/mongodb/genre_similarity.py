@@ -0,0 +1,33 @@
+# src/repositories/mongodb/genre_similarity.py
+"""Genre-similarity index (genre_index.py) loaded from the denormalized movies.genres."""
+from __future__ import annotations
+
+from typing import List
+
+from ..genre_index import PRELOAD, CatalogEntry, GenreSimilarity
+from .connection import readiness
+from .odm_models.movie_document import Movie
+
+_FIELDS = {"_id": 0, "movieId": 1, "title": 1, "releaseYear": 1, "runtimeMin": 1, "rating": 1, "genres": 1}
+
+
+def load_catalog() -> List[CatalogEntry]:
+    return [
+        (
+            doc["movieId"],
+            doc.get("genres") or [],
+            {
+                "id": doc["movieId"],
+                "title": doc.get("title"),
+                "release_year": doc.get("releaseYear"),
+                "runtime_min": doc.get("runtimeMin"),
+                "rating": doc.get("rating"),
+            },
+        )
+        for doc in Movie._get_collection().find({}, _FIELDS)
+    ]
+
+
+movie_genres = GenreSimilarity("mongodb", load_catalog)
+if PRELOAD:
+    readiness.on_ready(movie_genres.load)
@@ -1,16 +1,27 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from src.repositories.mongodb.odm_models.location_document import Location, InventoryItemEmbedded
+from src.repositories.mongodb.counters import next_sequence_id
+from src.repositories.mongodb.embedded_array import EmbeddedArray
+from src.repositories.mongodb.embedded_listing import EmbeddedField, EmbeddedListing
+
+# Flat inventory rows unwound from locations.inventory; movie_id/status filters
+# are served by the {"inventory.movieId": 1, "inventory.status": 1} index.
+_listing = EmbeddedListing(Location, "inventory", "id", {
+    "id": EmbeddedField("inventory.inventoryItemId", int),
+    "movie_id": EmbeddedField("inventory.movieId", int),
+    "format_id": EmbeddedField("inventory.formatId", int),
+    "status": EmbeddedField("inventory.status", str),
+    "location_id": EmbeddedField("locationId", int),
+})
+_inventory = EmbeddedArray(Location, "inventory", InventoryItemEmbedded, "inventory_item_id", "location_id")
 
 class InventoryItemRepositoryMongo:
-    def get_all(self) -> List[Dict[str, Any]]:
-        locations = Location.objects()
-        items = []
-        for loc in locations:
-            for item in loc.inventory:
-                d = item.to_dict()
-                d["location_id"] = loc.location_id
-                items.append(d)
-        return items
+    def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """All inventory items, e.g. filters={"movie_id": "12", "status": "AVAILABLE"}."""
+        return _listing.list(filters)
+
+    def get_page(self, limit: int, after: Optional[int] = None, filters: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return _listing.page(limit, after, filters)
 
     def get_by_id(self, id_: int) -> Optional[Dict[str, Any]]:
         loc = Location.objects(inventory__inventory_item_id=id_).first()
@@ -25,21 +36,13 @@ class InventoryItemRepositoryMongo:
 
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
         location_id = data.get("location_id")
-        if location_id:
-            loc = Location.objects(location_id=location_id).first()
-        else:
-            loc = Location.objects().first()
-        
-        if not loc:
-            raise ValueError("No location found to add inventory item to.")
+        if not location_id:
+            loc = Location.objects().only("location_id").first()
+            if not loc:
+                raise ValueError("No location found to add inventory item to.")
+            location_id = loc.location_id
 
-        max_id = 0
-        all_locs = Location.objects()
-        for l in all_locs:
-            for i in l.inventory:
-                if i.inventory_item_id > max_id:
-                    max_id = i.inventory_item_id
-        new_id = max_id + 1
+        new_id = next_sequence_id(Location._get_collection_name(), "inventory.inventoryItemId")
 
         # Handle status conversion if necessary. 
         # MySQL uses int (1=available), Mongo uses String in ODM.
@@ -52,46 +55,26 @@ class InventoryItemRepositoryMongo:
             status=str(status_val)
         )
         
-        loc.inventory.append(new_item)
-        loc.save()
-        
+        location_id = _inventory.push(location_id, new_item)
+        if location_id is None:
+            raise ValueError("No location found to add inventory item to.")
+
         d = new_item.to_dict()
-        d["location_id"] = loc.location_id
+        d["location_id"] = location_id
         return d
 
     def update(self, id_: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        loc = Location.objects(inventory__inventory_item_id=id_).first()
-        if not loc:
-            return None
-        
-        target_item = None
-        for item in loc.inventory:
-            if item.inventory_item_id == id_:
-                target_item = item
-                break
-        
-        if not target_item:
-            return None
+        changes = {k: data[k] for k in ("movie_id", "format_id") if k in data}
+        if "status" in data: changes["status"] = str(data["status"])
 
-        if "movie_id" in data: target_item.movie_id = data["movie_id"]
-        if "format_id" in data: target_item.format_id = data["format_id"]
-        if "status" in data: target_item.status = str(data["status"])
+        res = _inventory.set(id_, changes)
+        if not res:
+            return None
 
-        loc.save()
-        
-        d = target_item.to_dict()
-        d["location_id"] = loc.location_id
+        item, location_id = res
+        d = item.to_dict()
+        d["location_id"] = location_id
         return d
 
     def delete(self, id_: int) -> bool:
-        loc = Location.objects(inventory__inventory_item_id=id_).first()
-        if not loc:
-            return False
-        
-        original_len = len(loc.inventory)
-        loc.inventory = [i for i in loc.inventory if i.inventory_item_id != id_]
-        
-        if len(loc.inventory) < original_len:
-            loc.save()
-            return True
-        return False
+        return _inventory.pull(id_)
@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 from src.repositories.mongodb.odm_models.customer_document import Customer, MembershipPlan
+from src.repositories.mongodb.counters import next_sequence_id
 
 class MembershipPlanRepositoryMongo:
     def get_all(self) -> List[Dict[str, Any]]:
@@ -29,12 +30,7 @@ class MembershipPlanRepositoryMongo:
         if not cust:
             raise ValueError(f"Customer {customer_id} not found")
 
-        max_id = 0
-        all_custs = Customer.objects()
-        for c in all_custs:
-            if c.membership_plan and c.membership_plan.membership_plan_id > max_id:
-                max_id = c.membership_plan.membership_plan_id
-        new_id = max_id + 1
+        new_id = next_sequence_id(Customer._get_collection_name(), "membershipPlan.membershipPlanId")
 
         new_plan = MembershipPlan(
             membership_plan_id=new_id,
@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import MongoBaseRepository
 from .odm_models.membership_type_document import MembershipTypeDocument
 
 
-class MembershipTypeRepositoryMongo(MongoBaseRepository[MembershipTypeDocument]):
+class MembershipTypeRepositoryMongo(CachedRepositoryMixin, MongoBaseRepository[MembershipTypeDocument]):
+    cache_namespace = "mongodb.membership_types"
+    cache_ttl = 300
+
     def __init__(self) -> None:
         super().__init__(MembershipTypeDocument, id_field="membership_id")
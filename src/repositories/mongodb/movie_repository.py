@@ -1,5 +1,12 @@
+import re
+
 from .base_repository import MongoBaseRepository
+from .genre_similarity import movie_genres
 from .odm_models.movie_document import Movie
+from .recommendations import movie_recommender
+
+# $text operators: "exact phrase" and -negation
+_TEXT_OPERATORS = re.compile(r'"|(?:^|(?<=\s))-')
 
 
 class MovieRepositoryMongo(MongoBaseRepository[Movie]):
@@ -11,6 +18,53 @@ class MovieRepositoryMongo(MongoBaseRepository[Movie]):
         if movie:
             return movie.to_detailed_dict()
         return None
-    
+
     def get_all_details(self) -> list[dict]:
-        return [m.to_detailed_dict() for m in self.model.objects()]
\ No newline at end of file
+        return [m.to_detailed_dict() for m in self.model.objects()]
+
+    def similar(self, movie_id: int, limit: int = 25, mode: str = "shared") -> list[dict]:
+        """Movies sharing the most genres with `movie_id`, from the in-memory genre bitset index."""
+        return movie_genres.top(movie_id, limit, mode)
+
+    def recommendations(self, movie_id: int, limit: int = 25, metric: str = "cosine") -> list[dict]:
+        """Movies most often rented by the same customers, from the in-memory item-item model.
+
+        Same shape as the Neo4j recommendations: {"movie", "score", "customer_support"}.
+        """
+        neighbours = movie_recommender.top(movie_id, limit, metric)
+        if not neighbours:
+            return []
+        ids = [n["movie_id"] for n in neighbours]
+        movies = {m.movie_id: self._to_dict(m) for m in self.model.objects(movie_id__in=ids).exclude("reviews")}
+        return [
+            {"movie": movies[n["movie_id"]], "score": n["score"], "customer_support": n["co_rentals"]}
+            for n in neighbours
+            if n["movie_id"] in movies  # deleted since the model was built
+        ]
+
+    def search(self, query: str, mode: str = "natural", limit: int = 20, offset: int = 0) -> tuple[list[dict], int | None]:
+        """Full-text search over title and summary (movies_text index), best match first.
+
+        "natural" matches any of the words; "boolean" passes the $text
+        operators through ("exact phrase", -excluded). Returns the page and
+        the offset of the next one (None on the last page).
+        """
+        if mode == "natural":
+            query = _TEXT_OPERATORS.sub(" ", query).strip()
+        elif mode != "boolean":
+            raise ValueError(f"Unknown search mode: {mode}")
+        if not query:
+            return [], None
+        docs = list(
+            self.model.objects.search_text(query)
+            .exclude("reviews")
+            .order_by("$text_score")
+            .skip(offset)
+            .limit(limit + 1)
+        )
+        items = []
+        for doc in docs[:limit]:
+            item = self._to_dict(doc)
+            item["relevance"] = round(doc.get_text_score(), 4)
+            items.append(item)
+        return items, offset + limit if len(docs) > limit else None
@@ -1,17 +1,26 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from src.repositories.mongodb.odm_models.rental_document import Rental, PaymentEmbedded
+from src.repositories.mongodb.counters import next_sequence_id
+from src.repositories.mongodb.embedded_array import EmbeddedArray
+from src.repositories.mongodb.embedded_listing import EmbeddedField, EmbeddedListing, parse_datetime
+
+# Flat payment rows unwound from rentals.payments
+_listing = EmbeddedListing(Rental, "payments", "id", {
+    "id": EmbeddedField("payments.paymentId", int),
+    "amount_dkk": EmbeddedField("payments.amountDkk", float),
+    "created_at": EmbeddedField("payments.createdAt", parse_datetime),
+    "rental_id": EmbeddedField("rentalId", int),
+})
+_payments = EmbeddedArray(Rental, "payments", PaymentEmbedded, "payment_id", "rental_id")
 
 class PaymentRepositoryMongo:
-    def get_all(self) -> List[Dict[str, Any]]:
-        rentals = Rental.objects()
-        payments = []
-        for r in rentals:
-            for p in r.payments:
-                d = p.to_dict()
-                d["rental_id"] = r.rental_id
-                payments.append(d)
-        return payments
+    def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """All payments, e.g. filters={"created_at__gte": "2025-01-01", "rental_id": "7"}."""
+        return _listing.list(filters)
+
+    def get_page(self, limit: int, after: Optional[int] = None, filters: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return _listing.page(limit, after, filters)
 
     def get_by_id(self, id_: int) -> Optional[Dict[str, Any]]:
         r = Rental.objects(payments__payment_id=id_).first()
@@ -29,17 +38,7 @@ class PaymentRepositoryMongo:
         if not rental_id:
             raise ValueError("rental_id is required to create a payment")
         
-        r = Rental.objects(rental_id=rental_id).first()
-        if not r:
-            raise ValueError(f"Rental {rental_id} not found")
-
-        max_id = 0
-        all_rentals = Rental.objects()
-        for rent in all_rentals:
-            for p in rent.payments:
-                if p.payment_id > max_id:
-                    max_id = p.payment_id
-        new_id = max_id + 1
+        new_id = next_sequence_id(Rental._get_collection_name(), "payments.paymentId")
 
         new_payment = PaymentEmbedded(
             payment_id=new_id,
@@ -47,44 +46,24 @@ class PaymentRepositoryMongo:
             created_at=datetime.utcnow()
         )
         
-        r.payments.append(new_payment)
-        r.save()
-        
+        stored_id = _payments.push(rental_id, new_payment)
+        if stored_id is None:
+            raise ValueError(f"Rental {rental_id} not found")
+
         d = new_payment.to_dict()
-        d["rental_id"] = r.rental_id
+        d["rental_id"] = stored_id
         return d
 
     def update(self, id_: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        r = Rental.objects(payments__payment_id=id_).first()
-        if not r:
+        changes = {k: data[k] for k in ("amount_dkk",) if k in data}
+        res = _payments.set(id_, changes)
+        if not res:
             return None
-        
-        target_p = None
-        for p in r.payments:
-            if p.payment_id == id_:
-                target_p = p
-                break
-        
-        if not target_p:
-            return None
-
-        if "amount_dkk" in data: target_p.amount_dkk = data["amount_dkk"]
 
-        r.save()
-        
-        d = target_p.to_dict()
-        d["rental_id"] = r.rental_id
+        payment, rental_id = res
+        d = payment.to_dict()
+        d["rental_id"] = rental_id
         return d
 
     def delete(self, id_: int) -> bool:
-        r = Rental.objects(payments__payment_id=id_).first()
-        if not r:
-            return False
-        
-        original_len = len(r.payments)
-        r.payments = [p for p in r.payments if p.payment_id != id_]
-        
-        if len(r.payments) < original_len:
-            r.save()
-            return True
-        return False
+        return _payments.pull(id_)
@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import MongoBaseRepository
 from .odm_models.promo_code_document import PromoCodeDocument
 
 
-class PromoCodeRepositoryMongo(MongoBaseRepository[PromoCodeDocument]):
+class PromoCodeRepositoryMongo(CachedRepositoryMixin, MongoBaseRepository[PromoCodeDocument]):
+    cache_namespace = "mongodb.promo_codes"
+    cache_ttl = 60
+
     def __init__(self) -> None:
         super().__init__(PromoCodeDocument, id_field="promo_code_id")
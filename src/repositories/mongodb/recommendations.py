@@ -0,0 +1,41 @@
+# src/repositories/mongodb/recommendations.py
+"""
+Item-item recommendations (item_similarity.py) fed from rentals.items.
+
+Each rental document embeds the movieId of its copies, so the pairs come
+from one unwind over the rentals after the watermark (rentalId index).
+Rentals changed afterwards are picked up by the periodic full rebuild.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from ..item_similarity import PRELOAD, ItemRecommender
+from .connection import readiness
+from .odm_models.rental_document import Rental
+
+BATCH_SIZE = 10_000
+
+
+def rental_pairs(after: int) -> Tuple[int, List[int], List[int]]:
+    """(highest rentalId, customer ids, movie ids) of the rented copies after rental `after`."""
+    coll = Rental._get_collection()
+    # Fix the upper bound first: rentals inserted while reading wait for the next refresh
+    last = coll.find_one({}, {"rentalId": 1, "_id": 0}, sort=[("rentalId", -1)])
+    until = last["rentalId"] if last else 0
+    pipeline = [
+        {"$match": {"rentalId": {"$gt": after, "$lte": until}}},
+        {"$project": {"_id": 0, "customerId": 1, "movieId": "$items.movieId"}},
+        {"$unwind": "$movieId"},
+    ]
+    customers: List[int] = []
+    movies: List[int] = []
+    for row in coll.aggregate(pipeline, allowDiskUse=True, batchSize=BATCH_SIZE):
+        customers.append(row["customerId"])
+        movies.append(row["movieId"])
+    return max(int(until), after), customers, movies
+
+
+movie_recommender = ItemRecommender("mongodb", rental_pairs)
+if PRELOAD:
+    readiness.on_ready(movie_recommender.load)
@@ -4,9 +4,13 @@ from pymongo.write_concern import WriteConcern
 from pymongo.client_session import ClientSession
 
 from .base_repository import MongoBaseRepository
+from .counters import retry_on_duplicate
 from .odm_models.rental_document import Rental, RentalItemEmbedded
 from .odm_models.location_document import Location
 
+# The API writes "1" for an available copy, the MySQL migration "AVAILABLE"
+AVAILABLE_STATUSES = ("1", "AVAILABLE")
+
 
 class RentalRepositoryMongo(MongoBaseRepository[Rental]):
     def __init__(self) -> None:
@@ -25,13 +29,11 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
         2. Creates the rental record.
         3. Updates inventory status to 'Rented'.
         """
-        with get_db().client.start_session() as session:
-            return session.with_transaction(
-                lambda s: self._execute_rental_creation(
-                    s, customer_id, employee_id, promo_code_id, inventory_items
-                ),
-                write_concern=WriteConcern("majority")
+        return self._in_transaction(
+            lambda s: self._execute_rental_creation(
+                s, customer_id, employee_id, promo_code_id, inventory_items
             )
+        )
 
     def create_reservation(
         self,
@@ -46,13 +48,24 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
         2. Creates the rental record with status 'RESERVED'.
         3. Updates inventory status to 'Reserved'.
         """
-        with get_db().client.start_session() as session:
-            return session.with_transaction(
-                lambda s: self._execute_reservation_creation(
-                    s, customer_id, employee_id, promo_code_id, inventory_items
-                ),
-                write_concern=WriteConcern("majority")
+        return self._in_transaction(
+            lambda s: self._execute_reservation_creation(
+                s, customer_id, employee_id, promo_code_id, inventory_items
             )
+        )
+
+    def _in_transaction(self, callback):
+        """
+        Run callback(session) in a majority-acknowledged transaction. The
+        callback allocates the rental id; if that id is already taken, the
+        counter is re-synced and the transaction runs once more.
+        """
+        def run():
+            with get_db().client.start_session() as session:
+                return session.with_transaction(callback, write_concern=WriteConcern("majority"))
+
+        db_field = self.model._fields[self.id_field].db_field
+        return retry_on_duplicate(self.model._get_collection_name(), db_field, run)
 
     def _execute_rental_creation(
         self,
@@ -80,7 +93,7 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
             
             for inventory_item in location.inventory:
                 if inventory_item.inventory_item_id in target_item_ids:
-                    if inventory_item.status != "1": # "1" = Available
+                    if inventory_item.status not in AVAILABLE_STATUSES:
                         raise ValueError(f"Inventory Item {inventory_item.inventory_item_id} is not available.")
                     found_inventory_map[inventory_item.inventory_item_id] = inventory_item
 
@@ -89,8 +102,9 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
             raise ValueError(f"Inventory items not found: {missing_ids}")
 
         # 2. Generate New Rental ID
-        last_rental = Rental.objects.order_by("-rental_id").session(session).first()
-        new_rental_id = (last_rental.rental_id + 1) if last_rental else 1
+        # Allocated outside the transaction so concurrent checkouts don't
+        # conflict on the counter document; an aborted rental just leaves a gap.
+        new_rental_id = self._get_next_id()
         
         # 3. Create Rental Document
         rental_document = Rental(
@@ -152,7 +166,7 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
             if primary_location is None: primary_location = location
             for inventory_item in location.inventory:
                 if inventory_item.inventory_item_id in target_item_ids:
-                    if inventory_item.status != "1":
+                    if inventory_item.status not in AVAILABLE_STATUSES:
                         raise ValueError(f"Inventory Item {inventory_item.inventory_item_id} is not available.")
                     found_inventory_map[inventory_item.inventory_item_id] = inventory_item
 
@@ -160,8 +174,7 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
             raise ValueError("Some inventory items were not found.")
 
         # 2. Create Rental Document (Status RESERVED)
-        last_rental = Rental.objects.order_by("-rental_id").session(session).first()
-        new_rental_id = (last_rental.rental_id + 1) if last_rental else 1
+        new_rental_id = self._get_next_id()
 
         rental_document = Rental(
             rental_id=new_rental_id,
@@ -200,7 +213,7 @@ class RentalRepositoryMongo(MongoBaseRepository[Rental]):
     def create(self, data: dict) -> dict:
         # 1. Generate ID
         if "rental_id" not in data:
-            data["rental_id"] = self._get_next_id()
+            return self._create_with_next_id(data, self.create)
 
         # 2. Handle Inventory Items -> Embedded Items
         inventory_ids = data.pop("inventory_item_ids", [])
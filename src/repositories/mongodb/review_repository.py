@@ -1,17 +1,28 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from src.repositories.mongodb.odm_models.movie_document import Movie, ReviewEmbedded
+from src.repositories.mongodb.counters import next_sequence_id
+from src.repositories.mongodb.embedded_array import EmbeddedArray
+from src.repositories.mongodb.embedded_listing import EmbeddedField, EmbeddedListing, parse_datetime
+
+# Flat review rows unwound from movies.reviews
+_listing = EmbeddedListing(Movie, "reviews", "id", {
+    "id": EmbeddedField("reviews.reviewId", int),
+    "movie_id": EmbeddedField("movieId", int),
+    "rating": EmbeddedField("reviews.rating", int),
+    "body": EmbeddedField("reviews.body", str),
+    "created_at": EmbeddedField("reviews.createdAt", parse_datetime),
+    "customer_id": EmbeddedField("reviews.customerId", int),
+})
+_reviews = EmbeddedArray(Movie, "reviews", ReviewEmbedded, "review_id", "movie_id")
 
 class ReviewRepositoryMongo:
-    def get_all(self) -> List[Dict[str, Any]]:
-        movies = Movie.objects()
-        reviews = []
-        for m in movies:
-            for r in m.reviews:
-                d = r.to_dict()
-                d["movie_id"] = m.movie_id
-                reviews.append(d)
-        return reviews
+    def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """All reviews, e.g. filters={"movie_id": "3", "rating__gte": "8"}."""
+        return _listing.list(filters)
+
+    def get_page(self, limit: int, after: Optional[int] = None, filters: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        return _listing.page(limit, after, filters)
 
     def get_by_id(self, id_: int) -> Optional[Dict[str, Any]]:
         m = Movie.objects(reviews__review_id=id_).first()
@@ -29,17 +40,7 @@ class ReviewRepositoryMongo:
         if not movie_id:
             raise ValueError("movie_id is required to create a review")
         
-        m = Movie.objects(movie_id=movie_id).first()
-        if not m:
-            raise ValueError(f"Movie {movie_id} not found")
-
-        max_id = 0
-        all_movies = Movie.objects()
-        for mov in all_movies:
-            for r in mov.reviews:
-                if r.review_id > max_id:
-                    max_id = r.review_id
-        new_id = max_id + 1
+        new_id = next_sequence_id(Movie._get_collection_name(), "reviews.reviewId")
 
         new_review = ReviewEmbedded(
             review_id=new_id,
@@ -50,42 +51,20 @@ class ReviewRepositoryMongo:
             customer_id=data.get("customer_id")
         )
         
-        m.reviews.append(new_review)
-        m.save()
-        
+        stored_id = _reviews.push(movie_id, new_review)
+        if stored_id is None:
+            raise ValueError(f"Movie {movie_id} not found")
+
         return new_review.to_dict()
 
     def update(self, id_: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        m = Movie.objects(reviews__review_id=id_).first()
-        if not m:
-            return None
-        
-        target_r = None
-        for r in m.reviews:
-            if r.review_id == id_:
-                target_r = r
-                break
-        
-        if not target_r:
+        changes = {k: data[k] for k in ("rating", "body", "customer_id") if k in data}
+        res = _reviews.set(id_, changes)
+        if not res:
             return None
 
-        if "rating" in data: target_r.rating = data["rating"]
-        if "body" in data: target_r.body = data["body"]
-        if "customer_id" in data: target_r.customer_id = data["customer_id"]
-
-        m.save()
-        
-        return target_r.to_dict()
+        review, _ = res
+        return review.to_dict()
 
     def delete(self, id_: int) -> bool:
-        m = Movie.objects(reviews__review_id=id_).first()
-        if not m:
-            return False
-        
-        original_len = len(m.reviews)
-        m.reviews = [r for r in m.reviews if r.review_id != id_]
-        
-        if len(m.reviews) < original_len:
-            m.save()
-            return True
-        return False
+        return _reviews.pull(id_)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+import enum
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
 
+from sqlalchemy import Select, delete, insert, inspect, select, text, update
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
+from .. import bulk
+
 from .orm_models.base import SessionLocal
 
 
@@ -17,26 +24,107 @@ class BaseRepository(Generic[ModelT]):
     otherwise a best-effort dict of the column attributes.
     """
 
+    # SQL returning (stamp columns..., recent) for get_version(); None derives it
+    # from the table's updated_at column when it has one (013_movie_rental_change_tracking.sql)
+    version_sql: Optional[str] = None
+
     def __init__(self, model: Type[ModelT], session_factory: sessionmaker = SessionLocal):
         self.model = model
         self._SessionLocal = session_factory
+        self._version_stmt: Any = None
 
     # ── public helpers ──────────────────────────────────────────────────────
-    def get_all(self) -> List[Dict[str, Any]]:
+    def get_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        stmt = self._build_select(filters, order_by, fields)
+        with self._SessionLocal() as session:
+            return self._rows_to_dicts(session.execute(stmt), fields)
+
+    def get_page(
+        self,
+        limit: int,
+        after: Any = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Any]]:
+        """Keyset page ordered by primary key.
+
+        Returns the rows with a primary key greater than `after` (or from the
+        start when None) and the cursor for the next page, which is None once
+        the last page has been reached. With a custom `order_by` the cursor is
+        not available, so only the first `limit` rows are returned.
+        """
+        if order_by and after is not None:
+            raise ValueError("after can only be combined with the default primary key ordering")
+        stmt = self._build_select(filters, order_by, fields, after=after).limit(limit + 1)
+        pk_attr = self._pk_attr()
         with self._SessionLocal() as session:
-            rows = session.query(self.model).all()
-            return [self._to_dict(row) for row in rows]
+            result = session.execute(stmt)
+            rows = result.mappings().all() if fields else result.scalars().all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            next_after = None
+            if has_more and not order_by:
+                last = rows[-1]
+                next_after = last[pk_attr] if fields else getattr(last, pk_attr)
+            if fields:
+                return [self._row_to_dict(row) for row in rows], next_after
+            return [self._to_dict(obj) for obj in rows], next_after
+
+    def iter_all(
+        self,
+        after: Any = None,
+        batch_size: int = 500,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream every matching row without loading the table.
+
+        Uses `yield_per`, which fetches through a server-side cursor, so only
+        `batch_size` rows are held in memory at a time. The session stays open
+        until the generator is exhausted or closed.
+        """
+        if order_by and after is not None:
+            raise ValueError("after can only be combined with the default primary key ordering")
+        stmt = self._build_select(filters, order_by, fields, after=after)
+        stmt = stmt.execution_options(yield_per=batch_size)
+        with self._SessionLocal() as session:
+            result = session.execute(stmt)
+            if fields:
+                for row in result.mappings():
+                    yield self._row_to_dict(row)
+            else:
+                for obj in result.scalars():
+                    yield self._to_dict(obj)
 
     def get_by_id(self, id_: Any) -> Optional[Dict[str, Any]]:
         with self._SessionLocal() as session:
             obj = session.get(self.model, id_)
             return self._to_dict(obj) if obj else None
 
-    def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def create(self, data: Dict[str, Any], returning: bool = True) -> Dict[str, Any]:
+        """Insert one row and return it as stored.
+
+        The row is read back after the commit: the object still holds the
+        request's values (ISO strings for dates, strings for DECIMAL) and
+        not the server defaults. With `returning=False` only {"id": ...} is
+        returned and the row is never read back.
+        """
         with self._SessionLocal() as session:
             obj = self.model(**data)
             session.add(obj)
+            session.flush()
+            # Taken before the commit, which would expire the object
+            id_ = getattr(obj, self._pk_attr())
             session.commit()
+            if not returning:
+                return {"id": id_}
             session.refresh(obj)
             return self._to_dict(obj)
 
@@ -61,7 +149,278 @@ class BaseRepository(Generic[ModelT]):
             session.commit()
             return True
 
+    # ── bulk writes ────────────────────────────────────────────────────────
+    # Each returns one result per item (see repositories/bulk.py). Items are
+    # written in chunks with a single executemany statement and one transaction
+    # per chunk; if a chunk fails, it is replayed row by row under savepoints so
+    # the failing items are reported and the rest are still written.
+    # Repositories that override create/update/delete (stored procedures) get
+    # one call to that method per item instead.
+    def bulk_create(self, items: List[Dict[str, Any]], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """Insert many rows; each result carries the row's primary key."""
+        pk_attr = self._pk_attr()
+        if bulk.is_overridden(self, BaseRepository, "create"):
+            return bulk.each(items, self.create, "created", lambda item, out: (out or {}).get("id"))
+        step: List[int] = []
+
+        def apply(session, part):
+            # MySQL has no RETURNING. One multi-row INSERT ... VALUES per set of
+            # given columns: InnoDB reserves its generated keys as one block and
+            # reports the first one as lastrowid, so the others follow from it.
+            if not step:
+                step.append(int(session.execute(text("SELECT @@auto_increment_increment")).scalar() or 1))
+            groups: Dict[frozenset, List[Tuple[int, Dict[str, Any]]]] = {}
+            for index, row in part:
+                if row.get(pk_attr) is None:
+                    row = {k: v for k, v in row.items() if k != pk_attr}
+                groups.setdefault(frozenset(row), []).append((index, row))
+            done = []
+            for columns, group in groups.items():
+                result = session.execute(insert(self.model).values([row for _, row in group]))
+                first = None if pk_attr in columns else result.lastrowid
+                for offset, (index, row) in enumerate(group):
+                    id_ = row[pk_attr] if first is None else first + offset * step[0]
+                    done.append(bulk.ok(index, id_, "created"))
+            return done
+
+        return self._bulk_write(items, lambda data: self._bulk_mapping(data, with_pk=False), apply, chunk_size)
+
+    def bulk_update(self, items: List[Dict[str, Any]], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """Partial updates; every item carries its primary key as "id"."""
+        pk_attr = self._pk_attr()
+        if bulk.is_overridden(self, BaseRepository, "update"):
+            return bulk.each(
+                items,
+                lambda data: self.update(data.get("id"), {k: v for k, v in data.items() if k != "id"}),
+                "updated",
+                lambda item, out: bulk.id_field_of(item, "id"),
+            )
+
+        def apply(session, part):
+            existing = self._existing_ids(session, [row[pk_attr] for _, row in part])
+            found = [row for _, row in part if row[pk_attr] in existing]
+            if found:
+                session.execute(update(self.model), found)
+            return [bulk.ok(i, row[pk_attr], "updated" if row[pk_attr] in existing else "not_found") for i, row in part]
+
+        return self._bulk_write(items, lambda data: self._bulk_mapping(data, with_pk=True), apply, chunk_size)
+
+    def bulk_delete(self, ids: List[Any], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        if bulk.is_overridden(self, BaseRepository, "delete"):
+            return bulk.each(ids, self.delete, "deleted", lambda item, out: item)
+        pk = self._pk_column()
+
+        def apply(session, part):
+            existing = self._existing_ids(session, [id_ for _, id_ in part])
+            if existing:
+                session.execute(delete(self.model).where(pk.in_(existing)))
+            return [bulk.ok(i, id_, "deleted" if id_ in existing else "not_found") for i, id_ in part]
+
+        return self._bulk_write(ids, lambda id_: self._coerce("id", id_), apply, chunk_size)
+
+    def _bulk_write(
+        self,
+        items: Sequence[Any],
+        prepare: Callable[[Any], Any],
+        apply: Callable[[Any, List[Tuple[int, Any]]], List[Dict[str, Any]]],
+        chunk_size: int,
+    ) -> List[Dict[str, Any]]:
+        results: List[Any] = [None] * len(items)
+        prepared: List[Tuple[int, Any]] = []
+        for index, item in enumerate(items):
+            try:
+                prepared.append((index, prepare(item)))
+            except (ValueError, TypeError) as e:
+                results[index] = bulk.failed(index, bulk.id_field_of(item, "id"), e)
+
+        for part in bulk.chunks(prepared, chunk_size):
+            part = list(part)
+            with self._SessionLocal() as session:
+                try:
+                    with session.begin():
+                        done = apply(session, part)
+                except (SQLAlchemyError, TypeError, ValueError):
+                    # Replay the chunk row by row to isolate the failing items
+                    # (database errors, and values the driver cannot bind)
+                    done = []
+                    with session.begin():
+                        for index, row in part:
+                            try:
+                                with session.begin_nested():
+                                    done.extend(apply(session, [(index, row)]))
+                            except (SQLAlchemyError, TypeError, ValueError) as e:
+                                error = e.orig if isinstance(e, DBAPIError) else e
+                                done.append(bulk.failed(index, bulk.id_field_of(items[index], "id"), error))
+            for result in done:
+                results[result["index"]] = result
+        return results
+
+    def _bulk_mapping(self, data: Any, with_pk: bool) -> Dict[str, Any]:
+        """Validate one bulk item and map it to attribute names (`id` → primary key)."""
+        if not isinstance(data, dict):
+            raise ValueError("Each item must be a JSON object")
+        pk_attr = self._pk_attr()
+        row = {self._resolve_field(k): v for k, v in data.items()}
+        if with_pk:
+            if row.get(pk_attr) is None:
+                raise ValueError("id is required")
+            row[pk_attr] = self._coerce("id", row[pk_attr])
+            if len(row) == 1:
+                raise ValueError("No fields to update")
+        return row
+
+    def _existing_ids(self, session, ids: List[Any]) -> set:
+        pk = self._pk_column()
+        return set(session.execute(select(pk).where(pk.in_(ids))).scalars())
+
+    def get_version(self) -> Optional[str]:
+        """Cheap stamp that changes whenever the table changes, or None if unknown.
+
+        Built from MAX(pk), MAX(updated_at) and the newest sync_tombstone id
+        (deletes; 013_movie_rental_change_tracking.sql): each is one read at
+        the end of an index. Inserts and updates move updated_at, deletes add
+        a tombstone. updated_at has one-second resolution, so while the newest
+        change is less than a second old (the last column, `recent`) no stamp
+        is returned and callers fall back to hashing the result.
+        """
+        with self._SessionLocal() as session:
+            if self._version_stmt is None:
+                self._version_stmt = self._build_version_stmt(session) or False
+            if self._version_stmt is False:
+                return None
+            *stamp, recent = session.execute(self._version_stmt).one()
+        if recent:
+            return None
+        return "-".join("" if v is None else str(v) for v in stamp)
+
+    def _build_version_stmt(self, session) -> Any:
+        if self.version_sql:
+            return text(self.version_sql)
+        table = inspect(self.model).local_table.name
+        columns = {c["name"] for c in inspect(session.get_bind()).get_columns(table)}
+        if "updated_at" not in columns:
+            return None
+        pk = self._pk_column().name
+        return text(
+            f"SELECT MAX({pk}), MAX(updated_at), "
+            f"(SELECT COALESCE(MAX(tombstone_id), 0) FROM sync_tombstone), "
+            f"COALESCE(MAX(updated_at) >= NOW() - INTERVAL 1 SECOND, 0) FROM {table}"
+        )
+
+    # ── query spec ─────────────────────────────────────────────────────────
+    # Filters use Django-style suffixes, e.g. {"status": "OPEN",
+    # "due_at_datetime__lt": "2025-01-01T00:00:00", "status__in": "OPEN,LATE"}.
+    # Comparisons are applied to the bare column so MySQL can use the indexes
+    # from 002_movie_rental_index.sql (idx_rental_customer_id, idx_rental_status,
+    # idx_rental_due_datetime, ...). "id" always refers to the primary key.
+    _FILTER_OPS = {
+        "eq": lambda c, v: c == v,
+        "ne": lambda c, v: c != v,
+        "gt": lambda c, v: c > v,
+        "gte": lambda c, v: c >= v,
+        "lt": lambda c, v: c < v,
+        "lte": lambda c, v: c <= v,
+    }
+
+    def _build_select(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        after: Any = None,
+    ) -> Select:
+        pk = self._pk_column()
+        if fields:
+            names = [self._pk_attr()] + [self._resolve_field(f) for f in fields if f != "id"]
+            stmt = select(*[getattr(self.model, n) for n in dict.fromkeys(names)])
+        else:
+            stmt = select(self.model)
+
+        for key, raw in (filters or {}).items():
+            name, _, op = key.partition("__")
+            column = getattr(self.model, self._resolve_field(name))
+            if op == "in":
+                values = raw if isinstance(raw, (list, tuple)) else str(raw).split(",")
+                stmt = stmt.where(column.in_([self._coerce(name, v) for v in values]))
+            elif op in self._FILTER_OPS or not op:
+                stmt = stmt.where(self._FILTER_OPS[op or "eq"](column, self._coerce(name, raw)))
+            else:
+                raise ValueError(f"Unsupported filter operator: {op}")
+
+        if after is not None:
+            stmt = stmt.where(pk > after)
+
+        if order_by:
+            for key in order_by:
+                desc = key.startswith("-")
+                column = getattr(self.model, self._resolve_field(key.lstrip("-")))
+                stmt = stmt.order_by(column.desc() if desc else column.asc())
+        return stmt.order_by(pk)
+
+    def _resolve_field(self, name: str) -> str:
+        if name == "id":
+            return self._pk_attr()
+        if name not in inspect(self.model).column_attrs:
+            raise ValueError(f"Unknown field: {name}")
+        return name
+
+    def _coerce(self, name: str, value: Any) -> Any:
+        """Convert a query-string value to the column's Python type."""
+        if not isinstance(value, str):
+            return value
+        column = inspect(self.model).column_attrs[self._resolve_field(name)].columns[0]
+        try:
+            py_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            if issubclass(py_type, enum.Enum):
+                return py_type[value]
+            if py_type is bool:
+                return value.lower() in ("1", "true", "yes")
+            if py_type in (datetime, date):
+                return py_type.fromisoformat(value)
+            return py_type(value)
+        except (KeyError, ValueError, ArithmeticError):
+            raise ValueError(f"Invalid value for {name}: {value}")
+
+    def _rows_to_dicts(self, result: Any, fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+        if fields:
+            return [self._row_to_dict(row) for row in result.mappings()]
+        return [self._to_dict(obj) for obj in result.scalars()]
+
+    def _row_to_dict(self, row: Any) -> Dict[str, Any]:
+        """Serialize a projected (Core) row the same way the models' to_dict() do."""
+        pk_attr = self._pk_attr()
+        out: Dict[str, Any] = {}
+        for key, value in row.items():
+            if isinstance(value, (datetime, date)):
+                value = value.isoformat()
+            elif isinstance(value, Decimal):
+                value = float(value)
+            elif isinstance(value, enum.Enum):
+                value = value.value
+            out["id" if key == pk_attr else key] = value
+        return out
+
+    def _model_from_row(self, row: Any) -> Dict[str, Any]:
+        """Serialize a full row returned by a stored procedure through the model's to_dict()."""
+        mapper = inspect(self.model)
+        values = {
+            mapper.get_property_by_column(column).key: row[column.name]
+            for column in mapper.columns
+            if column.name in row
+        }
+        return self._to_dict(self.model(**values))
+
     # ── utilities ──────────────────────────────────────────────────────────
+    def _pk_column(self):
+        return inspect(self.model).primary_key[0]
+
+    def _pk_attr(self) -> str:
+        mapper = inspect(self.model)
+        return mapper.get_property_by_column(mapper.primary_key[0]).key
+
     def _to_dict(self, obj: Any) -> Dict[str, Any]:
         if obj is None:
             return {}
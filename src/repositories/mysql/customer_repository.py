@@ -8,7 +8,7 @@ class CustomerRepository(BaseRepository[Customer]):
         super().__init__(Customer)
 
     # Make BaseRepository's generic blueprint use the stored procedure for create
-    def create(self, data):  
+    def create(self, data, returning=True):
         required_fields = [
             "first_name", 
             "last_name", 
@@ -22,16 +22,23 @@ class CustomerRepository(BaseRepository[Customer]):
         if missing:
             raise ValueError(f"Missing fields: {', '.join(missing)}")
 
-        new_id = self.create_customer_via_proc(data)
-        if not new_id:
+        row = self.create_customer_via_proc(data)
+        if not row or not row.get("new_customer_id"):
             raise RuntimeError("Customer created, but ID could not be retrieved")
+        new_id = row["new_customer_id"]
+        if not returning:
+            return {"id": new_id}
+        if "customer_id" in row:
+            return self._model_from_row(row)
+
+        # Older add_customer_with_address only returned the ID
         created = self.get_by_id(new_id)
         return created or {"id": new_id}
 
     def create_customer_via_proc(self, data):
         """
         Calls the MySQL stored procedure add_customer_with_address().
-        Returns the new customer's ID.
+        Returns the created customer row (with `new_customer_id`) as a dict.
         """
         with self._SessionLocal() as session:
             result = session.execute(
@@ -62,9 +69,7 @@ class CustomerRepository(BaseRepository[Customer]):
             session.commit()
 
             row = result.fetchone()
-            if row and "new_customer_id" in row._mapping:
-                return row._mapping["new_customer_id"]
-            return None
+            return dict(row._mapping) if row else None
 
     def delete_customer(self, customer_id: int) -> bool:
         """Delete a customer by id. Returns True if a row was deleted."""
@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import BaseRepository
 from .orm_models.fee_orm import Fee
 
 
-class FeeRepository(BaseRepository[Fee]):
+class FeeRepository(CachedRepositoryMixin, BaseRepository[Fee]):
+    cache_namespace = "mysql.fees"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Fee)
@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import BaseRepository
 from .orm_models.format_orm import Format
 
 
-class FormatRepository(BaseRepository[Format]):
+class FormatRepository(CachedRepositoryMixin, BaseRepository[Format]):
+    cache_namespace = "mysql.formats"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Format)
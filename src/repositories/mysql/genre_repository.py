@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import BaseRepository
 from .orm_models.genre_orm import Genre
 
 
-class GenreRepository(BaseRepository[Genre]):
+class GenreRepository(CachedRepositoryMixin, BaseRepository[Genre]):
+    cache_namespace = "mysql.genres"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Genre)
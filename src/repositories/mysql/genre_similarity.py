@@ -0,0 +1,38 @@
+# src/repositories/mysql/genre_similarity.py
+"""Genre-similarity index (genre_index.py) loaded from movie / movie_genre."""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+
+from ..genre_index import PRELOAD, CatalogEntry, GenreSimilarity
+from .orm_models.base import SessionLocal, readiness
+
+_CATALOG_SQL = (
+    "SELECT m.movie_id, m.title, m.release_year, m.runtime_min, m.rating, mg.genre_id "
+    "FROM movie m LEFT JOIN movie_genre mg ON mg.movie_id = m.movie_id"
+)
+
+
+def load_catalog() -> List[CatalogEntry]:
+    movies: Dict[int, Dict[str, Any]] = {}
+    genres: Dict[int, List[int]] = {}
+    with SessionLocal() as session:
+        for movie_id, title, release_year, runtime_min, rating, genre_id in session.execute(text(_CATALOG_SQL)):
+            if movie_id not in movies:
+                movies[movie_id] = {
+                    "id": movie_id,
+                    "title": title,
+                    "release_year": release_year,
+                    "runtime_min": runtime_min,
+                    "rating": float(rating) if rating is not None else None,
+                }
+                genres[movie_id] = []
+            genres[movie_id].append(genre_id)
+    return [(movie_id, genres[movie_id], movie) for movie_id, movie in movies.items()]
+
+
+movie_genres = GenreSimilarity("mysql", load_catalog)
+if PRELOAD:
+    readiness.on_ready(movie_genres.load)
@@ -2,6 +2,8 @@ from .base_repository import BaseRepository
 from .orm_models.membership_plan_orm import MembershipPlan
 
 
+# Not cached: trg_check_membership_upgrade rewrites membership_plan on every
+# rental insert, which no repository invalidation would see.
 class MembershipPlanRepository(BaseRepository[MembershipPlan]):
     def __init__(self):
         super().__init__(MembershipPlan)
@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import BaseRepository
 from .orm_models.membership_orm import Membership
 
 
-class MembershipRepository(BaseRepository[Membership]):
+class MembershipRepository(CachedRepositoryMixin, BaseRepository[Membership]):
+    cache_namespace = "mysql.memberships"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Membership)
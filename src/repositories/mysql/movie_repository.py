@@ -1,7 +1,125 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import match
+
 from .base_repository import BaseRepository
+from .genre_similarity import movie_genres
+from .movie_titles import movie_titles
+from .recommendations import movie_recommender
 from .orm_models.movie_orm import Movie
 
+# Title matches count this many times as much as the combined title+summary score
+TITLE_WEIGHT = 2
+
 
 class MovieRepository(BaseRepository[Movie]):
+    # Writes keep this worker's title index current (other workers poll for
+    # them, see movie_titles.py). These overrides only add that hook around
+    # the base writes, so bulk writes keep their fast path.
+    bulk_hook_overrides = ("create", "update", "delete")
+
     def __init__(self):
         super().__init__(Movie)
+
+    def create(self, data: Dict[str, Any], returning: bool = True) -> Dict[str, Any]:
+        created = super().create(data, returning)
+        if "title" in created:
+            movie_titles.upsert(created)
+        else:
+            movie_titles.mark_stale()
+        return created
+
+    def update(self, id_: Any, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        updated = super().update(id_, data)
+        if updated:
+            movie_titles.upsert(updated)
+        return updated
+
+    def delete(self, id_: Any) -> bool:
+        deleted = super().delete(id_)
+        if deleted:
+            movie_titles.remove(id_)
+        return deleted
+
+    def bulk_create(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        try:
+            return super().bulk_create(*args, **kwargs)
+        finally:
+            movie_titles.mark_stale()
+
+    def bulk_update(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        try:
+            return super().bulk_update(*args, **kwargs)
+        finally:
+            movie_titles.mark_stale()
+
+    def bulk_delete(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        try:
+            return super().bulk_delete(*args, **kwargs)
+        finally:
+            movie_titles.mark_stale()
+
+    def autocomplete(self, prefix: str, limit: int = 10, sort: str = "rating") -> List[Dict[str, Any]]:
+        """Top `limit` movies with a title word starting with `prefix`, from the in-memory index."""
+        return movie_titles.top(prefix, limit, sort)
+
+    def similar(self, movie_id: int, limit: int = 25, mode: str = "shared") -> List[Dict[str, Any]]:
+        """Movies sharing the most genres with `movie_id`, from the in-memory genre bitset index."""
+        return movie_genres.top(movie_id, limit, mode)
+
+    def recommendations(self, movie_id: int, limit: int = 25, metric: str = "cosine") -> List[Dict[str, Any]]:
+        """Movies most often rented by the same customers, from the in-memory item-item model.
+
+        Same shape as the Neo4j recommendations: {"movie", "score", "customer_support"}.
+        """
+        neighbours = movie_recommender.top(movie_id, limit, metric)
+        if not neighbours:
+            return []
+        ids = [n["movie_id"] for n in neighbours]
+        with self._SessionLocal() as session:
+            movies = {m.movie_id: self._to_dict(m) for m in session.scalars(select(Movie).where(Movie.movie_id.in_(ids)))}
+        return [
+            {"movie": movies[n["movie_id"]], "score": n["score"], "customer_support": n["co_rentals"]}
+            for n in neighbours
+            if n["movie_id"] in movies  # deleted since the model was built
+        ]
+
+    def search(
+        self, query: str, mode: str = "natural", limit: int = 20, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Full-text search over title and summary, best match first.
+
+        mode "natural" is MySQL's natural-language mode; "boolean" accepts the
+        boolean-mode operators (+required -excluded "phrase" prefix*). Uses the
+        idx_movie_title_fts and idx_movie_title_summary_fts FULLTEXT indexes.
+        Returns the page and the offset of the next one (None on the last page).
+        """
+        title_match = self._match(query, mode, Movie.title)
+        text_match = self._match(query, mode, Movie.title, Movie.summary)
+        relevance = (title_match * TITLE_WEIGHT + text_match).label("relevance")
+        stmt = (
+            select(Movie, relevance)
+            .where(text_match)
+            .order_by(relevance.desc(), Movie.movie_id)
+            .limit(limit + 1)
+            .offset(offset)
+        )
+        with self._SessionLocal() as session:
+            rows = session.execute(stmt).all()
+        has_more = len(rows) > limit
+        items = []
+        for movie, score in rows[:limit]:
+            item = self._to_dict(movie)
+            item["relevance"] = round(float(score), 4)
+            items.append(item)
+        return items, offset + limit if has_more else None
+
+    @staticmethod
+    def _match(query: str, mode: str, *columns):
+        expr = match(*columns, against=query)
+        if mode == "boolean":
+            return expr.in_boolean_mode()
+        if mode == "natural":
+            return expr.in_natural_language_mode()
+        raise ValueError(f"Unknown search mode: {mode}")
@@ -0,0 +1,173 @@
+# src/repositories/mysql/movie_titles.py
+"""
+Movie title autocomplete backed by an in-memory PrefixIndex.
+
+The index is loaded from the movie table once MySQL is ready (or on first
+use, with AUTOCOMPLETE_PRELOAD=false) and kept current three ways:
+
+- writes through MovieRepository update this worker's index immediately;
+- every AUTOCOMPLETE_POLL_SECONDS a lookup first polls for rows changed by
+  other workers or directly in SQL: movie.updated_at and the movie
+  tombstones from 013_movie_rental_change_tracking.sql act as the version,
+  so a poll reads only the rows changed since the last one;
+- every AUTOCOMPLETE_REBUILD_SECONDS the index is rebuilt in the background,
+  which also refreshes popularity (rentals per movie).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from ..prefix_index import PrefixIndex
+from .orm_models.base import SessionLocal, readiness
+
+POLL_SECONDS = float(os.getenv("AUTOCOMPLETE_POLL_SECONDS", "2"))
+REBUILD_SECONDS = float(os.getenv("AUTOCOMPLETE_REBUILD_SECONDS", "600"))
+PRELOAD = os.getenv("AUTOCOMPLETE_PRELOAD", "true").lower() == "true"
+# Rows committed shortly after a poll may carry an earlier updated_at
+POLL_OVERLAP = timedelta(seconds=2)
+SORT_FIELDS = ("rating", "popularity")
+MAX_K = 50
+
+_MOVIES_SQL = "SELECT movie_id, title, rating FROM movie"
+_CHANGED_SQL = "SELECT movie_id, title, rating FROM movie WHERE updated_at >= :since"
+_POPULARITY_SQL = (
+    "SELECT ii.movie_id, COUNT(*) FROM rental_item ri "
+    "JOIN inventory_item ii ON ii.inventory_item_id = ri.inventory_item_id "
+    "GROUP BY ii.movie_id"
+)
+_DELETED_SQL = (
+    "SELECT tombstone_id, row_id FROM sync_tombstone "
+    "WHERE tombstone_id > :after AND table_name = 'movie' ORDER BY tombstone_id"
+)
+_VERSION_SQL = "SELECT NOW(), (SELECT COALESCE(MAX(tombstone_id), 0) FROM sync_tombstone)"
+
+
+def _entry(movie_id: int, title: str, rating: Any, popularity: int = 0) -> Dict[str, Any]:
+    return {
+        "id": movie_id,
+        "title": title,
+        "rating": float(rating) if rating is not None else None,
+        "popularity": popularity,
+    }
+
+
+class MovieTitleIndex:
+    def __init__(self, session_factory=SessionLocal):
+        self._SessionLocal = session_factory
+        self._index: Optional[PrefixIndex] = None
+        self._since: Optional[datetime] = None
+        self._last_tombstone = 0
+        self._polled_at = 0.0
+        self._built_at = 0.0
+        self._build_seconds: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        self._rebuilding = threading.Event()
+
+    # ── lookups ──────────────────────────────────────────────────
+    def top(self, prefix: str, k: int = 10, by: str = "rating") -> List[Dict[str, Any]]:
+        if by not in SORT_FIELDS:
+            raise ValueError(f"sort must be one of: {', '.join(SORT_FIELDS)}")
+        if self._index is None:
+            with self._refresh_lock:
+                if self._index is None:
+                    self._load()
+        else:
+            self._refresh_if_due()
+        return self._index.top(prefix, k, by)
+
+    # ── writes made through MovieRepository ──────────────────────
+    def upsert(self, movie: Dict[str, Any]) -> None:
+        if self._index is not None:
+            current = self._index.get(movie["id"])
+            popularity = current["popularity"] if current else 0
+            self._index.upsert(_entry(movie["id"], movie["title"], movie.get("rating"), popularity))
+
+    def remove(self, movie_id: int) -> None:
+        if self._index is not None:
+            self._index.remove(movie_id)
+
+    def mark_stale(self) -> None:
+        """Poll on the next lookup (after writes the index could not apply itself)."""
+        self._polled_at = 0.0
+
+    # ── loading and polling ──────────────────────────────────────
+    def load(self) -> None:
+        """(Re)build the whole index; safe to call from a background thread."""
+        with self._refresh_lock:
+            self._load()
+
+    def _load(self) -> None:
+        started = time.perf_counter()
+        with self._SessionLocal() as session:
+            # Version first: whatever changes while loading is picked up by the next poll
+            now, last_tombstone = session.execute(text(_VERSION_SQL)).one()
+            popularity = dict(session.execute(text(_POPULARITY_SQL)).all())
+            entries = [
+                _entry(movie_id, title, rating, int(popularity.get(movie_id, 0)))
+                for movie_id, title, rating in session.execute(text(_MOVIES_SQL))
+            ]
+        self._index = PrefixIndex(entries, max_k=MAX_K)
+        self._since, self._last_tombstone = now - POLL_OVERLAP, last_tombstone
+        self._polled_at = self._built_at = time.monotonic()
+        self._build_seconds = time.perf_counter() - started
+
+    def poll(self) -> int:
+        """Apply rows changed or deleted since the last poll; returns how many."""
+        with self._refresh_lock:
+            with self._SessionLocal() as session:
+                now, _ = session.execute(text(_VERSION_SQL)).one()
+                changed = session.execute(text(_CHANGED_SQL), {"since": self._since}).all()
+                deleted = session.execute(text(_DELETED_SQL), {"after": self._last_tombstone}).all()
+            for movie_id, title, rating in changed:
+                self.upsert({"id": movie_id, "title": title, "rating": rating})
+            for tombstone_id, movie_id in deleted:
+                self.remove(movie_id)
+                self._last_tombstone = tombstone_id
+            self._since = now - POLL_OVERLAP
+            self._polled_at = time.monotonic()
+            return len(changed) + len(deleted)
+
+    def _refresh_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._built_at >= REBUILD_SECONDS and not self._rebuilding.is_set():
+            self._rebuilding.set()
+            threading.Thread(target=self._rebuild, name="movie-titles-rebuild", daemon=True).start()
+        elif now - self._polled_at >= POLL_SECONDS and not self._refresh_lock.locked():
+            # Serve from the current index if the database does not answer
+            try:
+                self.poll()
+            except Exception as e:
+                self._polled_at = now
+                print(f"[MySQL] Movie title poll failed: {e}")
+
+    def _rebuild(self) -> None:
+        try:
+            self.load()
+        except Exception as e:
+            # keep serving (and polling) the current index; retry after another interval
+            self._built_at = time.monotonic()
+            print(f"[MySQL] Movie title index rebuild failed: {e}")
+        finally:
+            self._rebuilding.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        if self._index is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "movies": len(self._index),
+            "build_seconds": round(self._build_seconds or 0.0, 3),
+            "age_seconds": round(time.monotonic() - self._built_at, 1),
+            "polled_seconds_ago": round(time.monotonic() - self._polled_at, 1),
+        }
+
+
+movie_titles = MovieTitleIndex()
+if PRELOAD:
+    readiness.on_ready(movie_titles.load)
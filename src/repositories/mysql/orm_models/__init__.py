@@ -1,4 +1,4 @@
-from .base import Base, SessionLocal, engine
+from .base import Base, SessionLocal, get_engine
 from .customer_orm import Customer
 from .address_orm import Address
 from .employee_orm import Employee
@@ -19,6 +19,7 @@ __all__ = [
     "Base",
     "SessionLocal",
     "engine",
+    "get_engine",
     "Customer",
     "Address",
     "Employee",
@@ -35,3 +36,10 @@ __all__ = [
     "Payment",
     "Review",
 ]
+
+
+def __getattr__(name):
+    # The engine is built on first use, see base.get_engine()
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
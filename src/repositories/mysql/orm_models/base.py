@@ -1,9 +1,12 @@
 import os
 import socket
-import time
-from sqlalchemy import create_engine, text
+import threading
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import declarative_base, sessionmaker
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+
+from ..pool import CONNECT_TIMEOUT, engine_options, instrument
+from ...readiness import register
 
 DB_HOST = os.getenv("DB_HOST", "mysql")
 DB_PORT = int(os.getenv("DB_PORT", "3306"))
@@ -27,42 +30,98 @@ primary_port = DB_PORT
 fallback_host = os.getenv("DB_FALLBACK_HOST", "localhost")
 fallback_port = int(os.getenv("DB_FALLBACK_PORT", "3307"))
 
-candidate_urls = []
-if _can_resolve(primary_host):
-	candidate_urls.append(_build_url(primary_host, primary_port))
-else:
-	# push fallback first if primary cannot resolve
-	candidate_urls.append(_build_url(fallback_host, fallback_port))
-	# also keep primary (DNS might appear later e.g. after docker starts)
-	candidate_urls.append(_build_url(primary_host, primary_port))
+def candidate_urls() -> list[str]:
+	if _can_resolve(primary_host):
+		return [_build_url(primary_host, primary_port)]
+	# push fallback first if primary cannot resolve,
+	# but keep primary (DNS might appear later e.g. after docker starts)
+	return [_build_url(fallback_host, fallback_port), _build_url(primary_host, primary_port)]
 
 Base = declarative_base()
-engine = None
 
-last_error: Exception | None = None
-for idx, url in enumerate(candidate_urls):
-	for attempt in range(1, 6):  # up to 5 attempts each URL
+# Nothing connects at import time: the engine is built on first use (which
+# does not connect either) and the readiness probe started by create_app()
+# finds a reachable URL in the background.
+_engine = None
+_engine_lock = threading.Lock()
+
+def _create_engine(url: str):
+	new_engine = create_engine(url, **engine_options())
+	instrument(new_engine)
+	event.listen(new_engine, "handle_error", _on_error)
+	return new_engine
+
+def _on_error(context) -> None:
+	if context.is_disconnect:
+		readiness.mark_down(context.original_exception)
+
+def get_engine():
+	"""The MySQL engine, built on first use for the first candidate URL."""
+	global _engine
+	if _engine is None:
+		with _engine_lock:
+			if _engine is None:
+				_engine = _create_engine(candidate_urls()[0])
+	return _engine
+
+def _switch_to(url: str) -> None:
+	"""Point the engine (and SessionLocal) at another candidate URL."""
+	global _engine
+	with _engine_lock:
+		old = _engine
+		_engine = _create_engine(url)
+		SessionLocal.configure(bind=_engine)
+	if old is not None:
+		old.dispose()
+
+def _probe() -> None:
+	current = get_engine()
+	try:
+		with current.connect() as conn:
+			conn.execute(text("SELECT 1"))
+		print(f"[MySQL] Connected using {current.url}")
+		return
+	except Exception as e:
+		last_error = e
+	current_url = current.url.render_as_string(hide_password=False)
+	for url in candidate_urls():
+		if url == current_url:
+			continue
+		probe_engine = create_engine(url, poolclass=NullPool, connect_args={"connect_timeout": CONNECT_TIMEOUT})
 		try:
-			engine = create_engine(url, pool_pre_ping=True)
-			# quick test connection
-			with engine.connect() as conn:
-				conn.execute(text("SELECT 1"))  # type: ignore[name-defined]
-			print(f"[MySQL] Connected using URL #{idx+1}: {url}")
-			break
-		except OperationalError as e:
-			last_error = e
-			print(f"[MySQL] OperationalError attempt {attempt}/5 for {url}: {e}")
-			time.sleep(2)
+			with probe_engine.connect() as conn:
+				conn.execute(text("SELECT 1"))
 		except Exception as e:
 			last_error = e
-			print(f"[MySQL] General error attempt {attempt}/5 for {url}: {e}")
-			time.sleep(2)
-	if engine is not None:
-		break
+			continue
+		finally:
+			probe_engine.dispose()
+		_switch_to(url)
+		print(f"[MySQL] Connected using {get_engine().url}")
+		return
+	print(f"[MySQL] Not reachable yet: {last_error}")
+	raise last_error
+
+readiness = register("mysql", _probe)
+
+
+class _LazySessionmaker(sessionmaker):
+	"""sessionmaker that binds to get_engine() when the first session is made."""
+
+	def __call__(self, **local_kw):
+		if self.kw.get("bind") is None:
+			self.configure(bind=get_engine())
+		return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker()
+
 
-if engine is None:
-	raise RuntimeError(f"Could not connect to any MySQL URL. Last error: {last_error}")
+def __getattr__(name: str):
+	# `from .base import engine` keeps working, but builds the engine on first use
+	if name == "engine":
+		return get_engine()
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-SessionLocal = sessionmaker(bind=engine)
 
-__all__ = ["Base", "engine", "SessionLocal"]
+__all__ = ["Base", "engine", "get_engine", "readiness", "SessionLocal"]
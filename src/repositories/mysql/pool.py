@@ -0,0 +1,188 @@
+# src/repositories/mysql/pool.py
+"""
+Connection pool settings and metrics for the MySQL engine.
+
+Every gunicorn worker has its own engine and pool, so the server sees up to
+workers × (MYSQL_POOL_SIZE + MYSQL_MAX_OVERFLOW) connections; keep that
+below MySQL's max_connections. The numbers reported by pool_stats() are per
+worker.
+
+MYSQL_POOL_PRE_PING:
+    always  test every connection on checkout, one extra round trip each
+            time (default)
+    idle    only test connections that sat in the pool for more than
+            MYSQL_POOL_PRE_PING_IDLE_SECONDS
+    off     never test; rely on pool_recycle
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("MYSQL_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("MYSQL_POOL_TIMEOUT", "30"))
+# Below MySQL's wait_timeout (8 h by default) and typical proxy/NAT idle limits
+POOL_RECYCLE = int(os.getenv("MYSQL_POOL_RECYCLE", "1800"))
+PRE_PING = os.getenv("MYSQL_POOL_PRE_PING", "always").lower()
+PRE_PING_IDLE_SECONDS = float(os.getenv("MYSQL_POOL_PRE_PING_IDLE_SECONDS", "30"))
+# Seconds before a connection attempt gives up (pymysql's default is 10)
+CONNECT_TIMEOUT = int(os.getenv("MYSQL_CONNECT_TIMEOUT", "5"))
+
+_WAIT_SAMPLES = 1024
+
+
+class PoolMetrics:
+    """Process-wide counters fed by the pool events below."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._waits.clear()
+            self.checkouts = 0
+            self.connects = 0
+            self.overflow_connects = 0
+            self.timeouts = 0
+            self.invalidations = 0
+            self.pre_ping_failures = 0
+            self.waits = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.peak_in_use = 0
+
+    def record_wait(self, ms: float, timed_out: bool) -> None:
+        with self._lock:
+            self._waits.append(ms)
+            self.waits += 1
+            self.wait_total_ms += ms
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def observe_in_use(self, in_use: int) -> None:
+        with self._lock:
+            self.peak_in_use = max(self.peak_in_use, in_use)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            return {
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "overflow_connects": self.overflow_connects,
+                "timeouts": self.timeouts,
+                "invalidations": self.invalidations,
+                "pre_ping_failures": self.pre_ping_failures,
+                "peak_in_use": self.peak_in_use,
+                "wait_ms": {
+                    "mean": round(self.wait_total_ms / self.waits, 3) if self.waits else None,
+                    "p95": round(waits[max(0, int(len(waits) * 0.95) - 1)], 3) if waits else None,
+                    "max": round(self.wait_max_ms, 3),
+                },
+            }
+
+
+metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            metrics.record_wait((time.perf_counter() - start) * 1000, timed_out)
+
+
+def engine_options() -> Dict[str, Any]:
+    """Keyword arguments for create_engine() taken from the MYSQL_POOL_* settings."""
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": PRE_PING == "always",
+        "connect_args": {"connect_timeout": CONNECT_TIMEOUT},
+    }
+
+
+def instrument(engine: Any) -> None:
+    """Attach the metric hooks (and the idle pre-ping, if enabled) to `engine`'s pool."""
+    pool = engine.pool
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+        if pool.overflow() > 0:
+            metrics.incr("overflow_connects")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if (
+            PRE_PING == "idle"
+            and checked_in_at is not None
+            and time.monotonic() - checked_in_at > PRE_PING_IDLE_SECONDS
+        ):
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            except Exception:
+                metrics.incr("pre_ping_failures")
+                # The pool drops this connection and retries the checkout
+                raise exc.DisconnectionError("idle connection failed pre-ping")
+            finally:
+                cursor.close()
+        metrics.incr("checkouts")
+        metrics.observe_in_use(pool.checkedout())
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+
+def pool_stats(engine: Any) -> Dict[str, Any]:
+    """Configuration, live usage and counters of `engine`'s pool for this process."""
+    pool = engine.pool
+    stats: Dict[str, Any] = {
+        "size": POOL_SIZE,
+        "max_overflow": MAX_OVERFLOW,
+        "timeout_s": POOL_TIMEOUT,
+        "recycle_s": POOL_RECYCLE,
+        "pre_ping": PRE_PING,
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "in_use": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            }
+        )
+    stats.update(metrics.snapshot())
+    return stats
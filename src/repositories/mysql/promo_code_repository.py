@@ -1,7 +1,11 @@
+from ..cache import CachedRepositoryMixin
 from .base_repository import BaseRepository
 from .orm_models.promo_code_orm import PromoCode
 
 
-class PromoCodeRepository(BaseRepository[PromoCode]):
+class PromoCodeRepository(CachedRepositoryMixin, BaseRepository[PromoCode]):
+    cache_namespace = "mysql.promo_codes"
+    cache_ttl = 60
+
     def __init__(self):
         super().__init__(PromoCode)
@@ -0,0 +1,48 @@
+# src/repositories/mysql/recommendations.py
+"""
+Item-item recommendations (item_similarity.py) fed from rental / rental_item.
+
+Rentals are read in rental_id order, so the model's watermark is the highest
+rental_id it contains and a refresh reads only the rentals after it. Rows
+removed or changed afterwards (cancelled rentals, edited items) are picked
+up by the periodic full rebuild.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from sqlalchemy import text
+
+from ..item_similarity import PRELOAD, ItemRecommender
+from .orm_models.base import SessionLocal, readiness
+
+_WATERMARK_SQL = "SELECT COALESCE(MAX(rental_id), 0) FROM rental"
+_PAIRS_SQL = (
+    "SELECT r.customer_id, ii.movie_id FROM rental r "
+    "JOIN rental_item ri ON ri.rental_id = r.rental_id "
+    "JOIN inventory_item ii ON ii.inventory_item_id = ri.inventory_item_id "
+    "WHERE r.rental_id > :after AND r.rental_id <= :until"
+)
+STREAM_ROWS = 100_000
+
+
+def rental_pairs(after: int) -> Tuple[int, List[int], List[int]]:
+    """(highest rental_id, customer ids, movie ids) of the rented copies after rental `after`."""
+    customers: List[int] = []
+    movies: List[int] = []
+    with SessionLocal() as session:
+        # Fix the upper bound first: rentals committed while streaming wait for the next refresh
+        until = session.execute(text(_WATERMARK_SQL)).scalar_one()
+        result = session.execute(
+            text(_PAIRS_SQL).execution_options(stream_results=True, yield_per=STREAM_ROWS),
+            {"after": after, "until": until},
+        )
+        for customer_id, movie_id in result:
+            customers.append(customer_id)
+            movies.append(movie_id)
+    return max(int(until), after), customers, movies
+
+
+movie_recommender = ItemRecommender("mysql", rental_pairs)
+if PRELOAD:
+    readiness.on_ready(movie_recommender.load)
@@ -1,4 +1,5 @@
 from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 import json
 
 from .base_repository import BaseRepository
@@ -12,7 +13,7 @@ class RentalRepository(BaseRepository[Rental]):
     # ------------------------------------------------------------
     # Override the generic create() used by /rentals POST
     # ------------------------------------------------------------
-    def create(self, data: dict):
+    def create(self, data: dict, returning: bool = True):
         """
         Create a rental using the `create_rental` stored procedure.
         """
@@ -22,12 +23,10 @@ class RentalRepository(BaseRepository[Rental]):
         if missing:
             raise ValueError(f"Missing fields: {', '.join(missing)}")
 
-        new_id = self.create_rental_via_proc(data)
-        if not new_id:
+        row = self.create_rental_via_proc(data)
+        if not row or not row.get("new_rental_id"):
             raise RuntimeError("create_rental returned no rental ID")
-
-        created = self.get_by_id(new_id)
-        return created or {"id": new_id}
+        return self._created(row, row["new_rental_id"], returning)
 
     # ------------------------------------------------------------
     # Create rental via stored procedure
@@ -35,7 +34,7 @@ class RentalRepository(BaseRepository[Rental]):
     def create_rental_via_proc(self, data: dict):
         """
         Calls the MySQL stored procedure create_rental().
-        Returns the new rental_id.
+        Returns the created rental row (with `new_rental_id`) as a dict.
         """
         json_items = json.dumps(data["inventory_item_ids"]) # Convert list to JSON string
 
@@ -61,31 +60,75 @@ class RentalRepository(BaseRepository[Rental]):
 
             session.commit()
             row = result.fetchone()
+            return dict(row._mapping) if row else None
+
+    # ------------------------------------------------------------
+    # Batch checkout: many carts in one stored procedure call
+    # ------------------------------------------------------------
+    def create_rentals_batch(self, carts: list):
+        """
+        Create one rental per cart using the `create_rentals_batch` stored procedure.
 
-            if row and "new_rental_id" in row._mapping:
-                return row._mapping["new_rental_id"]
-            return None
+        All carts succeed or none do. Returns the created rentals in cart order,
+        each with its `inventory_item_ids`, straight from the procedure's result set.
+        """
+        for index, cart in enumerate(carts):
+            if not isinstance(cart, dict):
+                raise ValueError(f"Cart {index}: must be an object")
+            missing = [f for f in ("customer_id", "inventory_item_ids") if not cart.get(f)]
+            if missing:
+                raise ValueError(f"Cart {index}: missing fields: {', '.join(missing)}")
+            if not isinstance(cart["inventory_item_ids"], list):
+                raise ValueError(f"Cart {index}: inventory_item_ids must be a list")
+
+        # Absent keys read as NULL in JSON_TABLE, so drop unset optionals
+        fields = ("customer_id", "employee_id", "promo_code_id", "inventory_item_ids")
+        json_carts = json.dumps(
+            [{f: cart[f] for f in fields if cart.get(f) is not None} for cart in carts]
+        )
+
+        with self._SessionLocal() as session:
+            try:
+                result = session.execute(
+                    text("CALL create_rentals_batch(:carts_json)"),
+                    {"carts_json": json_carts},
+                )
+                rows = result.mappings().all()
+                session.commit()
+            except DBAPIError as e:
+                # SIGNAL SQLSTATE '45000' (unavailable/duplicate items) is a client error
+                if e.orig is not None and e.orig.args and e.orig.args[0] == 1644:
+                    raise ValueError(e.orig.args[1])
+                raise
+
+        created = []
+        for row in rows:
+            rental = self._model_from_row(row)
+            item_ids = row["inventory_item_ids"]
+            rental["inventory_item_ids"] = json.loads(item_ids) if isinstance(item_ids, str) else item_ids
+            created.append(rental)
+        return created
 
     # ------------------------------------------------------------
     # Make reservation creation via stored procedure
     # ------------------------------------------------------------
-    def create_reservation(self, data: dict):
+    def create_reservation(self, data: dict, returning: bool = True):
         required = ["customer_id", "inventory_item_ids"]
         missing = [f for f in required if f not in data or not data[f]]
         if missing:
             raise ValueError(f"Missing fields: {', '.join(missing)}")
 
-        new_id = self.create_reservation_via_proc(data)
+        row = self.create_reservation_via_proc(data)
+        # Fallback in case of used new_rental_id for both
+        new_id = row and (row.get("new_reservation_id") or row.get("new_rental_id"))
         if not new_id:
             raise RuntimeError("create_reservation returned no ID")
-
-        created = self.get_by_id(new_id)
-        return created or {"id": new_id}
+        return self._created(row, new_id, returning)
 
     def create_reservation_via_proc(self, data: dict):
         """
         Calls the MySQL stored procedure create_reservation().
-        Returns the new reservation/rental ID.
+        Returns the created reservation row (with `new_reservation_id`) as a dict.
         """
         json_items = json.dumps(data["inventory_item_ids"])
 
@@ -111,13 +154,15 @@ class RentalRepository(BaseRepository[Rental]):
 
             session.commit()
             row = result.fetchone()
+            return dict(row._mapping) if row else None
 
-            # Procedure returns: SELECT v_rental_id AS new_reservation_id;
-            if row and "new_reservation_id" in row._mapping:
-                return row._mapping["new_reservation_id"]
-
-            # Fallback in case of used new_rental_id for both
-            if row and "new_rental_id" in row._mapping:
-                return row._mapping["new_rental_id"]
+    def _created(self, row: dict, new_id, returning: bool):
+        """Response for a procedure-created rental, built from the procedure's own result row."""
+        if not returning:
+            return {"id": new_id}
+        if "rental_id" in row:
+            return self._model_from_row(row)
 
-            return None
\ No newline at end of file
+        # Older procedures only returned the ID
+        created = self.get_by_id(new_id)
+        return created or {"id": new_id}
\ No newline at end of file
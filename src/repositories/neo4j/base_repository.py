@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar
 
 # Ensure neomodel is configured via side-effect import
 from . import connection  # noqa: F401
 
-from neomodel import StructuredNode
-from neomodel.exceptions import DoesNotExist, MultipleNodesReturned
+from neo4j.exceptions import Neo4jError
+from neomodel import StructuredNode, db
+from neomodel.exceptions import DeflateError, DoesNotExist, MultipleNodesReturned
+
+from .. import bulk
+from .driver import write_query
 
 
 NodeT = TypeVar("NodeT", bound=StructuredNode)
@@ -21,6 +25,10 @@ class Neo4jBaseRepository(Generic[NodeT]):
       - CRUD helpers return plain dicts, using model.to_dict() if available
     Notes:
       - This base focuses on node properties only (no relationship mutations).
+      - neomodel runs on the managed driver (see driver.py); reads use read
+        transactions, so a neo4j:// URI routes them to cluster readers,
+        single writes run in write transactions sent to the leader, and the
+        bulk writes run as retried managed write transactions.
     """
 
     def __init__(self, model: Type[NodeT], id_field: str = "id"):
@@ -29,12 +37,14 @@ class Neo4jBaseRepository(Generic[NodeT]):
 
     # ── public helpers ────────────────────────────────────────────
     def get_all(self) -> List[Dict[str, Any]]:
-        nodes = self.model.nodes.all()
+        with db.read_transaction:
+            nodes = self.model.nodes.all()
         return [self._to_dict(n) for n in nodes]
 
     def get_by_id(self, id_: Any) -> Optional[Dict[str, Any]]:
         try:
-            node = self.model.nodes.get(**{self.id_field: id_})
+            with db.read_transaction:
+                node = self.model.nodes.get(**{self.id_field: id_})
         except (DoesNotExist, MultipleNodesReturned):
             return None
         return self._to_dict(node)
@@ -46,34 +56,148 @@ class Neo4jBaseRepository(Generic[NodeT]):
         missing = [f for f in self._model_required_fields() if normalized.get(f) is None]
         if missing:
             raise ValueError(f"Missing required fields: {', '.join(missing)}")
-        node = self.model(**normalized).save()
+        with db.write_transaction:
+            node = self.model(**normalized).save()
         return self._to_dict(node)
 
     def update(self, id_: Any, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        try:
-            node = self.model.nodes.get(**{self.id_field: id_})
-        except (DoesNotExist, MultipleNodesReturned):
-            return None
-        # Update only known property attributes; relationships should be handled explicitly in subclasses.
-        normalized = self._normalize_input(data or {})
-        for k, v in normalized.items():
-            if hasattr(node, k):
-                try:
-                    setattr(node, k, v)
-                except Exception:
-                    # Ignore relationship or invalid assignments here
-                    pass
-        node.save()
+        # Read and write in one write transaction, sent to the leader
+        with db.write_transaction:
+            try:
+                node = self.model.nodes.get(**{self.id_field: id_})
+            except (DoesNotExist, MultipleNodesReturned):
+                return None
+            # Update only known property attributes; relationships should be handled explicitly in subclasses.
+            normalized = self._normalize_input(data or {})
+            for k, v in normalized.items():
+                if hasattr(node, k):
+                    try:
+                        setattr(node, k, v)
+                    except Exception:
+                        # Ignore relationship or invalid assignments here
+                        pass
+            node.save()
         return self._to_dict(node)
 
     def delete(self, id_: Any) -> bool:
-        try:
-            node = self.model.nodes.get(**{self.id_field: id_})
-        except (DoesNotExist, MultipleNodesReturned):
-            return False
-        node.delete()
+        with db.write_transaction:
+            try:
+                node = self.model.nodes.get(**{self.id_field: id_})
+            except (DoesNotExist, MultipleNodesReturned):
+                return False
+            node.delete()
         return True
 
+    # ── bulk writes ──────────────────────────────────────────────
+    # One result per item (see repositories/bulk.py). Each chunk is a single
+    # UNWIND statement in one transaction; if it fails (e.g. a uniqueness
+    # constraint), the chunk is replayed one item per transaction to report
+    # the failing items. Subclasses overriding create/update/delete get one
+    # call per item.
+    def bulk_create(self, items: List[Dict[str, Any]], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        if bulk.is_overridden(self, Neo4jBaseRepository, "create"):
+            return bulk.each(items, self.create, "created", lambda item, out: (out or {}).get(self.id_field))
+
+        def prepare(data: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+            normalized = self._normalize_input(data)
+            # CREATE ... SET n = props skips neomodel's checks: a node without
+            # its id could never be reached through the CRUD routes
+            missing = [f for f in self._bulk_required_fields() if normalized.get(f) is None]
+            if missing:
+                raise ValueError(f"Missing required fields: {', '.join(missing)}")
+            return normalized[self.id_field], self._deflate(normalized, defaults=True)
+
+        cypher = f"UNWIND $rows AS row CREATE (n:{self.model.__label__}) SET n = row.props RETURN row.index"
+        return self._bulk_write(items, prepare, cypher, "created", chunk_size)
+
+    def bulk_update(self, items: List[Dict[str, Any]], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        """Partial updates; every item carries its id as "id" or under the id field."""
+        if bulk.is_overridden(self, Neo4jBaseRepository, "update"):
+            return bulk.each(
+                items,
+                lambda data: self.update(self._normalize_input(data).get(self.id_field), data),
+                "updated",
+                lambda item, out: self._normalize_input(item).get(self.id_field),
+            )
+
+        def prepare(data: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+            normalized = self._normalize_input(data)
+            id_ = normalized.pop(self.id_field, None)
+            if id_ is None:
+                raise ValueError("id is required")
+            if not normalized:
+                raise ValueError("No fields to update")
+            return id_, self._deflate(normalized)
+
+        cypher = (
+            f"UNWIND $rows AS row MATCH (n:{self.model.__label__} {{{self.id_field}: row.id}}) "
+            f"SET n += row.props RETURN DISTINCT row.index"
+        )
+        return self._bulk_write(items, prepare, cypher, "updated", chunk_size)
+
+    def bulk_delete(self, ids: List[Any], chunk_size: int = bulk.BULK_CHUNK_SIZE) -> List[Dict[str, Any]]:
+        if bulk.is_overridden(self, Neo4jBaseRepository, "delete"):
+            return bulk.each(ids, self.delete, "deleted", lambda item, out: item)
+
+        cypher = (
+            f"UNWIND $rows AS row MATCH (n:{self.model.__label__} {{{self.id_field}: row.id}}) "
+            f"DETACH DELETE n RETURN DISTINCT row.index"
+        )
+        return self._bulk_write(ids, lambda id_: (id_, {}), cypher, "deleted", chunk_size)
+
+    def _bulk_write(self, items, prepare, cypher: str, status: str, chunk_size: int) -> List[Dict[str, Any]]:
+        results: List[Any] = [None] * len(items)
+        rows: List[Dict[str, Any]] = []
+        for index, item in enumerate(items):
+            try:
+                if status != "deleted" and not isinstance(item, dict):
+                    raise ValueError("Each item must be a JSON object")
+                id_, props = prepare(item)
+            except (ValueError, TypeError, DeflateError) as e:
+                results[index] = bulk.failed(index, bulk.id_field_of(item, "id", self.id_field), e)
+                continue
+            rows.append({"index": index, "id": id_, "props": props})
+
+        for part in bulk.chunks(rows, chunk_size):
+            try:
+                matched = self._run_chunk(cypher, list(part))
+                errors: Dict[int, Any] = {}
+            except Neo4jError:
+                matched, errors = set(), {}
+                for row in part:
+                    try:
+                        matched |= self._run_chunk(cypher, [row])
+                    except Neo4jError as e:
+                        errors[row["index"]] = e.message or e
+            for row in part:
+                index = row["index"]
+                if index in errors:
+                    results[index] = bulk.failed(index, row["id"], errors[index])
+                else:
+                    results[index] = bulk.ok(index, row["id"], status if index in matched else "not_found")
+        return results
+
+    @staticmethod
+    def _run_chunk(cypher: str, rows: List[Dict[str, Any]]) -> Set[int]:
+        # Retried as a whole on transient errors; a chunk commits or rolls back at once
+        result, _ = write_query(cypher, {"rows": rows})
+        return {r[0] for r in result}
+
+    def _deflate(self, props: Dict[str, Any], defaults: bool = False) -> Dict[str, Any]:
+        """Convert API values to stored property values the way node.save() would."""
+        defined = self.model.defined_properties(rels=False, aliases=False)
+        out: Dict[str, Any] = {}
+        for name, value in props.items():
+            prop = defined.get(name)
+            if prop is None:
+                raise ValueError(f"Unknown field: {name}")
+            out[getattr(prop, "db_property", None) or name] = None if value is None else prop.deflate(value)
+        if defaults:
+            for name, prop in defined.items():
+                if name not in props and prop.has_default:
+                    out[getattr(prop, "db_property", None) or name] = prop.deflate(prop.default_value())
+        return out
+
     # ── utilities ────────────────────────────────────────────────
     def _to_dict(self, node: Any) -> Dict[str, Any]:
         if node is None:
@@ -149,3 +273,8 @@ class Neo4jBaseRepository(Generic[NodeT]):
             except Exception:
                 pass
         return req
+
+    def _bulk_required_fields(self) -> List[str]:
+        """The id field and every required property (neomodel lists them as (name, property) pairs)."""
+        defined = self.model.defined_properties(rels=False, aliases=False)
+        return [self.id_field] + [n for n, p in defined.items() if getattr(p, "required", False) and n != self.id_field]
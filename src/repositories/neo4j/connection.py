@@ -1,13 +1,50 @@
 import os
-from neomodel import config
+from neomodel import config, db, install_all_labels
 
-# Configure Neo4j OGM (neomodel) using environment variables
-NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
-NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "neo4j")
+from ..readiness import register
+from .driver import (
+    CONNECTION_TIMEOUT,
+    NEO4J_DATABASE,
+    NEO4J_PASSWORD,
+    NEO4J_URI,
+    NEO4J_USER,
+    get_driver,
+    read_query,
+)
 
+# Configure Neo4j OGM (neomodel) using environment variables
 # neomodel expects bolt URL with auth in URI form
 config.DATABASE_URL = f"bolt://{NEO4J_USER}:{NEO4J_PASSWORD}@{NEO4J_URI.split('://')[-1]}"
+# Fail fast when Neo4j is down instead of neomodel's 30 s default
+config.CONNECTION_TIMEOUT = CONNECTION_TIMEOUT
+# ...but neomodel uses the managed driver (and its pool) instead of opening its own
+config.DRIVER = get_driver()
+if NEO4J_DATABASE:
+    config.DATABASE_NAME = NEO4J_DATABASE
+
+# neomodel connects lazily on the first query. AUTO_INSTALL_LABELS would
+# connect while the model classes are being defined (i.e. on import), so
+# labels/constraints are installed by the readiness probe instead.
+config.AUTO_INSTALL_LABELS = False
+INSTALL_LABELS = os.getenv("NEO4J_INSTALL_LABELS", "true").lower() == "true"
+
+# Full-text index behind GET /movies/search (neomodel cannot declare these)
+MOVIE_FULLTEXT_INDEX = "movie_fulltext"
+
+
+def install_labels() -> None:
+    """Create the constraints and indexes of every imported node class."""
+    install_all_labels()
+    db.cypher_query(
+        f"CREATE FULLTEXT INDEX {MOVIE_FULLTEXT_INDEX} IF NOT EXISTS "
+        "FOR (m:Movie) ON EACH [m.title, m.summary]"
+    )
+
+
+def _probe() -> None:
+    read_query("RETURN 1")
+    if INSTALL_LABELS:
+        install_labels()
+
 
-# Optional: enable auto-install labels (useful during development)
-config.AUTO_INSTALL_LABELS = True
+readiness = register("neo4j", _probe)
@@ -0,0 +1,243 @@
+# src/repositories/neo4j/driver.py
+"""
+The process's Neo4j driver, its connection pool and managed transactions.
+
+One driver per process, shared by the custom Cypher queries (read_query /
+write_query below) and by neomodel, which is handed the same driver in
+connection.py, so the OGM and the routes draw from one pool. The driver is
+thread-safe and every call opens its own short session, so concurrent
+request threads each get a pooled connection: keep NEO4J_MAX_POOL_SIZE at
+least at the number of threads per worker.
+
+- read_query() runs in a managed read transaction (session.execute_read):
+  with a neo4j:// URI it is routed to a reader of the cluster, and it is
+  retried on transient errors and lost connections.
+- write_query() runs in a managed write transaction (session.execute_write),
+  sent to the leader and retried the same way, for up to
+  NEO4J_MAX_TRANSACTION_RETRY_TIME seconds. The transaction function can
+  run more than once, so write statements must be idempotent or atomic.
+
+When a query still fails with ServiceUnavailable or SessionExpired after
+the retries, the backend is marked down and probed again (readiness.py).
+
+Both return (rows, keys) like neomodel's db.cypher_query, with nodes and
+relationships left as driver objects (resolve_objects=False).
+read_query_with_summary() also returns the ResultSummary, which carries the
+plan of an EXPLAIN and the profile of a PROFILE (see queries.py).
+
+Every gunicorn worker has its own pool, so the server sees up to
+workers × NEO4J_MAX_POOL_SIZE connections. pool_stats() reports this
+worker's pool and the counters below.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from neo4j import GraphDatabase, READ_ACCESS, WRITE_ACCESS, ResultSummary
+from neo4j.exceptions import ClientError, ServiceUnavailable, SessionExpired
+
+from .. import instrumentation
+
+NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
+NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "neo4j")
+# None = the server's default database
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE") or None
+
+MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+# Seconds a query waits for a free pooled connection (the driver's default is 60)
+ACQUISITION_TIMEOUT = float(os.getenv("NEO4J_POOL_ACQUISITION_TIMEOUT", "10"))
+# Connections older than this are closed instead of reused (below typical proxy/LB idle limits)
+MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "1800"))
+MAX_TRANSACTION_RETRY_TIME = float(os.getenv("NEO4J_MAX_TRANSACTION_RETRY_TIME", "15"))
+# Seconds per connection attempt (shared with neomodel's setting in connection.py)
+CONNECTION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_TIMEOUT", "5"))
+
+_WAIT_SAMPLES = 1024
+
+_driver = None
+_driver_lock = threading.Lock()
+
+
+class DriverMetrics:
+    """Process-wide counters of the managed transactions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._waits.clear()
+            self.transactions = {"read": 0, "write": 0}
+            self.retries = 0
+            self.failures = 0
+            self.acquisition_timeouts = 0
+            self.in_flight = 0
+            self.peak_in_flight = 0
+            self.wait_max_ms = 0.0
+
+    def started(self, access: str) -> None:
+        with self._lock:
+            self.transactions[access] += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self, failed: bool, timed_out: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if failed:
+                self.failures += 1
+            if timed_out:
+                self.acquisition_timeouts += 1
+
+    def record_wait(self, ms: float) -> None:
+        with self._lock:
+            self._waits.append(ms)
+            self.wait_max_ms = max(self.wait_max_ms, ms)
+
+    def retried(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            count = len(self._waits)
+            return {
+                "transactions": dict(self.transactions),
+                "retries": self.retries,
+                "failures": self.failures,
+                "acquisition_timeouts": self.acquisition_timeouts,
+                "in_flight": self.in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                # from the call until the transaction function runs: pool checkout + BEGIN
+                "wait_ms": {
+                    "mean": round(sum(waits) / count, 3) if count else None,
+                    "p95": round(waits[max(0, int(count * 0.95) - 1)], 3) if waits else None,
+                    "max": round(self.wait_max_ms, 3),
+                },
+            }
+
+
+metrics = DriverMetrics()
+
+
+def get_driver():
+    """The process's driver, created on first use (creating it does not connect)."""
+    global _driver
+    if _driver is None:
+        with _driver_lock:
+            if _driver is None:
+                _driver = GraphDatabase.driver(
+                    NEO4J_URI,
+                    auth=(NEO4J_USER, NEO4J_PASSWORD),
+                    max_connection_pool_size=MAX_POOL_SIZE,
+                    connection_acquisition_timeout=ACQUISITION_TIMEOUT,
+                    max_connection_lifetime=MAX_CONNECTION_LIFETIME,
+                    max_transaction_retry_time=MAX_TRANSACTION_RETRY_TIME,
+                    connection_timeout=CONNECTION_TIMEOUT,
+                )
+    return _driver
+
+
+def read_query(query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[List[List[Any]], List[str]]:
+    """Run `query` in a managed read transaction; returns (rows, keys)."""
+    return _execute(READ_ACCESS, query, params)
+
+
+def write_query(query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[List[List[Any]], List[str]]:
+    """Run `query` in a managed, retried write transaction; returns (rows, keys)."""
+    return _execute(WRITE_ACCESS, query, params)
+
+
+def read_query_with_summary(
+    query: str, params: Optional[Dict[str, Any]] = None
+) -> Tuple[List[List[Any]], List[str], ResultSummary]:
+    """read_query() that also returns the result summary (plan, profile, notifications)."""
+    return _execute(READ_ACCESS, query, params, summary=True)
+
+
+def _execute(access: str, query: str, params: Optional[Dict[str, Any]], summary: bool = False) -> Tuple:
+    kind = "read" if access == READ_ACCESS else "write"
+    attempts = 0
+    start = time.perf_counter()
+
+    def work(tx):
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            metrics.record_wait((time.perf_counter() - start) * 1000)
+        else:
+            metrics.retried()
+        result = tx.run(query, params or {})
+        rows = [list(record.values()) for record in result]
+        if summary:
+            return rows, list(result.keys()), result.consume()
+        return rows, list(result.keys())
+
+    metrics.started(kind)
+    failed, timed_out = True, False
+    try:
+        with get_driver().session(database=NEO4J_DATABASE, default_access_mode=access) as session:
+            if access == READ_ACCESS:
+                out = session.execute_read(work)
+            else:
+                out = session.execute_write(work)
+        failed = False
+        return out
+    except ClientError as e:
+        timed_out = "failed to obtain a connection" in str(e)
+        raise
+    except (ServiceUnavailable, SessionExpired) as e:
+        # Raised once the driver's own retries are used up: the server is gone
+        from .connection import readiness  # connection.py imports this module
+
+        readiness.mark_down(e)
+        raise
+    finally:
+        metrics.finished(failed, timed_out)
+        instrumentation.record_cypher(query, time.perf_counter() - start, failed)
+
+
+def _pool_usage() -> Dict[str, Any]:
+    """Open and in-use connections per server, read from the driver's pool (best effort)."""
+    # Private API; absent from other driver versions
+    pool = getattr(_driver, "_pool", None)
+    if getattr(pool, "lock", None) is None or getattr(pool, "connections", None) is None:
+        return {}
+    try:
+        with pool.lock:
+            servers = {
+                str(address): {
+                    "open": len(connections),
+                    "in_use": sum(1 for c in connections if c.in_use),
+                }
+                for address, connections in pool.connections.items()
+            }
+    except (AttributeError, TypeError):
+        return {}
+    return {
+        "open": sum(s["open"] for s in servers.values()),
+        "in_use": sum(s["in_use"] for s in servers.values()),
+        "servers": servers,
+    }
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Configuration, live usage and counters of this process's Neo4j pool."""
+    stats: Dict[str, Any] = {
+        "max_size": MAX_POOL_SIZE,
+        "acquisition_timeout_s": ACQUISITION_TIMEOUT,
+        "max_lifetime_s": MAX_CONNECTION_LIFETIME,
+        "max_retry_time_s": MAX_TRANSACTION_RETRY_TIME,
+    }
+    stats.update(_pool_usage())
+    stats.update(metrics.snapshot())
+    return stats
+
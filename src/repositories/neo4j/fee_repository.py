@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from ..cache import CachedRepositoryMixin
 from .base_repository import Neo4jBaseRepository
 from .ogm_models.fee_ogm import Fee
 
 
-class FeeRepository(Neo4jBaseRepository[Fee]):
+class FeeRepository(CachedRepositoryMixin, Neo4jBaseRepository[Fee]):
+    cache_namespace = "neo4j.fees"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Fee, id_field="feeId")
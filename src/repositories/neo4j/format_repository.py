@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from ..cache import CachedRepositoryMixin
 from .base_repository import Neo4jBaseRepository
 from .ogm_models.format_ogm import Format
 
 
-class FormatRepository(Neo4jBaseRepository[Format]):
+class FormatRepository(CachedRepositoryMixin, Neo4jBaseRepository[Format]):
+    cache_namespace = "neo4j.formats"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Format, id_field="formatId")
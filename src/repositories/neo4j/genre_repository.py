@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from ..cache import CachedRepositoryMixin
 from .base_repository import Neo4jBaseRepository
 from .ogm_models.genre_ogm import Genre
 
 
-class GenreRepository(Neo4jBaseRepository[Genre]):
+class GenreRepository(CachedRepositoryMixin, Neo4jBaseRepository[Genre]):
+    cache_namespace = "neo4j.genres"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Genre, id_field="genreId")
@@ -0,0 +1,19 @@
+# src/repositories/neo4j/genre_similarity.py
+"""Genre-similarity index (genre_index.py) loaded from the OF_GENRE relationships."""
+from __future__ import annotations
+
+from typing import List
+
+from ..genre_index import PRELOAD, CatalogEntry, GenreSimilarity
+from .connection import readiness
+from . import queries
+
+
+def load_catalog() -> List[CatalogEntry]:
+    results, _ = queries.run("movie_genre_catalog")
+    return [(movie["movieId"], genres, movie) for movie, genres in results]
+
+
+movie_genres = GenreSimilarity("neo4j", load_catalog)
+if PRELOAD:
+    readiness.on_ready(movie_genres.load)
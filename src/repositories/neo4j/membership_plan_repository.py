@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from ..cache import CachedRepositoryMixin
 from .base_repository import Neo4jBaseRepository
 from .ogm_models.membership_plan_ogm import MembershipPlan
 
 
-class MembershipPlanRepository(Neo4jBaseRepository[MembershipPlan]):
+class MembershipPlanRepository(CachedRepositoryMixin, Neo4jBaseRepository[MembershipPlan]):
+    cache_namespace = "neo4j.membership_plans"
+    cache_ttl = 60
+
     def __init__(self):
         super().__init__(MembershipPlan, id_field="membershipPlanId")
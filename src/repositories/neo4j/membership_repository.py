@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from ..cache import CachedRepositoryMixin
 from .base_repository import Neo4jBaseRepository
 from .ogm_models.membership_ogm import Membership
 
 
-class MembershipRepository(Neo4jBaseRepository[Membership]):
+class MembershipRepository(CachedRepositoryMixin, Neo4jBaseRepository[Membership]):
+    cache_namespace = "neo4j.memberships"
+    cache_ttl = 300
+
     def __init__(self):
         super().__init__(Membership, id_field="membershipId")
@@ -1,9 +1,57 @@
 from __future__ import annotations
 
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from neo4j.exceptions import ClientError
+
 from .base_repository import Neo4jBaseRepository
+from .connection import MOVIE_FULLTEXT_INDEX
+from . import queries
+from .genre_similarity import movie_genres
 from .ogm_models.movie_ogm import Movie
 
+# Lucene query syntax characters, escaped in natural mode
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+# Title matches are boosted over summary matches in natural mode
+TITLE_BOOST = 3
+
 
 class MovieRepository(Neo4jBaseRepository[Movie]):
     def __init__(self):
         super().__init__(Movie, id_field="movieId")
+
+    def similar(self, movie_id: int, limit: int = 25, mode: str = "shared") -> List[Dict[str, Any]]:
+        """Movies sharing the most genres with `movie_id`, from the in-memory genre bitset index."""
+        return movie_genres.top(movie_id, limit, mode)
+
+    def search(
+        self, query: str, mode: str = "natural", limit: int = 20, offset: int = 0
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Full-text search over title and summary (movie_fulltext index), best match first.
+
+        "natural" matches any of the words, title hits boosted; "boolean"
+        passes Lucene query syntax through (+required -excluded "phrase"
+        prefix* title:word). Returns the page and the offset of the next one
+        (None on the last page).
+        """
+        if mode == "natural":
+            # lower-cased so AND/OR/NOT are plain words (the analyzer lower-cases anyway)
+            terms = _LUCENE_SPECIAL.sub(r"\\\1", query.lower())
+            query = f"title:({terms})^{TITLE_BOOST} summary:({terms})"
+        elif mode != "boolean":
+            raise ValueError(f"Unknown search mode: {mode}")
+        params = {"index": MOVIE_FULLTEXT_INDEX, "query": query, "skip": offset, "limit": limit + 1}
+        try:
+            rows, _ = queries.run("movie_fulltext_search", params)
+        except ClientError as e:
+            # Lucene parse errors surface as a failed procedure call
+            if "ParseException" in (e.message or ""):
+                raise ValueError("Invalid search query") from e
+            raise
+        items = []
+        for node, score in rows[:limit]:
+            item = self._to_dict(self.model.inflate(node))
+            item["relevance"] = round(float(score), 4)
+            items.append(item)
+        return items, offset + limit if len(rows) > limit else None
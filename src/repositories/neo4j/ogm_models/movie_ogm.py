@@ -7,7 +7,8 @@ class Movie(StructuredNode):
     title = StringProperty(required=True)
     releaseYear = IntegerProperty(required=True)
     runtimeMin = IntegerProperty(required=True)
-    rating = FloatProperty()
+    # range index behind GET /movies/by-rating
+    rating = FloatProperty(index=True)
     summary = StringProperty()
    
     genres = RelationshipTo(Genre, 'OF_GENRE')
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from ..cache import CachedRepositoryMixin
 from .base_repository import Neo4jBaseRepository
 from .ogm_models.promo_code_ogm import PromoCode
 
 
-class PromoCodeRepository(Neo4jBaseRepository[PromoCode]):
+class PromoCodeRepository(CachedRepositoryMixin, Neo4jBaseRepository[PromoCode]):
+    cache_namespace = "neo4j.promo_codes"
+    cache_ttl = 60
+
     def __init__(self):
         super().__init__(PromoCode, id_field="promoCodeId")
@@ -0,0 +1,349 @@
+# src/repositories/neo4j/queries.py
+"""
+Registry of the named Cypher queries behind the Neo4j read endpoints.
+
+Each query is defined once here, by name, with sample parameters of the
+right types, and run through run(name, params) instead of an inline string:
+
+- Plan cache: Neo4j caches execution plans by query text (and parameter
+  types). Once the backend is ready, warm_up() sends EXPLAIN for every query
+  with its sample parameters, which plans and caches it without executing
+  it, so the first request does not pay for planning.
+- Plan checks: the warm-up plans are searched for operators that read a
+  whole label or the whole graph (SCAN_OPERATORS). Queries that do so on
+  purpose are defined with full_scan=True; for the others each scan is
+  logged and reported in the query's stats, so a query that loses its index
+  shows up at startup.
+- Stats: calls, failures and latency per query, and, for one call in every
+  NEO4J_QUERY_PROFILE_EVERY, the db hits of a PROFILE run of the same query
+  (PROFILE returns the same rows, plus per-operator counts).
+- profile(name, params) runs PROFILE once and returns the plan tree with
+  rows and db hits per operator (GET/POST /api/v1/neo4j/admin/queries).
+
+Every query here is a read and runs in a read transaction, so profiling one
+cannot modify the graph.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .. import instrumentation
+from .connection import MOVIE_FULLTEXT_INDEX, readiness
+from .driver import read_query, read_query_with_summary
+
+# Run every Nth call of a query as PROFILE to sample its db hits (0 = never)
+PROFILE_EVERY = int(os.getenv("NEO4J_QUERY_PROFILE_EVERY", "100"))
+WARM_UP = os.getenv("NEO4J_QUERY_WARM_UP", "true").lower() == "true"
+# Operators that read every node of a label (or of the graph) or every relationship of a type
+SCAN_OPERATORS = (
+    "AllNodesScan",
+    "NodeByLabelScan",
+    "DirectedRelationshipTypeScan",
+    "UndirectedRelationshipTypeScan",
+    "DirectedAllRelationshipsScan",
+    "UndirectedAllRelationshipsScan",
+)
+
+query_duration = instrumentation.Histogram(
+    "neo4j_query_duration_seconds", "Latency of the named Neo4j queries.", ("query",), instrumentation.LATENCY_BUCKETS
+)
+query_errors = instrumentation.Counter("neo4j_query_errors_total", "Named Neo4j queries that raised.", ("query",))
+query_profiled = instrumentation.Counter(
+    "neo4j_query_profiled_total", "Named Neo4j query calls run as PROFILE.", ("query",)
+)
+query_db_hits = instrumentation.Counter(
+    "neo4j_query_db_hits_total", "Db hits of the profiled calls of the named Neo4j queries.", ("query",)
+)
+
+
+class NamedQuery:
+    """A Cypher read query with sample parameters and its running stats."""
+
+    def __init__(self, name: str, cypher: str, sample: Optional[Dict[str, Any]] = None,
+                 full_scan: bool = False, description: str = ""):
+        self.name = name
+        self.cypher = cypher
+        self.sample = dict(sample or {})
+        self.full_scan = full_scan
+        self.description = description
+        self._lock = threading.Lock()
+        self._calls = itertools.count(1)
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.failures = 0
+            self.total_seconds = 0.0
+            self.max_seconds = 0.0
+            self.profiled = 0
+            self.db_hits = 0
+            self.last_db_hits: Optional[int] = None
+            self.warmed = False
+            self.plan_warnings: List[str] = []
+
+    def run(self, params: Optional[Dict[str, Any]] = None) -> Tuple[List[List[Any]], List[str]]:
+        """Run the query; every PROFILE_EVERY-th call is profiled to sample its db hits."""
+        profiled = PROFILE_EVERY > 0 and next(self._calls) % PROFILE_EVERY == 0
+        hits: Optional[int] = None
+        start = time.perf_counter()
+        failed = True
+        try:
+            if profiled:
+                rows, keys, summary = read_query_with_summary(f"PROFILE {self.cypher}", params)
+                hits = _total(summary.profile, "dbHits")
+            else:
+                rows, keys = read_query(self.cypher, params)
+            failed = False
+            return rows, keys
+        finally:
+            self._record(time.perf_counter() - start, failed, hits)
+
+    def _record(self, seconds: float, failed: bool, hits: Optional[int]) -> None:
+        query_duration.observe(seconds, self.name)
+        if failed:
+            query_errors.inc(self.name)
+        if hits is not None:
+            query_profiled.inc(self.name)
+            query_db_hits.inc(self.name, amount=hits)
+        with self._lock:
+            self.calls += 1
+            self.failures += failed
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if hits is not None:
+                self.profiled += 1
+                self.db_hits += hits
+                self.last_db_hits = hits
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "description": self.description,
+                "calls": self.calls,
+                "failures": self.failures,
+                "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else None,
+                "max_ms": round(self.max_seconds * 1000, 3),
+                "profiled": self.profiled,
+                "mean_db_hits": round(self.db_hits / self.profiled, 1) if self.profiled else None,
+                "last_db_hits": self.last_db_hits,
+                "warmed": self.warmed,
+                "full_scan": self.full_scan,
+                "plan_warnings": list(self.plan_warnings),
+            }
+
+
+_QUERIES: Dict[str, NamedQuery] = {}
+
+
+def define(name: str, cypher: str, sample: Optional[Dict[str, Any]] = None,
+           full_scan: bool = False, description: str = "") -> NamedQuery:
+    if name in _QUERIES:
+        raise ValueError(f"Cypher query {name!r} is already defined")
+    query = _QUERIES[name] = NamedQuery(name, cypher, sample, full_scan, description)
+    return query
+
+
+def get(name: str) -> NamedQuery:
+    try:
+        return _QUERIES[name]
+    except KeyError:
+        raise LookupError(f"Unknown Cypher query: {name}") from None
+
+
+def names() -> List[str]:
+    return sorted(_QUERIES)
+
+
+def run(name: str, params: Optional[Dict[str, Any]] = None) -> Tuple[List[List[Any]], List[str]]:
+    """Run a named query; returns (rows, keys) like read_query()."""
+    return get(name).run(params)
+
+
+def stats() -> List[Dict[str, Any]]:
+    return [_QUERIES[name].stats() for name in names()]
+
+
+def warm_up() -> None:
+    """EXPLAIN every query with its sample parameters: fills the plan cache and checks for scans."""
+    started = time.perf_counter()
+    for name in names():
+        query = _QUERIES[name]
+        try:
+            _, _, summary = read_query_with_summary(f"EXPLAIN {query.cypher}", query.sample)
+        except Exception as e:
+            print(f"[neo4j] Could not plan query {name}: {e}")
+            continue
+        warnings = [] if query.full_scan else _scan_warnings(summary.plan)
+        with query._lock:
+            query.warmed = True
+            query.plan_warnings = warnings
+        for warning in warnings:
+            print(f"[neo4j] Query {name} plans a scan: {warning}")
+    print(f"[neo4j] Planned {len(_QUERIES)} named queries in {time.perf_counter() - started:.2f}s")
+
+
+def profile(name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """PROFILE a named query (sample parameters, overridden by `params`) and return its plan."""
+    query = get(name)
+    merged = {**query.sample, **(params or {})}
+    start = time.perf_counter()
+    rows, _, summary = read_query_with_summary(f"PROFILE {query.cypher}", merged)
+    elapsed = time.perf_counter() - start
+    return {
+        "name": name,
+        "cypher": query.cypher,
+        "params": merged,
+        "rows": len(rows),
+        "db_hits": _total(summary.profile, "dbHits"),
+        "elapsed_ms": round(elapsed * 1000, 3),
+        "warnings": [] if query.full_scan else _scan_warnings(summary.profile),
+        "notifications": [
+            {"code": n.get("code"), "title": n.get("title"), "description": n.get("description")}
+            for n in summary.notifications or []
+        ],
+        "plan": _plan_tree(summary.profile),
+    }
+
+
+# ── plan helpers (plans and profiles are nested dicts from the server) ─────
+def _operator(step: Dict[str, Any]) -> str:
+    # Neo4j 5 suffixes operators with the runtime ("NodeByLabelScan@neo4j")
+    return str(step.get("operatorType", "?")).split("@", 1)[0]
+
+
+def _steps(plan: Optional[Dict[str, Any]]):
+    if plan:
+        yield plan
+        for child in plan.get("children") or ():
+            yield from _steps(child)
+
+
+def _total(plan: Optional[Dict[str, Any]], key: str) -> int:
+    return sum(int(step.get(key) or 0) for step in _steps(plan))
+
+
+def _scan_warnings(plan: Optional[Dict[str, Any]]) -> List[str]:
+    warnings = []
+    for step in _steps(plan):
+        if _operator(step) in SCAN_OPERATORS:
+            args = step.get("args") or {}
+            detail = args.get("Details") or ", ".join(step.get("identifiers") or ())
+            rows = step.get("rows", args.get("EstimatedRows"))
+            warnings.append(f"{_operator(step)} {detail}" + (f" ({rows:.0f} rows)" if rows is not None else ""))
+    return warnings
+
+
+def _plan_tree(plan: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if not plan:
+        return None
+    args = plan.get("args") or {}
+    return {
+        "operator": _operator(plan),
+        "details": args.get("Details"),
+        "rows": plan.get("rows"),
+        "estimated_rows": args.get("EstimatedRows"),
+        "db_hits": plan.get("dbHits"),
+        "page_cache_hits": plan.get("pageCacheHits"),
+        "page_cache_misses": plan.get("pageCacheMisses"),
+        "identifiers": plan.get("identifiers") or [],
+        "children": [_plan_tree(child) for child in plan.get("children") or ()],
+    }
+
+
+# ── the queries ──────────────────────────────────────────────────
+define(
+    "node_count_sample",
+    "MATCH (n) RETURN count(n) AS cnt LIMIT 1",
+    description="Health check; answered from the count store",
+)
+define(
+    "movies_by_rating",
+    # Movie.rating is a float with a range index (movie_ogm.py), so this is
+    # an index seek in rating order; toFloat(m.rating) here forced a label scan
+    "MATCH (m:Movie) WHERE m.rating >= $min "
+    "RETURN m { .movieId, .title, .rating, .releaseYear, .runtimeMin, .summary } AS movie "
+    "ORDER BY m.rating DESC",
+    sample={"min": 8.0},
+    description="GET /movies/by-rating",
+)
+define(
+    "movie_fulltext_search",
+    "CALL db.index.fulltext.queryNodes($index, $query) YIELD node, score "
+    "RETURN node, score "
+    "ORDER BY score DESC, node.movieId "
+    "SKIP $skip LIMIT $limit",
+    sample={"index": MOVIE_FULLTEXT_INDEX, "query": "title:(matrix)^3 summary:(matrix)", "skip": 0, "limit": 21},
+    description="GET /movies/search",
+)
+define(
+    "movie_genre_catalog",
+    "MATCH (m:Movie) "
+    "OPTIONAL MATCH (m)-[:OF_GENRE]->(g:Genre) "
+    "RETURN m { .movieId, .title, .rating, .releaseYear, .runtimeMin } AS movie, collect(g.name)",
+    full_scan=True,
+    description="Catalog load of the genre-similarity index",
+)
+define(
+    "customer_rental_paths",
+    "MATCH (c:Customer {customerId: $cid})-[:RENTED]->(r:Rental)"
+    " OPTIONAL MATCH (r)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(m:Movie)"
+    " WITH r, m"
+    " RETURN r.rentalId AS rentalId,"
+    "        collect(distinct m { .movieId, .title, .rating, .releaseYear, .runtimeMin }) AS movies",
+    sample={"cid": 1},
+    description="GET /customers/<id>/rental-paths",
+)
+define(
+    "customer_exists",
+    "MATCH (c:Customer {customerId: $cid}) RETURN c LIMIT 1",
+    sample={"cid": 1},
+    description="404 check of GET /customers/<id>/rental-paths",
+)
+define(
+    "co_rentals_built",
+    "MATCH (s:CoRentalState) RETURN s LIMIT 1",
+    # a handful of state nodes (migrations/neo4j_co_rentals.py)
+    full_scan=True,
+    description="Whether the CO_RENTED edges have been built",
+)
+define(
+    "recommendations_live",
+    # Gather target movie genres once
+    "MATCH (target:Movie {movieId: $mid})-[:OF_GENRE]->(tg:Genre) "
+    "WITH target, collect(DISTINCT tg) AS targetGenres "
+    # Customers who rented the target movie
+    "MATCH (c:Customer)-[:RENTED]->(:Rental)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(target) "
+    # Other movies those customers rented
+    "MATCH (c)-[:RENTED]->(:Rental)-[:HAS_ITEM]->(:InventoryItem)-[:IS_COPY_OF]->(m:Movie) "
+    "WHERE m.movieId <> target.movieId "
+    # Genre overlap count between m and target
+    "OPTIONAL MATCH (m)-[:OF_GENRE]->(g:Genre) "
+    "WITH m, targetGenres, collect(DISTINCT g) AS mGenres, count(DISTINCT c) AS customerSupport "
+    "WITH m, customerSupport, size([x IN mGenres WHERE x IN targetGenres]) AS sharedGenreCount "
+    # Score: combine genre overlap and number of distinct customers supporting
+    "WITH m, (sharedGenreCount * 2) + customerSupport AS score, sharedGenreCount AS genres, customerSupport AS support "
+    "ORDER BY score DESC, m.title ASC "
+    "RETURN m { .movieId, .title, .rating, .releaseYear, .runtimeMin } AS movie, score, genres, support "
+    "LIMIT $limit",
+    sample={"mid": 1, "limit": 25},
+    description="GET /movies/<id>/recommendations?mode=live",
+)
+define(
+    "recommendations_precomputed",
+    # Same ranking as the live query, read from the CO_RENTED edges maintained by
+    # migrations/neo4j_co_rentals.py (stored once per pair, so matched undirected)
+    "MATCH (:Movie {movieId: $mid})-[e:CO_RENTED]-(m:Movie) "
+    "WITH m, e ORDER BY e.score DESC, m.title ASC LIMIT $limit "
+    "RETURN m { .movieId, .title, .rating, .releaseYear, .runtimeMin } AS movie, e.score, e.sharedGenres, e.weight",
+    sample={"mid": 1, "limit": 25},
+    description="GET /movies/<id>/recommendations?mode=precomputed",
+)
+
+if WARM_UP:
+    readiness.on_ready(warm_up)
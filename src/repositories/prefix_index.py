@@ -0,0 +1,117 @@
+# src/repositories/prefix_index.py
+"""
+In-memory prefix index for typeahead lookups.
+
+Every word of an entry's text is a possible starting point, so "god" finds
+"The Godfather". The index is a sorted list of (key, id) pairs, one per word
+start: the entries matching a prefix are one contiguous slice, found with two
+bisects. The top-k of a slice is picked by one score field of the entries
+(rating, popularity, ...); for short prefixes, whose slices are large, the
+ranking is memoized until the next write.
+
+Not tied to a backend: callers load it and keep it current (see
+mysql/movie_titles.py).
+"""
+from __future__ import annotations
+
+import bisect
+import heapq
+import threading
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Slices up to this size are ranked on every lookup; larger ones are memoized
+SCAN_LIMIT = 256
+MAX_MEMOIZED = 4096
+# Words of an entry that become keys (bounds memory for long titles)
+MAX_WORDS = 8
+
+
+def normalize(text: str) -> str:
+    """Lower-cased, accents stripped, punctuation collapsed to single spaces."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    chars = (c if c.isalnum() else " " for c in decomposed if not unicodedata.combining(c))
+    return " ".join("".join(chars).casefold().split())
+
+
+def _keys(norm: str) -> List[str]:
+    keys = [norm] if norm else []
+    start = norm.find(" ")
+    while start != -1 and len(keys) < MAX_WORDS:
+        keys.append(norm[start + 1:])
+        start = norm.find(" ", start + 1)
+    return keys
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over entries {"id": ..., <text_field>: ..., <score fields>...}."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = (), text_field: str = "title", max_k: int = 50):
+        self.text_field = text_field
+        self.max_k = max_k
+        self._entries: Dict[Any, Dict[str, Any]] = {}
+        self._normalized: Dict[Any, str] = {}
+        self._keys: List[Tuple[str, Any]] = []
+        self._top: Dict[Tuple[str, str], List[Any]] = {}
+        self._lock = threading.Lock()
+        for entry in entries:
+            id_ = entry["id"]
+            self._entries[id_] = entry
+            self._normalized[id_] = normalize(entry[text_field])
+            self._keys.extend((key, id_) for key in _keys(self._normalized[id_]))
+        self._keys.sort()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, id_: Any) -> Optional[Dict[str, Any]]:
+        return self._entries.get(id_)
+
+    def upsert(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            id_ = entry["id"]
+            self._remove(id_)
+            self._entries[id_] = entry
+            self._normalized[id_] = normalize(entry[self.text_field])
+            for key in _keys(self._normalized[id_]):
+                bisect.insort(self._keys, (key, id_))
+            self._top.clear()
+
+    def remove(self, id_: Any) -> None:
+        with self._lock:
+            self._remove(id_)
+            self._top.clear()
+
+    def _remove(self, id_: Any) -> None:
+        if self._entries.pop(id_, None) is None:
+            return
+        for key in _keys(self._normalized.pop(id_)):
+            pos = bisect.bisect_left(self._keys, (key, id_))
+            if pos < len(self._keys) and self._keys[pos] == (key, id_):
+                del self._keys[pos]
+
+    def top(self, prefix: str, k: int, by: str) -> List[Dict[str, Any]]:
+        """Up to k entries with a word starting with `prefix`, highest `by` first (ties by text)."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        k = min(k, self.max_k)
+        with self._lock:
+            lo = bisect.bisect_left(self._keys, (prefix,))
+            hi = bisect.bisect_left(self._keys, (prefix + "\U0010ffff",), lo)
+            if hi - lo <= SCAN_LIMIT:
+                return self._rank({self._keys[i][1] for i in range(lo, hi)}, k, by)
+            ids = self._top.get((prefix, by))
+            if ids is None:
+                ranked = self._rank({self._keys[i][1] for i in range(lo, hi)}, self.max_k, by)
+                ids = [e["id"] for e in ranked]
+                if len(self._top) >= MAX_MEMOIZED:
+                    self._top.clear()
+                self._top[(prefix, by)] = ids
+            return [dict(self._entries[id_]) for id_ in ids[:k]]
+
+    def _rank(self, ids: Iterable[Any], k: int, by: str) -> List[Dict[str, Any]]:
+        entries, normalized = self._entries, self._normalized
+        # largest score first; among equal scores, alphabetical
+        best = heapq.nsmallest(k, ids, key=lambda i: (-(entries[i].get(by) or 0), normalized[i], i))
+        return [dict(entries[i]) for i in best]
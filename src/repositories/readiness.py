@@ -0,0 +1,126 @@
+# src/repositories/readiness.py
+"""
+Background readiness probing for the database backends.
+
+Nothing connects at import time. Each backend registers a probe (a function
+that raises unless the database answers) and create_app() starts them all:
+every probe runs in its own daemon thread and retries with exponential
+backoff until it succeeds, so the API starts immediately and serves the
+backends that are up. A backend that goes away later can be put back into
+probing with mark_down(). Work that needs the database (warming caches,
+creating indexes) can be queued with on_ready().
+
+States: "starting" (no probe finished yet), "ready", "unavailable".
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+INITIAL_BACKOFF = float(os.getenv("DB_READINESS_INITIAL_BACKOFF", "0.5"))
+MAX_BACKOFF = float(os.getenv("DB_READINESS_MAX_BACKOFF", "30"))
+
+STARTING = "starting"
+READY = "ready"
+UNAVAILABLE = "unavailable"
+
+
+class Readiness:
+    """Readiness state of one backend, kept up to date by a probe thread."""
+
+    def __init__(self, name: str, probe: Callable[[], Any]):
+        self.name = name
+        self._probe = probe
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.state = STARTING
+        self.attempts = 0
+        self.last_error: Optional[str] = None
+        self.changed_at = time.time()
+        self._retry_at: Optional[float] = None
+        self._on_ready: List[Callable[[], Any]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.state == READY
+
+    def start(self) -> None:
+        """Start probing in the background unless a probe is already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name=f"readiness-{self.name}", daemon=True)
+            self._thread.start()
+
+    def on_ready(self, callback: Callable[[], Any]) -> None:
+        """Run `callback` in the probe thread each time the backend becomes ready."""
+        self._on_ready.append(callback)
+
+    def mark_down(self, error: Any) -> None:
+        """Report a lost connection; the backend is probed again until it answers."""
+        if self.state == READY:
+            self._set(UNAVAILABLE, str(error))
+            self.start()
+
+    def _run(self) -> None:
+        delay = INITIAL_BACKOFF
+        while True:
+            self.attempts += 1
+            try:
+                self._probe()
+            except Exception as e:
+                self._retry_at = time.time() + delay
+                self._set(UNAVAILABLE, f"{type(e).__name__}: {e}")
+                # Jitter keeps the workers of one host from probing in lockstep
+                time.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * 2, MAX_BACKOFF)
+                continue
+            self._retry_at = None
+            self._set(READY, None)
+            for callback in self._on_ready:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"[{self.name}] on_ready {getattr(callback, '__qualname__', callback)} failed: {e}")
+            return
+
+    def _set(self, state: str, error: Optional[str]) -> None:
+        if state != self.state:
+            self.changed_at = time.time()
+        self.state = state
+        self.last_error = error
+
+    def status(self) -> Dict[str, Any]:
+        status: Dict[str, Any] = {
+            "state": self.state,
+            "since": datetime.fromtimestamp(self.changed_at, timezone.utc).isoformat(),
+            "attempts": self.attempts,
+        }
+        if self.state != READY:
+            status["last_error"] = self.last_error
+            if self._retry_at is not None:
+                status["retry_in_s"] = round(max(0.0, self._retry_at - time.time()), 1)
+        return status
+
+
+_registry: Dict[str, Readiness] = {}
+
+
+def register(name: str, probe: Callable[[], Any]) -> Readiness:
+    readiness = _registry.get(name)
+    if readiness is None:
+        readiness = _registry[name] = Readiness(name, probe)
+    return readiness
+
+
+def start_all() -> None:
+    for readiness in _registry.values():
+        readiness.start()
+
+
+def readiness_status() -> Dict[str, Dict[str, Any]]:
+    return {name: r.status() for name, r in _registry.items()}